@@ -0,0 +1,112 @@
+"""Performance budgets for routes and interactions.
+
+A TOML file declares limits on what selenium_test.py measures; the suite
+checks them at the end of a run (--budgets) and fails the run when a limit is
+crossed, warning once a value gets close:
+
+    warn_at = 0.8
+
+    [routes."/browser"]
+    render_ms = 2500
+
+    [interactions."process-payment-button"]
+    total_ms = 3000
+
+Route names are route templates (ids replaced by :id, see route_template);
+interaction names are the description the helper was called with. Paint
+metrics (ttfb_ms, fcp_ms, lcp_ms) only exist for routes the suite loads cold;
+routes it reaches through client-side navigation are budgeted on render_ms.
+A budget that was never measured is reported as "missing", which the suite
+treats as a warning rather than a pass.
+"""
+from collections import namedtuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+BUDGET_FILE = "perf_budgets.toml"
+WARN_AT = 0.8  # Default fraction of a limit at which a value is reported as close to its budget
+
+# Budget key -> (field of the route summary, statistic); p75 over visits, max for counts
+ROUTE_METRICS = {
+    "ttfb_ms": ("ttfb", "p75"),
+    "fcp_ms": ("fcp", "p75"),
+    "lcp_ms": ("lcp", "p75"),
+    "render_ms": ("render_ms", "p75"),
+    "duration_ms": ("duration", "p75"),
+    "blocking_ms": ("blocking_ms", "p75"),
+    "cls": ("cls", "p75"),
+    "long_tasks": ("long_tasks", "max"),
+    "api_ms": ("api_ms", "p75"),
+    "api_calls": ("api_calls", "max"),
+}
+
+# Budget key -> (field of the interaction summary, statistic or None for a plain value)
+INTERACTION_METRICS = {
+    "total_ms": ("total_ms", "p75"),
+    "paint_ms": ("paint_p75_ms", None),
+    "api_ms": ("api_p75_ms", None),
+}
+
+# One limit; kind is "routes" or "interactions", target the route template or interaction description
+Budget = namedtuple("Budget", ["kind", "target", "metric", "limit"])
+
+# status: "ok", "warn" (at or above warn_at of the limit), "fail" (above the limit) or "missing" (not measured)
+BudgetResult = namedtuple("BudgetResult", ["budget", "value", "status"])
+
+class BudgetError(Exception):
+    """The budget file is missing, malformed or names an unknown metric"""
+
+def load_budgets(path=BUDGET_FILE):
+    """Read `path` and return (budgets, warn_at)"""
+    if tomllib is None:
+        raise BudgetError("Budget files need Python 3.11 or newer (tomllib)")
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise BudgetError(f"Could not read {path}: {e}")
+    warn_at = data.pop("warn_at", WARN_AT)
+    budgets = []
+    for kind, metrics in (("routes", ROUTE_METRICS), ("interactions", INTERACTION_METRICS)):
+        for target, limits in data.pop(kind, {}).items():
+            for metric, limit in limits.items():
+                if metric not in metrics:
+                    raise BudgetError(f"{path}: unknown {kind} metric '{metric}' for {target} "
+                                      f"(one of: {', '.join(metrics)})")
+                if not isinstance(limit, (int, float)):
+                    raise BudgetError(f"{path}: limit for {target} {metric} must be a number")
+                budgets.append(Budget(kind, target, metric, limit))
+    if data:
+        raise BudgetError(f"{path}: unknown section(s) {', '.join(data)} (expected routes, interactions, warn_at)")
+    return budgets, warn_at
+
+def measured_value(budget, summaries):
+    """The budget's value from summaries ({"routes": ..., "interactions": ...}), or None if it was not measured"""
+    field, statistic = (ROUTE_METRICS if budget.kind == "routes" else INTERACTION_METRICS)[budget.metric]
+    value = summaries.get(budget.kind, {}).get(budget.target, {}).get(field)
+    if statistic and isinstance(value, dict):
+        value = value.get(statistic)
+    return value
+
+def check_budgets(budgets, summaries, warn_at=WARN_AT):
+    """BudgetResult for every budget"""
+    results = []
+    for budget in budgets:
+        value = measured_value(budget, summaries)
+        if value is None:
+            status = "missing"
+        elif value > budget.limit:
+            status = "fail"
+        elif value >= budget.limit * warn_at:
+            status = "warn"
+        else:
+            status = "ok"
+        results.append(BudgetResult(budget, value, status))
+    return results
+
+def needs(budgets):
+    """Which measurements the budgets depend on: a set of "routes" and/or "interactions" """
+    return {budget.kind for budget in budgets}
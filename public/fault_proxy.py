@@ -0,0 +1,194 @@
+"""Latency and fault injection proxy between the frontend and the backend.
+
+Run the real backend on another port and put the proxy on 3001, where the
+frontend expects the API:
+
+    python fault_proxy.py --upstream http://localhost:3002 --profile p99
+
+Every request is forwarded; rules from the active profile add latency (fixed,
+normal or long-tail), cap response bandwidth, or fail the request with an
+error status or a hang. The suite switches profiles per stage through the
+control endpoints (see selenium_test.py --fault-profile):
+
+    POST /__proxy/profile {"profile": "p99"}   switch the active profile
+    GET  /__proxy/stats                         counters since the proxy started
+"""
+from collections import namedtuple
+from fnmatch import fnmatch
+from http.server import ThreadingHTTPServer
+import argparse
+import json
+import math
+import random
+import threading
+import time
+
+from standin_backend import StandinHandler, STANDIN_PORT
+
+CONTROL_PREFIX = "/__proxy/"
+HANG_SECONDS = 60  # How long an injected timeout holds the request before dropping it
+BANDWIDTH_CHUNK = 4096  # Bytes written between bandwidth pauses
+
+# Delay distribution in milliseconds.
+# fixed: always a; normal: mean a, standard deviation b; longtail: lognormal with median a and p99 b
+Latency = namedtuple("Latency", ["kind", "a", "b"])
+
+# One rule; route is an fnmatch pattern on the request path (query string ignored).
+# bandwidth: response bytes per second (None = unlimited)
+# error_rate/timeout_rate: fraction of matching requests answered with error_status or left hanging
+Rule = namedtuple("Rule", ["route", "latency", "bandwidth", "error_rate", "error_status", "timeout_rate"])
+
+def rule(route, latency=None, bandwidth=None, error_rate=0.0, error_status=503, timeout_rate=0.0):
+    return Rule(route, latency, bandwidth, error_rate, error_status, timeout_rate)
+
+# Named profiles; the first matching rule of the active profile applies to a request
+PAYMENT_ROUTES = "/api/payments/*"
+SLOT_ROUTES = "/api/salons/*/stylists*"
+ANALYTICS_ROUTES = "/api/admin/analytics/*"
+FAULT_PROFILES = {
+    "none": [],
+    "p50": [
+        rule("/api/*", Latency("normal", 80, 20)),
+    ],
+    "p99": [
+        rule(PAYMENT_ROUTES, Latency("longtail", 300, 4000)),
+        rule(SLOT_ROUTES, Latency("longtail", 250, 3000)),
+        rule(ANALYTICS_ROUTES, Latency("longtail", 400, 6000)),
+        rule("/api/*", Latency("longtail", 80, 1500)),
+    ],
+    "slow-network": [
+        rule("/api/*", Latency("fixed", 300, None), bandwidth=50 * 1024),
+    ],
+    "flaky": [
+        rule(PAYMENT_ROUTES, Latency("normal", 200, 50), error_rate=0.2, timeout_rate=0.05),
+        rule(SLOT_ROUTES, Latency("normal", 150, 50), error_rate=0.1),
+        rule("/api/*", error_rate=0.05),
+    ],
+}
+
+def sample_delay(latency):
+    """Seconds to wait for one request under `latency`"""
+    if latency is None:
+        return 0.0
+    if latency.kind == "fixed":
+        ms = latency.a
+    elif latency.kind == "normal":
+        ms = random.gauss(latency.a, latency.b)
+    elif latency.kind == "longtail":
+        # z(0.99) = 2.326: sigma puts the 99th percentile at b
+        sigma = math.log(latency.b / latency.a) / 2.326
+        ms = random.lognormvariate(math.log(latency.a), sigma)
+    else:
+        raise ValueError(f"Unknown latency kind: {latency.kind}")
+    return max(ms, 0) / 1000
+
+class FaultStats:
+    """Counters the suite reads through GET /__proxy/stats"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "errors": 0, "timeouts": 0, "delay_seconds": 0.0, "throttled_bytes": 0}
+
+    def add(self, **amounts):
+        with self.lock:
+            for name, amount in amounts.items():
+                self.counters[name] += amount
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counters)
+
+class FaultProxyHandler(StandinHandler):
+    """Forward to the upstream backend, applying the active profile's rules"""
+    profile = "none"
+    stats = None
+
+    def match_rule(self):
+        path = self.path.split("?", 1)[0]
+        for candidate in FAULT_PROFILES[self.profile]:
+            if fnmatch(path, candidate.route):
+                return candidate
+        return None
+
+    def respond(self, method, body):
+        if self.path.startswith(CONTROL_PREFIX):
+            self.control(method, body)
+            return
+        matched = self.match_rule() if method != "OPTIONS" else None
+        if matched is None:
+            self.send(*self.forward(method, body))
+            return
+        self.stats.add(requests=1)
+        delay = sample_delay(matched.latency)
+        self.stats.add(delay_seconds=delay)
+        time.sleep(delay)
+        roll = random.random()
+        if roll < matched.timeout_rate:
+            self.stats.add(timeouts=1)
+            time.sleep(HANG_SECONDS)
+            self.close_connection = True
+            return
+        if roll < matched.timeout_rate + matched.error_rate:
+            self.stats.add(errors=1)
+            message = json.dumps({"message": f"Injected {matched.error_status} ({self.profile} profile)"}).encode()
+            origin = self.headers.get("Origin")
+            cors = [("Access-Control-Allow-Origin", origin), ("Access-Control-Allow-Credentials", "true")] if origin else []
+            self.send(matched.error_status, cors + [("Content-Type", "application/json")], message)
+            return
+        status, headers, response_body = self.forward(method, body)
+        if matched.bandwidth:
+            self.stats.add(throttled_bytes=len(response_body))
+            self.send_throttled(status, headers, response_body, matched.bandwidth)
+        else:
+            self.send(status, headers, response_body)
+
+    def send_throttled(self, status, headers, body, bandwidth):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        for start in range(0, len(body), BANDWIDTH_CHUNK):
+            chunk = body[start:start + BANDWIDTH_CHUNK]
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            time.sleep(len(chunk) / bandwidth)
+
+    def control(self, method, body):
+        command = self.path[len(CONTROL_PREFIX):]
+        if command == "profile" and method == "POST":
+            profile = json.loads(body or b"{}").get("profile")
+            if profile not in FAULT_PROFILES:
+                self.send(400, [("Content-Type", "application/json")],
+                          json.dumps({"message": f"Unknown profile: {profile}"}).encode())
+                return
+            type(self).profile = profile
+            print(f"ℹ Fault profile: {profile}")
+        elif command != "stats":
+            self.send(404, [("Content-Type", "application/json")], b'{"message": "Unknown proxy command"}')
+            return
+        reply = dict(self.stats.snapshot(), profile=self.profile)
+        self.send(200, [("Content-Type", "application/json")], json.dumps(reply).encode())
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Latency and fault injection proxy for the Strands backend API")
+    parser.add_argument("--upstream", required=True, help="Real backend, e.g. http://localhost:3002")
+    parser.add_argument("--port", type=int, default=STANDIN_PORT,
+                        help=f"Port to listen on (default: {STANDIN_PORT}, where the frontend expects the backend)")
+    parser.add_argument("--profile", choices=sorted(FAULT_PROFILES), default="none",
+                        help="Profile active until the suite switches it (default: none)")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    options = parse_args()
+    FaultProxyHandler.upstream = options.upstream.rstrip("/")
+    FaultProxyHandler.profile = options.profile
+    FaultProxyHandler.stats = FaultStats()
+    server = ThreadingHTTPServer(("", options.port), FaultProxyHandler)
+    server.daemon_threads = True
+    print(f"Fault proxy on port {options.port} → {options.upstream} (profile: {options.profile}, Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,210 @@
+"""Seed test data directly through the backend REST API.
+
+Creates what the onboarding stages of selenium_test.py build through the UI -
+an approved salon with operating hours and products, and a stylist with
+working hours and services - in a few seconds, so booking, payment, review and
+note flows can start from it:
+
+    world = Fixtures().seed_world()
+    print(world.salon_id, world.owner.email, world.stylist.email)
+
+Run directly to seed a world and print it as JSON.
+"""
+from collections import namedtuple
+import json
+import random
+import string
+import sys
+import urllib.error
+import urllib.request
+
+BACKEND_URL = "http://localhost:3001/api"
+ADMIN_EMAIL = "admin@strands.com"
+DEFAULT_PASSWORD = "test123"  # Password the suite uses for every account it creates
+REQUEST_TIMEOUT = 10
+
+# A signed-in account; token and user_data are what the app keeps in localStorage
+Account = namedtuple("Account", ["email", "password", "token", "user_data"])
+
+# Everything seed_world() creates
+World = namedtuple("World", ["admin", "owner", "stylist", "salon_id", "employee_id", "service_ids", "product_ids"])
+
+# Same hours the owner_dashboard and staff_setup stages enter through the UI
+SALON_HOURS = {
+    "SUNDAY": ("09:00", "23:59"),
+    "MONDAY": ("08:00", "22:00"),
+    "TUESDAY": ("07:00", "22:00"),
+    "WEDNESDAY": ("09:00", "18:00"),
+    "THURSDAY": ("10:00", "21:00"),
+    "FRIDAY": ("08:00", "22:00"),
+    "SATURDAY": ("09:00", "17:00"),
+}
+STYLIST_HOURS = {
+    "SUNDAY": ("10:00", "23:59"),
+    "MONDAY": ("09:00", "22:00"),
+    "TUESDAY": ("08:00", "22:00"),
+    "WEDNESDAY": ("10:00", "17:00"),
+    "THURSDAY": ("11:00", "20:00"),
+    "FRIDAY": ("09:00", "21:00"),
+    "SATURDAY": ("10:00", "16:00"),
+}
+
+# (name, description, duration in minutes, price) - the services stylist_dashboard adds
+SERVICES = [
+    ("Haircut", "Professional haircut and styling", 1, 25.00),
+    ("Hair Color", "Full hair coloring service", 120, 85.50),
+    ("Hair Styling", "Professional hair styling for special occasions", 60, 45.75),
+]
+
+# (name, description, category, price, stock) - stock for the product_purchase stage
+PRODUCTS = [
+    ("Professional Shampoo", "High-quality professional hair care product", "SHAMPOO", 24.99, 50),
+    ("Deep Conditioner", "Premium salon-grade treatment for all hair types", "CONDITIONER", 29.99, 50),
+]
+
+class FixtureError(Exception):
+    """A fixture request was rejected by the backend"""
+
+class Fixtures:
+    """Create users, salons, staff, services and products against BACKEND_URL"""
+    def __init__(self, backend_url=BACKEND_URL):
+        self.backend_url = backend_url
+
+    def request(self, method, path, body=None, account=None):
+        """Send a JSON request and return the decoded response; raises FixtureError on HTTP errors"""
+        headers = {"Content-Type": "application/json"}
+        if account:
+            headers["Authorization"] = f"Bearer {account.token}"
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(f"{self.backend_url}{path}", data=data, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.load(e).get("message", "")
+            except Exception:
+                message = ""
+            raise FixtureError(f"{method} {path} failed with {e.code}: {message or e.reason}")
+
+    def generate_email(self):
+        """Random address in the same format as StrandsTestSuite.generate_email"""
+        random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+        return f"test_{random_str}@selenium.com"
+
+    def sign_in(self, email, password=DEFAULT_PASSWORD):
+        data = self.request("POST", "/user/login", {"email": email, "password": password})["data"]
+        user_data = {
+            "user_id": data["user_id"],
+            "full_name": data["full_name"],
+            "role": data["role"],
+            "email": email,
+        }
+        return Account(email, password, data["token"], user_data)
+
+    def create_account(self, role, full_name, email=None, password=DEFAULT_PASSWORD):
+        """Sign up a new OWNER, EMPLOYEE or CUSTOMER and return it signed in"""
+        email = email or self.generate_email()
+        self.request("POST", "/user/signup", {
+            "full_name": full_name,
+            "email": email,
+            "password": password,
+            "role": role,
+        })
+        return self.sign_in(email, password)
+
+    def create_salon(self, owner, name="Selenium Test Salon"):
+        """Register a salon for `owner` (status PENDING) and return its salon_id"""
+        self.request("POST", "/salons/create", {
+            "name": name,
+            "phone": "5551234567",
+            "address": "123 Test Street, Austin, TX 78701",
+            "category": "HAIR SALON",
+            "description": "Salon created by the Selenium fixtures",
+            "owner_user_id": owner.user_data["user_id"],
+            "status": "PENDING",
+            "email": owner.email,
+            "city": "Austin",
+            "state": "TX",
+            "postal_code": "78701",
+            "country": "USA",
+            "profile_picture_url": "",
+        }, owner)
+        return self.request("GET", "/salons/information", account=owner)["data"]["salon_id"]
+
+    def approve_salon(self, admin, salon_id):
+        self.request("PATCH", "/salons/approve", {"salon_id": salon_id, "status": "APPROVED"}, admin)
+
+    def set_salon_hours(self, owner, hours=SALON_HOURS):
+        weekly_hours = {day: {"start_time": start, "end_time": end} for day, (start, end) in hours.items()}
+        self.request("POST", "/salons/setHours", {"weekly_hours": weekly_hours}, owner)
+
+    def add_stylist(self, owner, salon_id, stylist, title="Senior Stylist"):
+        """Add `stylist` to the owner's salon and return their employee_id"""
+        self.request("POST", "/salons/addEmployee", {"salon_id": salon_id, "email": stylist.email, "title": title}, owner)
+        employees = self.request("POST", "/salons/viewEmployees", {"salon_id": salon_id, "limit": 100, "offset": 0}, owner)["data"]
+        for employee in employees:
+            if employee.get("email") == stylist.email:
+                return employee["employee_id"]
+        raise FixtureError(f"{stylist.email} was added but is not listed as an employee of salon {salon_id}")
+
+    def set_stylist_hours(self, owner, employee_id, hours=STYLIST_HOURS):
+        weekly_availability = {day: {"start_time": start, "end_time": end} for day, (start, end) in hours.items()}
+        self.request("POST", f"/salons/setEmployeeAvailability/{employee_id}", {"weekly_availability": weekly_availability}, owner)
+
+    def create_services(self, stylist, services=SERVICES):
+        """Create the stylist's services and return their ids (None where the response has no id)"""
+        service_ids = []
+        for name, description, duration, price in services:
+            data = self.request("POST", "/salons/stylist/createService", {
+                "name": name,
+                "description": description,
+                "duration_minutes": duration,
+                "price": price,
+            }, stylist).get("data") or {}
+            service_ids.append(data.get("service_id"))
+        return service_ids
+
+    def create_products(self, owner, products=PRODUCTS):
+        """Add products to the owner's salon and return their ids (None where the response has no id)"""
+        product_ids = []
+        for name, description, category, price, stock in products:
+            data = self.request("POST", "/products", {
+                "name": name,
+                "description": description,
+                "sku": f"PROD-{random.randint(1000, 9999)}",
+                "price": price,
+                "category": category,
+                "stock_qty": stock,
+            }, owner).get("data") or {}
+            product_ids.append(data.get("product_id"))
+        return product_ids
+
+    def seed_world(self, admin_password=DEFAULT_PASSWORD):
+        """Owner with an approved salon (hours, products) and a stylist working there (hours, services)"""
+        admin = self.sign_in(ADMIN_EMAIL, admin_password)
+        owner = self.create_account("OWNER", "Selenium Test Owner")
+        salon_id = self.create_salon(owner)
+        self.approve_salon(admin, salon_id)
+        self.set_salon_hours(owner)
+        product_ids = self.create_products(owner)
+        stylist = self.create_account("EMPLOYEE", "Selenium Test Stylist")
+        employee_id = self.add_stylist(owner, salon_id, stylist)
+        self.set_stylist_hours(owner, employee_id)
+        service_ids = self.create_services(stylist)
+        return World(admin, owner, stylist, salon_id, employee_id, service_ids, product_ids)
+
+if __name__ == "__main__":
+    try:
+        world = Fixtures().seed_world()
+    except (FixtureError, urllib.error.URLError) as e:
+        print(f"⚠ Could not seed fixtures: {e}")
+        sys.exit(1)
+    print(json.dumps({
+        "salon_id": world.salon_id,
+        "employee_id": world.employee_id,
+        "owner": {"email": world.owner.email, "password": world.owner.password},
+        "stylist": {"email": world.stylist.email, "password": world.stylist.password},
+        "service_ids": world.service_ids,
+        "product_ids": world.product_ids,
+    }, indent=2))
@@ -5,9 +5,26 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import namedtuple, Counter
+from contextlib import contextmanager
+from fixtures import Fixtures
+from fault_proxy import FAULT_PROFILES
+from timing_history import TimingHistory, HISTORY_FILE, git_commit, print_regressions
+from budgets import BUDGET_FILE, BudgetError, load_budgets, check_budgets, needs
+import argparse
+import ast
+import functools
+import inspect
+import json
+import math
+import os
+import threading
 import time
+import traceback
 import random
+import re
 import string
 import signal
 import sys
@@ -16,10 +33,904 @@ BASE_URL = "http://localhost:3000"
 BACKEND_URL = "http://localhost:3001/api"
 WAIT_TIMEOUT = 3  # Fast timeout
 ACTION_DELAY = 0.1  # Very fast execution
-MAX_TEST_TIME = 300  # Maximum time per test (5 minutes)
+MAX_TEST_TIME = 300  # Default deadline per test or stage (5 minutes); see --deadline
+# Deadline overrides per test or stage (None = no deadline of its own). Test 5 only
+# runs the onboarding stages, which each have their own deadline; one around all of
+# them would report every stage after the one that overran as timed out too.
+STAGE_DEADLINES = {
+    "test_5_owner_signup_and_admin_approval": None,
+}
+DEADLINE_SNAPSHOT_DIR = "deadline_snapshots"  # Screenshot, URL and stack of every test that hit its deadline
+DEADLINE_SNAPSHOT_TIMEOUT = 10  # Longest the watchdog waits for the snapshot before closing the browser
+CHECKPOINT_FILE = "selenium_checkpoint.json"  # State saved after every stage for --resume-from
+DRIVER_POOL_SPARE = 2  # Chrome sessions kept launched and idle, ready for as_role or a lost session
+FAULT_PROXY_URL = "http://localhost:3001/__proxy"  # Control endpoints when fault_proxy.py stands in on 3001
+FAULT_REPORT_FILE = "fault_report.json"  # Per-stage results under each --fault-profile
+WEB_VITALS_REPORT = "web_vitals.json"  # Per-route rendering metrics (--web-vitals)
+API_LATENCY_REPORT = "api_latency.json"  # Per-endpoint backend latency (--api-stats)
+INTERACTION_REPORT = "interactions.json"  # Per-interaction response times (--interaction-stats)
+TRACE_FILE = "suite_trace.json"  # Chrome trace-event spans of the suite itself (--trace)
+TRACE_ARG_LENGTH = 200  # Longest string argument recorded on a span
+COMMAND_PROFILE_REPORT = "webdriver_profile.json"  # chromedriver round trips per call site (--profile-commands)
+INTERACTION_QUIET_MS = 300  # DOM and API quiet time that ends an interaction measurement
+INTERACTION_TIMEOUT = 10  # Longest an interaction measurement waits for the app to settle
+# PaymentPage.jsx validates a typed promo code in a setTimeout(..., 500) after the last keystroke
+PROMO_CODE_DEBOUNCE = 0.5
+SETTLE_POLL_INTERVAL = 0.05  # How often settle() re-checks the page
+SETTLE_QUIET_PERIOD = 0.25  # How long the page must stay unchanged to count as settled
 
-class StrandsTestSuite:
+# Run profiles (--profile). "demo" keeps the visible scrolling and pacing used for the
+# recorded walkthrough; "fast" drops cosmetic scrolling and only scrolls to reach elements.
+# page_scroll: run scroll_page_to_show_all/scroll_through_page
+# smooth_scroll: animate scroll_to_element even when the element is already on screen
+# quiet_period: how long settle() needs the page unchanged
+Profile = namedtuple("Profile", ["page_scroll", "smooth_scroll", "quiet_period"])
+PROFILES = {
+    "demo": Profile(page_scroll=True, smooth_scroll=True, quiet_period=SETTLE_QUIET_PERIOD),
+    "fast": Profile(page_scroll=False, smooth_scroll=False, quiet_period=0.1),
+}
+
+# --lean browser: headless at a fixed size, with Chrome's background services switched off
+LEAN_WINDOW_SIZE = (1920, 1080)
+LEAN_CHROME_FLAGS = (
+    "--headless=new",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--no-first-run",
+    "--mute-audio",
+)
+
+# Injected on every page in --lean mode: animations and transitions finish immediately
+NO_ANIMATIONS_SCRIPT = """
+var style = document.createElement('style');
+style.textContent = '*, *::before, *::after { animation-duration: 0s !important; animation-delay: 0s !important; ' +
+    'transition-duration: 0s !important; transition-delay: 0s !important; scroll-behavior: auto !important; }';
+(document.head || document.documentElement).appendChild(style);
+"""
+
+# Requests dropped with --block-media (images and web fonts; inline SVG icons are unaffected)
+BLOCKED_MEDIA_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+                      "*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+
+# True when the element is fully inside the viewport
+IN_VIEWPORT_SCRIPT = """
+var rect = arguments[0].getBoundingClientRect();
+return rect.top >= 0 && rect.left >= 0 &&
+    rect.bottom <= (window.innerHeight || document.documentElement.clientHeight) &&
+    rect.right <= (window.innerWidth || document.documentElement.clientWidth);
+"""
+
+# Background routes the app polls on a timer; they never go quiet, so waits ignore them
+# (useNotifications polls unread-count every 5s, an open NotificationInbox polls inbox)
+POLLING_ROUTES = ("/notifications/unread-count", "/notifications/inbox")
+API_IDLE_TIMEOUT = 10  # Longest wait_for_api_idle() waits for in-flight requests
+
+# Installed before any app script on every page load (see create_driver). Wraps fetch
+# and XMLHttpRequest and records requests to the backend in window.__strandsNetwork
+NETWORK_TRACKER_SCRIPT = """
+(function (apiBase) {
+    if (window.__strandsNetwork) return;
+    var network = window.__strandsNetwork = {pending: {}, done: [], nextId: 0};
+    function start(method, url) {
+        url = String(url);
+        if (url.indexOf(apiBase) !== 0) return null;
+        var id = ++network.nextId;
+        network.pending[id] = {method: (method || 'GET').toUpperCase(), url: url.slice(apiBase.length), started: Date.now()};
+        return id;
+    }
+    function finish(id, status) {
+        if (id === null || !network.pending[id]) return;
+        var request = network.pending[id];
+        delete network.pending[id];
+        request.status = status;
+        request.finished = Date.now();
+        network.done.push(request);
+        if (network.done.length > 500) network.done.shift();
+    }
+    var originalFetch = window.fetch;
+    window.fetch = function (input, init) {
+        var url = typeof input === 'string' ? input : (input && input.url);
+        var method = (init && init.method) || (input && input.method);
+        var id = start(method, url);
+        return originalFetch.apply(this, arguments).then(function (response) {
+            finish(id, response.status);
+            return response;
+        }, function (error) {
+            finish(id, 0);
+            throw error;
+        });
+    };
+    var originalOpen = XMLHttpRequest.prototype.open;
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__strandsRequest = [method, url];
+        return originalOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this;
+        var id = xhr.__strandsRequest ? start(xhr.__strandsRequest[0], xhr.__strandsRequest[1]) : null;
+        xhr.addEventListener('loadend', function () { finish(id, xhr.status); });
+        return originalSend.apply(this, arguments);
+    };
+})(arguments[0]);
+"""
+
+# In-flight backend requests, excluding routes in arguments[0]; null if the tracker is not installed
+PENDING_REQUESTS_SCRIPT = """
+var network = window.__strandsNetwork;
+if (!network) return null;
+var ignore = arguments[0];
+var pending = [];
+for (var id in network.pending) {
+    var request = network.pending[id];
+    if (!ignore.some(function (route) { return request.url.indexOf(route) === 0; })) {
+        pending.push(request.method + ' ' + request.url);
+    }
+}
+return pending;
+"""
+
+# One round trip with everything settle() needs to decide the page is idle:
+# document loaded, no finite (non-spinner) animations running, no backend request
+# in flight (polling routes aside), and a signature of DOM size, text, completed
+# network requests, URL and scroll position
+PAGE_STATE_SCRIPT = """
+var network = window.__strandsNetwork;
+var ignore = arguments[0];
+var requests = 0;
+if (network) {
+    for (var id in network.pending) {
+        var url = network.pending[id].url;
+        if (!ignore.some(function (route) { return url.indexOf(route) === 0; })) requests++;
+    }
+}
+var running = 0;
+if (document.getAnimations) {
+    document.getAnimations().forEach(function (animation) {
+        var timing = animation.effect && animation.effect.getComputedTiming();
+        if (animation.playState === 'running' && timing && isFinite(timing.endTime)) running++;
+    });
+}
+return {
+    ready: document.readyState === 'complete',
+    animating: running,
+    requests: requests,
+    signature: [
+        document.getElementsByTagName('*').length,
+        document.body ? document.body.textContent.length : 0,
+        performance.getEntriesByType('resource').length,
+        location.href,
+        Math.round(window.scrollY)
+    ].join('|')
+};
+"""
+
+DOM_STABLE_TIMEOUT = 10  # Default limit for wait_for_dom_stable()
+SCRIPT_TIMEOUT = 30  # WebDriver limit for execute_async_script calls
+
+# Resolves once the subtree under arguments[0] has had no mutations for arguments[1] ms,
+# every selector in arguments[2] matches a visible element and none in arguments[3] does.
+# Selectors starting with "/" or "(" are XPath, anything else is CSS.
+DOM_STABLE_SCRIPT = """
+var rootSelector = arguments[0], quietMs = arguments[1], required = arguments[2], absent = arguments[3];
+var timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+function find(selector) {
+    if (selector[0] === '/' || selector[0] === '(') {
+        return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(selector);
+}
+function visible(element) { return !!element && element.getClientRects().length > 0; }
+function unmet() {
+    return required.filter(function (selector) { return !visible(find(selector)); })
+        .concat(absent.filter(function (selector) { return visible(find(selector)); }).map(function (selector) { return 'not ' + selector; }));
+}
+var start = Date.now(), lastChange = start, observer = null, timer = null;
+function finish(stable) {
+    clearInterval(timer);
+    if (observer) observer.disconnect();
+    done({stable: stable, unmet: unmet(), elapsed: Date.now() - start});
+}
+function check() {
+    var root = document.querySelector(rootSelector);
+    if (root && !observer) {
+        observer = new MutationObserver(function () { lastChange = Date.now(); });
+        observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+        lastChange = Date.now();
+    }
+    if (root && Date.now() - lastChange >= quietMs && unmet().length === 0) return finish(true);
+    if (Date.now() - start >= timeoutMs) finish(false);
+}
+timer = setInterval(check, 50);
+check();
+"""
+
+# Locator strategies expect_elements() resolves inside the page
+BATCH_LOCATOR_KINDS = {By.ID: "id", By.CSS_SELECTOR: "css", By.XPATH: "xpath", By.NAME: "name"}
+
+# Looks up every locator in arguments[0] ({name: [kind, value]}) until all of them reach
+# the state in arguments[1] ("present", "visible" or "enabled") or arguments[2] ms pass
+EXPECT_ELEMENTS_SCRIPT = """
+var locators = arguments[0], require = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+function find(kind, value) {
+    if (kind === 'id') return document.getElementById(value);
+    if (kind === 'name') return document.getElementsByName(value)[0] || null;
+    if (kind === 'xpath') return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return document.querySelector(value);
+}
+function inspect() {
+    var elements = {}, satisfied = true;
+    Object.keys(locators).forEach(function (name) {
+        var element = find(locators[name][0], locators[name][1]);
+        var visible = !!element && element.getClientRects().length > 0 && getComputedStyle(element).visibility !== 'hidden';
+        var info = {
+            present: !!element,
+            visible: visible,
+            enabled: visible && !element.disabled && element.getAttribute('aria-disabled') !== 'true',
+            element: element
+        };
+        if (!info[require]) satisfied = false;
+        elements[name] = info;
+    });
+    return {satisfied: satisfied, elements: elements};
+}
+var start = Date.now();
+(function poll() {
+    var result = inspect();
+    if (result.satisfied || Date.now() - start >= timeoutMs) return done(result.elements);
+    setTimeout(poll, 50);
+})();
+"""
+
+# Sets every {id: value} in arguments[0] the way React expects: through the native value
+# setter of the element's prototype (bypassing React's own instance setter) followed by
+# bubbling input/change events; booleans tick or untick checkboxes. Values are read back
+# after React has re-rendered so rejected or reformatted input shows up in the result.
+FILL_FORM_SCRIPT = """
+var values = arguments[0], done = arguments[arguments.length - 1];
+var fields = {};
+Object.keys(values).forEach(function (id) {
+    var element = document.getElementById(id), value = values[id];
+    fields[id] = element;
+    if (!element) return;
+    if (typeof value === 'boolean') {
+        if (element.checked !== value) element.click();
+        return;
+    }
+    var proto = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : element instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+        : HTMLInputElement.prototype;
+    element.focus();
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, String(value));
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.blur();
+});
+function normalize(value) { return String(value).replace(/[^0-9a-z]/gi, '').toLowerCase(); }
+requestAnimationFrame(function () {
+    setTimeout(function () {
+        var results = {};
+        Object.keys(values).forEach(function (id) {
+            var element = fields[id], value = values[id];
+            if (!element || !element.isConnected) element = document.getElementById(id);
+            if (!element) {
+                results[id] = {ok: false, value: null};
+            } else if (typeof value === 'boolean') {
+                results[id] = {ok: element.checked === value, value: element.checked};
+            } else {
+                // Inputs that format as you type (card number, phone) count as long as the characters match
+                results[id] = {ok: element.value === String(value) || normalize(element.value) === normalize(value), value: element.value};
+            }
+        });
+        done(results);
+    }, 0);
+});
+"""
+
+# Client-side navigation: push the route onto the history stack the way React Router's
+# BrowserRouter does and fire popstate so the router renders it without a page reload.
+# Returns false when the app is not mounted in this page (a full load is needed).
+SPA_NAVIGATE_SCRIPT = """
+var root = document.getElementById('root');
+if (!root || !root.children.length) {
+    return false;
+}
+var state = window.history.state || {};
+var next = {usr: null, key: Math.random().toString(36).slice(2, 10), idx: (state.idx || 0) + 1};
+window.history.pushState(next, '', arguments[0]);
+window.dispatchEvent(new PopStateEvent('popstate', {state: next}));
+return true;
+"""
+
+# Installed on every page with --web-vitals. Keeps one record per route the page shows
+# (a full load, or a client-side route change): TTFB, FCP and LCP for loads, layout
+# shift and long tasks for both. Records survive full navigations in sessionStorage
+# until collect_vitals() drains them.
+WEB_VITALS_SCRIPT = """
+(function (ignore) {
+    if (window.__strandsVitals) {
+        return;
+    }
+    var KEY = '__strandsVitals';
+    var records = [];
+    try {
+        records = JSON.parse(window.sessionStorage.getItem(KEY) || '[]');
+        window.sessionStorage.removeItem(KEY);
+    } catch (e) {}
+    function route() {
+        return window.location.pathname + window.location.search;
+    }
+    function newRecord(type) {
+        return {
+            route: route(), type: type, start: type === 'load' ? 0 : performance.now(),
+            started_at: type === 'load' ? Date.now() - performance.now() : Date.now(),
+            ttfb: null, fcp: null, lcp: null, cls: 0, long_tasks: 0, long_task_ms: 0, blocking_ms: 0,
+            render_ms: null, duration: null, navigation: null, api_calls: 0, api_ms: 0
+        };
+    }
+    var current = newRecord('load');
+    function finish() {
+        if (current.type === 'load') {
+            var nav = performance.getEntriesByType('navigation')[0];
+            if (nav) {
+                current.ttfb = nav.responseStart;
+                current.navigation = {
+                    dns: nav.domainLookupEnd - nav.domainLookupStart,
+                    connect: nav.connectEnd - nav.connectStart,
+                    request: nav.responseStart - nav.requestStart,
+                    response: nav.responseEnd - nav.responseStart,
+                    dom_interactive: nav.domInteractive,
+                    dom_content_loaded: nav.domContentLoadedEventEnd,
+                    load: nav.loadEventEnd,
+                    transfer_size: nav.transferSize
+                };
+            }
+        }
+        current.duration = performance.now() - current.start;
+        // Backend calls (minus notification polling) started while the route was on screen
+        var network = window.__strandsNetwork;
+        if (network) {
+            network.done.forEach(function (request) {
+                var polling = ignore.some(function (prefix) { return request.url.indexOf(prefix) === 0; });
+                if (request.started >= current.started_at && !polling) {
+                    current.api_calls += 1;
+                    current.api_ms += request.finished - request.started;
+                }
+            });
+        }
+        delete current.started_at;
+        records.push(current);
+    }
+    function observe(type, callback) {
+        try {
+            new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+                .observe({type: type, buffered: true});
+        } catch (e) {}
+    }
+    observe('paint', function (entry) {
+        if (entry.name === 'first-contentful-paint' && current.type === 'load') { current.fcp = entry.startTime; }
+    });
+    observe('largest-contentful-paint', function (entry) {
+        if (current.type === 'load') { current.lcp = entry.startTime; }
+    });
+    observe('layout-shift', function (entry) {
+        if (!entry.hadRecentInput && entry.startTime >= current.start) { current.cls += entry.value; }
+    });
+    observe('longtask', function (entry) {
+        if (entry.startTime >= current.start) {
+            current.long_tasks += 1;
+            current.long_task_ms += entry.duration;
+            current.blocking_ms += Math.max(0, entry.duration - 50);
+        }
+    });
+    function routeChanged() {
+        if (route() !== current.route) {
+            finish();
+            current = newRecord('spa');
+        }
+    }
+    ['pushState', 'replaceState'].forEach(function (name) {
+        var original = window.history[name];
+        window.history[name] = function () {
+            var result = original.apply(this, arguments);
+            routeChanged();
+            return result;
+        };
+    });
+    window.addEventListener('popstate', routeChanged);
+    window.addEventListener('pagehide', function () {
+        finish();
+        try {
+            window.sessionStorage.setItem(KEY, JSON.stringify(records));
+        } catch (e) {}
+    });
+    window.__strandsVitals = {
+        drain: function (includeCurrent) {
+            if (includeCurrent) {
+                finish();
+                current = newRecord('spa');
+            }
+            var done = records;
+            records = [];
+            return done;
+        },
+        markRendered: function () {
+            if (current.render_ms === null) { current.render_ms = performance.now() - current.start; }
+        }
+    };
+})(arguments[0]);
+"""
+
+# Per-route metrics summarized from WEB_VITALS_SCRIPT records: name -> unit (cls is a unitless score)
+VITALS_METRICS = {
+    "ttfb": "ms",
+    "fcp": "ms",
+    "lcp": "ms",
+    "render_ms": "ms",
+    "duration": "ms",
+    "cls": "score",
+    "long_tasks": "count",
+    "blocking_ms": "ms",
+    "api_calls": "count",
+    "api_ms": "ms",
+}
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+def route_template(route):
+    """Group routes that differ only in ids or cache-busting parameters (/salon/12 -> /salon/:id)"""
+    path, _, query = route.partition("?")
+    path = re.sub(r"/\d+(?=/|$)", "/:id", path)
+    params = [param for param in query.split("&") if param and not param.startswith("_t=")]
+    return path + ("?" + "&".join(params) if params else "")
+
+# Armed right before a helper dispatches a click or keystrokes (--interaction-stats).
+# The first input event marks the start; requestAnimationFrame + setTimeout marks the
+# next paint after it, and a MutationObserver the last DOM change.
+INTERACTION_START_SCRIPT = """
+var probe = window.__strandsInteraction = {start: Date.now(), paint: null, lastMutation: null, began: false};
+function begin() {
+    if (probe.began) return;
+    probe.began = true;
+    probe.start = Date.now();
+    requestAnimationFrame(function () { setTimeout(function () { probe.paint = Date.now(); }, 0); });
+}
+['pointerdown', 'mousedown', 'keydown', 'click', 'input'].forEach(function (type) {
+    document.addEventListener(type, begin, {capture: true, once: true});
+});
+probe.observer = new MutationObserver(function () { probe.lastMutation = Date.now(); });
+probe.observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# Waits (async) until the interaction has painted, its API calls (excluding the routes in
+# arguments[0]) have finished and the DOM has been quiet for arguments[1] ms, or until
+# arguments[2] ms pass. Times are ms after the interaction started; null when the page
+# navigated away and the probe was lost.
+INTERACTION_RESULT_SCRIPT = """
+var ignore = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var probe = window.__strandsInteraction;
+var network = window.__strandsNetwork;
+if (!probe) {
+    done(null);
+    return;
+}
+var waitStart = Date.now();
+function counts(request) {
+    return request.started >= probe.start && !ignore.some(function (route) { return request.url.indexOf(route) === 0; });
+}
+(function check() {
+    var now = Date.now();
+    var finished = network ? network.done.filter(counts) : [];
+    var pending = 0;
+    if (network) {
+        for (var id in network.pending) {
+            if (counts(network.pending[id])) pending++;
+        }
+    }
+    var apiEnd = finished.reduce(function (latest, request) { return Math.max(latest, request.finished); }, 0);
+    var lastChange = Math.max(probe.lastMutation || probe.start, apiEnd);
+    var idle = (probe.paint !== null || !probe.began) && pending === 0 && now - lastChange >= quietMs;
+    if (!idle && now - waitStart < timeoutMs) {
+        setTimeout(check, 25);
+        return;
+    }
+    probe.observer.disconnect();
+    window.__strandsInteraction = null;
+    done({
+        paint: probe.paint === null ? null : probe.paint - probe.start,
+        dom: probe.lastMutation === null ? 0 : Math.max(0, probe.lastMutation - probe.start),
+        api: finished.length ? apiEnd - probe.start : null,
+        requests: finished.length,
+        timed_out: !idle
+    });
+})();
+"""
+
+# The app's response to one helper interaction (--interaction-stats); times in ms
+Interaction = namedtuple("Interaction", ["helper", "description", "paint", "dom", "api", "requests", "timed_out"])
+
+# One backend call seen in Chrome's performance log (--api-stats); seconds and bytes
+ApiCall = namedtuple("ApiCall", ["method", "route", "status", "latency", "size"])
+
+# Methods that implement waiting and may call time.sleep directly
+WAIT_ENGINE_METHODS = ("settle", "wait_for_api_idle", "pause")
+
+def waiting(method):
+    """Count the time spent in a wait method towards the suite's `waited` total (and stop waiting past a deadline)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.check_deadline()
+        start = time.time()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.waited += time.time() - start
+    return wrapper
+
+class StageTimeout(BaseException):
+    """A test or stage ran past its deadline.
+    
+    Derives from BaseException like KeyboardInterrupt, so the stages' own
+    `except Exception` handlers do not swallow it and carry on (the suite has
+    no bare `except:` clauses for the same reason).
+    """
+
+class Deadline:
+    """Time budget of one running test or stage, enforced by a watchdog timer thread"""
+    def __init__(self, name, seconds, on_expiry):
+        self.name = name
+        self.seconds = seconds
+        self.expired = False
+        self.thread_id = threading.get_ident()
+        self.timer = threading.Timer(seconds, self.expire, args=(on_expiry,))
+        self.timer.daemon = True
+    
+    def expire(self, on_expiry):
+        self.expired = True
+        on_expiry(self)
+
+class Tracer:
+    """Begin/end spans in Chrome trace-event format (--trace); open the file in Perfetto or chrome://tracing.
+    
+    Each suite (main or worker) gets its own track, so parallel workers show
+    up as separate rows.
+    """
+    def __init__(self):
+        self.events = []
+        self.tracks = {}  # suite name -> tid
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+    
+    def add(self, phase, track, name, category, args):
+        timestamp = (time.perf_counter() - self.origin) * 1e6
+        with self.lock:
+            tid = self.tracks.setdefault(track, len(self.tracks) + 1)
+            event = {"ph": phase, "name": name, "cat": category, "ts": timestamp, "pid": 1, "tid": tid}
+            if args:
+                event["args"] = args
+            self.events.append(event)
+    
+    def begin(self, track, name, category, args=None):
+        self.add("B", track, name, category, args)
+    
+    def end(self, track, name, category, args=None):
+        self.add("E", track, name, category, args)
+    
+    @contextmanager
+    def span(self, track, name, category, args=None):
+        self.begin(track, name, category, args)
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = {"error": f"{type(e).__name__}: {str(e)[:TRACE_ARG_LENGTH]}"}
+            raise
+        finally:
+            self.end(track, name, category, error)
+    
+    def save(self, path):
+        with self.lock:
+            names = [{"ph": "M", "name": "thread_name", "pid": 1, "tid": tid, "args": {"name": track}}
+                     for track, tid in self.tracks.items()]
+            events = names + list(self.events)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(events) - len(names)
+
+def traced(category):
+    """Record each call as a span under `category` (--trace), with its plain arguments (locator, url, description, ...)"""
+    def decorate(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return method(self, *args, **kwargs)
+            span_args = {"role": self.current_role}
+            for name, value in list(signature.bind(self, *args, **kwargs).arguments.items())[1:]:
+                if isinstance(value, str):
+                    span_args[name] = value[:TRACE_ARG_LENGTH]
+                elif isinstance(value, (int, float, bool)) or value is None:
+                    span_args[name] = value
+            with self.tracer.span(self.name, method.__name__, category, span_args):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+# A schedulable unit of the suite.
+# role: session expected on entry ("guest" = signed out, or admin/owner/stylist/user)
+# requires: suite attributes that must be set before the stage runs
+# provides: suite attributes the stage sets for later stages
+# after: stages or tests that must finish first (a failed stage skips its dependents)
+Stage = namedtuple("Stage", ["name", "role", "requires", "provides", "after"])
+
+# Suite attributes shared between stages (and between workers in --workers mode)
+STATE_ATTRS = (
+    "test_salon_id",
+    "owner_email",
+    "owner_password",
+    "stylist_email",
+    "user_email",
+    "user_password",
+    "latest_promo_code",
+    "rescheduled_booking_id",
+)
+
+# Tests 1-4 as stages for --workers mode
+TEST_STAGES = [
+    Stage("test_1_login_page_loads", "guest", (), (), ()),
+    Stage("test_2_invalid_login_attempt", "guest", (), (), ()),
+    Stage("test_3_successful_login_admin", "guest", (), (), ()),
+    Stage("test_4_admin_pages_and_salon_rejection", "admin", (), (), ()),
+]
+
+# Phases of test 5, listed in the order a sequential run executes them.
+# Each stage runs on the persistent browser of its role (see as_role).
+# Owner signup waits for test 4 because test 4 rejects the first pending salon.
+TEST_5_STAGES = [
+    Stage("owner_signup", "guest", (), ("owner_email", "owner_password"), ("test_4_admin_pages_and_salon_rejection",)),
+    Stage("admin_approval", "admin", ("owner_email",), ("test_salon_id",), ("owner_signup",)),
+    Stage("owner_dashboard", "owner", ("owner_email", "owner_password"), (), ("admin_approval",)),
+    Stage("stylist_signup", "guest", (), ("stylist_email",), ()),
+    Stage("staff_setup", "owner", ("owner_email", "stylist_email"), (), ("owner_dashboard", "stylist_signup")),
+    Stage("stylist_dashboard", "stylist", ("stylist_email",), (), ("staff_setup",)),
+    Stage("customer_booking", "guest", (), ("user_email", "user_password"), ("stylist_dashboard",)),
+    Stage("loyalty_promotions", "user", ("owner_email", "user_email"), ("latest_promo_code",), ("customer_booking",)),
+    Stage("second_booking", "user", ("user_email",), (), ("loyalty_promotions",)),
+    Stage("reschedule", "user", ("user_email",), ("rescheduled_booking_id",), ("second_booking",)),
+    Stage("private_note", "user", ("rescheduled_booking_id",), (), ("reschedule",)),
+    Stage("product_purchase", "user", ("user_email",), (), ("customer_booking", "owner_dashboard")),
+    Stage("appointment_review", "user", ("user_email",), (), ("reschedule",)),
+    Stage("salon_review", "user", ("user_email",), (), ("customer_booking",)),
+    Stage("stylist_review_replies", "stylist", ("stylist_email", "user_email"), (), ("appointment_review",)),
+    Stage("owner_review_replies", "owner", ("owner_email",), (), ("salon_review", "appointment_review", "product_purchase")),
+    Stage("admin_analytics", "admin", (), (), ("owner_review_replies", "stylist_review_replies", "private_note")),
+]
+
+ALL_STAGES = TEST_STAGES + TEST_5_STAGES
+
+# Suite attributes --seed fills from a fixture world created through the API
+SEEDED_ATTRS = ("owner_email", "owner_password", "stylist_email", "test_salon_id")
+
+# Results that satisfy a dependency ("RESTORED" = passed in the checkpoint a run resumed from)
+COMPLETED_RESULTS = ("PASSED", "RESTORED")
+
+# Frames skipped when charging a WebDriver command to a line of the suite (decorators and the profiler itself)
+PROFILER_SKIPPED_FRAMES = ("wrapper", "profiled", "call_site")
+
+class CommandProfiler:
+    """Counts and times every chromedriver round trip (--profile-commands).
+    
+    install() wraps a driver's execute(), which every WebDriver, WebElement and
+    WebDriverWait command goes through, and charges each command to the
+    innermost line of this file that issued it. Shared between workers.
+    """
     def __init__(self):
+        self.sites = {}  # (function, line) -> {"count", "seconds", "max", "commands": Counter}
+        self.lock = threading.Lock()
+    
+    def install(self, driver):
+        execute = driver.execute
+        
+        def profiled(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(self.call_site(), driver_command, time.perf_counter() - start)
+        driver.execute = profiled
+    
+    def call_site(self):
+        frame = sys._getframe(1)
+        while frame:
+            code = frame.f_code
+            if code.co_filename == __file__ and code.co_name not in PROFILER_SKIPPED_FRAMES:
+                return code.co_name, frame.f_lineno
+            frame = frame.f_back
+        return "(outside the suite)", 0
+    
+    def record(self, site, command, seconds):
+        with self.lock:
+            stats = self.sites.setdefault(site, {"count": 0, "seconds": 0.0, "max": 0.0, "commands": Counter()})
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["commands"][command] += 1
+    
+    def report(self, top=25):
+        """Print the call sites that spend the most time in round trips and save them all"""
+        with self.lock:
+            ranked = sorted(self.sites.items(), key=lambda item: -item[1]["seconds"])
+        by_command = Counter()
+        for _, stats in ranked:
+            by_command.update(stats["commands"])
+        total_count = sum(stats["count"] for _, stats in ranked)
+        total_seconds = sum(stats["seconds"] for _, stats in ranked)
+        try:
+            with open(COMMAND_PROFILE_REPORT, "w") as f:
+                json.dump({
+                    "saved_at": datetime.now().isoformat(),
+                    "round_trips": total_count,
+                    "seconds": round(total_seconds, 3),
+                    "commands": dict(by_command.most_common()),
+                    "call_sites": [{
+                        "function": function,
+                        "line": line,
+                        "count": stats["count"],
+                        "seconds": round(stats["seconds"], 3),
+                        "max_ms": round(stats["max"] * 1000, 1),
+                        "commands": dict(stats["commands"].most_common()),
+                    } for (function, line), stats in ranked],
+                }, f, indent=2)
+        except Exception as e:
+            print(f"Could not write {COMMAND_PROFILE_REPORT}: {e}")
+        print(f"\nWEBDRIVER COMMANDS ({total_count} round trips, {total_seconds:.1f}s; top {top} call sites by time)")
+        print(f"  {'call site':<40} {'calls':>6} {'total s':>8} {'avg ms':>7}  commands")
+        for (function, line), stats in ranked[:top]:
+            commands = ", ".join(f"{command} x{count}" for command, count in stats["commands"].most_common(3))
+            print(f"  {f'{function}:{line}'[:40]:<40} {stats['count']:>6} {stats['seconds']:>8.2f} "
+                  f"{stats['seconds'] / stats['count'] * 1000:>7.1f}  {commands}")
+        print("  By command: " + ", ".join(f"{command} x{count}" for command, count in by_command.most_common(8)))
+        print(f"  Saved to {COMMAND_PROFILE_REPORT}")
+
+class DriverPool:
+    """Chrome sessions launched in the background so nobody waits on a cold start.
+    
+    acquire() hands out an idle session and starts launching its replacement, so
+    a lost session is replaced without waiting. Shared between workers, so every
+    method is thread safe.
+    """
+    def __init__(self, factory, spare=DRIVER_POOL_SPARE):
+        self.factory = factory
+        self.spare = spare
+        self.idle = []
+        self.launching = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def fill(self):
+        """Launch drivers in the background until `spare` are idle or starting"""
+        with self.condition:
+            if self.closed:
+                return
+            needed = max(self.spare - len(self.idle) - self.launching, 0)
+            self.launching += needed
+        for _ in range(needed):
+            threading.Thread(target=self.launch, daemon=True).start()
+
+    def launch(self):
+        try:
+            driver = self.factory()
+        except Exception as e:
+            print(f"  ⚠ Could not launch a Chrome session for the pool: {e}")
+            driver = None
+        with self.condition:
+            self.launching -= 1
+            if driver and not self.closed:
+                self.idle.append(driver)
+                driver = None
+            self.condition.notify_all()
+        if driver:
+            self.discard(driver)
+
+    def acquire(self):
+        """Return a live driver, waiting for one that is already starting rather than launching another"""
+        while True:
+            with self.condition:
+                while not self.idle and self.launching:
+                    self.condition.wait()
+                driver = self.idle.pop(0) if self.idle else None
+            self.fill()
+            if driver is None:
+                return self.factory()
+            if self.is_alive(driver):
+                return driver
+            self.discard(driver)
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            idle, self.idle = self.idle, []
+        for driver in idle:
+            self.discard(driver)
+
+    @staticmethod
+    def is_alive(driver):
+        """Cheap liveness probe: one round trip that fails once the session or browser is gone"""
+        try:
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def reset(driver):
+        """Sign the browser out of everything by clearing cookies and storage for the app origin"""
+        try:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": BASE_URL, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            try:
+                if driver.current_url.startswith(BASE_URL):
+                    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+                driver.delete_all_cookies()
+            except Exception:
+                return False
+        try:
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def discard(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+class WorkerOutput:
+    """Prefix every printed line with the name of the worker thread that printed it"""
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def set_worker(self, name):
+        self.local.name = name
+        self.local.at_line_start = True
+
+    def write(self, text):
+        name = getattr(self.local, "name", None)
+        if not name:
+            return self.stream.write(text)
+        with self.lock:
+            for chunk in text.splitlines(True):
+                if self.local.at_line_start:
+                    self.stream.write(f"[{name}] ")
+                self.stream.write(chunk)
+                self.local.at_line_start = chunk.endswith("\n")
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+class StrandsTestSuite:
+    def __init__(self, options=None, install_signal_handlers=True):
+        self.options = options or parse_args([])
+        self.profile = PROFILES[self.options.profile]
+        self.name = "main"
         self.driver = None
         self.wait = None
         self.test_results = []
@@ -29,9 +940,31 @@ class StrandsTestSuite:
         self.user_email = None
         self.user_password = "test123"
         self.latest_promo_code = None
+        self.owner_password = None
+        self.rescheduled_booking_id = None
         self.test_start_time = None
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
+        self.workers = []
+        self.sessions = {}  # email -> cookies/localStorage captured right after login
+        self.auth_tokens = {}  # email -> token and user_data from the backend (--fast-auth)
+        self.restored_stages = set()
+        self.checkpoint_results = {}
+        self.current_role = "guest"
+        self.role_drivers = {}  # role -> persistent signed-in driver (see as_role)
+        self.driver_pool = None  # shared with workers; only the suite that started it closes it
+        self.owns_driver_pool = False
+        self.waited = 0.0  # seconds spent in settle/wait_for_* (see waiting)
+        self.fault_results = []  # one entry per stage run under a --fault-profile
+        self.vitals = []  # route records drained from the pages (--web-vitals)
+        self.api_calls = []  # ApiCall per finished backend request (--api-stats)
+        self.api_in_flight = {}  # (driver id, CDP requestId) -> requestWillBeSent params
+        self.interactions = []  # Interaction per measured helper call (--interaction-stats)
+        self.tracer = Tracer() if self.options.trace else None  # shared with workers
+        self.command_profiler = CommandProfiler() if self.options.profile_commands else None  # shared with workers
+        self.deadlines = []  # Deadline of the running test and stage, outermost first
+        self.durations = []  # (test or stage method name, seconds, result) per run_test; shared with workers
+        if install_signal_handlers:
+            signal.signal(signal.SIGINT, self.signal_handler)
+            signal.signal(signal.SIGTERM, self.signal_handler)
     
     def signal_handler(self, signum, frame):
         """Handle interrupt signals gracefully"""
@@ -48,37 +981,247 @@ class StrandsTestSuite:
             urllib.request.urlopen(req, timeout=2)
             print("Backend detected on port 3001")
             return True
-        except:
+        except Exception:
             print("WARNING: Backend server not detected on port 3001.")
             print("Please ensure the backend is running before executing tests.")
             return False
     
-    def navigate_and_scroll(self, url):
-        """Navigate to URL and ALWAYS scroll - use this instead of driver.get"""
-        self.driver.get(url)
-        time.sleep(0.3)
+    @traced("wait")
+    @waiting
+    def settle(self, max_wait):
+        """Wait until the page is idle, for at most `max_wait` seconds.
+        
+        Used everywhere a fixed delay used to be: returns as soon as the page is
+        loaded, no backend request is in flight, animations have finished and the
+        DOM has been quiet for the profile's quiet_period. `max_wait` caps the
+        polling, but every call makes at least one PAGE_STATE_SCRIPT round trip,
+        so a call can take longer than a very short old sleep did.
+        """
+        deadline = time.time() + max_wait
+        quiet_period = min(self.profile.quiet_period, max_wait / 2)
+        last_signature = None
+        quiet_since = None
+        while True:
+            self.check_deadline()
+            now = time.time()
+            try:
+                state = self.driver.execute_script(PAGE_STATE_SCRIPT, list(POLLING_ROUTES))
+            except Exception:
+                # No driver, or the page is mid-navigation
+                state = None
+            if state and state["ready"] and not state["animating"] and not state["requests"]:
+                if state["signature"] != last_signature:
+                    last_signature = state["signature"]
+                    quiet_since = now
+                elif now - quiet_since >= quiet_period:
+                    return True
+            else:
+                last_signature = None
+            if now >= deadline:
+                return False
+            time.sleep(min(SETTLE_POLL_INTERVAL, deadline - now))
+    
+    @traced("wait")
+    @waiting
+    def wait_for_api_idle(self, ignore=POLLING_ROUTES, timeout=API_IDLE_TIMEOUT, description=""):
+        """Wait until no request to BACKEND_URL is in flight (except routes starting with one of `ignore`).
+        
+        Prints the requests it waited on; returns False on timeout or when the
+        network tracker is not installed in the page.
+        """
+        start = time.time()
+        waited_on = set()
+        while True:
+            try:
+                pending = self.driver.execute_script(PENDING_REQUESTS_SCRIPT, list(ignore))
+            except Exception:
+                pending = []
+            if pending is None:
+                print(f"  ⚠ Network tracker not installed; cannot wait for API idle {description}".rstrip())
+                return False
+            waited_on.update(pending)
+            elapsed = time.time() - start
+            if not pending:
+                if waited_on:
+                    print(f"  ✓ API idle after {elapsed:.2f}s {description}".rstrip() + f" (waited on: {', '.join(sorted(waited_on))})")
+                return True
+            if elapsed >= timeout:
+                print(f"  ⚠ API still busy after {timeout}s {description}".rstrip() + f": {', '.join(pending)}")
+                return False
+            time.sleep(SETTLE_POLL_INTERVAL)
+    
+    @traced("wait")
+    @waiting
+    def wait_for_dom_stable(self, root_selector="body", quiet_ms=300, required_selectors=(),
+                            absent_selectors=(), timeout=DOM_STABLE_TIMEOUT, description=""):
+        """Wait in one round trip until `root_selector` stops changing and the selectors are satisfied.
+        
+        A MutationObserver inside the page tracks the subtree; the call returns once
+        it has been quiet for `quiet_ms`, every `required_selectors` entry matches a
+        visible element and no `absent_selectors` entry does (CSS, or XPath when the
+        selector starts with "/").
+        """
+        timeout = min(timeout, SCRIPT_TIMEOUT - 1)
+        try:
+            result = self.driver.execute_async_script(
+                DOM_STABLE_SCRIPT, root_selector, quiet_ms, list(required_selectors),
+                list(absent_selectors), int(timeout * 1000)
+            )
+        except Exception as e:
+            print(f"  ⚠ DOM stability check failed {description}".rstrip() + f": {e}")
+            return False
+        if result["stable"]:
+            if description:
+                print(f"  ✓ {description} ready after {result['elapsed'] / 1000:.2f}s")
+            return True
+        print(f"  ⚠ {description or root_selector} not stable after {timeout}s; unmet: {', '.join(result['unmet']) or 'still changing'}")
+        return False
+    
+    @traced("sleep")
+    @waiting
+    def pause(self, seconds, reason):
+        """Fixed wait for things settle() cannot observe (e.g. an input debounce timer) or for demo pacing"""
+        time.sleep(seconds)
+    
+    @traced("navigation")
+    def navigate_and_scroll(self, url, reload=False):
+        """Navigate to URL and ALWAYS scroll - use this instead of driver.get
+        
+        App URLs are opened with spa_navigate; pass reload=True where the cold
+        load itself matters (first paint, or the app must re-read localStorage).
+        """
+        if reload or not url.startswith(BASE_URL):
+            self.driver.get(url)
+            self.settle(0.3)
+        else:
+            self.spa_navigate(url[len(BASE_URL):] or "/")
         self.scroll_page_to_show_all()
     
-    def setup(self):
+    @traced("navigation")
+    def spa_navigate(self, path, description=""):
+        """Open `path` through React Router in the running app instead of reloading the page.
+        
+        Keeps the loaded bundle, auth context and notification polling; falls
+        back to driver.get when the app is not loaded in the current page.
+        """
+        try:
+            on_app = self.driver.current_url.startswith(BASE_URL)
+            if not on_app or not self.driver.execute_script(SPA_NAVIGATE_SCRIPT, path):
+                self.driver.get(f"{BASE_URL}{path}")
+                self.settle(0.3)
+                return True
+        except Exception as e:
+            print(f"  ⚠ Client-side navigation to {path} failed, reloading: {e}")
+            self.driver.get(f"{BASE_URL}{path}")
+            self.settle(0.3)
+            return True
+        # Route guards may redirect, so wait for the new route to render rather than for the URL
+        rendered = self.wait_for_dom_stable("#root", quiet_ms=150, description=description)
+        if rendered and self.options.web_vitals:
+            try:
+                self.driver.execute_script("if (window.__strandsVitals) { window.__strandsVitals.markRendered(); }")
+            except Exception:
+                pass
+        return rendered
+    
+    def setup(self, check_backend=True):
         print("Setting up Selenium WebDriver...")
-        print("Checking backend connection...")
-        self.check_backend()
-        options = webdriver.ChromeOptions()
-        options.add_argument('--start-maximized')
-        self.driver = webdriver.Chrome(options=options)
+        # Chrome starts in the background while the backend is checked
+        self.start_driver_pool()
+        if check_backend:
+            print("Checking backend connection...")
+            self.check_backend()
+        self.driver = self.driver_pool.acquire()
         self.wait = WebDriverWait(self.driver, WAIT_TIMEOUT)
+        self.role_drivers[self.current_role] = self.driver
         self.navigate_and_scroll(BASE_URL)
+    
+    def start_driver_pool(self, spare=DRIVER_POOL_SPARE):
+        """Create the driver pool on first use and top it up"""
+        if self.driver_pool is None:
+            self.driver_pool = DriverPool(self.create_driver, spare)
+            self.owns_driver_pool = True
+        self.driver_pool.fill()
+    
+    def replace_driver(self):
+        """Swap the current (dead) session for a ready one from the pool"""
+        if self.driver:
+            DriverPool.discard(self.driver)
+        self.driver = None
+        self.setup(check_backend=False)
+    
+    def create_driver(self):
+        options = webdriver.ChromeOptions()
+        if self.options.lean:
+            for flag in LEAN_CHROME_FLAGS:
+                options.add_argument(flag)
+            options.add_argument("--window-size={},{}".format(*LEAN_WINDOW_SIZE))
+        else:
+            options.add_argument('--start-maximized')
+        if self.options.api_stats:
+            # Network events land in the performance log, read by collect_api_timings()
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        driver = webdriver.Chrome(options=options)
+        if self.command_profiler:
+            self.command_profiler.install(driver)
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+        if self.options.lean:
+            try:
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                    "source": f"document.addEventListener('DOMContentLoaded', function () {{ {NO_ANIMATIONS_SCRIPT} }});"
+                })
+            except Exception as e:
+                print(f"  ⚠ Could not disable animations: {e}")
+        if self.options.block_media:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_MEDIA_URLS})
+            except Exception as e:
+                print(f"  ⚠ Could not block image and font requests: {e}")
+        # Track backend requests from the first app script on (read by settle/wait_for_api_idle)
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": f"(function () {{ {NETWORK_TRACKER_SCRIPT} }}).call(null, {json.dumps(BACKEND_URL)});"
+            })
+        except Exception as e:
+            print(f"  ⚠ Could not install network tracker: {e}")
+        if self.options.web_vitals:
+            try:
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                    "source": f"(function () {{ {WEB_VITALS_SCRIPT} }}).call(null, {json.dumps(list(POLLING_ROUTES))});"
+                })
+            except Exception as e:
+                print(f"  ⚠ Could not install web vitals collector: {e}")
+        return driver
         
     def teardown(self):
+        for worker in self.workers:
+            try:
+                worker.teardown()
+            except Exception:
+                pass
+        self.workers = []
+        for role, driver in list(self.role_drivers.items()):
+            if driver is not self.driver:
+                DriverPool.discard(driver)
+        self.role_drivers = {}
         if self.driver:
             self.driver.quit()
+            self.driver = None
             print("Browser closed")
+        if self.driver_pool and self.owns_driver_pool:
+            self.driver_pool.close()
+        self.driver_pool = None
     
+    @traced("scroll")
     def scroll_page_to_show_all(self):
-        """Scroll the entire page instantly to show all content - ALWAYS CALLED"""
+        """Scroll the entire page instantly to show all content - ALWAYS CALLED (no-op in the fast profile)"""
+        if not self.profile.page_scroll:
+            return True
         try:
             # Get page height - wait a tiny bit for page to render
-            time.sleep(0.2)
+            self.pause(0.2, "demo pacing")
             page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight, document.body.offsetHeight, document.documentElement.offsetHeight)")
             viewport_height = self.driver.execute_script("return window.innerHeight")
             
@@ -86,63 +1229,174 @@ class StrandsTestSuite:
                 # Scroll through page quickly to show all content
                 # Scroll to bottom
                 self.driver.execute_script(f"window.scrollTo(0, {page_height});")
-                time.sleep(0.1)
+                self.pause(0.1, "demo pacing")
                 # Scroll to middle to show most content
                 self.driver.execute_script(f"window.scrollTo(0, {page_height * 0.5});")
-                time.sleep(0.1)
+                self.pause(0.1, "demo pacing")
                 return True
             return True
         except Exception as e:
             # Silently fail - don't break tests if scrolling fails
             return False
     
+    @traced("scroll")
+    def scroll_through_page(self, step=0.8, pause=0.4, scroll_back=False):
+        """Visibly scroll down the page `step` viewports at a time, then back to the top.
+        
+        step=None jumps straight to the bottom; scroll_back=True scrolls back up in
+        steps instead of jumping. Cosmetic only, so it does nothing in the fast profile
+        and keeps fixed pauses (not settle()) so demo recordings keep their pacing.
+        """
+        if not self.profile.page_scroll:
+            return True
+        try:
+            self.pause(pause, "demo pacing")
+            page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
+            viewport_height = self.driver.execute_script("return window.innerHeight")
+            if page_height <= viewport_height:
+                return True
+            increment = viewport_height * step if step else page_height
+            current_scroll = 0
+            while current_scroll < page_height:
+                current_scroll += increment
+                self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
+                self.pause(pause, "demo pacing")
+            if scroll_back:
+                while current_scroll > 0:
+                    current_scroll = max(current_scroll - increment, 0)
+                    self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
+                    self.pause(pause, "demo pacing")
+            else:
+                self.driver.execute_script("window.scrollTo(0, 0);")
+                self.pause(pause, "demo pacing")
+            return True
+        except Exception as e:
+            print(f"    ⚠ Could not scroll through page: {e}")
+            return False
+    
+    @traced("scroll")
     def scroll_to_element(self, element):
-        """Scroll element into view using JavaScript"""
+        """Scroll element into view using JavaScript (fast profile: only when it is off-screen, without animation)"""
+        if not self.profile.smooth_scroll:
+            try:
+                if not self.driver.execute_script(IN_VIEWPORT_SCRIPT, element):
+                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center', inline: 'nearest'});", element)
+                return True
+            except Exception:
+                return False
         try:
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center', inline: 'nearest'});", element)
-            time.sleep(ACTION_DELAY * 0.2)
+            self.settle(ACTION_DELAY * 0.2)
             return True
-        except:
+        except Exception:
             try:
                 # Fallback to simple scroll
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(ACTION_DELAY * 0.2)
+                self.settle(ACTION_DELAY * 0.2)
                 return True
-            except:
+            except Exception:
                 return False
     
+    @contextmanager
+    def measure_interaction(self, helper, description):
+        """Time how the app responds to the interaction dispatched in the body (--interaction-stats only)"""
+        armed = False
+        if self.options.interaction_stats:
+            try:
+                self.driver.execute_script(INTERACTION_START_SCRIPT)
+                armed = True
+            except Exception:
+                pass
+        yield
+        if not armed:
+            return
+        try:
+            result = self.driver.execute_async_script(
+                INTERACTION_RESULT_SCRIPT, list(POLLING_ROUTES), INTERACTION_QUIET_MS,
+                int(min(INTERACTION_TIMEOUT, SCRIPT_TIMEOUT - 1) * 1000)
+            )
+        except Exception:
+            return
+        if result:
+            self.interactions.append(Interaction(helper, description or "(no description)", result["paint"],
+                                                 result["dom"], result["api"], result["requests"], result["timed_out"]))
+    
+    def interaction_summary(self):
+        """Count and p50/p75/p90/max of the time until paint, DOM and API calls all finished, per description"""
+        by_description = {}
+        for interaction in self.interactions:
+            by_description.setdefault(interaction.description, []).append(interaction)
+        summary = {}
+        for description, samples in by_description.items():
+            totals = [max(sample.paint or 0, sample.dom, sample.api or 0) for sample in samples]
+            paints = [sample.paint for sample in samples if sample.paint is not None]
+            apis = [sample.api for sample in samples if sample.api is not None]
+            summary[description] = {
+                "helper": samples[0].helper,
+                "count": len(samples),
+                "timed_out": sum(1 for sample in samples if sample.timed_out),
+                "total_ms": {"p50": percentile(totals, 0.5), "p75": percentile(totals, 0.75),
+                             "p90": percentile(totals, 0.9), "max": max(totals)},
+                "paint_p75_ms": percentile(paints, 0.75) if paints else None,
+                "api_p75_ms": percentile(apis, 0.75) if apis else None,
+                "requests": sum(sample.requests for sample in samples),
+            }
+        return summary
+    
+    def report_interactions(self, top=25):
+        """Print the slowest interactions (p75 of time until paint, DOM and API calls all finished) and save them all"""
+        ranked = sorted(self.interaction_summary().items(), key=lambda item: -item[1]["total_ms"]["p75"])
+        try:
+            with open(INTERACTION_REPORT, "w") as f:
+                json.dump({"saved_at": datetime.now().isoformat(), "interactions": dict(ranked)}, f, indent=2)
+        except Exception as e:
+            print(f"Could not write {INTERACTION_REPORT}: {e}")
+        print(f"\nSLOWEST INTERACTIONS (time until painted, DOM settled and API calls done; top {top})")
+        print(f"  {'interaction':<45} {'count':>5} {'p50':>7} {'p75':>7} {'p90':>7} {'max':>7} {'paint':>7} {'api':>7}")
+        for description, stats in ranked[:top]:
+            total = stats["total_ms"]
+            paint = f"{stats['paint_p75_ms']:.0f}" if stats["paint_p75_ms"] is not None else "-"
+            api = f"{stats['api_p75_ms']:.0f}" if stats["api_p75_ms"] is not None else "-"
+            print(f"  {description[:45]:<45} {stats['count']:>5} {total['p50']:>7.0f} {total['p75']:>7.0f} "
+                  f"{total['p90']:>7.0f} {total['max']:>7.0f} {paint:>7} {api:>7}")
+        print(f"  {len(self.interactions)} interactions measured, saved to {INTERACTION_REPORT} (ms; paint/api are p75)")
+    
+    @traced("click")
     def safe_click_element(self, element, description=""):
         """Click an element with scrolling and fallback to JS click"""
         try:
             self.scroll_to_element(element)
             # Wait a bit for scroll to complete
-            time.sleep(ACTION_DELAY * 0.2)
-            try:
-                element.click()
-            except:
-                # Fallback to JavaScript click
-                self.driver.execute_script("arguments[0].click();", element)
-            time.sleep(ACTION_DELAY * 0.3)
+            self.settle(ACTION_DELAY * 0.2)
+            with self.measure_interaction("safe_click_element", description):
+                try:
+                    element.click()
+                except Exception:
+                    # Fallback to JavaScript click
+                    self.driver.execute_script("arguments[0].click();", element)
+            self.settle(ACTION_DELAY * 0.3)
             return True
         except Exception as e:
             print(f"Failed to click element: {description} - {e}")
             return False
     
+    @traced("form")
     def safe_send_keys_element(self, element, text, description=""):
         """Send keys to an element with scrolling"""
         try:
             self.scroll_to_element(element)
-            time.sleep(ACTION_DELAY * 0.2)
+            self.settle(ACTION_DELAY * 0.2)
             element.clear()
             element.click()  # Focus
-            time.sleep(ACTION_DELAY * 0.1)
+            self.settle(ACTION_DELAY * 0.1)
             element.send_keys(text)
-            time.sleep(ACTION_DELAY * 0.3)
+            self.settle(ACTION_DELAY * 0.3)
             return True
         except Exception as e:
             print(f"Failed to send keys to element: {description} - {e}")
             return False
     
+    @traced("click")
     def safe_click(self, by, value, description=""):
         try:
             element = self.wait.until(EC.element_to_be_clickable((by, value)))
@@ -151,11 +1405,12 @@ class StrandsTestSuite:
             # Ensure element is still clickable after scroll
             element = self.wait.until(EC.element_to_be_clickable((by, value)))
             # Use JavaScript click as fallback if regular click fails
-            try:
-                element.click()
-            except:
-                self.driver.execute_script("arguments[0].click();", element)
-            time.sleep(ACTION_DELAY)
+            with self.measure_interaction("safe_click", description or value):
+                try:
+                    element.click()
+                except Exception:
+                    self.driver.execute_script("arguments[0].click();", element)
+            self.settle(ACTION_DELAY)
             print(f"Clicked: {description or value}")
             return True
         except TimeoutException:
@@ -167,13 +1422,14 @@ class StrandsTestSuite:
                 element = self.driver.find_element(by, value)
                 self.scroll_to_element(element)
                 self.driver.execute_script("arguments[0].click();", element)
-                time.sleep(ACTION_DELAY)
+                self.settle(ACTION_DELAY)
                 print(f"Clicked (via JS): {description or value}")
                 return True
-            except:
+            except Exception:
                 print(f"Failed to click: {description or value} - {e}")
                 return False
     
+    @traced("form")
     def safe_send_keys(self, by, value, text, description=""):
         try:
             element = self.wait.until(EC.presence_of_element_located((by, value)))
@@ -183,9 +1439,10 @@ class StrandsTestSuite:
             element = self.wait.until(EC.presence_of_element_located((by, value)))
             element.clear()
             element.click()  # Focus the element
-            time.sleep(ACTION_DELAY * 0.2)
-            element.send_keys(text)
-            time.sleep(ACTION_DELAY * 0.5)
+            self.settle(ACTION_DELAY * 0.2)
+            with self.measure_interaction("safe_send_keys", description or value):
+                element.send_keys(text)
+            self.settle(ACTION_DELAY * 0.5)
             print(f"Entered text in: {description or value}")
             return True
         except TimeoutException:
@@ -224,7 +1481,7 @@ class StrandsTestSuite:
                         EC.element_to_be_clickable((By.ID, button_id))
                     )
                     self.scroll_to_element(submit_button)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     submit_button.click()
                     print(f"    ✓ Clicked loyalty submit button ({button_id})")
                     try:
@@ -232,7 +1489,7 @@ class StrandsTestSuite:
                             EC.element_to_be_clickable((By.ID, "loyalty-settings-success-ok-button"))
                         )
                         self.scroll_to_element(ok_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         ok_button.click()
                         print("    ✓ Confirmed loyalty settings success modal")
                     except Exception as modal_error:
@@ -251,160 +1508,33 @@ class StrandsTestSuite:
     def send_individual_promotion(self, email, discount_pct, expiration_days=7):
         """Send a promotion to a specific customer.
         
-        The expiration date must be entered in MM/DD/YYYY format (e.g., 02/02/2026).
+        The promotion expires `expiration_days` from today (the input has
+        min=today, so a past date would block the submit). It is an HTML5 date
+        input, so the date is set in its native YYYY-MM-DD format.
         """
         try:
-            email_input = self.wait.until(EC.presence_of_element_located((By.ID, "promotion-email-input")))
-            discount_input = self.wait.until(EC.presence_of_element_located((By.ID, "promotion-discount-input")))
             expiration_input = self.wait.until(EC.presence_of_element_located((By.ID, "promotion-expiration-input")))
 
             # HTML5 date inputs expect YYYY-MM-DD format internally, even though they may display as MM/DD/YYYY
-            expiration_value_native = "2026-02-02"  # Native format for HTML5 date input
-
-            # Fill email and discount fields and ensure React state updates
-            self.safe_send_keys_element(email_input, email, "Promotion email")
-            
-            # Fill discount and trigger React events to ensure state updates
-            discount_input.clear()
-            time.sleep(0.2)
-            discount_input.send_keys(str(discount_pct))
-            time.sleep(0.2)
-            # Trigger React onChange for discount
-            self.driver.execute_script(
-                "arguments[0].dispatchEvent(new Event('input', {bubbles: true})); arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
-                discount_input
-            )
-            time.sleep(0.3)
-            print(f"    ✓ Set discount percentage to {discount_pct}%")
-            
-            # Set expiration date using calendar picker - interact with the calendar popup
-            # Target date: February 2, 2026 (MM/DD/YYYY = 02/02/2026)
-            print("    Setting expiration date using calendar picker (02/02/2026)...")
-            self.scroll_to_element(expiration_input)
-            time.sleep(0.3)
-            
-            # Clear the field first
-            expiration_input.clear()
-            time.sleep(0.2)
-            
-            # Click the input to open the calendar picker (this is what the user requested)
-            expiration_input.click()
-            time.sleep(0.5)
-            
-            # HTML5 date inputs display in MM/DD/YYYY format but internally use YYYY-MM-DD
-            # We'll type in MM/DD/YYYY format as the user requested, character by character
-            # Then ensure React state updates properly
-            date_set = False
-            
-            try:
-                # Type the date in MM/DD/YYYY format (as displayed in UI)
-                # The browser should parse this and convert it internally
-                expiration_input.send_keys("02")
-                time.sleep(0.1)
-                expiration_input.send_keys("/")
-                time.sleep(0.1)
-                expiration_input.send_keys("02")
-                time.sleep(0.1)
-                expiration_input.send_keys("/")
-                time.sleep(0.1)
-                expiration_input.send_keys("2026")
-                time.sleep(0.5)
-                
-                # Trigger React events to ensure state updates properly
-                self.driver.execute_script(
-                    """
-                    var input = arguments[0];
-                    // Trigger input event for React onChange
-                    var inputEvent = new Event('input', { bubbles: true, cancelable: true });
-                    input.dispatchEvent(inputEvent);
-                    
-                    // Trigger change event for React onChange
-                    var changeEvent = new Event('change', { bubbles: true, cancelable: true });
-                    input.dispatchEvent(changeEvent);
-                    
-                    // Also ensure the value is properly set if browser didn't parse MM/DD/YYYY
-                    // Set native format as fallback
-                    if (!input.value || input.value === '') {
-                        input.value = '2026-02-02';
-                        input.dispatchEvent(inputEvent);
-                        input.dispatchEvent(changeEvent);
-                    }
-                    """,
-                    expiration_input
-                )
-                time.sleep(0.5)
-                
-                # Verify the field has a value
-                field_value = expiration_input.get_attribute("value")
-                if field_value and field_value.strip():
-                    print(f"    ✓ Promotion expiration date set successfully (field value: {field_value})")
-                    date_set = True
-                else:
-                    # Fallback: Set using native YYYY-MM-DD format via JavaScript
-                    print("    ⚠ MM/DD/YYYY input didn't set value, using JavaScript fallback...")
-                    self.driver.execute_script(
-                        """
-                        var input = arguments[0];
-                        input.value = '2026-02-02';
-                        input.dispatchEvent(new Event('input', { bubbles: true }));
-                        input.dispatchEvent(new Event('change', { bubbles: true }));
-                        """,
-                        expiration_input
-                    )
-                    time.sleep(0.5)
-                    field_value = expiration_input.get_attribute("value")
-                    if field_value:
-                        print(f"    ✓ Set expiration date via JavaScript fallback (value: {field_value})")
-                        date_set = True
-                        
-            except Exception as e:
-                print(f"    ⚠ Error setting date: {e}, trying JavaScript fallback...")
-                try:
-                    # Final fallback: Direct JavaScript setting
-                    self.driver.execute_script(
-                        """
-                        var input = arguments[0];
-                        input.value = '2026-02-02';
-                        input.dispatchEvent(new Event('input', { bubbles: true }));
-                        input.dispatchEvent(new Event('change', { bubbles: true }));
-                        """,
-                        expiration_input
-                    )
-                    time.sleep(0.5)
-                    field_value = expiration_input.get_attribute("value")
-                    if field_value:
-                        print(f"    ✓ Set expiration date via final fallback (value: {field_value})")
-                        date_set = True
-                except Exception as fallback_error:
-                    print(f"    ⚠ All methods failed: {fallback_error}")
-            
-            if not date_set:
-                print("    ⚠ WARNING: Could not set expiration date. Continuing anyway...")
+            expiration_date = date.today() + timedelta(days=expiration_days)
+            expiration_value_native = expiration_date.isoformat()
 
-            # Final verification - check that both required fields have values in React state
-            # Check discount first
-            final_discount_value = discount_input.get_attribute("value")
-            if not final_discount_value or final_discount_value.strip() == "":
-                print(f"    ⚠ ERROR: Discount percentage is still empty in DOM before sending. Cannot proceed.")
-                return False
-            print(f"    ✓ Final verification: Discount percentage is set (value: {final_discount_value})")
-            
-            # Check expiration date
-            final_expiration_value = expiration_input.get_attribute("value")
-            if not final_expiration_value or final_expiration_value.strip() == "":
-                print(f"    ⚠ ERROR: Expiration date is still empty in DOM before sending. Cannot proceed.")
+            # Email, discount and expiration date in one call; fill_form verifies each value took
+            print(f"    Setting promotion for {email}: {discount_pct}% off, expires {expiration_date.strftime('%m/%d/%Y')}...")
+            if not self.fill_form({
+                "promotion-email-input": email,
+                "promotion-discount-input": str(discount_pct),
+                "promotion-expiration-input": expiration_value_native,
+            }, "promotion form"):
+                print("    ⚠ ERROR: Promotion form fields did not take their values. Cannot proceed.")
                 return False
-            
-            print(f"    ✓ Final verification: Expiration date is set in DOM (value: {final_expiration_value})")
-            # Wait a bit more to ensure React state has fully updated for both fields
-            time.sleep(0.5)
 
             # Submit the form by pressing Enter in the expiration field
             print("    Submitting promotion form by pressing Enter in expiration field...")
             expiration_input.click()  # Ensure field is focused
-            time.sleep(0.2)
+            self.settle(0.2)
             expiration_input.send_keys(Keys.ENTER)
-            time.sleep(0.5)
+            self.settle(0.5)
             print("    ✓ Submitted promotion form via Enter key")
 
             try:
@@ -412,7 +1542,7 @@ class StrandsTestSuite:
                     EC.element_to_be_clickable((By.ID, "promotion-success-ok-button"))
                 )
                 self.scroll_to_element(ok_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 ok_button.click()
                 print("    ✓ Confirmed promotion success modal")
             except Exception as modal_error:
@@ -427,7 +1557,7 @@ class StrandsTestSuite:
         try:
             reminder_button = self.wait.until(EC.element_to_be_clickable((By.ID, "send-reminders-button")))
             self.scroll_to_element(reminder_button)
-            time.sleep(0.2)
+            self.settle(0.2)
             reminder_button.click()
             print("    ✓ Clicked Send Reminders button")
             try:
@@ -435,7 +1565,7 @@ class StrandsTestSuite:
                     EC.element_to_be_clickable((By.ID, "promotion-reminder-success-ok-button"))
                 )
                 self.scroll_to_element(ok_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 ok_button.click()
                 print("    ✓ Confirmed reminder success modal")
             except Exception as modal_error:
@@ -451,7 +1581,7 @@ class StrandsTestSuite:
         try:
             inbox_button = self.wait.until(EC.element_to_be_clickable((By.ID, "user-inbox-button")))
             self.scroll_to_element(inbox_button)
-            time.sleep(0.2)
+            self.settle(0.2)
             inbox_button.click()
             print("    ✓ Opened notification inbox")
             inbox_opened = True
@@ -478,7 +1608,7 @@ class StrandsTestSuite:
                 try:
                     close_button = self.wait.until(EC.element_to_be_clickable((By.ID, "notification-inbox-close-button")))
                     self.scroll_to_element(close_button)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     close_button.click()
                     WebDriverWait(self.driver, 5).until_not(
                         EC.visibility_of_element_located((By.ID, "notification-inbox-panel"))
@@ -495,93 +1625,94 @@ class StrandsTestSuite:
         try:
             promo_input = self.wait.until(EC.presence_of_element_located((By.ID, "promo-code-input")))
             self.scroll_to_element(promo_input)
-            time.sleep(0.2)
+            self.settle(0.2)
             promo_input.clear()
             promo_input.send_keys(self.latest_promo_code)
             print(f"    ✓ Entered promo code: {self.latest_promo_code}")
             
-            # Wait for debounce (500ms) + validation time
-            time.sleep(1.5)  # Give time for debounce and API call
+            # The old 1.5s sleep covered the debounce plus the validation call; only the
+            # debounce is invisible to the page, the validation result is awaited below
+            self.pause(PROMO_CODE_DEBOUNCE, "promo code debounce (PaymentPage.jsx)")
             
             # Wait for success message using ID
             WebDriverWait(self.driver, 10).until(
                 EC.visibility_of_element_located((By.ID, "promo-code-success-message"))
             )
             print("    ✓ Promo code applied successfully")
-            time.sleep(1)
+            self.settle(1)
             return True
         except Exception as e:
             print(f"    ⚠ Failed to apply promo code: {e}")
             return False
 
     def perform_loyalty_and_promotion_updates(self):
-        """Logout user, update loyalty/promo settings as owner, send promotion/reminders, capture code"""
+        """Update loyalty/promo settings in the owner's browser, then capture the promo code as the user"""
         try:
             if not self.user_email:
                 print("  ⚠ No user email stored; skipping loyalty/promotion updates")
                 return False
             print("\nSwitching to owner to update loyalty program and promotions...")
-            self.logout()
-            if not self.login(self.owner_email, self.owner_password, "Owner (for loyalty updates)"):
-                return False
-
-            # Navigate to loyalty tab
-            self.navigate_and_scroll(f"{BASE_URL}/owner/loyalty")
-            time.sleep(1)
-
-            # Ensure loyalty program subtab is active
-            try:
-                program_tab = self.wait.until(EC.element_to_be_clickable((By.ID, "loyalty-subtab-loyalty-program-button")))
-                self.scroll_to_element(program_tab)
-                time.sleep(0.2)
-                program_tab.click()
-                time.sleep(1)
-            except Exception as e:
-                print(f"    ⚠ Could not click loyalty program subtab: {e}")
-
-            self.configure_loyalty_program(
-                target_visits=4,
-                discount_pct=40,
-                description="Updated automation reward: 40% off any service after 4 visits",
-                preferred_button_id="update-loyalty-settings-button"
-            )
-
-            # Switch to promotions subtab
-            try:
-                promotions_tab = self.wait.until(EC.element_to_be_clickable((By.ID, "loyalty-subtab-promotions-button")))
-                self.scroll_to_element(promotions_tab)
-                time.sleep(0.2)
-                promotions_tab.click()
-                time.sleep(1)
-            except Exception as e:
-                print(f"    ⚠ Could not click promotions subtab: {e}")
-
-            # Send promotion to the current user
-            if self.user_email:
-                self.send_individual_promotion(
-                    email=self.user_email,
-                    discount_pct=15,
-                    expiration_days=10
-                )
-            else:
-                print("    ⚠ No user email available to send promotion")
-
-            # Send reminders to all customers with unused offers
-            self.send_unused_offer_reminders()
-
-            # Logout owner and log back into user account
-            self.logout()
-            if not self.login(self.user_email, self.user_password, "User (after promotions)"):
-                return False
-
+            with self.as_role("owner"):
+                self.update_loyalty_and_send_promotions()
+            
+            # Back on the user's browser; reload so the inbox picks up the new promotion
+            self.navigate_and_scroll(f"{BASE_URL}/dashboard", reload=True)
+            
             # Capture latest promo code from inbox for second booking
-            time.sleep(2)
+            self.settle(2)
             self.capture_latest_promo_code_from_inbox()
             return True
         except Exception as e:
             print(f"  ⚠ Error while performing loyalty/promotion updates: {e}")
             return False
+    
+    def update_loyalty_and_send_promotions(self):
+        """As the owner: raise the loyalty reward, send the user a promotion and remind unused offers"""
+        # Navigate to loyalty tab
+        self.navigate_and_scroll(f"{BASE_URL}/owner/loyalty")
+        self.settle(1)
+
+        # Ensure loyalty program subtab is active
+        try:
+            program_tab = self.wait.until(EC.element_to_be_clickable((By.ID, "loyalty-subtab-loyalty-program-button")))
+            self.scroll_to_element(program_tab)
+            self.settle(0.2)
+            program_tab.click()
+            self.settle(1)
+        except Exception as e:
+            print(f"    ⚠ Could not click loyalty program subtab: {e}")
+
+        self.configure_loyalty_program(
+            target_visits=4,
+            discount_pct=40,
+            description="Updated automation reward: 40% off any service after 4 visits",
+            preferred_button_id="update-loyalty-settings-button"
+        )
+
+        # Switch to promotions subtab
+        try:
+            promotions_tab = self.wait.until(EC.element_to_be_clickable((By.ID, "loyalty-subtab-promotions-button")))
+            self.scroll_to_element(promotions_tab)
+            self.settle(0.2)
+            promotions_tab.click()
+            self.settle(1)
+        except Exception as e:
+            print(f"    ⚠ Could not click promotions subtab: {e}")
+
+        # Send promotion to the current user
+        if self.user_email:
+            self.send_individual_promotion(
+                email=self.user_email,
+                discount_pct=15,
+                expiration_days=10
+            )
+        else:
+            print("    ⚠ No user email available to send promotion")
 
+        # Send reminders to all customers with unused offers
+        self.send_unused_offer_reminders()
+
+    @traced("wait")
     def wait_for_element(self, by, value, description="", timeout=None):
         """Wait for element with optional custom timeout"""
         try:
@@ -599,6 +1730,55 @@ class StrandsTestSuite:
             print(f"Error waiting for element {description or value}: {e}")
             return False
     
+    @traced("wait")
+    def expect_elements(self, locators, require="present", timeout=None):
+        """Check or wait for many elements in a single WebDriver call.
+        
+        `locators` maps a name to (By, value) or to a plain element id. Waits up to
+        `timeout` seconds (default WAIT_TIMEOUT, 0 checks once) until every element
+        is `require` ("present", "visible" or "enabled") and returns
+        {name: {"present", "visible", "enabled", "element"}}; "element" is None
+        when nothing matched.
+        """
+        timeout = WAIT_TIMEOUT if timeout is None else min(timeout, SCRIPT_TIMEOUT - 1)
+        batch = {}
+        for name, locator in locators.items():
+            by, value = (By.ID, locator) if isinstance(locator, str) else locator
+            if by not in BATCH_LOCATOR_KINDS:
+                raise ValueError(f"expect_elements does not support locator strategy {by!r}")
+            batch[name] = [BATCH_LOCATOR_KINDS[by], value]
+        return self.driver.execute_async_script(EXPECT_ELEMENTS_SCRIPT, batch, require, int(timeout * 1000))
+    
+    @traced("form")
+    def fill_form(self, values, description="form"):
+        """Fill many controlled inputs in one round trip.
+        
+        `values` maps element ids to the value to enter (True/False for checkboxes).
+        React state is updated through the native value setter and input/change
+        events; every field is read back afterwards and any that did not take
+        its value is reported. Returns True when all fields hold their values.
+        """
+        results = self.driver.execute_async_script(FILL_FORM_SCRIPT, values)
+        failed = [element_id for element_id, result in results.items() if not result["ok"]]
+        for element_id in failed:
+            actual = results[element_id]["value"]
+            if actual is None:
+                print(f"    ⚠ {description}: field '{element_id}' not found")
+            else:
+                print(f"    ⚠ {description}: field '{element_id}' is {actual!r}, expected {values[element_id]!r}")
+        if not failed:
+            print(f"    ✓ Filled {description} ({len(values)} fields)")
+        return not failed
+    
+    def get_elements(self, locators, require="present", timeout=None):
+        """expect_elements() that returns {name: element} and raises TimeoutException if any is missing"""
+        found = self.expect_elements(locators, require, timeout)
+        missing = [name for name, info in found.items() if not info[require]]
+        if missing:
+            raise TimeoutException(f"Elements not {require}: {', '.join(missing)}")
+        return {name: info["element"] for name, info in found.items()}
+    
+    @traced("auth")
     def logout(self):
         """Logout - reliable with cookie/localStorage clearing"""
         try:
@@ -616,7 +1796,7 @@ class StrandsTestSuite:
                 if logout_buttons:
                     # Scroll to button first
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", logout_buttons[0])
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     
                     # Wait for button to be clickable
                     logout_btn = WebDriverWait(self.driver, 3).until(
@@ -626,19 +1806,19 @@ class StrandsTestSuite:
                     # Try regular click first
                     try:
                         logout_btn.click()
-                    except:
+                    except Exception:
                         # Fallback to JS click
                         self.driver.execute_script("arguments[0].click();", logout_btn)
                     
                     # Wait for logout to process and redirect
-                    time.sleep(0.3)
+                    self.settle(0.3)
                     
                     # Clear cookies and localStorage
                     try:
                         self.driver.delete_all_cookies()
                         self.driver.execute_script("window.localStorage.clear();")
                         self.driver.execute_script("window.sessionStorage.clear();")
-                    except:
+                    except Exception:
                         pass
                     
                     print("Logged out successfully")
@@ -652,25 +1832,90 @@ class StrandsTestSuite:
             # Fallback: Navigate to home and clear session
             try:
                 self.driver.get(f"{BASE_URL}/")
-                time.sleep(0.5)
+                self.settle(0.5)
                 
                 # Clear cookies and localStorage
                 try:
                     self.driver.delete_all_cookies()
                     self.driver.execute_script("window.localStorage.clear();")
                     self.driver.execute_script("window.sessionStorage.clear();")
-                except:
+                    # Reload so the app drops the signed-in user it still holds in memory
+                    # (later navigations are client-side and would not re-read storage)
+                    self.driver.refresh()
+                except Exception:
                     pass
                 
                 print("Session cleared (navigated to home)")
-            except:
+            except Exception:
                 pass
             return True
         except Exception as e:
             # Silently fail - don't crash tests
             return True
     
-    def login(self, email, password, role_description):
+    def fetch_auth_token(self, email, password):
+        """Sign in against the backend API and return the token plus the user_data the app stores"""
+        import urllib.request
+        body = json.dumps({"email": email, "password": password}).encode()
+        req = urllib.request.Request(f"{BACKEND_URL}/user/login", data=body, method='POST',
+                                     headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=5) as response:
+            data = json.load(response)["data"]
+        return {
+            "token": data["token"],
+            "user_data": {
+                "user_id": data["user_id"],
+                "full_name": data["full_name"],
+                "role": data["role"],
+                "email": email,
+            },
+        }
+    
+    @traced("auth")
+    def api_login(self, email, password, role_description):
+        """Inject a backend-issued token into the browser instead of driving the login form"""
+        try:
+            auth = self.auth_tokens.get(email)
+            if not auth:
+                auth = self.fetch_auth_token(email, password)
+                self.auth_tokens[email] = auth
+            # Storage is per origin, so a page from the app has to be loaded first
+            if not self.driver.current_url.startswith(BASE_URL):
+                self.driver.get(BASE_URL)
+            # Same keys AuthContext.login writes; the app reads them back on the next load
+            self.driver.execute_script(
+                "window.localStorage.setItem('auth_token', arguments[0]);"
+                "window.localStorage.setItem('user_data', JSON.stringify(arguments[1]));"
+                "document.cookie = 'auth_token=' + arguments[0] + '; path=/; max-age=' + (7 * 24 * 60 * 60);",
+                auth["token"], auth["user_data"],
+            )
+            self.navigate_and_scroll(f"{BASE_URL}/dashboard", reload=True)
+            if self.current_session_email() == email and "/login" not in self.driver.current_url:
+                print(f"Successfully logged in as {role_description} (token injected)")
+                return True
+            # Token rejected (e.g. expired) - drop it so the next attempt fetches a new one
+            self.auth_tokens.pop(email, None)
+        except Exception as e:
+            print(f"Fast login failed for {role_description}: {e}")
+        return False
+    
+    @traced("auth")
+    def login(self, email, password, role_description, ui=False):
+        """Sign in as a user. With --fast-auth the form is skipped unless `ui` is set (tests that cover login itself)"""
+        if self.options.fast_auth and not ui:
+            print(f"Logging in as {role_description}...")
+            if self.api_login(email, password, role_description):
+                self.save_session(email)
+                return True
+            print("Falling back to the login form...")
+        if self.submit_login(email, password, role_description):
+            self.save_session(email)
+            return True
+        return False
+    
+    @traced("auth")
+    def submit_login(self, email, password, role_description):
+        """Sign in through the login form and return True once the app redirects away from /login"""
         print(f"Logging in as {role_description}...")
         self.navigate_and_scroll(f"{BASE_URL}/login")
         
@@ -686,7 +1931,7 @@ class StrandsTestSuite:
             )
             
             # Additional wait for redirect to complete
-            time.sleep(0.3)
+            self.settle(0.3)
             
             # Check URL after login
             current_url = self.driver.current_url
@@ -767,21 +2012,22 @@ class StrandsTestSuite:
             print(f"Error converting time {time_12h}: {e}")
             return time_12h
     
+    @traced("wait")
     def wait_for_modal(self, timeout=4):
         """Wait for confirmation modal to appear"""
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            modal = wait.until(EC.any_of(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'fixed') and contains(@class, 'inset-0')]")),
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'z-50') and contains(@class, 'fixed')]")),
-                EC.presence_of_element_located((By.XPATH, "//div[@role='dialog']"))
-            ))
-            time.sleep(0.2)  # Wait for modal animation
-            return True
-        except:
-            return False
+        # Modal present and done rendering/animating in
+        return self.wait_for_dom_stable(
+            quiet_ms=200,
+            required_selectors=[
+                "//div[contains(@class, 'fixed') and contains(@class, 'inset-0')] | "
+                "//div[contains(@class, 'z-50') and contains(@class, 'fixed')] | "
+                "//div[@role='dialog']"
+            ],
+            timeout=timeout,
+        )
     
-    def click_modal_confirm(self, timeout=4):
+    @traced("click")
+    def click_modal_confirm(self, timeout=4, description=""):
         """Click the confirm button in a modal"""
         try:
             wait = WebDriverWait(self.driver, timeout)
@@ -800,13 +2046,14 @@ class StrandsTestSuite:
                 
                 if visible_buttons:
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", visible_buttons[0])
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     clickable_btn = wait.until(EC.element_to_be_clickable(visible_buttons[0]))
-                    try:
-                        clickable_btn.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", clickable_btn)
-                    time.sleep(0.3)
+                    with self.measure_interaction("click_modal_confirm", description or f"Modal {clickable_btn.text.strip()}"):
+                        try:
+                            clickable_btn.click()
+                        except Exception:
+                            self.driver.execute_script("arguments[0].click();", clickable_btn)
+                    self.settle(0.3)
                     return True
             except TimeoutException:
                 pass
@@ -823,32 +2070,34 @@ class StrandsTestSuite:
                 btn_text = btn.text.strip().lower()
                 if 'cancel' not in btn_text and btn.is_enabled():
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                    time.sleep(0.2)
-                    try:
-                        btn.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", btn)
-                    time.sleep(0.3)
+                    self.settle(0.2)
+                    with self.measure_interaction("click_modal_confirm", description or f"Modal {btn.text.strip()}"):
+                        try:
+                            btn.click()
+                        except Exception:
+                            self.driver.execute_script("arguments[0].click();", btn)
+                    self.settle(0.3)
                     return True
             return False
         except Exception as e:
             print(f"Modal confirm click failed: {e}")
             return False
     
+    @traced("click")
     def select_select_dropdown(self, element_id, option_text):
         """Helper method to handle Radix UI Select dropdowns (like role selector)"""
         try:
             # Find the SelectTrigger by ID
             select_trigger = self.wait.until(EC.element_to_be_clickable((By.ID, element_id)))
             self.scroll_to_element(select_trigger)
-            time.sleep(0.2)
+            self.settle(0.2)
             
             # Click to open the dropdown
             try:
                 select_trigger.click()
-            except:
+            except Exception:
                 self.driver.execute_script("arguments[0].click();", select_trigger)
-            time.sleep(0.5)  # Wait for dropdown to open
+            self.settle(0.5)  # Wait for dropdown to open
             
             # Wait for SelectContent to appear and find the option
             option_selectors = [
@@ -865,19 +2114,19 @@ class StrandsTestSuite:
                         EC.element_to_be_clickable((By.XPATH, selector))
                     )
                     self.scroll_to_element(option)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     
                     # Click the option
                     try:
                         option.click()
-                    except:
+                    except Exception:
                         self.driver.execute_script("arguments[0].click();", option)
                     
-                    time.sleep(0.3)  # Wait for selection to register
+                    self.settle(0.3)  # Wait for selection to register
                     print(f"Selected role: {option_text}")
                     option_found = True
                     break
-                except:
+                except Exception:
                     continue
             
             if not option_found:
@@ -889,6 +2138,7 @@ class StrandsTestSuite:
             print(f"Failed to select from dropdown {element_id}: {e}")
             return False
     
+    @traced("click")
     def select_strands_select(self, option_text, element_id=None, dropdown_index=None):
         """Helper method to handle StrandsSelect custom dropdowns - uses ID to find button"""
         try:
@@ -913,15 +2163,15 @@ class StrandsTestSuite:
             
             # Scroll to button and ensure it's visible
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", select_trigger)
-            time.sleep(0.3)
+            self.settle(0.3)
             
             # Click to open dropdown
             print(f"    Clicking dropdown button to open options...")
             try:
                 select_trigger.click()
-            except:
+            except Exception:
                 self.driver.execute_script("arguments[0].click();", select_trigger)
-                time.sleep(0.3)  # Wait for dropdown to open
+                self.settle(0.3)  # Wait for dropdown to open
             
             # Find the option by text (StrandsSelect uses divs with cursor-pointer class inside the dropdown)
             print(f"    Looking for option: {option_text}")
@@ -940,14 +2190,15 @@ class StrandsTestSuite:
                         EC.element_to_be_clickable((By.XPATH, selector))
                     )
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", option)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     
                     # Click the option
-                    try:
-                        option.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", option)
-                        time.sleep(0.1)  # Wait for selection to register
+                    with self.measure_interaction("select_strands_select", f"{element_id or 'Dropdown'}: {option_text}"):
+                        try:
+                            option.click()
+                        except Exception:
+                            self.driver.execute_script("arguments[0].click();", option)
+                    self.settle(0.1)  # Wait for selection to register
                     print(f"    ✓ Selected option: {option_text}")
                     option_found = True
                     break
@@ -985,18 +2236,19 @@ class StrandsTestSuite:
         print("TEST 1: Login Page Loads")
         print("="*70)
         try:
-            self.navigate_and_scroll(f"{BASE_URL}/login")
+            # Cold load on purpose: this test is about the login page loading
+            self.navigate_and_scroll(f"{BASE_URL}/login", reload=True)
             
-            # Check for email input
-            email_found = self.wait_for_element(By.ID, "login-email", "Email input")
+            # Check for email input, password input and submit button in one call
+            fields = self.expect_elements({
+                "Email input": (By.ID, "login-email"),
+                "Password input": (By.ID, "login-password"),
+                "Submit button": (By.XPATH, "//button[@type='submit' and contains(text(), 'Sign In')]"),
+            }, require="visible")
+            for description, info in fields.items():
+                print(f"Found: {description}" if info["present"] else f"Element not found: {description}")
             
-            # Check for password input
-            password_found = self.wait_for_element(By.ID, "login-password", "Password input")
-            
-            # Check for submit button
-            submit_found = self.wait_for_element(By.XPATH, "//button[@type='submit' and contains(text(), 'Sign In')]", "Submit button")
-            
-            if email_found and password_found and submit_found:
+            if all(info["visible"] for info in fields.values()):
                 print("PASS: Login page loaded successfully with all required fields")
                 return True
             else:
@@ -1018,7 +2270,7 @@ class StrandsTestSuite:
         print("="*70)
         try:
             self.driver.get(f"{BASE_URL}/login")
-            time.sleep(ACTION_DELAY)
+            self.settle(ACTION_DELAY)
             
             # First, test empty fields validation
             print("Testing empty fields validation...")
@@ -1028,14 +2280,14 @@ class StrandsTestSuite:
                 password_input = self.driver.find_element(By.ID, "login-password")
                 email_input.clear()
                 password_input.clear()
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 # Click Sign In button with empty fields
                 sign_in_button = self.driver.find_element(By.XPATH, "//button[@type='submit' and contains(text(), 'Sign In')]")
                 self.scroll_to_element(sign_in_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 sign_in_button.click()
-                time.sleep(ACTION_DELAY * 2)  # Wait for validation to appear
+                self.settle(ACTION_DELAY * 2)  # Wait for validation to appear
                 
                 # Check for validation error messages
                 empty_field_error = False
@@ -1056,7 +2308,7 @@ class StrandsTestSuite:
                         if "/login" in self.driver.current_url:
                             print("  ✓ Empty fields prevented form submission (stayed on login page)")
                             empty_field_error = True
-                except:
+                except Exception:
                     pass
                 
                 if not empty_field_error:
@@ -1067,12 +2319,12 @@ class StrandsTestSuite:
             # Now test invalid credentials
             print("Testing invalid credentials...")
             self.driver.get(f"{BASE_URL}/login")
-            time.sleep(ACTION_DELAY)
+            self.settle(ACTION_DELAY)
             
             self.safe_send_keys(By.ID, "login-email", "invalid@test.com", "Invalid Email")
             self.safe_send_keys(By.ID, "login-password", "wrongpassword", "Invalid Password")
             self.safe_click(By.XPATH, "//button[@type='submit' and contains(text(), 'Sign In')]", "Login button")
-            time.sleep(ACTION_DELAY * 2)
+            self.settle(ACTION_DELAY * 2)
             
             # Look for error message
             error_found = False
@@ -1081,7 +2333,7 @@ class StrandsTestSuite:
                 if error_elements:
                     error_found = True
                     print(f" Error message displayed: {error_elements[0].text[:50]}")
-            except:
+            except Exception:
                 pass
             
             if error_found or "/login" in self.driver.current_url:
@@ -1105,11 +2357,11 @@ class StrandsTestSuite:
         print("TEST 3: Successful Login (Admin)")
         print("="*70)
         try:
-            if not self.login("admin@strands.com", "test123", "Admin"):
+            if not self.login("admin@strands.com", "test123", "Admin", ui=True):
                 return False
             
             # Check if redirected to admin dashboard
-                time.sleep(ACTION_DELAY)  # Wait longer for redirect
+                self.settle(ACTION_DELAY)  # Wait longer for redirect
             current_url = self.driver.current_url
             print(f" Current URL after login: {current_url}")
             
@@ -1127,10 +2379,10 @@ class StrandsTestSuite:
                     if not salon_mgmt_clicked:
                         self.navigate_and_scroll(f"{BASE_URL}/admin/salon-verification")
                     else:
-                        time.sleep(0.3)
+                        self.settle(0.3)
                     
                     # Wait for page to load
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     current_url = self.driver.current_url
                     print(f" Current URL after navigation: {current_url}")
                     if "/admin/salon-verification" in current_url:
@@ -1183,7 +2435,7 @@ class StrandsTestSuite:
                 if not salon_mgmt_clicked:
                     self.navigate_and_scroll(f"{BASE_URL}/admin/salon-verification")
                 else:
-                    time.sleep(0.3)
+                    self.settle(0.3)
             
             # Go through each admin page in the order they appear in the navbar
             print("Going through admin pages in navbar order...")
@@ -1207,10 +2459,10 @@ class StrandsTestSuite:
                     if not salon_mgmt_clicked:
                         self.navigate_and_scroll(f"{BASE_URL}{path}")
                     else:
-                        time.sleep(0.3)
+                        self.settle(0.3)
                     
                     # Wait for page to load
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     
                     # Test pagination: click next, then previous
                     print(f"    Testing pagination buttons...")
@@ -1221,9 +2473,9 @@ class StrandsTestSuite:
                             # Click next button
                             print(f"      Clicking 'Next' pagination button...")
                             self.scroll_to_element(next_button[0])
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             next_button[0].click()
-                            time.sleep(0.5)
+                            self.settle(0.5)
                             print(f"      ✓ Clicked 'Next' button")
                             
                             # Now click previous button
@@ -1232,9 +2484,9 @@ class StrandsTestSuite:
                             )
                             print(f"      Clicking 'Previous' pagination button...")
                             self.scroll_to_element(prev_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             prev_button.click()
-                            time.sleep(0.5)
+                            self.settle(0.5)
                             print(f"      ✓ Clicked 'Previous' button")
                         else:
                             print(f"      ⚠ Pagination buttons not available or disabled (may be on first/last page or only one page)")
@@ -1249,7 +2501,7 @@ class StrandsTestSuite:
                     if not loyalty_clicked:
                         self.navigate_and_scroll(f"{BASE_URL}{path}")
                     else:
-                        time.sleep(0.3)
+                        self.settle(0.3)
                 elif name == "User Analytics":
                     user_analytics_clicked = self.safe_click(
                         By.XPATH,
@@ -1259,32 +2511,14 @@ class StrandsTestSuite:
                     if not user_analytics_clicked:
                         self.navigate_and_scroll(f"{BASE_URL}{path}")
                     else:
-                        time.sleep(0.3)
+                        self.settle(0.3)
                     
                     # Wait for User Analytics page to load
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     
                     # First, scroll through the Overview tab (default/base tab)
                     print(f"    Scrolling through 'Overview' subtab (default)...")
-                    time.sleep(0.5)
-                    page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                    viewport_height = self.driver.execute_script("return window.innerHeight")
-                    
-                    # Scroll in increments to make it visible
-                    scroll_increment = viewport_height * 0.8
-                    current_scroll = 0
-                    while current_scroll < page_height:
-                        current_scroll += scroll_increment
-                        self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
-                        time.sleep(0.4)  # Delay to make scrolling visible
-                    
-                    # Scroll to bottom
-                    self.driver.execute_script(f"window.scrollTo(0, {page_height});")
-                    time.sleep(0.5)
-                    
-                    # Scroll back to top
-                    self.driver.execute_script("window.scrollTo(0, 0);")
-                    time.sleep(0.3)
+                    self.scroll_through_page()
                     print(f"    ✓ Scrolled through 'Overview' subtab")
                     
                     # Click on "Activity & Retention" subtab
@@ -1299,9 +2533,9 @@ class StrandsTestSuite:
                             ))
                         )
                         self.scroll_to_element(activity_retention_tab)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         activity_retention_tab.click()
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         print(f"    ✓ Clicked 'Activity & Retention' subtab")
                     except Exception as e:
                         print(f"    ⚠ Could not find or click 'Activity & Retention' subtab: {e}")
@@ -1314,7 +2548,7 @@ class StrandsTestSuite:
                     if not business_clicked:
                         self.navigate_and_scroll(f"{BASE_URL}{path}")
                     else:
-                        time.sleep(0.3)
+                        self.settle(0.3)
                 elif name == "Revenue Analytics":
                     revenue_clicked = self.safe_click(
                         By.XPATH,
@@ -1324,33 +2558,15 @@ class StrandsTestSuite:
                     if not revenue_clicked:
                         self.navigate_and_scroll(f"{BASE_URL}{path}")
                     else:
-                        time.sleep(0.3)
+                        self.settle(0.3)
                 else:
                     self.navigate_and_scroll(f"{BASE_URL}{path}")
                 
-                time.sleep(0.5)  # Wait for page to load
+                self.settle(0.5)  # Wait for page to load
                 
                 # Visibly scroll to show all content
                 print(f"    Scrolling through {name} page...")
-                time.sleep(0.5)
-                page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                viewport_height = self.driver.execute_script("return window.innerHeight")
-                
-                # Scroll in increments to make it visible
-                scroll_increment = viewport_height * 0.8
-                current_scroll = 0
-                while current_scroll < page_height:
-                    current_scroll += scroll_increment
-                    self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
-                    time.sleep(0.4)  # Delay to make scrolling visible
-                
-                # Scroll to bottom
-                self.driver.execute_script(f"window.scrollTo(0, {page_height});")
-                time.sleep(0.5)
-                
-                # Scroll back to top
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(0.3)
+                self.scroll_through_page()
                 print(f"    ✓ {name} page scrolled through")
             
             # Go back to salon verification (last page in the loop should be Revenue, so navigate back)
@@ -1363,10 +2579,10 @@ class StrandsTestSuite:
             if not salon_mgmt_clicked:
                 self.navigate_and_scroll(f"{BASE_URL}/admin/salon-verification")
             else:
-                time.sleep(0.3)
+                self.settle(0.3)
             
             # Wait for page to load
-            time.sleep(0.3)
+            self.settle(0.3)
             
             # Go through salon management filter tabs using IDs
             print("Clicking through salon management filter tabs...")
@@ -1381,13 +2597,13 @@ class StrandsTestSuite:
                 try:
                     filter_button = self.wait.until(EC.element_to_be_clickable((By.ID, filter_id)))
                     self.scroll_to_element(filter_button)
-                    time.sleep(0.3)
+                    self.settle(0.3)
                     filter_button.click()
-                    time.sleep(0.3)  # Wait for filter to apply and content to load
+                    self.settle(0.3)  # Wait for filter to apply and content to load
                     print(f"  ✓ Clicked {filter_name} filter")
                     
                     # Verify content is loaded
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     salon_cards = self.driver.find_elements(By.XPATH, 
                         "//div[contains(@class, 'Card')] | //div[contains(@class, 'card')]"
                     )
@@ -1400,9 +2616,9 @@ class StrandsTestSuite:
             try:
                 all_filter = self.wait.until(EC.element_to_be_clickable((By.ID, "filter-all-button")))
                 self.scroll_to_element(all_filter)
-                time.sleep(0.3)
+                self.settle(0.3)
                 all_filter.click()
-                time.sleep(0.3)  # Wait for filter to apply
+                self.settle(0.3)  # Wait for filter to apply
                 print("  ✓ Returned to 'All' filter")
             except Exception as e:
                 print(f"  ⚠ Could not return to 'All' filter: {e}")
@@ -1413,8 +2629,8 @@ class StrandsTestSuite:
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'Card')] | //div[contains(@class, 'card')]"))
                 )
-                time.sleep(0.5)
-            except:
+                self.settle(0.5)
+            except Exception:
                 print("Warning: Salon cards may not have loaded, continuing anyway...")
             
             # Find and reject the first salon using ID
@@ -1430,7 +2646,7 @@ class StrandsTestSuite:
                     
                     # Scroll to button and ensure it's visible
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", reject_buttons[0])
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     
                     # Wait for button to be clickable
                     reject_btn = WebDriverWait(self.driver, 5).until(
@@ -1440,10 +2656,10 @@ class StrandsTestSuite:
                     # Click the button
                     try:
                         reject_btn.click()
-                    except:
+                    except Exception:
                         self.driver.execute_script("arguments[0].click();", reject_btn)
                     
-                    time.sleep(0.3)  # Wait for modal to appear
+                    self.settle(0.3)  # Wait for modal to appear
                     
                     # Wait for modal and click confirm
                     modal_clicked = False
@@ -1453,16 +2669,16 @@ class StrandsTestSuite:
                             try:
                                 modal_body = self.driver.find_element(By.XPATH, "//div[contains(@class, 'fixed')]//div[contains(@class, 'modal')] | //div[@role='dialog']")
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", modal_body)
-                                time.sleep(0.3)
-                            except:
+                                self.settle(0.3)
+                            except Exception:
                                 pass
                             
                             if self.click_modal_confirm(timeout=4):
-                                time.sleep(0.3)  # Wait for rejection to complete
+                                self.settle(0.3)  # Wait for rejection to complete
                                 print("  ✓ Salon rejected successfully")
                                 modal_clicked = True
                                 break
-                        time.sleep(0.5)
+                        self.settle(0.5)
                     
                     if not modal_clicked:
                         print("  WARNING: Could not complete rejection - continuing")
@@ -1473,15 +2689,15 @@ class StrandsTestSuite:
             
             # Click logout using ID
             print("Clicking logout button...")
-            time.sleep(0.5)
+            self.settle(0.5)
             try:
                 # Try desktop logout button first
                 try:
                     logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "admin-logout-button")))
                     self.scroll_to_element(logout_button)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     logout_button.click()
-                    time.sleep(0.3)  # Wait for logout modal to appear
+                    self.settle(0.3)  # Wait for logout modal to appear
                     
                     # Handle logout success modal - click OK button
                     print("  Handling logout success modal...")
@@ -1490,9 +2706,9 @@ class StrandsTestSuite:
                             EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
                         )
                         ok_button.click()
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         print("  ✓ Clicked OK on logout modal")
-                    except:
+                    except Exception:
                         # Fallback: try to find OK button by text
                         try:
                             ok_button = WebDriverWait(self.driver, 3).until(
@@ -1502,21 +2718,21 @@ class StrandsTestSuite:
                                 ))
                             )
                             ok_button.click()
-                            time.sleep(0.5)
+                            self.settle(0.5)
                             print("  ✓ Clicked OK on logout modal (fallback)")
-                        except:
+                        except Exception:
                             print("  ⚠ Could not find OK button on logout modal")
                     
-                    time.sleep(0.3)
+                    self.settle(0.3)
                     print("  ✓ Logged out successfully")
-                except:
+                except Exception:
                     # Try mobile logout button
                     try:
                         logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "admin-logout-button-mobile")))
                         self.scroll_to_element(logout_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         logout_button.click()
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         
                         # Handle logout modal
                         try:
@@ -1524,14 +2740,14 @@ class StrandsTestSuite:
                                 EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
                             )
                             ok_button.click()
-                            time.sleep(0.5)
+                            self.settle(0.5)
                             print("  ✓ Clicked OK on logout modal")
-                        except:
+                        except Exception:
                             pass
                         
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         print("  ✓ Logged out successfully (mobile)")
-                    except:
+                    except Exception:
                         # Fallback to XPath
                         logout_buttons = self.driver.find_elements(By.XPATH, 
                             "//button[contains(text(), 'Logout')] | "
@@ -1539,9 +2755,9 @@ class StrandsTestSuite:
                         )
                         if logout_buttons:
                             self.scroll_to_element(logout_buttons[0])
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             logout_buttons[0].click()
-                            time.sleep(0.5)
+                            self.settle(0.5)
                             
                             # Handle logout modal
                             try:
@@ -1549,12 +2765,12 @@ class StrandsTestSuite:
                                     EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
                                 )
                                 ok_button.click()
-                                time.sleep(0.5)
+                                self.settle(0.5)
                                 print("  ✓ Clicked OK on logout modal")
-                            except:
+                            except Exception:
                                 pass
                             
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             print("  ✓ Logged out successfully (fallback)")
                         else:
                             print("  ⚠ Could not find logout button")
@@ -1571,28 +2787,24 @@ class StrandsTestSuite:
     def test_5_owner_signup_and_admin_approval(self):
         """
         Test 5 — Owner Signup and Admin Approval
-        After Phase 2, should be signed out and on landing page
-        Click Get Started button
-        Test error handling (empty fields, invalid info)
-        Fill with valid random information
-        Click Create Account
-        Log out using logout button ID
-        Log back into admin account
-        On salon management page, approve the new salon using approve button ID
-        Log out of admin
-        Log back into the owner account that was just created
-        Go through owner dashboard tabs in order and scroll through each
+        Runs the onboarding, booking, purchase, review and analytics phases
+        declared in TEST_5_STAGES; each stage starts once the stages it depends
+        on have passed and the suite state it requires has been set
         """
         print("\n" + "="*70)
         print("TEST 5: Owner Signup and Admin Approval")
         print("="*70)
+        return self.run_stages(TEST_5_STAGES)
+    
+    def stage_owner_signup(self):
+        """Signup validation, owner account creation, salon registration, then owner logout"""
         try:
             # Should be on landing page after Phase 2 logout
             current_url = self.driver.current_url
             if "/" not in current_url and "/login" not in current_url:
                 print("Navigating to landing page...")
                 self.navigate_and_scroll(f"{BASE_URL}/")
-                time.sleep(0.3)
+                self.settle(0.3)
             
             # Click Get Started button using ID
             print("Clicking Get Started button...")
@@ -1600,16 +2812,16 @@ class StrandsTestSuite:
                 # Try hero button first (more prominent)
                 get_started_button = self.wait.until(EC.element_to_be_clickable((By.ID, "get-started-hero-button")))
                 self.scroll_to_element(get_started_button)
-                time.sleep(0.3)
+                self.settle(0.3)
                 get_started_button.click()
-            except:
+            except Exception:
                 # Fallback to header button
                 try:
                     get_started_button = self.wait.until(EC.element_to_be_clickable((By.ID, "get-started-header-button")))
                     self.scroll_to_element(get_started_button)
-                    time.sleep(0.3)
+                    self.settle(0.3)
                     get_started_button.click()
-                except:
+                except Exception:
                     # Fallback to XPath
                     get_started_buttons = self.driver.find_elements(By.XPATH, 
                         "//button[contains(text(), 'Get Started')]"
@@ -1617,7 +2829,7 @@ class StrandsTestSuite:
                     if get_started_buttons:
                         self.safe_click_element(get_started_buttons[0], "Get Started button")
             
-            time.sleep(0.5)  # Wait for signup page to load
+            self.settle(0.5)  # Wait for signup page to load
             
             # Ensure we're on signup tab
             print("Ensuring we're on Sign Up tab...")
@@ -1625,31 +2837,35 @@ class StrandsTestSuite:
                 signup_tab = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Sign Up')]")
                 if signup_tab:
                     signup_tab.click()
-                    time.sleep(0.5)
-            except:
+                    self.settle(0.5)
+            except Exception:
                 pass
             
             # Test error handling - empty fields
             print("Testing error handling with empty fields...")
             try:
                 # Clear all fields
-                name_input = self.driver.find_element(By.ID, "name")
-                email_input = self.driver.find_element(By.ID, "email")
-                password_input = self.driver.find_element(By.ID, "password")
-                confirm_password_input = self.driver.find_element(By.ID, "confirmPassword")
+                form = self.expect_elements({
+                    "name": "name", "email": "email", "password": "password",
+                    "confirm": "confirmPassword", "submit": "create-account-button",
+                })
+                name_input = form["name"]["element"]
+                email_input = form["email"]["element"]
+                password_input = form["password"]["element"]
+                confirm_password_input = form["confirm"]["element"]
                 
                 name_input.clear()
                 email_input.clear()
                 password_input.clear()
                 confirm_password_input.clear()
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 # Try to submit with empty fields
-                create_account_button = self.driver.find_element(By.ID, "create-account-button")
+                create_account_button = form["submit"]["element"]
                 self.scroll_to_element(create_account_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 create_account_button.click()
-                time.sleep(0.3)  # Wait for validation errors
+                self.settle(0.3)  # Wait for validation errors
                 
                 # Check for validation errors
                 validation_errors = self.driver.find_elements(By.XPATH, 
@@ -1669,10 +2885,14 @@ class StrandsTestSuite:
             print("Testing error handling with invalid information...")
             try:
                 # Fill with invalid data
-                name_input = self.driver.find_element(By.ID, "name")
-                email_input = self.driver.find_element(By.ID, "email")
-                password_input = self.driver.find_element(By.ID, "password")
-                confirm_password_input = self.driver.find_element(By.ID, "confirmPassword")
+                form = self.expect_elements({
+                    "name": "name", "email": "email", "password": "password",
+                    "confirm": "confirmPassword", "submit": "create-account-button",
+                })
+                name_input = form["name"]["element"]
+                email_input = form["email"]["element"]
+                password_input = form["password"]["element"]
+                confirm_password_input = form["confirm"]["element"]
                 
                 name_input.clear()
                 name_input.send_keys("A")  # Too short
@@ -1682,14 +2902,14 @@ class StrandsTestSuite:
                 password_input.send_keys("123")  # Too short
                 confirm_password_input.clear()
                 confirm_password_input.send_keys("456")  # Doesn't match
-                time.sleep(0.3)
+                self.settle(0.3)
                 
                 # Try to submit
-                create_account_button = self.driver.find_element(By.ID, "create-account-button")
+                create_account_button = form["submit"]["element"]
                 self.scroll_to_element(create_account_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 create_account_button.click()
-                time.sleep(0.3)  # Wait for validation errors
+                self.settle(0.3)  # Wait for validation errors
                 
                 # Check for validation errors
                 validation_errors = self.driver.find_elements(By.XPATH, 
@@ -1713,29 +2933,13 @@ class StrandsTestSuite:
             owner_password = self.owner_password  # Keep local variable for compatibility
             
             try:
-                # Fill Full Name
-                name_input = self.driver.find_element(By.ID, "name")
-                name_input.clear()
-                self.safe_send_keys_element(name_input, owner_name, "Full Name")
-                time.sleep(0.2)
-                
-                # Fill Email
-                email_input = self.driver.find_element(By.ID, "email")
-                email_input.clear()
-                self.safe_send_keys_element(email_input, self.owner_email, "Email")
-                time.sleep(0.2)
-                
-                # Fill Password
-                password_input = self.driver.find_element(By.ID, "password")
-                password_input.clear()
-                self.safe_send_keys_element(password_input, owner_password, "Password")
-                time.sleep(0.2)
-                
-                # Fill Confirm Password
-                confirm_password_input = self.driver.find_element(By.ID, "confirmPassword")
-                confirm_password_input.clear()
-                self.safe_send_keys_element(confirm_password_input, owner_password, "Confirm Password")
-                time.sleep(0.2)
+                # Fill Full Name, Email, Password and Confirm Password
+                self.fill_form({
+                    "name": owner_name,
+                    "email": self.owner_email,
+                    "password": owner_password,
+                    "confirmPassword": owner_password,
+                }, "signup form")
                 
                 # Select Owner role
                 print("Selecting Owner role...")
@@ -1745,14 +2949,14 @@ class StrandsTestSuite:
                         select_trigger = self.wait.until(EC.element_to_be_clickable((By.ID, "role")))
                         self.scroll_to_element(select_trigger)
                         select_trigger.click()
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         owner_option = WebDriverWait(self.driver, 3).until(
                             EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and (contains(., 'Owner') or contains(., 'Salon'))]"))
                         )
                         owner_option.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         print("Selected Owner role via fallback")
-                    except:
+                    except Exception:
                         print("Warning: Could not select Owner role")
                 
                 # Click Create Account button using ID
@@ -1760,7 +2964,7 @@ class StrandsTestSuite:
                 create_account_button = self.wait.until(EC.element_to_be_clickable((By.ID, "create-account-button")))
                 self.scroll_to_element(create_account_button)
                 create_account_button.click()
-                time.sleep(ACTION_DELAY * 2)  # Wait for account creation and redirect
+                self.settle(ACTION_DELAY * 2)  # Wait for account creation and redirect
                 
                 # Check if signup was successful
                 current_url = self.driver.current_url
@@ -1774,7 +2978,7 @@ class StrandsTestSuite:
             
             # Wait for salon registration form to appear
             print("Waiting for salon registration form...")
-            time.sleep(0.5)  # Wait for redirect to salon registration page
+            self.settle(0.5)  # Wait for redirect to salon registration page
             
             # Check if we're on salon registration page
             current_url = self.driver.current_url
@@ -1785,7 +2989,7 @@ class StrandsTestSuite:
                         EC.presence_of_element_located((By.ID, "name"))
                     )
                     print("  ✓ Salon registration form found")
-                except:
+                except Exception:
                     print("  ⚠ Salon registration form may not have appeared")
             else:
                 print("  ✓ On salon registration page")
@@ -1808,12 +3012,12 @@ class StrandsTestSuite:
                         try:
                             if btn.is_displayed():
                                 btn.click()
-                                time.sleep(0.3)
+                                self.settle(0.3)
                                 print("  Closed notification modal if it was open")
                                 break
-                        except:
+                        except Exception:
                             pass
-            except:
+            except Exception:
                 pass
             
             # Scroll to the form to avoid accidentally clicking navbar buttons (like inbox)
@@ -1823,9 +3027,9 @@ class StrandsTestSuite:
                     "//form | //div[contains(@class, 'Card')] | //div[contains(@class, 'card')]"
                 )
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'start', behavior: 'smooth'});", form_element)
-                time.sleep(0.5)
+                self.settle(0.5)
                 print("  Scrolled to form to avoid navbar buttons")
-            except:
+            except Exception:
                 pass
             
             # Test error handling - empty fields
@@ -1834,9 +3038,9 @@ class StrandsTestSuite:
                 # Try to submit with empty fields
                 submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "submit-for-review-button")))
                 self.scroll_to_element(submit_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 submit_button.click()
-                time.sleep(0.3)  # Wait for validation errors
+                self.settle(0.3)  # Wait for validation errors
                 
                 # Check for validation errors
                 validation_errors = self.driver.find_elements(By.XPATH, 
@@ -1864,14 +3068,14 @@ class StrandsTestSuite:
                 phone_input.send_keys("abc")  # Invalid phone
                 postal_code_input.clear()
                 postal_code_input.send_keys("abc")  # Invalid postal code
-                time.sleep(0.3)
+                self.settle(0.3)
                 
                 # Try to submit
                 submit_button = self.driver.find_element(By.ID, "submit-for-review-button")
                 self.scroll_to_element(submit_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 submit_button.click()
-                time.sleep(0.3)  # Wait for validation errors
+                self.settle(0.3)  # Wait for validation errors
                 
                 # Check for validation errors
                 validation_errors = self.driver.find_elements(By.XPATH, 
@@ -1898,8 +3102,8 @@ class StrandsTestSuite:
                 try:
                     form = self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "form")))
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'start'});", form)
-                    time.sleep(0.3)
-                except:
+                    self.settle(0.3)
+                except Exception:
                     pass
                 
                 # Disable inbox button temporarily to prevent accidental clicks
@@ -1910,48 +3114,19 @@ class StrandsTestSuite:
                         arguments[0].style.opacity = '0.5';
                     """, inbox_button)
                     print("  Disabled inbox button to prevent accidental clicks")
-                except:
+                except Exception:
                     pass
                 
-                # Fill Salon Name using ID
-                print("  Filling Salon Name (id='name')...")
-                salon_name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", salon_name_input)
-                time.sleep(0.2)
-                salon_name_input.clear()
-                salon_name_input.send_keys("Selenium Test Salon")
-                time.sleep(0.2)
-                
-                # Email is already filled and locked
-                print("  Email is locked to account (as expected)")
-                time.sleep(0.2)
-                
-                # Fill Phone Number using ID
-                print("  Filling Phone Number (id='phone')...")
-                phone_input = self.wait.until(EC.presence_of_element_located((By.ID, "phone")))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", phone_input)
-                time.sleep(0.2)
-                phone_input.clear()
-                phone_input.send_keys("5551234567")
-                time.sleep(0.2)
-                
-                # Fill Street Address using ID
-                print("  Filling Street Address (id='street')...")
-                street_input = self.wait.until(EC.presence_of_element_located((By.ID, "street")))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", street_input)
-                time.sleep(0.2)
-                street_input.clear()
-                street_input.send_keys("123 Test Street")
-                time.sleep(0.2)
-                
-                # Fill City using ID
-                print("  Filling City (id='city')...")
-                city_input = self.wait.until(EC.presence_of_element_located((By.ID, "city")))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", city_input)
-                time.sleep(0.2)
-                city_input.clear()
-                city_input.send_keys("Test City")
-                time.sleep(0.2)
+                # Fill the text fields in one call; the dropdowns follow
+                print("  Filling salon name, phone, address, postal code and description...")
+                self.fill_form({
+                    "name": "Selenium Test Salon",
+                    "phone": "5551234567",
+                    "street": "123 Test Street",
+                    "city": "Test City",
+                    "postal_code": "12345",
+                    "description": "This is a test salon created by Selenium automation for testing purposes.",
+                }, "salon registration form")
                 
                 # Select State using ID (id="state")
                 print("  Selecting State (id='state')...")
@@ -1962,9 +3137,9 @@ class StrandsTestSuite:
                     try:
                         state_button = self.wait.until(EC.element_to_be_clickable((By.ID, "state")))
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", state_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         state_button.click()
-                        time.sleep(0.8)
+                        self.settle(0.8)
                         # Find California option
                         california_option = WebDriverWait(self.driver, 4).until(
                             EC.element_to_be_clickable((By.XPATH, 
@@ -1973,43 +3148,13 @@ class StrandsTestSuite:
                             ))
                         )
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", california_option)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         california_option.click()
-                        time.sleep(0.4)
+                        self.settle(0.4)
                         print("  ✓ Selected State: California (alternative method)")
                     except Exception as e:
                         print(f"  ✗ Could not select State: {e}")
                 
-                # Fill Postal Code (numbers only) using ID
-                print("  Filling Postal Code (id='postal_code')...")
-                postal_code_input = self.wait.until(EC.presence_of_element_located((By.ID, "postal_code")))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", postal_code_input)
-                time.sleep(0.2)
-                postal_code_input.clear()
-                time.sleep(0.1)
-                # Send keys one by one to ensure numeric input
-                postal_code_input.send_keys("1")
-                time.sleep(0.05)
-                postal_code_input.send_keys("2")
-                time.sleep(0.05)
-                postal_code_input.send_keys("3")
-                time.sleep(0.05)
-                postal_code_input.send_keys("4")
-                time.sleep(0.05)
-                postal_code_input.send_keys("5")
-                time.sleep(0.2)
-                # Verify postal code is numeric
-                postal_value = postal_code_input.get_attribute("value")
-                if postal_value and not postal_value.replace(" ", "").isdigit():
-                    print(f"  ⚠ Warning: Postal code may not be numeric: {postal_value}")
-                    # Try clearing and re-entering
-                    postal_code_input.clear()
-                    time.sleep(0.1)
-                    postal_code_input.send_keys("12345")
-                    time.sleep(0.2)
-                else:
-                    print(f"  ✓ Postal code is numeric: {postal_value}")
-                
                 # Select Salon Type using ID (id="category")
                 print("  Selecting Salon Type (id='category')...")
                 salon_type_selected = self.select_strands_select("Hair Salon", element_id="category")
@@ -2019,9 +3164,9 @@ class StrandsTestSuite:
                     try:
                         salon_type_button = self.wait.until(EC.element_to_be_clickable((By.ID, "category")))
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", salon_type_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         salon_type_button.click()
-                        time.sleep(0.8)
+                        self.settle(0.8)
                         # Find Hair Salon option
                         hair_salon_option = WebDriverWait(self.driver, 4).until(
                             EC.element_to_be_clickable((By.XPATH,
@@ -2030,29 +3175,13 @@ class StrandsTestSuite:
                             ))
                         )
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", hair_salon_option)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         hair_salon_option.click()
-                        time.sleep(0.4)
+                        self.settle(0.4)
                         print("  ✓ Selected Salon Type: Hair Salon (alternative method)")
                     except Exception as e:
                         print(f"  ✗ Could not select Salon Type: {e}")
                 
-                # Fill Description using ID (id="description")
-                print("  Filling Description (id='description')...")
-                description_input = self.wait.until(EC.presence_of_element_located((By.ID, "description")))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", description_input)
-                time.sleep(0.2)
-                description_input.clear()
-                time.sleep(0.1)
-                description_input.send_keys("This is a test salon created by Selenium automation for testing purposes.")
-                time.sleep(0.3)
-                # Verify description was filled
-                desc_value = description_input.get_attribute("value")
-                if desc_value:
-                    print(f"  ✓ Description filled: {desc_value[:50]}...")
-                else:
-                    print("  ⚠ Warning: Description may not have been filled")
-                
                 # Click Submit for Review button using ID - make absolutely sure we're not clicking inbox
                 print("Clicking Submit for Review button (id='submit-for-review-button')...")
                 submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "submit-for-review-button")))
@@ -2063,7 +3192,7 @@ class StrandsTestSuite:
                 
                 # Scroll to button to ensure it's visible and not blocked by navbar
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", submit_button)
-                time.sleep(0.5)
+                self.settle(0.5)
                 
                 # Double-check we're not clicking the inbox button
                 try:
@@ -2073,17 +3202,17 @@ class StrandsTestSuite:
                     # If they're too close, scroll more
                     if abs(inbox_location['y'] - submit_location['y']) < 100:
                         self.driver.execute_script("window.scrollBy(0, -150);")
-                        time.sleep(0.3)
-                except:
+                        self.settle(0.3)
+                except Exception:
                     pass
                 
                 # Make sure we're clicking the submit button, not any navbar buttons
                 try:
                     submit_button.click()
-                except:
+                except Exception:
                     # Fallback: use JavaScript click
                     self.driver.execute_script("arguments[0].click();", submit_button)
-                time.sleep(ACTION_DELAY * 2)  # Wait for submission and redirect/modal
+                self.settle(ACTION_DELAY * 2)  # Wait for submission and redirect/modal
                 
                 # Close notification modal if it opened
                 try:
@@ -2098,9 +3227,9 @@ class StrandsTestSuite:
                         )
                         if close_btn and close_btn.is_displayed():
                             close_btn.click()
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             print("  Closed notification modal after submission")
-                except:
+                except Exception:
                     pass
                 
                 # Check if a success modal appeared and close it if needed
@@ -2114,9 +3243,9 @@ class StrandsTestSuite:
                     )
                     if modal_confirm:
                         modal_confirm.click()
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         print("  Closed success modal")
-                except:
+                except Exception:
                     pass
                 
                 # Check if submission was successful
@@ -2133,18 +3262,18 @@ class StrandsTestSuite:
             
             # After salon registration form is submitted, log out of owner account
             print("Logging out of owner account after salon registration...")
-            time.sleep(0.5)  # Wait for page to load after form submission
+            self.settle(0.5)  # Wait for page to load after form submission
             try:
                 # Try owner logout button ID first
                 try:
                     logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "owner-logout-button")))
                     self.scroll_to_element(logout_button)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     logout_button.click()
                     # Wait for logout to process and redirect
-                    time.sleep(1.0)
+                    self.settle(1.0)
                     print("  ✓ Logged out using owner logout button ID")
-                except:
+                except Exception:
                     # Fallback to XPath
                     logout_buttons = self.driver.find_elements(By.XPATH, 
                         "//button[@id='owner-logout-button'] | "
@@ -2153,24 +3282,29 @@ class StrandsTestSuite:
                     )
                     if logout_buttons:
                         self.scroll_to_element(logout_buttons[0])
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         logout_buttons[0].click()
                         # Wait for logout to process and redirect
-                        time.sleep(1.0)
+                        self.settle(1.0)
                         print("  ✓ Logged out (fallback)")
                     else:
                         # Navigate to home and clear session
                         self.driver.get(f"{BASE_URL}/")
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         print("  ✓ Navigated to home (logout)")
             except Exception as e:
                 print(f"  ⚠ Error logging out: {e}")
             
-            # Log back into admin account
-            print("Logging back into admin account...")
-            if not self.login("admin@strands.com", "test123", "Admin"):
-                return False
-            
+            return True
+        except Exception as e:
+            print(f" Stage owner_signup failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_admin_approval(self):
+        """Admin approves the newly registered salon"""
+        try:
             # Navigate to salon management page
             print("Navigating to Salon Management page...")
             salon_mgmt_clicked = self.safe_click(
@@ -2181,10 +3315,10 @@ class StrandsTestSuite:
             if not salon_mgmt_clicked:
                 self.navigate_and_scroll(f"{BASE_URL}/admin/salon-verification")
             else:
-                time.sleep(0.3)
+                self.settle(0.3)
             
             # Wait for page to load
-            time.sleep(0.3)
+            self.settle(0.3)
             
             # Find and approve the new salon using approve button ID
             print("Looking for new salon to approve...")
@@ -2197,9 +3331,15 @@ class StrandsTestSuite:
                 if approve_buttons:
                     print(f"Found {len(approve_buttons)} Approve button(s), clicking first one...")
                     
+                    # Keep the salon id for later stages
+                    approve_button_id = approve_buttons[0].get_attribute("id") or ""
+                    if approve_button_id.startswith("approve-salon-"):
+                        self.test_salon_id = approve_button_id.replace("approve-salon-", "")
+                        print(f"  Stored salon_id: {self.test_salon_id}")
+                    
                     # Scroll to button
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", approve_buttons[0])
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     
                     # Wait for button to be clickable
                     approve_btn = WebDriverWait(self.driver, 5).until(
@@ -2209,21 +3349,21 @@ class StrandsTestSuite:
                     # Click the button
                     try:
                         approve_btn.click()
-                    except:
+                    except Exception:
                         self.driver.execute_script("arguments[0].click();", approve_btn)
                     
-                    time.sleep(0.3)  # Wait for modal to appear
+                    self.settle(0.3)  # Wait for modal to appear
                     
                     # Wait for modal and click confirm
                     modal_clicked = False
                     for attempt in range(3):
                         if self.wait_for_modal(timeout=4):
                             if self.click_modal_confirm(timeout=4):
-                                time.sleep(0.3)  # Wait for approval to complete
+                                self.settle(0.3)  # Wait for approval to complete
                                 print("  ✓ Salon approved successfully")
                                 modal_clicked = True
                                 break
-                        time.sleep(0.5)
+                        self.settle(0.5)
                     
                     if not modal_clicked:
                         print("  WARNING: Could not complete approval - continuing")
@@ -2232,106 +3372,23 @@ class StrandsTestSuite:
             except Exception as e:
                 print(f"  Error approving salon: {e}")
             
-            # Log out of admin using logout button ID
-            print("Logging out of admin...")
-            time.sleep(0.5)
-            try:
-                # Try desktop logout button first
-                try:
-                    logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "admin-logout-button")))
-                    self.scroll_to_element(logout_button)
-                    time.sleep(0.2)
-                    logout_button.click()
-                    time.sleep(0.3)  # Wait for logout modal to appear
-                    
-                    # Handle logout success modal - click OK button
-                    print("  Handling logout success modal...")
-                    try:
-                        ok_button = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
-                        )
-                        ok_button.click()
-                        time.sleep(0.5)
-                        print("  ✓ Clicked OK on logout modal")
-                    except:
-                        # Fallback: try to find OK button by text
-                        try:
-                            ok_button = WebDriverWait(self.driver, 3).until(
-                                EC.element_to_be_clickable((By.XPATH,
-                                    "//div[contains(@class, 'fixed')]//button[contains(text(), 'OK')] | "
-                                    "//div[@role='dialog']//button[contains(text(), 'OK')]"
-                                ))
-                            )
-                            ok_button.click()
-                            time.sleep(0.5)
-                            print("  ✓ Clicked OK on logout modal (fallback)")
-                        except:
-                            print("  ⚠ Could not find OK button on logout modal")
-                    
-                    time.sleep(0.3)
-                    print("  ✓ Logged out of admin")
-                except:
-                    # Try mobile logout button
-                    try:
-                        logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "admin-logout-button-mobile")))
-                        self.scroll_to_element(logout_button)
-                        time.sleep(0.2)
-                        logout_button.click()
-                        time.sleep(0.5)
-                        
-                        # Handle logout modal
-                        try:
-                            ok_button = WebDriverWait(self.driver, 5).until(
-                                EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
-                            )
-                            ok_button.click()
-                            time.sleep(0.5)
-                            print("  ✓ Clicked OK on logout modal")
-                        except:
-                            pass
-                        
-                        time.sleep(0.3)
-                        print("  ✓ Logged out of admin (mobile)")
-                    except:
-                        # Fallback to XPath
-                        logout_buttons = self.driver.find_elements(By.XPATH, 
-                            "//button[contains(text(), 'Logout')] | "
-                            "//button[contains(., 'Logout')]"
-                        )
-                        if logout_buttons:
-                            self.scroll_to_element(logout_buttons[0])
-                            time.sleep(0.2)
-                            logout_buttons[0].click()
-                            time.sleep(0.5)
-                            
-                            # Handle logout modal
-                            try:
-                                ok_button = WebDriverWait(self.driver, 5).until(
-                                    EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
-                                )
-                                ok_button.click()
-                                time.sleep(0.5)
-                                print("  ✓ Clicked OK on logout modal")
-                            except:
-                                pass
-                            
-                            time.sleep(0.3)
-                            print("  ✓ Logged out of admin (fallback)")
-            except Exception as e:
-                print(f"  ⚠ Error logging out: {e}")
-            
-            # Log back into the owner account that was just created
-            print(f"Logging back into owner account: {self.owner_email}")
-            if not self.login(self.owner_email, self.owner_password, "Owner"):
-                return False
-            
+            return True
+        except Exception as e:
+            print(f" Stage admin_approval failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_owner_dashboard(self):
+        """Owner walks every dashboard tab (loyalty, products, operating hours)"""
+        try:
             # Should start on overview page after login
-            time.sleep(0.3)
+            self.settle(0.3)
             current_url = self.driver.current_url
             if "/owner/overview" not in current_url:
                 # Navigate to overview if not already there
                 self.navigate_and_scroll(f"{BASE_URL}/owner/overview")
-                time.sleep(0.3)
+                self.settle(0.3)
             
             # Go through owner dashboard tabs in order (as shown in navbar)
             print("Going through owner dashboard tabs in order...")
@@ -2350,29 +3407,11 @@ class StrandsTestSuite:
             for path, name in owner_tabs:
                 print(f"  Checking {name} page...")
                 self.navigate_and_scroll(f"{BASE_URL}{path}")
-                time.sleep(0.5)  # Wait for page to load
+                self.settle(0.5)  # Wait for page to load
                 
                 # Visibly scroll to show all content
                 print(f"    Scrolling through {name} page...")
-                time.sleep(0.5)
-                page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                viewport_height = self.driver.execute_script("return window.innerHeight")
-                
-                # Scroll in increments to make it visible
-                scroll_increment = viewport_height * 0.8
-                current_scroll = 0
-                while current_scroll < page_height:
-                    current_scroll += scroll_increment
-                    self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
-                    time.sleep(0.4)  # Delay to make scrolling visible
-                
-                # Scroll to bottom
-                self.driver.execute_script(f"window.scrollTo(0, {page_height});")
-                time.sleep(0.5)
-                
-                # Scroll back to top
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(0.3)
+                self.scroll_through_page()
                 print(f"    ✓ {name} page scrolled through")
                 
                 if name == "Loyalty & Promotions":
@@ -2380,9 +3419,9 @@ class StrandsTestSuite:
                     try:
                         program_tab_button = self.wait.until(EC.element_to_be_clickable((By.ID, "loyalty-subtab-loyalty-program-button")))
                         self.scroll_to_element(program_tab_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         program_tab_button.click()
-                        time.sleep(0.5)
+                        self.settle(0.5)
                     except Exception as e:
                         print(f"    ⚠ Could not focus loyalty program subtab: {e}")
                     created = self.configure_loyalty_program(
@@ -2404,22 +3443,22 @@ class StrandsTestSuite:
                         try:
                             add_product_button = self.wait.until(EC.element_to_be_clickable((By.ID, "add-product-page-button")))
                             self.scroll_to_element(add_product_button)
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             add_product_button.click()
                             add_product_clicked = True
                             print("      ✓ Clicked Add Product button (page)")
-                        except:
+                        except Exception:
                             try:
                                 add_product_button = self.wait.until(EC.element_to_be_clickable((By.ID, "add-product-empty-button")))
                                 self.scroll_to_element(add_product_button)
                                 add_product_button.click()
                                 add_product_clicked = True
                                 print("      ✓ Clicked Add Product button (empty state)")
-                            except:
+                            except Exception:
                                 print("      ⚠ Could not find Add Product button")
                         
                         if add_product_clicked:
-                            time.sleep(0.3)  # Wait for modal to appear
+                            self.settle(0.3)  # Wait for modal to appear
                             
                             # Generate random product data
                             product_names = ["Professional Shampoo", "Deep Conditioner", "Hair Serum", "Styling Gel", "Hair Mask", "Color Treatment"]
@@ -2440,40 +3479,16 @@ class StrandsTestSuite:
                             product_stock = str(random.randint(10, 100))
                             product_category = random.choice(categories)
                             
-                            # Fill Product Name
-                            print(f"      Filling Product Name: {product_name}")
-                            name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", name_input)
-                            name_input.clear()
-                            name_input.send_keys(product_name)
-                            
-                            # Fill Description
-                            print(f"      Filling Description...")
-                            desc_input = self.wait.until(EC.presence_of_element_located((By.ID, "description")))
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", desc_input)
-                            desc_input.clear()
-                            desc_input.send_keys(product_description)
-                            
-                            # Fill SKU
-                            print(f"      Filling SKU: {product_sku}")
-                            sku_input = self.wait.until(EC.presence_of_element_located((By.ID, "sku")))
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", sku_input)
-                            sku_input.clear()
-                            sku_input.send_keys(product_sku)
-                            
-                            # Fill Price
-                            print(f"      Filling Price: ${product_price}")
-                            price_input = self.wait.until(EC.presence_of_element_located((By.ID, "price")))
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", price_input)
-                            price_input.clear()
-                            price_input.send_keys(product_price)
-                            
-                            # Fill Stock Quantity
-                            print(f"      Filling Stock Quantity: {product_stock}")
-                            stock_input = self.wait.until(EC.presence_of_element_located((By.ID, "stock_qty")))
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", stock_input)
-                            stock_input.clear()
-                            stock_input.send_keys(product_stock)
+                            # Fill Product Name, Description, SKU, Price and Stock Quantity in one call
+                            print(f"      Filling product: {product_name}, SKU {product_sku}, ${product_price}, stock {product_stock}")
+                            self.wait.until(EC.presence_of_element_located((By.ID, "name")))
+                            self.fill_form({
+                                "name": product_name,
+                                "description": product_description,
+                                "sku": product_sku,
+                                "price": product_price,
+                                "stock_qty": product_stock,
+                            }, "product form")
                             
                             # Select Category (dropdown - uses standard Select component)
                             print(f"      Selecting Category: {product_category}")
@@ -2482,7 +3497,7 @@ class StrandsTestSuite:
                                 category_trigger = self.wait.until(EC.element_to_be_clickable((By.ID, "category")))
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", category_trigger)
                                 category_trigger.click()
-                                time.sleep(0.3)  # Wait for dropdown to open
+                                self.settle(0.3)  # Wait for dropdown to open
                                 
                                 # Find the category option (SelectItem)
                                 category_option = WebDriverWait(self.driver, 3).until(
@@ -2494,7 +3509,7 @@ class StrandsTestSuite:
                                 )
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", category_option)
                                 category_option.click()
-                                time.sleep(0.1)
+                                self.settle(0.1)
                                 print(f"      ✓ Selected Category: {product_category}")
                             except Exception as e:
                                 print(f"      ⚠ Could not select category: {e}")
@@ -2502,9 +3517,9 @@ class StrandsTestSuite:
                                 try:
                                     category_trigger = self.driver.find_element(By.ID, "category")
                                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", category_trigger)
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                     self.driver.execute_script("arguments[0].click();", category_trigger)
-                                    time.sleep(0.8)
+                                    self.settle(0.8)
                                     # Try to find option by text in any visible dropdown
                                     all_options = self.driver.find_elements(By.XPATH, 
                                         "//div[contains(text(), '" + product_category + "')]"
@@ -2512,7 +3527,7 @@ class StrandsTestSuite:
                                     for opt in all_options:
                                         if opt.is_displayed():
                                             self.driver.execute_script("arguments[0].click();", opt)
-                                            time.sleep(0.1)
+                                            self.settle(0.1)
                                             print(f"      ✓ Selected Category: {product_category} (alternative)")
                                             break
                                 except Exception as e2:
@@ -2520,7 +3535,7 @@ class StrandsTestSuite:
                             
                             # Click Add Product button inside modal
                             print("      Clicking Add Product button in modal...")
-                            time.sleep(0.2)  # Wait for form to be ready after filling all fields
+                            self.settle(0.2)  # Wait for form to be ready after filling all fields
                             
                             # Wait for button to be present and get reference
                             submit_button = self.wait.until(
@@ -2535,7 +3550,7 @@ class StrandsTestSuite:
                             
                             # Scroll button into view
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_button)
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             
                             # Get fresh reference after scroll
                             submit_button = self.driver.find_element(By.ID, "add-product-modal-submit-button")
@@ -2550,7 +3565,7 @@ class StrandsTestSuite:
                                 submit_button.click()
                                 print("      ✓ Clicked Add Product button (regular click)")
                             
-                            time.sleep(ACTION_DELAY * 2)  # Wait for product to be added
+                            self.settle(ACTION_DELAY * 2)  # Wait for product to be added
                             
                             print("      ✓ Product added successfully")
                     except Exception as e:
@@ -2563,7 +3578,7 @@ class StrandsTestSuite:
                     print("    Setting operating hours...")
                     try:
                         # Wait for settings page to fully load
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         
                         # Define operating hours for each day (12-hour format with AM/PM)
                         operating_hours = {
@@ -2595,9 +3610,9 @@ class StrandsTestSuite:
                                 button_text = toggle_button.text.strip().upper()
                                 if 'CLOSED' in button_text:
                                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", toggle_button)
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                     toggle_button.click()
-                                    time.sleep(0.4)  # Wait for inputs to appear
+                                    self.settle(0.4)  # Wait for inputs to appear
                                 
                                 # Fill start time
                                 start_input_id = f"hours-{day}-start-time"
@@ -2605,21 +3620,21 @@ class StrandsTestSuite:
                                     EC.element_to_be_clickable((By.ID, start_input_id))
                                 )
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", start_input)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 
                                 # Click the input to focus it first
                                 start_input.click()
-                                time.sleep(0.1)
+                                self.settle(0.1)
                                 
                                 # Clear the input completely
                                 start_input.clear()
                                 # Also clear using JavaScript
                                 self.driver.execute_script("arguments[0].value = '';", start_input)
-                                time.sleep(0.1)
+                                self.settle(0.1)
                                 
                                 # Set value using send_keys character by character to ensure it's complete
                                 start_input.send_keys(start_time_24h)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 
                                 # Also set via JavaScript and trigger React events
                                 self.driver.execute_script(f"""
@@ -2633,7 +3648,7 @@ class StrandsTestSuite:
                                     input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
                                     input.dispatchEvent(new Event('blur', {{ bubbles: true, cancelable: true }}));
                                 """, start_input)
-                                time.sleep(0.3)
+                                self.settle(0.3)
                                 
                                 # Verify the value was set correctly
                                 actual_value = start_input.get_attribute('value')
@@ -2641,7 +3656,7 @@ class StrandsTestSuite:
                                     print(f"        ⚠ Start time value mismatch. Expected: {start_time_24h}, Got: {actual_value}")
                                     # Try one more time with direct JavaScript assignment
                                     self.driver.execute_script(f"arguments[0].value = '{start_time_24h}'; arguments[0].dispatchEvent(new Event('change', {{ bubbles: true }}));", start_input)
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                 else:
                                     print(f"        ✓ Start time set correctly: {actual_value}")
                                 
@@ -2651,21 +3666,21 @@ class StrandsTestSuite:
                                     EC.element_to_be_clickable((By.ID, end_input_id))
                                 )
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", end_input)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 
                                 # Click the input to focus it first
                                 end_input.click()
-                                time.sleep(0.1)
+                                self.settle(0.1)
                                 
                                 # Clear the input completely
                                 end_input.clear()
                                 # Also clear using JavaScript
                                 self.driver.execute_script("arguments[0].value = '';", end_input)
-                                time.sleep(0.1)
+                                self.settle(0.1)
                                 
                                 # Set value using send_keys character by character to ensure it's complete
                                 end_input.send_keys(end_time_24h)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 
                                 # Also set via JavaScript and trigger React events
                                 self.driver.execute_script(f"""
@@ -2679,7 +3694,7 @@ class StrandsTestSuite:
                                     input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
                                     input.dispatchEvent(new Event('blur', {{ bubbles: true, cancelable: true }}));
                                 """, end_input)
-                                time.sleep(0.3)
+                                self.settle(0.3)
                                 
                                 # Verify the value was set correctly
                                 actual_value = end_input.get_attribute('value')
@@ -2687,7 +3702,7 @@ class StrandsTestSuite:
                                     print(f"        ⚠ End time value mismatch. Expected: {end_time_24h}, Got: {actual_value}")
                                     # Try one more time with direct JavaScript assignment
                                     self.driver.execute_script(f"arguments[0].value = '{end_time_24h}'; arguments[0].dispatchEvent(new Event('change', {{ bubbles: true }}));", end_input)
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                 else:
                                     print(f"        ✓ End time set correctly: {actual_value}")
                                 
@@ -2699,7 +3714,7 @@ class StrandsTestSuite:
                                 traceback.print_exc()
                         
                         # Wait a moment for all changes to register
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         
                         # Click Save Operating Hours button
                         print("    Clicking Save Operating Hours button...")
@@ -2708,18 +3723,18 @@ class StrandsTestSuite:
                                 EC.element_to_be_clickable((By.ID, "save-operating-hours-button"))
                             )
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", save_button)
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             
                             # Try JavaScript click first
                             try:
                                 self.driver.execute_script("arguments[0].click();", save_button)
                                 print("      ✓ Clicked Save button (JavaScript click)")
-                            except:
+                            except Exception:
                                 save_button.click()
                                 print("      ✓ Clicked Save button (regular click)")
                             
                             # Wait for save to complete and success modal to appear
-                            time.sleep(ACTION_DELAY * 2)  # Wait for save to complete
+                            self.settle(ACTION_DELAY * 2)  # Wait for save to complete
                             
                             # Click OK button in success modal
                             print("  Clicking OK button in success modal...")
@@ -2728,16 +3743,16 @@ class StrandsTestSuite:
                                     EC.element_to_be_clickable((By.ID, "operating-hours-success-ok-button"))
                                 )
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", ok_button)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 
                                 try:
                                     self.driver.execute_script("arguments[0].click();", ok_button)
                                     print("      ✓ Clicked OK button (JavaScript click)")
-                                except:
+                                except Exception:
                                     ok_button.click()
                                     print("      ✓ Clicked OK button (regular click)")
                                 
-                                time.sleep(0.5)  # Wait for modal to close
+                                self.settle(0.5)  # Wait for modal to close
                                 print("      ✓ Operating hours saved successfully")
                             except Exception as e:
                                 print(f"      ⚠ Could not find or click OK button: {e}")
@@ -2748,9 +3763,9 @@ class StrandsTestSuite:
                                     )
                                     if ok_buttons:
                                         ok_buttons[0].click()
-                                        time.sleep(0.5)
+                                        self.settle(0.5)
                                         print("      ✓ Clicked OK button (fallback)")
-                                except:
+                                except Exception:
                                     print("      ⚠ Could not click OK button, continuing...")
                         except Exception as e:
                             print(f"      ⚠ Error saving operating hours: {e}")
@@ -2763,87 +3778,48 @@ class StrandsTestSuite:
             
             print("  ✓ All owner dashboard tabs checked")
             
-            # Log out of owner account
-            print("\nLogging out of owner account...")
-            try:
-                # Wait for any toast notifications to disappear
-                time.sleep(2.0)
-                try:
-                    toast_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'sonner-toast')]")
-                    if toast_elements:
-                        time.sleep(2.0)
-                except:
-                    pass
-                
-                # Try owner logout button ID first
-                try:
-                    logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "owner-logout-button")))
-                    self.scroll_to_element(logout_button)
-                    time.sleep(0.2)
-                    try:
-                        logout_button.click()
-                    except:
-                        # If regular click fails, use JavaScript click
-                        self.driver.execute_script("arguments[0].click();", logout_button)
-                    # Wait for logout to process and redirect
-                    time.sleep(1.0)
-                    print("  ✓ Logged out using owner logout button ID")
-                except:
-                    # Fallback to XPath
-                    logout_buttons = self.driver.find_elements(By.XPATH, 
-                        "//button[@id='owner-logout-button'] | "
-                        "//button[contains(text(), 'Logout')] | "
-                        "//button[contains(., 'Logout')]"
-                    )
-                    if logout_buttons:
-                        self.scroll_to_element(logout_buttons[0])
-                        time.sleep(0.2)
-                        try:
-                            logout_buttons[0].click()
-                        except:
-                            self.driver.execute_script("arguments[0].click();", logout_buttons[0])
-                        # Wait for logout to process and redirect
-                        time.sleep(1.0)
-                        print("  ✓ Logged out (fallback)")
-                    else:
-                        raise Exception("Could not find logout button")
-            except Exception as e:
-                print(f"  ⚠ Error logging out: {e}")
-                import traceback
-                traceback.print_exc()
-            
+            return True
+        except Exception as e:
+            print(f" Stage owner_dashboard failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_stylist_signup(self):
+        """Sign up a new hairstylist account, then log out"""
+        try:
             # Navigate to landing page and sign up as stylist
             print("\nSigning up as stylist...")
-            time.sleep(0.5)
+            self.settle(0.5)
             self.navigate_and_scroll(f"{BASE_URL}/")
-            time.sleep(0.3)
+            self.settle(0.3)
             
             # Click Get Started button
             try:
                 get_started_button = self.wait.until(EC.element_to_be_clickable((By.ID, "get-started-hero-button")))
                 self.scroll_to_element(get_started_button)
-                time.sleep(0.3)
+                self.settle(0.3)
                 get_started_button.click()
-            except:
+            except Exception:
                 try:
                     get_started_button = self.wait.until(EC.element_to_be_clickable((By.ID, "get-started-header-button")))
                     self.scroll_to_element(get_started_button)
-                    time.sleep(0.3)
+                    self.settle(0.3)
                     get_started_button.click()
-                except:
+                except Exception:
                     get_started_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Get Started')]")
                     if get_started_buttons:
                         get_started_buttons[0].click()
             
-            time.sleep(0.5)
+            self.settle(0.5)
             
             # Ensure we're on signup tab
             try:
                 signup_tab = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Sign Up')]")
                 if signup_tab:
                     signup_tab.click()
-                    time.sleep(0.5)
-            except:
+                    self.settle(0.5)
+            except Exception:
                 pass
             
             # Fill signup form for stylist
@@ -2856,25 +3832,25 @@ class StrandsTestSuite:
                 name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
                 name_input.clear()
                 name_input.send_keys(stylist_name)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 # Fill Email
                 email_input = self.wait.until(EC.presence_of_element_located((By.ID, "email")))
                 email_input.clear()
                 email_input.send_keys(self.stylist_email)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 # Fill Password
                 password_input = self.wait.until(EC.presence_of_element_located((By.ID, "password")))
                 password_input.clear()
                 password_input.send_keys(stylist_password)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 # Fill Confirm Password
                 confirm_password_input = self.wait.until(EC.presence_of_element_located((By.ID, "confirmPassword")))
                 confirm_password_input.clear()
                 confirm_password_input.send_keys(stylist_password)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 # Select Hairstylist role
                 print("  Selecting Hairstylist role...")
@@ -2883,14 +3859,14 @@ class StrandsTestSuite:
                         select_trigger = self.wait.until(EC.element_to_be_clickable((By.ID, "role")))
                         self.scroll_to_element(select_trigger)
                         select_trigger.click()
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         stylist_option = WebDriverWait(self.driver, 3).until(
                             EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and contains(., 'Hairstylist')]"))
                         )
                         stylist_option.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         print("  ✓ Selected Hairstylist role")
-                    except:
+                    except Exception:
                         print("  ⚠ Could not select Hairstylist role")
                 
                 # Click Create Account button
@@ -2898,7 +3874,7 @@ class StrandsTestSuite:
                 create_account_button = self.wait.until(EC.element_to_be_clickable((By.ID, "create-account-button")))
                 self.scroll_to_element(create_account_button)
                 create_account_button.click()
-                time.sleep(ACTION_DELAY * 2)
+                self.settle(ACTION_DELAY * 2)
                 
                 # Check if signup was successful
                 current_url = self.driver.current_url
@@ -2915,23 +3891,23 @@ class StrandsTestSuite:
             print("\nLogging out of stylist account...")
             try:
                 # Wait for page to fully load
-                time.sleep(0.5)
+                self.settle(0.5)
                 
                 # Try stylist logout button by ID
                 try:
                     logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "stylist-logout-button")))
                     self.scroll_to_element(logout_button)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     
                     # Click using JavaScript for reliability
                     try:
                         self.driver.execute_script("arguments[0].click();", logout_button)
                         print("  ✓ Clicked stylist logout button (JavaScript click)")
-                    except:
+                    except Exception:
                         logout_button.click()
                         print("  ✓ Clicked stylist logout button (regular click)")
                     
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     
                     # Handle logout modal
                     try:
@@ -2939,16 +3915,16 @@ class StrandsTestSuite:
                             EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
                         )
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", ok_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         
                         try:
                             self.driver.execute_script("arguments[0].click();", ok_button)
                             print("  ✓ Clicked logout modal OK button (JavaScript click)")
-                        except:
+                        except Exception:
                             ok_button.click()
                             print("  ✓ Clicked logout modal OK button (regular click)")
                         
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         print("  ✓ Logged out of stylist account successfully")
                     except Exception as modal_error:
                         print(f"  ⚠ Could not find or click logout modal OK button: {modal_error}")
@@ -2959,9 +3935,9 @@ class StrandsTestSuite:
                             )
                             if ok_buttons:
                                 ok_buttons[0].click()
-                                time.sleep(0.5)
+                                self.settle(0.5)
                                 print("  ✓ Clicked OK button in logout modal (fallback)")
-                        except:
+                        except Exception:
                             print("  ⚠ Could not find OK button in logout modal")
                             
                 except Exception as btn_error:
@@ -2973,9 +3949,9 @@ class StrandsTestSuite:
                         )
                         if logout_buttons:
                             self.scroll_to_element(logout_buttons[0])
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             self.driver.execute_script("arguments[0].click();", logout_buttons[0])
-                            time.sleep(0.5)
+                            self.settle(0.5)
                             print("  ✓ Clicked stylist logout button (XPath fallback)")
                             
                             # Try to handle modal
@@ -2984,9 +3960,9 @@ class StrandsTestSuite:
                                     EC.element_to_be_clickable((By.ID, "logout-modal-ok-button"))
                                 )
                                 ok_button.click()
-                                time.sleep(0.5)
+                                self.settle(0.5)
                                 print("  ✓ Logged out of stylist account (fallback)")
-                            except:
+                            except Exception:
                                 pass
                     except Exception as fallback_error:
                         print(f"  ⚠ Error in fallback logout attempt: {fallback_error}")
@@ -2998,29 +3974,29 @@ class StrandsTestSuite:
                 import traceback
                 traceback.print_exc()
             
-            # Navigate back to landing page and sign back into owner account
-            print("\nSigning back into owner account...")
-            time.sleep(0.5)
-            self.navigate_and_scroll(f"{BASE_URL}/")
-            time.sleep(0.3)
-            
-            if not self.login(self.owner_email, self.owner_password, "Owner"):
-                print("  ⚠ Failed to log back into owner account")
-                return False
-            
+            return True
+        except Exception as e:
+            print(f" Stage stylist_signup failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_staff_setup(self):
+        """Owner adds the stylist as an employee and sets their hours"""
+        try:
             # Navigate to Staff tab
             print("\nNavigating to Staff tab to add employee...")
             self.navigate_and_scroll(f"{BASE_URL}/owner/staff")
-            time.sleep(0.5)
+            self.settle(0.5)
             
             # Click Add Employee button
             print("  Clicking Add Employee button...")
             try:
                 add_employee_button = self.wait.until(EC.element_to_be_clickable((By.ID, "add-employee-page-button")))
                 self.scroll_to_element(add_employee_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 add_employee_button.click()
-                time.sleep(0.5)  # Wait for modal to appear
+                self.settle(0.5)  # Wait for modal to appear
                 print("  ✓ Clicked Add Employee button")
             except Exception as e:
                 print(f"  ⚠ Error clicking Add Employee button: {e}")
@@ -3032,35 +4008,35 @@ class StrandsTestSuite:
                 # Fill Employee Email
                 email_input = self.wait.until(EC.presence_of_element_located((By.ID, "add-employee-email-input")))
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", email_input)
-                time.sleep(0.2)
+                self.settle(0.2)
                 email_input.clear()
                 email_input.send_keys(self.stylist_email)
-                time.sleep(0.2)
+                self.settle(0.2)
                 print(f"    ✓ Filled Employee Email: {self.stylist_email}")
                 
                 # Fill Job Title
                 job_title_input = self.wait.until(EC.presence_of_element_located((By.ID, "add-employee-job-title-input")))
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", job_title_input)
-                time.sleep(0.2)
+                self.settle(0.2)
                 job_title_input.clear()
                 job_title_input.send_keys("Senior Stylist")
-                time.sleep(0.2)
+                self.settle(0.2)
                 print("    ✓ Filled Job Title: Senior Stylist")
                 
                 # Click Add Employee button in modal
                 print("  Clicking Add Employee button in modal...")
                 submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "add-employee-modal-submit-button")))
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 try:
                     self.driver.execute_script("arguments[0].click();", submit_button)
                     print("    ✓ Clicked Add Employee button (JavaScript click)")
-                except:
+                except Exception:
                     submit_button.click()
                     print("    ✓ Clicked Add Employee button (regular click)")
                 
-                time.sleep(ACTION_DELAY * 2)  # Wait for employee to be added
+                self.settle(ACTION_DELAY * 2)  # Wait for employee to be added
                 
                 # Click OK button in success modal
                 print("  Clicking OK button in success modal...")
@@ -3070,16 +4046,16 @@ class StrandsTestSuite:
                         EC.element_to_be_clickable((By.ID, "add-employee-success-ok-button"))
                     )
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", ok_button)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     
                     try:
                         self.driver.execute_script("arguments[0].click();", ok_button)
                         print("    ✓ Clicked OK button (JavaScript click)")
-                    except:
+                    except Exception:
                         ok_button.click()
                         print("    ✓ Clicked OK button (regular click)")
                     
-                    time.sleep(0.5)  # Wait for modal to close
+                    self.settle(0.5)  # Wait for modal to close
                     print("  ✓ Employee added successfully")
                 except Exception as e:
                     print(f"  ⚠ Could not find or click OK button: {e}")
@@ -3090,13 +4066,13 @@ class StrandsTestSuite:
                         )
                         if ok_buttons:
                             ok_buttons[0].click()
-                            time.sleep(0.5)
+                            self.settle(0.5)
                             print("  ✓ Clicked OK button (fallback)")
-                    except:
+                    except Exception:
                         print("  ⚠ Could not click OK button, continuing...")
                 
                 # Wait for employee list to refresh after modal closes
-                time.sleep(1.5)  # Give time for fetchEmployees to complete and list to render
+                self.settle(1.5)  # Give time for fetchEmployees to complete and list to render
                 
                 # Find the employee card by email and click Set Hours
                 print("\nSetting hours for the newly added employee...")
@@ -3108,7 +4084,7 @@ class StrandsTestSuite:
                         EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{self.stylist_email}')]"))
                     )
                     print(f"  ✓ Found employee email in list: {self.stylist_email}")
-                    time.sleep(0.5)  # Additional wait for card to fully render
+                    self.settle(0.5)  # Additional wait for card to fully render
                     
                     # Try multiple strategies to find the Set Hours button
                     set_hours_button = None
@@ -3142,7 +4118,7 @@ class StrandsTestSuite:
                                 print(f"  ✓ Found Set Hours button (found {len(set_hours_buttons)} total, using last one)")
                             else:
                                 raise Exception("No Set Hours buttons found")
-                        except:
+                        except Exception:
                             # Strategy 3: Find by text
                             set_hours_buttons = self.driver.find_elements(By.XPATH, 
                                 "//button[contains(text(), 'Set Hours')]"
@@ -3156,16 +4132,16 @@ class StrandsTestSuite:
                     # Click the Set Hours button
                     if set_hours_button:
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", set_hours_button)
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         
                         try:
                             self.driver.execute_script("arguments[0].click();", set_hours_button)
                             print("  ✓ Clicked Set Hours button (JavaScript click)")
-                        except:
+                        except Exception:
                             set_hours_button.click()
                             print("  ✓ Clicked Set Hours button (regular click)")
                         
-                        time.sleep(0.5)  # Wait for modal to appear
+                        self.settle(0.5)  # Wait for modal to appear
                     else:
                         print("  ⚠ Could not find Set Hours button")
                         return False
@@ -3201,9 +4177,9 @@ class StrandsTestSuite:
                             button_text = toggle_button.text.strip().upper()
                             if 'NOT AVAILABLE' in button_text or 'UNAVAILABLE' in button_text:
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", toggle_button)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 toggle_button.click()
-                                time.sleep(0.4)  # Wait for inputs to appear
+                                self.settle(0.4)  # Wait for inputs to appear
                             
                             # Fill start time
                             start_input_id = f"employee-{day}-start-time"
@@ -3211,16 +4187,16 @@ class StrandsTestSuite:
                                 EC.element_to_be_clickable((By.ID, start_input_id))
                             )
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", start_input)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Click and set value
                             start_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             start_input.clear()
                             self.driver.execute_script("arguments[0].value = '';", start_input)
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             start_input.send_keys(start_time_24h)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Trigger React events
                             self.driver.execute_script(f"""
@@ -3231,7 +4207,7 @@ class StrandsTestSuite:
                                 input.dispatchEvent(new Event('input', {{ bubbles: true, cancelable: true }}));
                                 input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
                             """, start_input)
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             
                             # Fill end time
                             end_input_id = f"employee-{day}-end-time"
@@ -3239,16 +4215,16 @@ class StrandsTestSuite:
                                 EC.element_to_be_clickable((By.ID, end_input_id))
                             )
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", end_input)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Click and set value
                             end_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             end_input.clear()
                             self.driver.execute_script("arguments[0].value = '';", end_input)
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             end_input.send_keys(end_time_24h)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Trigger React events
                             self.driver.execute_script(f"""
@@ -3259,7 +4235,7 @@ class StrandsTestSuite:
                                 input.dispatchEvent(new Event('input', {{ bubbles: true, cancelable: true }}));
                                 input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
                             """, end_input)
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             
                             print(f"      ✓ Set {day.capitalize()} hours: {start_time_12h} to {end_time_12h}")
                             
@@ -3269,7 +4245,7 @@ class StrandsTestSuite:
                             traceback.print_exc()
                     
                     # Wait for all changes to register
-                    time.sleep(0.5)
+                    self.settle(0.5)
                     
                     # Click Save Hours button
                     print("  Clicking Save Hours button...")
@@ -3278,16 +4254,16 @@ class StrandsTestSuite:
                             EC.element_to_be_clickable((By.ID, "save-employee-hours-button"))
                         )
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", save_button)
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         
                         try:
                             self.driver.execute_script("arguments[0].click();", save_button)
                             print("    ✓ Clicked Save Hours button (JavaScript click)")
-                        except:
+                        except Exception:
                             save_button.click()
                             print("    ✓ Clicked Save Hours button (regular click)")
                         
-                        time.sleep(ACTION_DELAY * 2)  # Wait for save to complete
+                        self.settle(ACTION_DELAY * 2)  # Wait for save to complete
                         
                         # Click OK button in success modal
                         print("  Clicking OK button in employee hours success modal...")
@@ -3296,16 +4272,16 @@ class StrandsTestSuite:
                                 EC.element_to_be_clickable((By.ID, "employee-hours-success-ok-button"))
                             )
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", ok_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             try:
                                 self.driver.execute_script("arguments[0].click();", ok_button)
                                 print("    ✓ Clicked OK button (JavaScript click)")
-                            except:
+                            except Exception:
                                 ok_button.click()
                                 print("    ✓ Clicked OK button (regular click)")
                             
-                            time.sleep(0.5)  # Wait for modal to close
+                            self.settle(0.5)  # Wait for modal to close
                             print("  ✓ Employee hours saved successfully")
                         except Exception as e:
                             print(f"  ⚠ Could not find or click OK button: {e}")
@@ -3316,9 +4292,9 @@ class StrandsTestSuite:
                                 )
                                 if ok_buttons:
                                     ok_buttons[0].click()
-                                    time.sleep(0.5)
+                                    self.settle(0.5)
                                     print("  ✓ Clicked OK button (fallback)")
-                            except:
+                            except Exception:
                                 print("  ⚠ Could not click OK button, continuing...")
                     except Exception as e:
                         print(f"  ⚠ Error saving employee hours: {e}")
@@ -3335,65 +4311,16 @@ class StrandsTestSuite:
                 import traceback
                 traceback.print_exc()
             
-            # Log out of owner account
-            print("\nLogging out of owner account...")
-            try:
-                # Wait for any toast notifications to disappear
-                time.sleep(2.0)
-                try:
-                    toast_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'sonner-toast')]")
-                    if toast_elements:
-                        time.sleep(2.0)
-                except:
-                    pass
-                
-                # Try owner logout button ID first
-                try:
-                    logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "owner-logout-button")))
-                    self.scroll_to_element(logout_button)
-                    time.sleep(0.2)
-                    try:
-                        logout_button.click()
-                    except:
-                        # If regular click fails, use JavaScript click
-                        self.driver.execute_script("arguments[0].click();", logout_button)
-                    # Wait for logout to process and redirect
-                    time.sleep(1.0)
-                    print("  ✓ Logged out using owner logout button ID")
-                except:
-                    # Fallback to XPath
-                    logout_buttons = self.driver.find_elements(By.XPATH, 
-                        "//button[@id='owner-logout-button'] | "
-                        "//button[contains(text(), 'Logout')] | "
-                        "//button[contains(., 'Logout')]"
-                    )
-                    if logout_buttons:
-                        self.scroll_to_element(logout_buttons[0])
-                        time.sleep(0.2)
-                        try:
-                            logout_buttons[0].click()
-                        except:
-                            self.driver.execute_script("arguments[0].click();", logout_buttons[0])
-                        # Wait for logout to process and redirect
-                        time.sleep(1.0)
-                        print("  ✓ Logged out (fallback)")
-                    else:
-                        raise Exception("Could not find logout button")
-            except Exception as e:
-                print(f"  ⚠ Error logging out: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            # Navigate to landing page and sign back into stylist account
-            print("\nSigning back into stylist account...")
-            time.sleep(0.5)
-            self.navigate_and_scroll(f"{BASE_URL}/")
-            time.sleep(0.3)
-            
-            if not self.login(self.stylist_email, "test123", "Stylist"):
-                print("  ⚠ Failed to log back into stylist account")
-                return False
-            
+            return True
+        except Exception as e:
+            print(f" Stage staff_setup failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_stylist_dashboard(self):
+        """Stylist walks the dashboard tabs (block time, services)"""
+        try:
             # Go through stylist dashboard tabs in order
             print("\nGoing through stylist dashboard tabs in order...")
             stylist_tabs = [
@@ -3410,17 +4337,14 @@ class StrandsTestSuite:
                 try:
                     tab_button = self.wait.until(EC.element_to_be_clickable((By.ID, f"stylist-tab-{tab_id}")))
                     self.scroll_to_element(tab_button)
-                    time.sleep(0.2)
+                    self.settle(0.2)
                     tab_button.click()
-                    time.sleep(0.5)  # Wait for tab content to load
+                    self.settle(0.5)  # Wait for tab content to load
                     print(f"    ✓ Opened {tab_name} tab")
                     
                     # Scroll through the page content to ensure everything loads
                     try:
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(0.3)
-                        self.driver.execute_script("window.scrollTo(0, 0);")
-                        time.sleep(0.3)
+                        self.scroll_through_page(step=None, pause=0.3)
                         print(f"    ✓ Scrolled through {tab_name} tab content")
                     except Exception as e:
                         print(f"    ⚠ Could not scroll {tab_name} tab: {e}")
@@ -3436,9 +4360,9 @@ class StrandsTestSuite:
                     try:
                         refresh_button = self.wait.until(EC.element_to_be_clickable((By.ID, "refresh-data-button")))
                         self.scroll_to_element(refresh_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         refresh_button.click()
-                        time.sleep(0.5)  # Wait for data refresh
+                        self.settle(0.5)  # Wait for data refresh
                         print("      ✓ Clicked Refresh Data button")
                     except Exception as e:
                         print(f"      ⚠ Could not click Refresh Data button: {e}")
@@ -3448,9 +4372,9 @@ class StrandsTestSuite:
                     try:
                         block_time_button = self.wait.until(EC.element_to_be_clickable((By.ID, "block-time-button")))
                         self.scroll_to_element(block_time_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         block_time_button.click()
-                        time.sleep(0.5)  # Wait for modal to appear
+                        self.settle(0.5)  # Wait for modal to appear
                         print("      ✓ Clicked Block Time button")
                         
                         # Test error handling: Try to block time with empty fields
@@ -3458,14 +4382,14 @@ class StrandsTestSuite:
                         try:
                             block_submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "block-time-modal-submit-button")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", block_submit_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             try:
                                 self.driver.execute_script("arguments[0].click();", block_submit_button)
-                            except:
+                            except Exception:
                                 block_submit_button.click()
                             
-                            time.sleep(0.5)  # Wait for error message
+                            self.settle(0.5)  # Wait for error message
                             
                             # Check for error message (toast or validation)
                             error_elements = self.driver.find_elements(By.XPATH, 
@@ -3487,41 +4411,41 @@ class StrandsTestSuite:
                             # Re-open modal if it closed
                             try:
                                 block_submit_button = self.driver.find_element(By.ID, "block-time-modal-submit-button")
-                            except:
+                            except Exception:
                                 block_time_button = self.wait.until(EC.element_to_be_clickable((By.ID, "block-time-button")))
                                 block_time_button.click()
-                                time.sleep(0.5)
+                                self.settle(0.5)
                             
                             # Select Monday
                             day_select = self.wait.until(EC.presence_of_element_located((By.ID, "block-time-day-select")))
                             day_dropdown = Select(day_select)
                             day_dropdown.select_by_value("1")
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Set time outside worker hours (e.g., 11:00 PM - 01:00 AM)
                             start_time_input = self.wait.until(EC.presence_of_element_located((By.ID, "block-time-start-time")))
                             start_time_input.click()
                             start_time_input.clear()
                             start_time_input.send_keys("23:00")  # 11:00 PM
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             end_time_input = self.wait.until(EC.presence_of_element_located((By.ID, "block-time-end-time")))
                             end_time_input.click()
                             end_time_input.clear()
                             end_time_input.send_keys("01:00")  # 1:00 AM
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Try to submit
                             block_submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "block-time-modal-submit-button")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", block_submit_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             try:
                                 self.driver.execute_script("arguments[0].click();", block_submit_button)
-                            except:
+                            except Exception:
                                 block_submit_button.click()
                             
-                            time.sleep(0.5)  # Wait for error message
+                            self.settle(0.5)  # Wait for error message
                             print("      ✓ Attempted to block time outside worker hours")
                             print("      ℹ Note: Backend may or may not validate this")
                         except Exception as e:
@@ -3532,21 +4456,21 @@ class StrandsTestSuite:
                         # Re-open modal if it closed
                         try:
                             block_submit_button = self.driver.find_element(By.ID, "block-time-modal-submit-button")
-                        except:
+                        except Exception:
                             block_time_button = self.wait.until(EC.element_to_be_clickable((By.ID, "block-time-button")))
                             block_time_button.click()
-                            time.sleep(0.5)
+                            self.settle(0.5)
                         
                         # Select Day of Week (dropdown)
                         try:
                             day_select = self.wait.until(EC.presence_of_element_located((By.ID, "block-time-day-select")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", day_select)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Select Monday (value="1")
                             day_dropdown = Select(day_select)
                             day_dropdown.select_by_value("1")  # Monday
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             print("      ✓ Selected Monday")
                         except Exception as e:
                             print(f"      ⚠ Could not select day: {e}")
@@ -3555,14 +4479,14 @@ class StrandsTestSuite:
                         try:
                             start_time_input = self.wait.until(EC.presence_of_element_located((By.ID, "block-time-start-time")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", start_time_input)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             start_time_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             start_time_input.clear()
                             start_time_24h = self.convert_12h_to_24h("02:00 PM")
                             start_time_input.send_keys(start_time_24h)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Trigger React events
                             self.driver.execute_script(f"""
@@ -3573,7 +4497,7 @@ class StrandsTestSuite:
                                 input.dispatchEvent(new Event('input', {{ bubbles: true, cancelable: true }}));
                                 input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
                             """, start_time_input)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             print("      ✓ Set Start Time: 02:00 PM")
                         except Exception as e:
                             print(f"      ⚠ Could not set start time: {e}")
@@ -3582,14 +4506,14 @@ class StrandsTestSuite:
                         try:
                             end_time_input = self.wait.until(EC.presence_of_element_located((By.ID, "block-time-end-time")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", end_time_input)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             end_time_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             end_time_input.clear()
                             end_time_24h = self.convert_12h_to_24h("04:00 PM")
                             end_time_input.send_keys(end_time_24h)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             # Trigger React events
                             self.driver.execute_script(f"""
@@ -3600,7 +4524,7 @@ class StrandsTestSuite:
                                 input.dispatchEvent(new Event('input', {{ bubbles: true, cancelable: true }}));
                                 input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
                             """, end_time_input)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             print("      ✓ Set End Time: 04:00 PM")
                         except Exception as e:
                             print(f"      ⚠ Could not set end time: {e}")
@@ -3610,16 +4534,16 @@ class StrandsTestSuite:
                         try:
                             block_submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "block-time-modal-submit-button")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", block_submit_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             try:
                                 self.driver.execute_script("arguments[0].click();", block_submit_button)
                                 print("      ✓ Clicked Block Time button (JavaScript click)")
-                            except:
+                            except Exception:
                                 block_submit_button.click()
                                 print("      ✓ Clicked Block Time button (regular click)")
                             
-                            time.sleep(ACTION_DELAY * 2)  # Wait for block to be saved
+                            self.settle(ACTION_DELAY * 2)  # Wait for block to be saved
                             print("      ✓ Time slot blocked successfully")
                         except Exception as e:
                             print(f"      ⚠ Error clicking Block Time button: {e}")
@@ -3627,7 +4551,7 @@ class StrandsTestSuite:
                             traceback.print_exc()
                         
                         # Wait for modal to close
-                        time.sleep(0.5)
+                        self.settle(0.5)
                         
                         # Click Next Day button a few times
                         print("    Clicking Next Day button a few times...")
@@ -3636,9 +4560,9 @@ class StrandsTestSuite:
                                 next_day_button = self.wait.until(EC.element_to_be_clickable((By.ID, "next-day-button")))
                                 if next_day_button.is_enabled():
                                     self.scroll_to_element(next_day_button)
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                     next_day_button.click()
-                                    time.sleep(0.3)
+                                    self.settle(0.3)
                                     print(f"      ✓ Clicked Next Day ({i+1}/3)")
                                 else:
                                     print(f"      ⚠ Next Day button disabled, stopping at {i+1}")
@@ -3654,9 +4578,9 @@ class StrandsTestSuite:
                                 prev_day_button = self.wait.until(EC.element_to_be_clickable((By.ID, "previous-day-button")))
                                 if prev_day_button.is_enabled():
                                     self.scroll_to_element(prev_day_button)
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                     prev_day_button.click()
-                                    time.sleep(0.3)
+                                    self.settle(0.3)
                                     print(f"      ✓ Clicked Previous Day ({i+1}/3)")
                                 else:
                                     print(f"      ⚠ Previous Day button disabled, stopping at {i+1}")
@@ -3670,9 +4594,9 @@ class StrandsTestSuite:
                         try:
                             week_view_button = self.wait.until(EC.element_to_be_clickable((By.ID, "schedule-view-week-button")))
                             self.scroll_to_element(week_view_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             week_view_button.click()
-                            time.sleep(0.5)  # Wait for week view to load
+                            self.settle(0.5)  # Wait for week view to load
                             print("      ✓ Switched to Week view")
                         except Exception as e:
                             print(f"      ⚠ Could not switch to Week view: {e}")
@@ -3683,9 +4607,9 @@ class StrandsTestSuite:
                             next_week_button = self.wait.until(EC.element_to_be_clickable((By.ID, "next-week-button")))
                             if next_week_button.is_enabled():
                                 self.scroll_to_element(next_week_button)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 next_week_button.click()
-                                time.sleep(0.5)
+                                self.settle(0.5)
                                 print("      ✓ Clicked Next Week")
                             else:
                                 print("      ⚠ Next Week button is disabled")
@@ -3698,9 +4622,9 @@ class StrandsTestSuite:
                             prev_week_button = self.wait.until(EC.element_to_be_clickable((By.ID, "previous-week-button")))
                             if prev_week_button.is_enabled():
                                 self.scroll_to_element(prev_week_button)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 prev_week_button.click()
-                                time.sleep(0.5)
+                                self.settle(0.5)
                                 print("      ✓ Clicked Previous Week")
                             else:
                                 print("      ⚠ Previous Week button is disabled")
@@ -3712,16 +4636,16 @@ class StrandsTestSuite:
                         try:
                             unblock_button = self.wait.until(EC.element_to_be_clickable((By.ID, "unblock-time-button")))
                             self.scroll_to_element(unblock_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             unblock_button.click()
-                            time.sleep(0.5)  # Wait for modal to appear
+                            self.settle(0.5)  # Wait for modal to appear
                             print("      ✓ Clicked Unblock Time button")
                             
                             # Try to click the X button to remove a blocked slot (if any exist)
                             print("    Attempting to click X button to remove a blocked time slot...")
                             try:
                                 # Wait a moment for blocked slots to load
-                                time.sleep(0.5)
+                                self.settle(0.5)
                                 
                                 # Try to find any remove button (X button) for blocked slots
                                 # The button has ID like "unblock-time-remove-button-{id}"
@@ -3730,25 +4654,25 @@ class StrandsTestSuite:
                                     # Click the first remove button
                                     remove_button = remove_buttons[0]
                                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", remove_button)
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                     try:
                                         self.driver.execute_script("arguments[0].click();", remove_button)
                                         print("      ✓ Clicked X button to remove blocked slot (JavaScript click)")
-                                    except:
+                                    except Exception:
                                         remove_button.click()
                                         print("      ✓ Clicked X button to remove blocked slot (regular click)")
-                                    time.sleep(0.5)  # Wait for removal
+                                    self.settle(0.5)  # Wait for removal
                                     
                                     # If modal closed (last slot removed), re-open it
                                     try:
                                         close_button = self.driver.find_element(By.ID, "unblock-time-modal-cancel-button")
-                                    except:
+                                    except Exception:
                                         print("      Modal closed after removal, re-opening...")
                                         unblock_button = self.wait.until(EC.element_to_be_clickable((By.ID, "unblock-time-button")))
                                         self.scroll_to_element(unblock_button)
-                                        time.sleep(0.2)
+                                        self.settle(0.2)
                                         unblock_button.click()
-                                        time.sleep(0.5)
+                                        self.settle(0.5)
                                 else:
                                     print("      ⚠ No blocked slots found to remove")
                             except Exception as e:
@@ -3759,14 +4683,14 @@ class StrandsTestSuite:
                             try:
                                 close_button = self.wait.until(EC.element_to_be_clickable((By.ID, "unblock-time-modal-cancel-button")))
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", close_button)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 try:
                                     self.driver.execute_script("arguments[0].click();", close_button)
                                     print("      ✓ Clicked Close button (JavaScript click)")
-                                except:
+                                except Exception:
                                     close_button.click()
                                     print("      ✓ Clicked Close button (regular click)")
-                                time.sleep(0.3)
+                                self.settle(0.3)
                             except Exception as e:
                                 print(f"      ⚠ Could not click Close button: {e}")
                             
@@ -3813,9 +4737,9 @@ class StrandsTestSuite:
                         try:
                             add_service_button = self.wait.until(EC.element_to_be_clickable((By.ID, "add-service-page-button")))
                             self.scroll_to_element(add_service_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             add_service_button.click()
-                            time.sleep(0.5)  # Wait for modal to appear
+                            self.settle(0.5)  # Wait for modal to appear
                             print(f"      ✓ Clicked Add Service button for service {service_idx}")
                         except Exception as e:
                             print(f"      ⚠ Could not click Add Service button: {e}")
@@ -3826,45 +4750,45 @@ class StrandsTestSuite:
                             # Service Name
                             name_input = self.wait.until(EC.presence_of_element_located((By.ID, "add-service-name-input")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", name_input)
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             name_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             name_input.clear()
                             name_input.send_keys(service_data["name"])
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             print(f"      ✓ Entered service name: {service_data['name']}")
                             
                             # Description
                             desc_input = self.wait.until(EC.presence_of_element_located((By.ID, "add-service-description-input")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", desc_input)
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             desc_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             desc_input.clear()
                             desc_input.send_keys(service_data["description"])
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             print(f"      ✓ Entered description")
                             
                             # Duration
                             duration_input = self.wait.until(EC.presence_of_element_located((By.ID, "add-service-duration-input")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", duration_input)
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             duration_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             duration_input.clear()
                             duration_input.send_keys(service_data["duration"])
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             print(f"      ✓ Entered duration: {service_data['duration']} minutes")
                             
                             # Price
                             price_input = self.wait.until(EC.presence_of_element_located((By.ID, "add-service-price-input")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", price_input)
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             price_input.click()
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             price_input.clear()
                             price_input.send_keys(service_data["price"])
-                            time.sleep(0.1)
+                            self.settle(0.1)
                             print(f"      ✓ Entered price: ${service_data['price']}")
                             
                         except Exception as e:
@@ -3878,16 +4802,16 @@ class StrandsTestSuite:
                         try:
                             create_button = self.wait.until(EC.element_to_be_clickable((By.ID, "add-service-modal-submit-button")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", create_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             
                             try:
                                 self.driver.execute_script("arguments[0].click();", create_button)
                                 print(f"      ✓ Clicked Create Service button (JavaScript click)")
-                            except:
+                            except Exception:
                                 create_button.click()
                                 print(f"      ✓ Clicked Create Service button (regular click)")
                             
-                            time.sleep(ACTION_DELAY * 3)  # Wait for service to be created
+                            self.settle(ACTION_DELAY * 3)  # Wait for service to be created
                             print(f"      ✓ Service {service_idx} created successfully")
                         except Exception as e:
                             print(f"      ⚠ Error clicking Create Service button: {e}")
@@ -3900,35 +4824,35 @@ class StrandsTestSuite:
                     print("    Deleting the first service...")
                     try:
                         # Wait for services to load
-                        time.sleep(1)
+                        self.settle(1)
                         
                         # Find the first delete button (delete-service-button-{service_id})
                         delete_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'delete-service-button-')]")
                         if delete_buttons:
                             delete_button = delete_buttons[0]
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", delete_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", delete_button)
                                 print("      ✓ Clicked Delete button (JavaScript click)")
-                            except:
+                            except Exception:
                                 delete_button.click()
                                 print("      ✓ Clicked Delete button (regular click)")
                             
-                            time.sleep(0.5)  # Wait for delete modal to appear
+                            self.settle(0.5)  # Wait for delete modal to appear
                             
                             # Click Delete Service button in confirmation modal
                             delete_confirm_button = self.wait.until(EC.element_to_be_clickable((By.ID, "delete-service-modal-submit-button")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", delete_confirm_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", delete_confirm_button)
                                 print("      ✓ Clicked Delete Service button in modal (JavaScript click)")
-                            except:
+                            except Exception:
                                 delete_confirm_button.click()
                                 print("      ✓ Clicked Delete Service button in modal (regular click)")
                             
-                            time.sleep(ACTION_DELAY * 2)  # Wait for service to be deleted
+                            self.settle(ACTION_DELAY * 2)  # Wait for service to be deleted
                             print("      ✓ Service deleted successfully")
                         else:
                             print("      ⚠ No delete buttons found")
@@ -3941,35 +4865,35 @@ class StrandsTestSuite:
                     print("    Editing the second service (changing price)...")
                     try:
                         # Wait for services to load
-                        time.sleep(1)
+                        self.settle(1)
                         
                         # Find the second edit button (edit-service-button-{service_id})
                         edit_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'edit-service-button-')]")
                         if edit_buttons and len(edit_buttons) >= 1:
                             edit_button = edit_buttons[0]  # Second service (first was deleted)
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", edit_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", edit_button)
                                 print("      ✓ Clicked Edit button (JavaScript click)")
-                            except:
+                            except Exception:
                                 edit_button.click()
                                 print("      ✓ Clicked Edit button (regular click)")
                             
-                            time.sleep(0.5)  # Wait for edit modal to appear
+                            self.settle(0.5)  # Wait for edit modal to appear
                             
                             # Update the price field
                             try:
                                 price_input = self.wait.until(EC.presence_of_element_located((By.ID, "edit-service-price-input")))
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", price_input)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 
                                 price_input.click()
-                                time.sleep(0.1)
+                                self.settle(0.1)
                                 price_input.clear()
                                 new_price = "50.00"
                                 price_input.send_keys(new_price)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 
                                 # Trigger React events
                                 self.driver.execute_script(f"""
@@ -3980,7 +4904,7 @@ class StrandsTestSuite:
                                     input.dispatchEvent(new Event('input', {{ bubbles: true, cancelable: true }}));
                                     input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
                                 """, price_input)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 print(f"      ✓ Updated price to ${new_price}")
                             except Exception as e:
                                 print(f"      ⚠ Error updating price: {e}")
@@ -3988,15 +4912,15 @@ class StrandsTestSuite:
                             # Click Update Service button
                             update_button = self.wait.until(EC.element_to_be_clickable((By.ID, "update-service-modal-submit-button")))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", update_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", update_button)
                                 print("      ✓ Clicked Update Service button (JavaScript click)")
-                            except:
+                            except Exception:
                                 update_button.click()
                                 print("      ✓ Clicked Update Service button (regular click)")
                             
-                            time.sleep(ACTION_DELAY * 2)  # Wait for service to be updated
+                            self.settle(ACTION_DELAY * 2)  # Wait for service to be updated
                             print("      ✓ Service updated successfully")
                         else:
                             print("      ⚠ No edit buttons found")
@@ -4007,87 +4931,45 @@ class StrandsTestSuite:
             
             print("  ✓ All stylist dashboard tabs checked")
             
-            # Log out of stylist account
-            print("Logging out of stylist account...")
-            try:
-                # Wait for any toast notifications to disappear
-                try:
-                    toasts = self.driver.find_elements(By.XPATH, "//li[@data-sonner-toast]")
-                    if toasts:
-                        print("  Waiting for toast notifications to disappear...")
-                        WebDriverWait(self.driver, 5).until(
-                            lambda d: len(d.find_elements(By.XPATH, "//li[@data-sonner-toast and @data-visible='true']")) == 0
-                        )
-                        time.sleep(0.5)  # Extra wait for animation
-                except:
-                    pass  # No toasts or they already disappeared
-                
-                logout_button = self.wait.until(EC.element_to_be_clickable((By.ID, "stylist-logout-button")))
-                self.scroll_to_element(logout_button)
-                time.sleep(0.2)
-                
-                # Try regular click first, fallback to JavaScript click if intercepted
-                try:
-                    logout_button.click()
-                except:
-                    # If click is intercepted, use JavaScript click
-                    self.driver.execute_script("arguments[0].click();", logout_button)
-                time.sleep(0.5)
-                
-                # Handle logout confirmation modal if present
-                try:
-                    confirm_buttons = self.driver.find_elements(By.XPATH, 
-                        "//button[contains(text(), 'Logout')] | "
-                        "//button[contains(text(), 'Log out')] | "
-                        "//button[contains(text(), 'Yes')] | "
-                        "//button[contains(text(), 'Confirm')]"
-                    )
-                    if confirm_buttons:
-                        confirm_buttons[0].click()
-                        time.sleep(0.5)
-                except:
-                    pass
-                
-                # Wait for redirect to landing page
-                time.sleep(1)
-                current_url = self.driver.current_url
-                if "/login" in current_url or "/" == current_url or current_url.endswith("/"):
-                    print("  ✓ Successfully logged out of stylist account")
-                else:
-                    print(f"  ⚠ Logout may not have completed - current URL: {current_url}")
-            except Exception as e:
-                print(f"  ⚠ Error logging out: {e}")
-                import traceback
-                traceback.print_exc()
-            
+            return True
+        except Exception as e:
+            print(f" Stage stylist_dashboard failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_customer_booking(self):
+        """Sign up a customer and book and pay for the first appointment"""
+        booked = False
+        try:
             # Navigate to landing page and sign up a new user account
             print("Navigating to landing page to sign up new user...")
             try:
                 self.navigate_and_scroll(f"{BASE_URL}/")
-                time.sleep(0.5)
+                self.settle(0.5)
                 
                 # Click Get Started button
                 try:
                     get_started_button = self.wait.until(EC.element_to_be_clickable((By.ID, "get-started-hero-button")))
                     get_started_button.click()
-                except:
+                except Exception:
                     try:
                         get_started_button = self.wait.until(EC.element_to_be_clickable((By.ID, "get-started-header-button")))
                         get_started_button.click()
-                    except:
+                    except Exception:
                         get_started_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Get Started')]")
                         if get_started_buttons:
                             get_started_buttons[0].click()
                 
-                time.sleep(0.5)
+                self.settle(0.5)
                 
                 # Ensure we're on signup tab
                 try:
                     signup_tab = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Sign Up')]")
                     if signup_tab:
                         signup_tab.click()
-                        time.sleep(0.5)
-                except:
+                        self.settle(0.5)
+                except Exception:
                     pass
                 
                 # Generate new user credentials
@@ -4101,43 +4983,43 @@ class StrandsTestSuite:
                 name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
                 name_input.clear()
                 name_input.send_keys(new_user_name)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 email_input = self.wait.until(EC.presence_of_element_located((By.ID, "email")))
                 email_input.clear()
                 email_input.send_keys(new_user_email)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 password_input = self.wait.until(EC.presence_of_element_located((By.ID, "password")))
                 password_input.clear()
                 password_input.send_keys(new_user_password)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 confirm_password_input = self.wait.until(EC.presence_of_element_located((By.ID, "confirmPassword")))
                 confirm_password_input.clear()
                 confirm_password_input.send_keys(new_user_password)
-                time.sleep(0.2)
+                self.settle(0.2)
                 
                 # Select Customer role (default user)
                 try:
                     role_select = self.driver.find_element(By.ID, "role")
                     if role_select:
                         role_select.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         customer_option = WebDriverWait(self.driver, 3).until(
                             EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and contains(., 'Customer')]"))
                         )
                         customer_option.click()
-                        time.sleep(0.3)
-                except:
+                        self.settle(0.3)
+                except Exception:
                     print("  ℹ Using default role (Customer)")
                 
                 # Click Create Account button
                 create_account_button = self.wait.until(EC.element_to_be_clickable((By.ID, "create-account-button")))
                 self.scroll_to_element(create_account_button)
-                time.sleep(0.2)
+                self.settle(0.2)
                 create_account_button.click()
-                time.sleep(ACTION_DELAY * 3)  # Wait for account creation
+                self.settle(ACTION_DELAY * 3)  # Wait for account creation
                 
                 # Wait for redirect after signup
                 print("Waiting for redirect after signup...")
@@ -4145,8 +5027,8 @@ class StrandsTestSuite:
                     WebDriverWait(self.driver, 10).until(
                         lambda driver: "/login" not in driver.current_url
                     )
-                    time.sleep(1)  # Additional wait for page to fully load
-                except:
+                    self.settle(1)  # Additional wait for page to fully load
+                except Exception:
                     print("  ⚠ Timeout waiting for redirect")
                 
                 # Check if signup was successful and navigate to browser
@@ -4168,12 +5050,12 @@ class StrandsTestSuite:
                     try:
                         if "/browser" not in current_url:
                             print("  Navigating to /browser...")
-                            self.driver.get(f"{BASE_URL}/browser")
-                            time.sleep(2)  # Wait for page to load
+                            self.spa_navigate("/browser")
+                            self.settle(2)  # Wait for page to load
                             print(f"  Current URL: {self.driver.current_url}")
                         else:
                             print("  Already on browser page")
-                            time.sleep(1)  # Wait for page to fully load
+                            self.settle(1)  # Wait for page to fully load
                     except Exception as e:
                         print(f"  ⚠ Error navigating to browser page: {e}")
                         import traceback
@@ -4181,80 +5063,25 @@ class StrandsTestSuite:
                         # Try alternative navigation
                         try:
                             self.navigate_and_scroll(f"{BASE_URL}/browser")
-                            time.sleep(2)
-                        except:
+                            self.settle(2)
+                        except Exception:
                             pass
                     
-                    # Wait for salon cards to load completely
+                    # Wait for salon cards to load completely: loaders gone, our salon's card
+                    # and its View Details button rendered, and the list no longer changing
                     print("Waiting for salon cards to load...")
-                    try:
-                        # Wait for loading indicator to disappear or cards to appear
-                        # First, wait for any loading indicators to disappear
-                        print("  Step 1: Waiting for loading indicators to disappear...")
-                        try:
-                            WebDriverWait(self.driver, 15).until_not(
-                                EC.presence_of_element_located((By.XPATH, 
-                                    "//div[contains(text(), 'Loading salons')] | "
-                                    "//div[contains(text(), 'Loading')] | "
-                                    "//div[contains(@class, 'animate-pulse')] | "
-                                    "//div[contains(@class, 'spinner')]"
-                                ))
-                            )
-                            print("  ✓ Loading indicators disappeared")
-                        except:
-                            print("  ℹ No loading indicators found or timeout - continuing")
-                            time.sleep(2)  # Give it a moment anyway
-                        
-                        # Wait for at least one salon card to be visible (not just present)
-                        print("  Step 2: Waiting for salon cards to be visible...")
-                        WebDriverWait(self.driver, 20).until(
-                            EC.visibility_of_element_located((By.XPATH, 
-                                "//div[contains(@class, 'Card')] | "
-                                "//div[contains(@class, 'card')] | "
-                                "//article"
-                            ))
-                        )
-                        print("  ✓ Salon cards are visible")
-                        
-                        # Additional wait to ensure cards are fully rendered
-                        time.sleep(2)
-                        
-                        # Wait specifically for "Selenium Test Salon" text to be visible
-                        print("  Step 3: Waiting for 'Selenium Test Salon' to appear...")
-                        WebDriverWait(self.driver, 15).until(
-                            EC.visibility_of_element_located((By.XPATH, 
-                                "//*[contains(text(), 'Selenium Test Salon')]"
-                            ))
-                        )
-                        print("  ✓ 'Selenium Test Salon' is visible on page")
-                        
-                        # Wait for View Details buttons to be present and clickable
-                        print("  Step 4: Waiting for View Details buttons to be available...")
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.XPATH, 
-                                "//button[contains(@id, 'view-details-button-')]"
-                            ))
-                        )
-                        print("  ✓ View Details buttons are present")
-                        
-                        # Wait for at least one View Details button to be clickable
-                        print("  Step 5: Waiting for View Details button to be clickable...")
-                        WebDriverWait(self.driver, 10).until(
-                            EC.element_to_be_clickable((By.XPATH, 
-                                "//button[contains(@id, 'view-details-button-')]"
-                            ))
-                        )
-                        print("  ✓ View Details buttons are clickable")
-                        
-                        # Final wait to ensure everything is fully interactive
-                        time.sleep(2)
-                        print("  ✓ Salon cards are fully loaded and ready for interaction")
-                    except Exception as e:
-                        print(f"  ⚠ Error waiting for salon cards: {e}")
-                        import traceback
-                        traceback.print_exc()
+                    cards_ready = self.wait_for_dom_stable(
+                        quiet_ms=300,
+                        required_selectors=[
+                            "//*[contains(text(), 'Selenium Test Salon')]",
+                            "button[id^='view-details-button-']:not([disabled])",
+                        ],
+                        absent_selectors=["//div[contains(text(), 'Loading salons')]"],
+                        timeout=20,
+                        description="Salon cards",
+                    )
+                    if not cards_ready:
                         print("  Continuing anyway - cards might still be loading...")
-                        time.sleep(3)  # Extra wait before continuing
                     
                     # Find salon card with "Selenium Test Salon" and click View Details
                     print("Finding salon card and clicking View Details...")
@@ -4281,9 +5108,9 @@ class StrandsTestSuite:
                                     try:
                                         view_details_button = card.find_element(By.XPATH, ".//button[contains(@id, 'view-details-button-')]")
                                         break
-                                    except:
+                                    except Exception:
                                         continue
-                        except:
+                        except Exception:
                             pass
                         
                         # Strategy 2: Find all View Details buttons and check nearby text
@@ -4300,7 +5127,7 @@ class StrandsTestSuite:
                                         view_details_button = btn
                                         print(f"    Found matching View Details button in card with text: {card_text[:50]}...")
                                         break
-                                except:
+                                except Exception:
                                     continue
                         
                         if view_details_button:
@@ -4309,23 +5136,23 @@ class StrandsTestSuite:
                                 WebDriverWait(self.driver, 5).until(
                                     EC.element_to_be_clickable(view_details_button)
                                 )
-                            except:
+                            except Exception:
                                 pass  # Continue anyway
                             
                             self.scroll_to_element(view_details_button)
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             
                             # Ensure button is in viewport
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", view_details_button)
-                            time.sleep(0.3)
+                            self.settle(0.3)
                             
                             try:
                                 self.driver.execute_script("arguments[0].click();", view_details_button)
                                 print("    ✓ Clicked View Details button (JavaScript click)")
-                            except:
+                            except Exception:
                                 view_details_button.click()
                                 print("    ✓ Clicked View Details button (regular click)")
-                            time.sleep(2)  # Wait for salon detail page to load
+                            self.settle(2)  # Wait for salon detail page to load
                             print(f"    Current URL after clicking View Details: {self.driver.current_url}")
                         else:
                             print("    ⚠ Could not find View Details button for salon")
@@ -4339,12 +5166,12 @@ class StrandsTestSuite:
                                             card = btn.find_element(By.XPATH, "./ancestor::div[contains(@class, 'Card') or contains(@class, 'card')][1]")
                                             if "Selenium Test Salon" in card.text:
                                                 self.scroll_to_element(btn)
-                                                time.sleep(0.2)
+                                                self.settle(0.2)
                                                 btn.click()
                                                 print("    ✓ Clicked View Details button (fallback)")
-                                                time.sleep(2)
+                                                self.settle(2)
                                                 break
-                                        except:
+                                        except Exception:
                                             continue
                                 else:
                                     raise Exception("View Details button not found")
@@ -4362,14 +5189,14 @@ class StrandsTestSuite:
                     try:
                         book_appt_button = self.wait.until(EC.element_to_be_clickable((By.ID, "book-appointment-detail-button")))
                         self.scroll_to_element(book_appt_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         try:
                             self.driver.execute_script("arguments[0].click();", book_appt_button)
                             print("    ✓ Clicked Book Appointment button (JavaScript click)")
-                        except:
+                        except Exception:
                             book_appt_button.click()
                             print("    ✓ Clicked Book Appointment button (regular click)")
-                        time.sleep(2)  # Wait for booking page to load
+                        self.settle(2)  # Wait for booking page to load
                         print(f"    Current URL after clicking Book Appointment: {self.driver.current_url}")
                     except Exception as e:
                         print(f"    ⚠ Error clicking Book Appointment button: {e}")
@@ -4379,16 +5206,16 @@ class StrandsTestSuite:
                         try:
                             book_by_text = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Book Appointment')]")
                             book_by_text.click()
-                            time.sleep(2)
+                            self.settle(2)
                             print("    ✓ Clicked Book Appointment button (fallback by text)")
-                        except:
+                        except Exception:
                             print("    ⚠ Could not find Book Appointment button")
                     
                     # Select stylist
                     print("Selecting stylist...")
                     try:
                         # Wait a bit for stylists to load
-                        time.sleep(1)
+                        self.settle(1)
                         
                         # Find stylist buttons by ID pattern
                         stylist_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-stylist-button-')]")
@@ -4401,19 +5228,19 @@ class StrandsTestSuite:
                                 if btn.is_enabled() and btn.is_displayed():
                                     stylist_button = btn
                                     break
-                            except:
+                            except Exception:
                                 continue
 
                         if stylist_button:
                             self.scroll_to_element(stylist_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", stylist_button)
                                 print(f"    ✓ Selected stylist button with id: {stylist_button.get_attribute('id')} (JavaScript click)")
-                            except:
+                            except Exception:
                                 stylist_button.click()
                                 print(f"    ✓ Selected stylist button with id: {stylist_button.get_attribute('id')} (regular click)")
-                            time.sleep(2)  # Wait for services to load
+                            self.settle(2)  # Wait for services to load
                         else:
                             print("    ⚠ No stylist buttons found or all disabled")
                     except Exception as e:
@@ -4424,32 +5251,32 @@ class StrandsTestSuite:
                     # Select a service
                     print("Selecting a service...")
                     try:
-                        time.sleep(1)  # Wait for services to appear
+                        self.settle(1)  # Wait for services to appear
                         service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
                         print(f"    Found {len(service_buttons)} service button(s)")
                         
                         if service_buttons:
                             service_button = service_buttons[0]  # Select first available service
                             self.scroll_to_element(service_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", service_button)
                                 print("    ✓ Selected service (JavaScript click)")
-                            except:
+                            except Exception:
                                 service_button.click()
                                 print("    ✓ Selected service (regular click)")
-                            time.sleep(2)  # Wait for dates to load
+                            self.settle(2)  # Wait for dates to load
                         else:
                             print("    ⚠ No services found - waiting longer...")
-                            time.sleep(2)
+                            self.settle(2)
                             service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
                             if service_buttons:
                                 service_button = service_buttons[0]
                                 self.scroll_to_element(service_button)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 service_button.click()
                                 print("    ✓ Selected service (after retry)")
-                                time.sleep(2)
+                                self.settle(2)
                             else:
                                 print("    ⚠ Still no services found")
                     except Exception as e:
@@ -4460,7 +5287,7 @@ class StrandsTestSuite:
                     # Select a date (skip today, select tomorrow or later)
                     print("Selecting a date (skipping today, selecting tomorrow or later)...")
                     try:
-                        time.sleep(1)  # Wait for dates to appear
+                        self.settle(1)  # Wait for dates to appear
                         date_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-date-button-')]")
                         print(f"    Found {len(date_buttons)} date button(s)")
                         
@@ -4470,7 +5297,7 @@ class StrandsTestSuite:
                             try:
                                 if btn.is_enabled():
                                     available_date_buttons.append(btn)
-                            except:
+                            except Exception:
                                 continue
                         
                         print(f"    Found {len(available_date_buttons)} available date(s)")
@@ -4485,14 +5312,14 @@ class StrandsTestSuite:
                                 print("    Only one date available, selecting it")
                             
                             self.scroll_to_element(date_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", date_button)
                                 print("    ✓ Selected date (JavaScript click)")
-                            except:
+                            except Exception:
                                 date_button.click()
                                 print("    ✓ Selected date (regular click)")
-                            time.sleep(2)  # Wait for time slots to load
+                            self.settle(2)  # Wait for time slots to load
                         else:
                             print("    ⚠ No available dates found")
                     except Exception as e:
@@ -4503,7 +5330,7 @@ class StrandsTestSuite:
                     # Select a time
                     print("Selecting a time...")
                     try:
-                        time.sleep(1)  # Wait for time slots to appear
+                        self.settle(1)  # Wait for time slots to appear
                         time_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-time-button-')]")
                         print(f"    Found {len(time_buttons)} time button(s)")
                         
@@ -4513,7 +5340,7 @@ class StrandsTestSuite:
                             try:
                                 if btn.is_enabled():
                                     available_time_buttons.append(btn)
-                            except:
+                            except Exception:
                                 continue
                         
                         print(f"    Found {len(available_time_buttons)} available time(s)")
@@ -4521,14 +5348,14 @@ class StrandsTestSuite:
                         if available_time_buttons:
                             time_button = available_time_buttons[0]  # Select first available time
                             self.scroll_to_element(time_button)
-                            time.sleep(0.2)
+                            self.settle(0.2)
                             try:
                                 self.driver.execute_script("arguments[0].click();", time_button)
                                 print("    ✓ Selected time (JavaScript click)")
-                            except:
+                            except Exception:
                                 time_button.click()
                                 print("    ✓ Selected time (regular click)")
-                            time.sleep(1)
+                            self.settle(1)
                         else:
                             print("    ⚠ No available times found")
                     except Exception as e:
@@ -4541,14 +5368,14 @@ class StrandsTestSuite:
                     try:
                         book_submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "book-appointment-submit-button")))
                         self.scroll_to_element(book_submit_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         try:
                             self.driver.execute_script("arguments[0].click();", book_submit_button)
                             print("    ✓ Clicked Book Appointment submit button (JavaScript click)")
-                        except:
+                        except Exception:
                             book_submit_button.click()
                             print("    ✓ Clicked Book Appointment submit button (regular click)")
-                        time.sleep(2)  # Wait for confirmation modal
+                        self.settle(2)  # Wait for confirmation modal
                     except Exception as e:
                         print(f"    ⚠ Error clicking Book Appointment submit button: {e}")
                         import traceback
@@ -4559,14 +5386,14 @@ class StrandsTestSuite:
                     try:
                         confirm_button = self.wait.until(EC.element_to_be_clickable((By.ID, "booking-confirm-button")))
                         self.scroll_to_element(confirm_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         try:
                             self.driver.execute_script("arguments[0].click();", confirm_button)
                             print("    ✓ Clicked Confirm button (JavaScript click)")
-                        except:
+                        except Exception:
                             confirm_button.click()
                             print("    ✓ Clicked Confirm button (regular click)")
-                        time.sleep(3)  # Wait for payment page to load
+                        self.settle(3)  # Wait for payment page to load
                         print(f"    Current URL after confirming: {self.driver.current_url}")
                     except Exception as e:
                         print(f"    ⚠ Error clicking Confirm button: {e}")
@@ -4576,16 +5403,16 @@ class StrandsTestSuite:
                         try:
                             confirm_by_text = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Confirm')]")
                             confirm_by_text.click()
-                            time.sleep(3)
+                            self.settle(3)
                             print("    ✓ Clicked Confirm button (fallback by text)")
-                        except:
+                        except Exception:
                             print("    ⚠ Could not find Confirm button")
                     
                     # Fill billing address
                     print("Filling billing address...")
                     try:
                         # Wait for payment page to load
-                        time.sleep(1)
+                        self.settle(1)
                         print(f"    Current URL: {self.driver.current_url}")
                         
                         # Check if we need to click "Enter Card Details" first (if form is not visible)
@@ -4594,70 +5421,45 @@ class StrandsTestSuite:
                             if enter_card_button.is_displayed():
                                 print("    Clicking 'Enter Card Details' to show form...")
                                 enter_card_button.click()
-                                time.sleep(0.5)
-                        except:
+                                self.settle(0.5)
+                        except Exception:
                             pass  # Form might already be visible
                         
-                        # Full Name
-                        full_name_input = self.wait.until(EC.presence_of_element_located((By.ID, "billing-address-full-name-input")))
-                        full_name_input.clear()
-                        full_name_input.send_keys("Nas Miah")
-                        time.sleep(0.2)
-                        print("    ✓ Entered full name")
-                        
-                        # Street Address
-                        address_line1_input = self.wait.until(EC.presence_of_element_located((By.ID, "billing-address-line1-input")))
-                        address_line1_input.clear()
-                        address_line1_input.send_keys("123 Main St")
-                        time.sleep(0.2)
-                        print("    ✓ Entered street address")
-                        
-                        # Address Line 2 (optional)
-                        try:
-                            address_line2_input = self.wait.until(EC.presence_of_element_located((By.ID, "billing-address-line2-input")))
-                            address_line2_input.clear()
-                            address_line2_input.send_keys("Apt 4B")
-                            time.sleep(0.2)
-                            print("    ✓ Entered address line 2")
-                        except:
-                            pass
-                        
-                        # City
-                        city_input = self.wait.until(EC.presence_of_element_located((By.ID, "billing-address-city-input")))
-                        city_input.clear()
-                        city_input.send_keys("Newark")
-                        time.sleep(0.2)
-                        print("    ✓ Entered city")
+                        # Full Name, Street Address, Address Line 2, City and Postal Code in one call
+                        self.wait.until(EC.presence_of_element_located((By.ID, "billing-address-full-name-input")))
+                        address = {
+                            "billing-address-full-name-input": "Nas Miah",
+                            "billing-address-line1-input": "123 Main St",
+                            "billing-address-city-input": "Newark",
+                            "billing-address-postal-code-input": "07508",
+                        }
+                        # Address Line 2 is optional
+                        if self.expect_elements({"line2": "billing-address-line2-input"}, timeout=0)["line2"]["present"]:
+                            address["billing-address-line2-input"] = "Apt 4B"
+                        self.fill_form(address, "billing address")
                         
                         # State (dropdown)
                         state_select = self.wait.until(EC.element_to_be_clickable((By.ID, "billing-address-state-select")))
                         state_select.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         nj_option = WebDriverWait(self.driver, 3).until(
                             EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and text()='NJ']"))
                         )
                         nj_option.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         print("    ✓ Selected state: NJ")
                         
-                        # Postal Code
-                        postal_code_input = self.wait.until(EC.presence_of_element_located((By.ID, "billing-address-postal-code-input")))
-                        postal_code_input.clear()
-                        postal_code_input.send_keys("07508")
-                        time.sleep(0.2)
-                        print("    ✓ Entered postal code")
-                        
                         # Save Address button
                         save_address_button = self.wait.until(EC.element_to_be_clickable((By.ID, "save-billing-address-button")))
                         self.scroll_to_element(save_address_button)
-                        time.sleep(0.2)
+                        self.settle(0.2)
                         try:
                             self.driver.execute_script("arguments[0].click();", save_address_button)
                             print("    ✓ Clicked Save Address button (JavaScript click)")
-                        except:
+                        except Exception:
                             save_address_button.click()
                             print("    ✓ Clicked Save Address button (regular click)")
-                        time.sleep(2)  # Wait for address to be saved
+                        self.settle(2)  # Wait for address to be saved
                         print("    ✓ Billing address saved")
                     except Exception as e:
                         print(f"    ⚠ Error filling billing address: {e}")
@@ -4668,7 +5470,7 @@ class StrandsTestSuite:
                     # Fill payment card information
                     print("Filling payment card information...")
                     try:
-                        time.sleep(1)  # Wait a bit
+                        self.settle(1)  # Wait a bit
                         
                         # Check if "Enter Card Details" button is visible (if no saved cards)
                         try:
@@ -4676,54 +5478,42 @@ class StrandsTestSuite:
                             if enter_card_button.is_displayed():
                                 print("    Clicking 'Enter Card Details' button...")
                                 enter_card_button.click()
-                                time.sleep(1)
+                                self.settle(1)
                                 print("    ✓ Clicked Enter Card Details button")
-                        except:
+                        except Exception:
                             print("    Form already visible or button not found")
                             pass  # Button might not exist if form is already visible
                         
-                        # Card Number
-                        card_number_input = self.wait.until(EC.presence_of_element_located((By.ID, "payment-card-number-input")))
-                        card_number_input.clear()
-                        card_number_input.send_keys("4242 4242 4242 4242")
-                        time.sleep(0.2)
-                        print("    ✓ Entered card number")
-                        
-                        # Cardholder Name
-                        cardholder_name_input = self.wait.until(EC.presence_of_element_located((By.ID, "payment-cardholder-name-input")))
-                        cardholder_name_input.clear()
-                        cardholder_name_input.send_keys("Nas Miah")
-                        time.sleep(0.2)
-                        print("    ✓ Entered cardholder name")
+                        # Card Number, Cardholder Name and CVV in one call; the expiry dropdowns follow
+                        self.wait.until(EC.presence_of_element_located((By.ID, "payment-card-number-input")))
+                        self.fill_form({
+                            "payment-card-number-input": "4242 4242 4242 4242",
+                            "payment-cardholder-name-input": "Nas Miah",
+                            "payment-cvv-input": "123",
+                        }, "card details")
                         
                         # Expiration Month (dropdown)
                         exp_month_select = self.wait.until(EC.element_to_be_clickable((By.ID, "payment-exp-month-select")))
                         exp_month_select.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         month_option = WebDriverWait(self.driver, 3).until(
                             EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and text()='01']"))
                         )
                         month_option.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         print("    ✓ Selected expiration month: 01")
                         
                         # Expiration Year (dropdown)
                         exp_year_select = self.wait.until(EC.element_to_be_clickable((By.ID, "payment-exp-year-select")))
                         exp_year_select.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         year_option = WebDriverWait(self.driver, 3).until(
                             EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and text()='2026']"))
                         )
                         year_option.click()
-                        time.sleep(0.3)
+                        self.settle(0.3)
                         print("    ✓ Selected expiration year: 2026")
                         
-                        # CVV
-                        cvv_input = self.wait.until(EC.presence_of_element_located((By.ID, "payment-cvv-input")))
-                        cvv_input.clear()
-                        cvv_input.send_keys("123")
-                        time.sleep(0.2)
-                        print("    ✓ Entered CVV")
 
                         # Save card for future use checkbox
                         try:
@@ -4731,10 +5521,10 @@ class StrandsTestSuite:
                             if save_card_checkbox.is_displayed():
                                 print("    Clicking 'Save this card for future use' checkbox...")
                                 self.scroll_to_element(save_card_checkbox)
-                                time.sleep(0.2)
+                                self.settle(0.2)
                                 if not save_card_checkbox.is_selected():
                                     save_card_checkbox.click()
-                                    time.sleep(0.2)
+                                    self.settle(0.2)
                                 print("    ✓ 'Save card for future use' checkbox is selected")
                         except Exception as e:
                             print(f"    ⚠ Could not click 'Save card for future use' checkbox: {e}")
@@ -4743,3069 +5533,3709 @@ class StrandsTestSuite:
                         print("Clicking Process Payment button...")
                         process_payment_button = self.wait.until(EC.element_to_be_clickable((By.ID, "process-payment-button")))
                         self.scroll_to_element(process_payment_button)
-                        time.sleep(0.2)
-                        try:
-                            self.driver.execute_script("arguments[0].click();", process_payment_button)
-                            print("    ✓ Clicked Process Payment button (JavaScript click)")
-                        except:
-                            process_payment_button.click()
-                            print("    ✓ Clicked Process Payment button (regular click)")
-                        time.sleep(ACTION_DELAY * 5)  # Wait for payment processing
+                        self.settle(0.2)
+                        with self.measure_interaction("process_payment", "process-payment-button"):
+                            try:
+                                self.driver.execute_script("arguments[0].click();", process_payment_button)
+                                print("    ✓ Clicked Process Payment button (JavaScript click)")
+                            except Exception:
+                                process_payment_button.click()
+                                print("    ✓ Clicked Process Payment button (regular click)")
+                        self.settle(ACTION_DELAY * 5)  # Wait for payment processing
                         print(f"    Current URL after payment: {self.driver.current_url}")
                         print("    ✓ Payment processing completed")
                         print("\n" + "="*70)
                         print("BOOKING FLOW COMPLETED SUCCESSFULLY (FIRST APPOINTMENT)")
                         print("="*70)
+                        booked = True
+                    except Exception as e:
+                        print(f"    ⚠ Error filling payment card: {e}")
+                        import traceback
+                        traceback.print_exc()
+                else:
+                    print(f"  ⚠ Signup may have completed - redirected to: {current_url}")
+                    print("  Attempting to navigate to browser page anyway...")
+                    try:
+                        self.spa_navigate("/browser")
+                        self.settle(2)
+                        print("  ✓ Navigated to browser page")
+                        # Try to continue with booking flow
+                        print("Attempting booking flow from current page...")
+                        # (The booking flow code would continue here, but we'll let it try)
+                    except Exception:
+                        pass
+                    
+            except Exception as e:
+                print(f"  ⚠ Error signing up new user or booking: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            if not booked:
+                print("  ✗ First appointment was not booked and paid")
+            return booked
+        except Exception as e:
+            print(f" Stage customer_booking failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_loyalty_promotions(self):
+        """Owner updates the loyalty program and sends a promotion; customer captures the promo code"""
+        return self.perform_loyalty_and_promotion_updates()
+    
+    def stage_second_booking(self):
+        """Customer books a second appointment via Book Now using the saved card and promo code"""
+        # ============================
+        # SECOND APPOINTMENT VIA BOOK NOW
+        # ============================
+        confirmed = False
+        paid = False
+        try:
+            print("\nStarting second booking via 'Book Now'...")
+            # Navigate back to browse salons
+            self.spa_navigate("/browser")
+            self.settle(2)
+            print(f"  Current URL (second booking): {self.driver.current_url}")
 
-                        # Update loyalty settings and send promotions before second booking
-                        self.perform_loyalty_and_promotion_updates()
+            # Wait for salon cards and Selenium Test Salon to appear
+            print("  Waiting for salon cards for second booking...")
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    EC.visibility_of_element_located((By.XPATH,
+                        "//div[contains(@class, 'Card')] | //div[contains(@class, 'card')] | //article"
+                    ))
+                )
+                WebDriverWait(self.driver, 10).until(
+                    EC.visibility_of_element_located((By.XPATH,
+                        "//*[contains(text(), 'Selenium Test Salon')]"
+                    ))
+                )
+                self.settle(1)
+            except Exception as e:
+                print(f"  ⚠ Error waiting for cards on second booking: {e}")
 
-                        # ============================
-                        # SECOND APPOINTMENT VIA BOOK NOW
-                        # ============================
-                        try:
-                            print("\nStarting second booking via 'Book Now'...")
-                            # Navigate back to browse salons
-                            self.driver.get(f"{BASE_URL}/browser")
-                            time.sleep(2)
-                            print(f"  Current URL (second booking): {self.driver.current_url}")
+            # Find Book Now button for Selenium Test Salon
+            print("  Finding 'Book Now' button for Selenium Test Salon...")
+            book_now_button = None
+            try:
+                # Strategy: find all book-now buttons and match card text
+                all_book_now = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'book-now-button-')]")
+                print(f"    Found {len(all_book_now)} Book Now button(s)")
+                for btn in all_book_now:
+                    try:
+                        card = btn.find_element(By.XPATH, "./ancestor::div[contains(@class, 'Card') or contains(@class, 'card')][1]")
+                        if "Selenium Test Salon" in card.text:
+                            book_now_button = btn
+                            break
+                    except Exception:
+                        continue
+            except Exception as e:
+                print(f"    ⚠ Error finding Book Now buttons: {e}")
 
-                            # Wait for salon cards and Selenium Test Salon to appear
-                            print("  Waiting for salon cards for second booking...")
-                            try:
-                                WebDriverWait(self.driver, 15).until(
-                                    EC.visibility_of_element_located((By.XPATH,
-                                        "//div[contains(@class, 'Card')] | //div[contains(@class, 'card')] | //article"
-                                    ))
-                                )
-                                WebDriverWait(self.driver, 10).until(
-                                    EC.visibility_of_element_located((By.XPATH,
-                                        "//*[contains(text(), 'Selenium Test Salon')]"
-                                    ))
-                                )
-                                time.sleep(1)
-                            except Exception as e:
-                                print(f"  ⚠ Error waiting for cards on second booking: {e}")
+            if book_now_button:
+                self.scroll_to_element(book_now_button)
+                self.settle(0.3)
+                try:
+                    self.driver.execute_script("arguments[0].click();", book_now_button)
+                    print("    ✓ Clicked Book Now button (JavaScript click)")
+                except Exception:
+                    book_now_button.click()
+                    print("    ✓ Clicked Book Now button (regular click)")
+                
+                # Wait for booking page to load - wait for stylist buttons to appear
+                print("  Waiting for booking page to load...")
+                try:
+                    WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_element_located((By.XPATH, "//button[contains(@id, 'select-stylist-button-')]"))
+                    )
+                    print("    ✓ Booking page loaded, stylist buttons are present")
+                except Exception as e:
+                    print(f"    ⚠ Timeout waiting for booking page to load: {e}")
+                    self.settle(2)  # Fallback wait
+                
+                print(f"  URL after clicking Book Now: {self.driver.current_url}")
+            else:
+                print("    ⚠ Could not find Book Now button for Selenium Test Salon")
 
-                            # Find Book Now button for Selenium Test Salon
-                            print("  Finding 'Book Now' button for Selenium Test Salon...")
-                            book_now_button = None
-                            try:
-                                # Strategy: find all book-now buttons and match card text
-                                all_book_now = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'book-now-button-')]")
-                                print(f"    Found {len(all_book_now)} Book Now button(s)")
-                                for btn in all_book_now:
-                                    try:
-                                        card = btn.find_element(By.XPATH, "./ancestor::div[contains(@class, 'Card') or contains(@class, 'card')][1]")
-                                        if "Selenium Test Salon" in card.text:
-                                            book_now_button = btn
-                                            break
-                                    except:
-                                        continue
-                            except Exception as e:
-                                print(f"    ⚠ Error finding Book Now buttons: {e}")
+            # Re-use same selection flow: stylist, service, date, time
+            print("  Second booking: selecting stylist / service / slot...")
 
-                            if book_now_button:
-                                self.scroll_to_element(book_now_button)
-                                time.sleep(0.3)
-                                try:
-                                    self.driver.execute_script("arguments[0].click();", book_now_button)
-                                    print("    ✓ Clicked Book Now button (JavaScript click)")
-                                except:
-                                    book_now_button.click()
-                                    print("    ✓ Clicked Book Now button (regular click)")
-                                
-                                # Wait for booking page to load - wait for stylist buttons to appear
-                                print("  Waiting for booking page to load...")
-                                try:
-                                    WebDriverWait(self.driver, 10).until(
-                                        EC.presence_of_element_located((By.XPATH, "//button[contains(@id, 'select-stylist-button-')]"))
-                                    )
-                                    print("    ✓ Booking page loaded, stylist buttons are present")
-                                except Exception as e:
-                                    print(f"    ⚠ Timeout waiting for booking page to load: {e}")
-                                    time.sleep(2)  # Fallback wait
-                                
-                                print(f"  URL after clicking Book Now: {self.driver.current_url}")
-                            else:
-                                print("    ⚠ Could not find Book Now button for Selenium Test Salon")
+            # Stylist - use same robust approach as first booking
+            print("  [Second booking] Selecting stylist...")
+            try:
+                # Wait a bit for stylists to load
+                self.settle(1)
+                
+                # Find stylist buttons by ID pattern (same as first booking)
+                stylist_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-stylist-button-')]")
+                print(f"    [Second booking] Found {len(stylist_buttons)} stylist button(s)")
 
-                            # Re-use same selection flow: stylist, service, date, time
-                            print("  Second booking: selecting stylist / service / slot...")
+                # Prefer the first enabled stylist button (same logic as first booking)
+                stylist_button = None
+                for btn in stylist_buttons:
+                    try:
+                        if btn.is_enabled() and btn.is_displayed():
+                            stylist_button = btn
+                            break
+                    except Exception:
+                        continue
 
-                            # Stylist - use same robust approach as first booking
-                            print("  [Second booking] Selecting stylist...")
-                            try:
-                                # Wait a bit for stylists to load
-                                time.sleep(1)
-                                
-                                # Find stylist buttons by ID pattern (same as first booking)
-                                stylist_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-stylist-button-')]")
-                                print(f"    [Second booking] Found {len(stylist_buttons)} stylist button(s)")
+                if stylist_button:
+                    self.scroll_to_element(stylist_button)
+                    self.settle(0.2)
+                    try:
+                        self.driver.execute_script("arguments[0].click();", stylist_button)
+                        print(f"    ✓ [Second booking] Selected stylist button with id: {stylist_button.get_attribute('id')} (JavaScript click)")
+                    except Exception:
+                        stylist_button.click()
+                        print(f"    ✓ [Second booking] Selected stylist button with id: {stylist_button.get_attribute('id')} (regular click)")
+                    self.settle(2)  # Wait for services to load
+                else:
+                    print("    ⚠ [Second booking] No stylist buttons found or all disabled")
+                    # Retry after a longer wait
+                    print("    [Second booking] Retrying after longer wait...")
+                    self.settle(3)
+                    stylist_buttons_retry = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-stylist-button-')]")
+                    for btn in stylist_buttons_retry:
+                        try:
+                            if btn.is_enabled() and btn.is_displayed():
+                                stylist_button = btn
+                                self.scroll_to_element(stylist_button)
+                                self.settle(0.2)
+                                stylist_button.click()
+                                print(f"    ✓ [Second booking] Selected stylist after retry: {stylist_button.get_attribute('id')}")
+                                self.settle(2)
+                                break
+                        except Exception:
+                            continue
+            except Exception as e:
+                print(f"    ⚠ [Second booking] Error selecting stylist: {e}")
+                import traceback
+                traceback.print_exc()
 
-                                # Prefer the first enabled stylist button (same logic as first booking)
-                                stylist_button = None
-                                for btn in stylist_buttons:
-                                    try:
-                                        if btn.is_enabled() and btn.is_displayed():
-                                            stylist_button = btn
-                                            break
-                                    except:
-                                        continue
+            # Service - select the 1-minute service (Haircut)
+            print("  [Second booking] Selecting the 1-minute service (Haircut)...")
+            try:
+                self.settle(1)  # Wait for services to appear
+                service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
+                print(f"    [Second booking] Found {len(service_buttons)} service button(s)")
+                
+                # Find the service with "Haircut" name (1-minute service)
+                haircut_service = None
+                for btn in service_buttons:
+                    try:
+                        # Check if the button contains "Haircut" text
+                        btn_text = btn.text
+                        if "Haircut" in btn_text:
+                            haircut_service = btn
+                            print(f"    [Second booking] Found Haircut service: {btn_text}")
+                            break
+                    except Exception:
+                        continue
+                
+                if haircut_service:
+                    self.scroll_to_element(haircut_service)
+                    self.settle(0.2)
+                    try:
+                        self.driver.execute_script("arguments[0].click();", haircut_service)
+                        print("    ✓ [Second booking] Selected 1-minute Haircut service (JavaScript click)")
+                    except Exception:
+                        haircut_service.click()
+                        print("    ✓ [Second booking] Selected 1-minute Haircut service (regular click)")
+                    self.settle(2)  # Wait for dates to load
+                elif service_buttons:
+                    # Fallback to first service if Haircut not found
+                    service_button = service_buttons[0]
+                    self.scroll_to_element(service_button)
+                    self.settle(0.2)
+                    service_button.click()
+                    print("    ✓ [Second booking] Selected first available service (fallback)")
+                    self.settle(2)
+                else:
+                    print("    ⚠ [Second booking] No services found - waiting longer...")
+                    self.settle(2)
+                    service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
+                    if service_buttons:
+                        service_button = service_buttons[0]
+                        self.scroll_to_element(service_button)
+                        self.settle(0.2)
+                        service_button.click()
+                        print("    ✓ [Second booking] Selected service (after retry)")
+                        self.settle(2)
+                    else:
+                        print("    ⚠ [Second booking] Still no services found")
+            except Exception as e:
+                print(f"    ⚠ [Second booking] Error selecting service: {e}")
+                import traceback
+                traceback.print_exc()
 
-                                if stylist_button:
-                                    self.scroll_to_element(stylist_button)
-                                    time.sleep(0.2)
-                                    try:
-                                        self.driver.execute_script("arguments[0].click();", stylist_button)
-                                        print(f"    ✓ [Second booking] Selected stylist button with id: {stylist_button.get_attribute('id')} (JavaScript click)")
-                                    except:
-                                        stylist_button.click()
-                                        print(f"    ✓ [Second booking] Selected stylist button with id: {stylist_button.get_attribute('id')} (regular click)")
-                                    time.sleep(2)  # Wait for services to load
-                                else:
-                                    print("    ⚠ [Second booking] No stylist buttons found or all disabled")
-                                    # Retry after a longer wait
-                                    print("    [Second booking] Retrying after longer wait...")
-                                    time.sleep(3)
-                                    stylist_buttons_retry = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-stylist-button-')]")
-                                    for btn in stylist_buttons_retry:
-                                        try:
-                                            if btn.is_enabled() and btn.is_displayed():
-                                                stylist_button = btn
-                                                self.scroll_to_element(stylist_button)
-                                                time.sleep(0.2)
-                                                stylist_button.click()
-                                                print(f"    ✓ [Second booking] Selected stylist after retry: {stylist_button.get_attribute('id')}")
-                                                time.sleep(2)
-                                                break
-                                        except:
-                                            continue
-                            except Exception as e:
-                                print(f"    ⚠ [Second booking] Error selecting stylist: {e}")
-                                import traceback
-                                traceback.print_exc()
+            # Date - select today
+            print("  [Second booking] Selecting today's date...")
+            try:
+                self.settle(1)  # Wait for dates to appear
+                date_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-date-button-')]")
+                print(f"    [Second booking] Found {len(date_buttons)} date button(s)")
+                
+                # Filter out disabled dates
+                available_date_buttons = []
+                for btn in date_buttons:
+                    try:
+                        if btn.is_enabled():
+                            available_date_buttons.append(btn)
+                    except Exception:
+                        continue
+                
+                print(f"    [Second booking] Found {len(available_date_buttons)} available date(s)")
+                
+                if available_date_buttons:
+                    # Select the first date (today)
+                    date_button = available_date_buttons[0]
+                    print("    [Second booking] Selecting today's date")
+                    self.scroll_to_element(date_button)
+                    self.settle(0.2)
+                    try:
+                        self.driver.execute_script("arguments[0].click();", date_button)
+                        print("    ✓ [Second booking] Selected today's date (JavaScript click)")
+                    except Exception:
+                        date_button.click()
+                        print("    ✓ [Second booking] Selected today's date (regular click)")
+                    self.settle(2)  # Wait for time slots to load
+                else:
+                    print("    ⚠ [Second booking] No available dates found")
+            except Exception as e:
+                print(f"    ⚠ [Second booking] Error selecting date: {e}")
+                import traceback
+                traceback.print_exc()
 
-                            # Service - select the 1-minute service (Haircut)
-                            print("  [Second booking] Selecting the 1-minute service (Haircut)...")
-                            try:
-                                time.sleep(1)  # Wait for services to appear
-                                service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
-                                print(f"    [Second booking] Found {len(service_buttons)} service button(s)")
-                                
-                                # Find the service with "Haircut" name (1-minute service)
-                                haircut_service = None
-                                for btn in service_buttons:
-                                    try:
-                                        # Check if the button contains "Haircut" text
-                                        btn_text = btn.text
-                                        if "Haircut" in btn_text:
-                                            haircut_service = btn
-                                            print(f"    [Second booking] Found Haircut service: {btn_text}")
-                                            break
-                                    except:
-                                        continue
-                                
-                                if haircut_service:
-                                    self.scroll_to_element(haircut_service)
-                                    time.sleep(0.2)
-                                    try:
-                                        self.driver.execute_script("arguments[0].click();", haircut_service)
-                                        print("    ✓ [Second booking] Selected 1-minute Haircut service (JavaScript click)")
-                                    except:
-                                        haircut_service.click()
-                                        print("    ✓ [Second booking] Selected 1-minute Haircut service (regular click)")
-                                    time.sleep(2)  # Wait for dates to load
-                                elif service_buttons:
-                                    # Fallback to first service if Haircut not found
-                                    service_button = service_buttons[0]
-                                    self.scroll_to_element(service_button)
-                                    time.sleep(0.2)
-                                    service_button.click()
-                                    print("    ✓ [Second booking] Selected first available service (fallback)")
-                                    time.sleep(2)
-                                else:
-                                    print("    ⚠ [Second booking] No services found - waiting longer...")
-                                    time.sleep(2)
-                                    service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
-                                    if service_buttons:
-                                        service_button = service_buttons[0]
-                                        self.scroll_to_element(service_button)
-                                        time.sleep(0.2)
-                                        service_button.click()
-                                        print("    ✓ [Second booking] Selected service (after retry)")
-                                        time.sleep(2)
-                                    else:
-                                        print("    ⚠ [Second booking] Still no services found")
-                            except Exception as e:
-                                print(f"    ⚠ [Second booking] Error selecting service: {e}")
-                                import traceback
-                                traceback.print_exc()
+            # Time - use custom time (1 minute after current time)
+            print("  [Second booking] Selecting custom time (1 minute after current time)...")
+            try:
+                self.settle(1)  # Wait for time options to appear
+                
+                # Click "Custom Time" button using ID
+                try:
+                    custom_time_button = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "custom-time-button"))
+                    )
+                    self.scroll_to_element(custom_time_button)
+                    self.settle(0.2)
+                    custom_time_button.click()
+                    self.settle(0.5)
+                    print("    ✓ [Second booking] Clicked Custom Time button")
+                except Exception as e:
+                    print(f"    ⚠ [Second booking] Could not find/click Custom Time button: {e}")
+                
+                # Get current time and add 1 minute
+                from datetime import datetime, timedelta
+                now = datetime.now()
+                future_time = now + timedelta(minutes=1)
+                time_str = future_time.strftime("%H:%M")  # Format as HH:MM (24-hour)
+                
+                print(f"    [Second booking] Current time: {now.strftime('%H:%M')}, Booking for: {time_str}")
+                
+                # Find and fill the start time input using ID
+                try:
+                    start_time_input = self.wait.until(
+                        EC.presence_of_element_located((By.ID, "custom-start-time"))
+                    )
+                    self.scroll_to_element(start_time_input)
+                    self.settle(0.2)
+                    start_time_input.click()
+                    self.settle(0.1)
+                    start_time_input.clear()
+                    start_time_input.send_keys(time_str)
+                    self.settle(0.2)
+                    
+                    # Trigger React events
+                    self.driver.execute_script(f"""
+                        var input = arguments[0];
+                        var value = '{time_str}';
+                        var nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, "value").set;
+                        nativeInputValueSetter.call(input, value);
+                        input.dispatchEvent(new Event('input', {{ bubbles: true, cancelable: true }}));
+                        input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
+                    """, start_time_input)
+                    self.settle(0.5)
+                    print(f"    ✓ [Second booking] Set custom time to {time_str}")
+                except Exception as e:
+                    print(f"    ⚠ [Second booking] Error setting custom time: {e}")
+                    import traceback
+                    traceback.print_exc()
+            except Exception as e:
+                print(f"    ⚠ [Second booking] Error selecting custom time: {e}")
+                import traceback
+                traceback.print_exc()
 
-                            # Date - select today
-                            print("  [Second booking] Selecting today's date...")
-                            try:
-                                time.sleep(1)  # Wait for dates to appear
-                                date_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-date-button-')]")
-                                print(f"    [Second booking] Found {len(date_buttons)} date button(s)")
-                                
-                                # Filter out disabled dates
-                                available_date_buttons = []
-                                for btn in date_buttons:
-                                    try:
-                                        if btn.is_enabled():
-                                            available_date_buttons.append(btn)
-                                    except:
-                                        continue
-                                
-                                print(f"    [Second booking] Found {len(available_date_buttons)} available date(s)")
-                                
-                                if available_date_buttons:
-                                    # Select the first date (today)
-                                    date_button = available_date_buttons[0]
-                                    print("    [Second booking] Selecting today's date")
-                                    self.scroll_to_element(date_button)
-                                    time.sleep(0.2)
-                                    try:
-                                        self.driver.execute_script("arguments[0].click();", date_button)
-                                        print("    ✓ [Second booking] Selected today's date (JavaScript click)")
-                                    except:
-                                        date_button.click()
-                                        print("    ✓ [Second booking] Selected today's date (regular click)")
-                                    time.sleep(2)  # Wait for time slots to load
-                                else:
-                                    print("    ⚠ [Second booking] No available dates found")
-                            except Exception as e:
-                                print(f"    ⚠ [Second booking] Error selecting date: {e}")
-                                import traceback
-                                traceback.print_exc()
+            # Click Book Appointment button - use same approach as first booking
+            print("  [Second booking] Clicking Book Appointment submit button...")
+            try:
+                book_submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "book-appointment-submit-button")))
+                self.scroll_to_element(book_submit_button)
+                self.settle(0.2)
+                try:
+                    self.driver.execute_script("arguments[0].click();", book_submit_button)
+                    print("    ✓ [Second booking] Clicked Book Appointment submit button (JavaScript click)")
+                except Exception:
+                    book_submit_button.click()
+                    print("    ✓ [Second booking] Clicked Book Appointment submit button (regular click)")
+                self.settle(2)  # Wait for confirmation modal
+            except Exception as e:
+                print(f"    ⚠ [Second booking] Error clicking Book Appointment submit button: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            # Click Confirm button in modal - use same approach as first booking
+            print("  [Second booking] Clicking Confirm button in booking modal...")
+            try:
+                confirm_button = self.wait.until(EC.element_to_be_clickable((By.ID, "booking-confirm-button")))
+                self.scroll_to_element(confirm_button)
+                self.settle(0.2)
+                try:
+                    self.driver.execute_script("arguments[0].click();", confirm_button)
+                    print("    ✓ [Second booking] Clicked Confirm button (JavaScript click)")
+                except Exception:
+                    confirm_button.click()
+                    print("    ✓ [Second booking] Clicked Confirm button (regular click)")
+                self.settle(3)  # Wait for payment page to load
+                print(f"    [Second booking] Current URL after confirming: {self.driver.current_url}")
+                confirmed = True
+            except Exception as e:
+                print(f"    ⚠ [Second booking] Error clicking Confirm button: {e}")
+                import traceback
+                traceback.print_exc()
 
-                            # Time - use custom time (1 minute after current time)
-                            print("  [Second booking] Selecting custom time (1 minute after current time)...")
-                            try:
-                                time.sleep(1)  # Wait for time options to appear
-                                
-                                # Click "Custom Time" button using ID
-                                try:
-                                    custom_time_button = self.wait.until(
-                                        EC.element_to_be_clickable((By.ID, "custom-time-button"))
-                                    )
-                                    self.scroll_to_element(custom_time_button)
-                                    time.sleep(0.2)
-                                    custom_time_button.click()
-                                    time.sleep(0.5)
-                                    print("    ✓ [Second booking] Clicked Custom Time button")
-                                except Exception as e:
-                                    print(f"    ⚠ [Second booking] Could not find/click Custom Time button: {e}")
-                                
-                                # Get current time and add 1 minute
-                                from datetime import datetime, timedelta
-                                now = datetime.now()
-                                future_time = now + timedelta(minutes=1)
-                                time_str = future_time.strftime("%H:%M")  # Format as HH:MM (24-hour)
-                                
-                                print(f"    [Second booking] Current time: {now.strftime('%H:%M')}, Booking for: {time_str}")
-                                
-                                # Find and fill the start time input using ID
-                                try:
-                                    start_time_input = self.wait.until(
-                                        EC.presence_of_element_located((By.ID, "custom-start-time"))
-                                    )
-                                    self.scroll_to_element(start_time_input)
-                                    time.sleep(0.2)
-                                    start_time_input.click()
-                                    time.sleep(0.1)
-                                    start_time_input.clear()
-                                    start_time_input.send_keys(time_str)
-                                    time.sleep(0.2)
-                                    
-                                    # Trigger React events
-                                    self.driver.execute_script(f"""
-                                        var input = arguments[0];
-                                        var value = '{time_str}';
-                                        var nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, "value").set;
-                                        nativeInputValueSetter.call(input, value);
-                                        input.dispatchEvent(new Event('input', {{ bubbles: true, cancelable: true }}));
-                                        input.dispatchEvent(new Event('change', {{ bubbles: true, cancelable: true }}));
-                                    """, start_time_input)
-                                    time.sleep(0.5)
-                                    print(f"    ✓ [Second booking] Set custom time to {time_str}")
-                                except Exception as e:
-                                    print(f"    ⚠ [Second booking] Error setting custom time: {e}")
-                                    import traceback
-                                    traceback.print_exc()
-                            except Exception as e:
-                                print(f"    ⚠ [Second booking] Error selecting custom time: {e}")
-                                import traceback
-                                traceback.print_exc()
+            # For second booking, billing/card should already be saved; reuse existing card
+            try:
+                print("  [Second booking] Attempting payment (if required)...")
+                if "/payment" in self.driver.current_url:
+                    self.apply_saved_promo_code()
+                    print("  [Second booking] On payment page - selecting existing saved card...")
+                    try:
+                        # Click the first existing card button
+                        existing_cards = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'existing-card-button-')]")
+                        print(f"    [Second booking] Found {len(existing_cards)} existing card element(s)")
+                        if existing_cards:
+                            existing_card = existing_cards[0]
+                            self.scroll_to_element(existing_card)
+                            self.settle(0.2)
+                            existing_card.click()
+                            self.settle(0.5)
+                            print("    ✓ [Second booking] Selected existing saved card")
+                        else:
+                            print("    ⚠ [Second booking] No existing saved cards found; payment button may stay disabled")
+                    except Exception as e:
+                        print(f"    ⚠ [Second booking] Error selecting existing card: {e}")
 
-                            # Click Book Appointment button - use same approach as first booking
-                            print("  [Second booking] Clicking Book Appointment submit button...")
-                            try:
-                                book_submit_button = self.wait.until(EC.element_to_be_clickable((By.ID, "book-appointment-submit-button")))
-                                self.scroll_to_element(book_submit_button)
-                                time.sleep(0.2)
-                                try:
-                                    self.driver.execute_script("arguments[0].click();", book_submit_button)
-                                    print("    ✓ [Second booking] Clicked Book Appointment submit button (JavaScript click)")
-                                except:
-                                    book_submit_button.click()
-                                    print("    ✓ [Second booking] Clicked Book Appointment submit button (regular click)")
-                                time.sleep(2)  # Wait for confirmation modal
-                            except Exception as e:
-                                print(f"    ⚠ [Second booking] Error clicking Book Appointment submit button: {e}")
-                                import traceback
-                                traceback.print_exc()
-                            
-                            # Click Confirm button in modal - use same approach as first booking
-                            print("  [Second booking] Clicking Confirm button in booking modal...")
+                    # Click Process Payment button
+                    try:
+                        process_payment_button_2 = WebDriverWait(self.driver, 5).until(
+                            EC.element_to_be_clickable((By.ID, "process-payment-button"))
+                        )
+                        self.scroll_to_element(process_payment_button_2)
+                        self.settle(0.2)
+                        with self.measure_interaction("process_payment", "process-payment-button"):
                             try:
-                                confirm_button = self.wait.until(EC.element_to_be_clickable((By.ID, "booking-confirm-button")))
-                                self.scroll_to_element(confirm_button)
-                                time.sleep(0.2)
-                                try:
-                                    self.driver.execute_script("arguments[0].click();", confirm_button)
-                                    print("    ✓ [Second booking] Clicked Confirm button (JavaScript click)")
-                                except:
-                                    confirm_button.click()
-                                    print("    ✓ [Second booking] Clicked Confirm button (regular click)")
-                                time.sleep(3)  # Wait for payment page to load
-                                print(f"    [Second booking] Current URL after confirming: {self.driver.current_url}")
-                            except Exception as e:
-                                print(f"    ⚠ [Second booking] Error clicking Confirm button: {e}")
-                                import traceback
-                                traceback.print_exc()
+                                self.driver.execute_script("arguments[0].click();", process_payment_button_2)
+                            except Exception:
+                                process_payment_button_2.click()
+                        self.settle(3)
+                        print("    ✓ [Second booking] Processed payment using saved card")
+                        paid = True
+                    except Exception as e:
+                        print(f"    ⚠ [Second booking] Process payment button not clickable or not found: {e}")
+                else:
+                    print("  [Second booking] Not on payment page; assuming booking confirmed")
+                    paid = True
+            except Exception as e:
+                print(f"    ⚠ [Second booking] Error during payment step: {e}")
 
-                            # For second booking, billing/card should already be saved; reuse existing card
-                            try:
-                                print("  [Second booking] Attempting payment (if required)...")
-                                if "/payment" in self.driver.current_url:
-                                    self.apply_saved_promo_code()
-                                    print("  [Second booking] On payment page - selecting existing saved card...")
-                                    try:
-                                        # Click the first existing card button
-                                        existing_cards = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'existing-card-button-')]")
-                                        print(f"    [Second booking] Found {len(existing_cards)} existing card element(s)")
-                                        if existing_cards:
-                                            existing_card = existing_cards[0]
-                                            self.scroll_to_element(existing_card)
-                                            time.sleep(0.2)
-                                            existing_card.click()
-                                            time.sleep(0.5)
-                                            print("    ✓ [Second booking] Selected existing saved card")
-                                        else:
-                                            print("    ⚠ [Second booking] No existing saved cards found; payment button may stay disabled")
-                                    except Exception as e:
-                                        print(f"    ⚠ [Second booking] Error selecting existing card: {e}")
+            print("\n" + "-"*70)
+            print("SECOND BOOKING FLOW COMPLETED" if confirmed and paid else "SECOND BOOKING FLOW INCOMPLETE")
+            print("-"*70)
+        except Exception as e:
+            print(f"  ⚠ Error during second booking flow: {e}")
+        
+        if not (confirmed and paid):
+            print("  ✗ Second appointment was not " + ("paid for" if confirmed else "confirmed"))
+        return confirmed and paid
+    
+    def stage_reschedule(self):
+        """Customer reschedules the first appointment from My Appointments"""
+        # ============================
+        # RESCHEDULE FROM MY APPOINTMENTS
+        # ============================
+        rescheduled = False
+        try:
+            print("\nNavigating to My Appointments to test reschedule...")
+            self.spa_navigate("/appointments")
+            self.settle(2)
+            print(f"  Current URL (appointments): {self.driver.current_url}")
 
-                                    # Click Process Payment button
-                                    try:
-                                        process_payment_button_2 = WebDriverWait(self.driver, 5).until(
-                                            EC.element_to_be_clickable((By.ID, "process-payment-button"))
-                                        )
-                                        self.scroll_to_element(process_payment_button_2)
-                                        time.sleep(0.2)
-                                        try:
-                                            self.driver.execute_script("arguments[0].click();", process_payment_button_2)
-                                        except:
-                                            process_payment_button_2.click()
-                                        time.sleep(3)
-                                        print("    ✓ [Second booking] Processed payment using saved card")
-                                    except Exception as e:
-                                        print(f"    ⚠ [Second booking] Process payment button not clickable or not found: {e}")
-                                else:
-                                    print("  [Second booking] Not on payment page; assuming booking confirmed")
-                            except Exception as e:
-                                print(f"    ⚠ [Second booking] Error during payment step: {e}")
+            # Wait for at least one reschedule button
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.XPATH,
+                    "//button[contains(@id, 'reschedule-appointment-button-')]"
+                ))
+            )
+            reschedule_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'reschedule-appointment-button-')]")
+            print(f"  Found {len(reschedule_buttons)} reschedule button(s)")
+            
+            # Store booking_id from the first reschedule button for private note interactions
+            self.rescheduled_booking_id = None
+            if reschedule_buttons:
+                resched_button = reschedule_buttons[0]
+                # Extract booking_id from button ID
+                button_id = resched_button.get_attribute('id')
+                if button_id and 'reschedule-appointment-button-' in button_id:
+                    self.rescheduled_booking_id = button_id.replace('reschedule-appointment-button-', '')
+                    print(f"  Stored booking_id for private note: {self.rescheduled_booking_id}")
+                
+                self.scroll_to_element(resched_button)
+                self.settle(0.2)
+                try:
+                    self.driver.execute_script("arguments[0].click();", resched_button)
+                except Exception:
+                    resched_button.click()
+                print("  ✓ Clicked Reschedule button for first appointment")
+                self.settle(3)  # Wait for booking page/reschedule view
 
-                            print("\n" + "-"*70)
-                            print("SECOND BOOKING FLOW COMPLETED (or best-effort)")
-                            print("-"*70)
-                        except Exception as e:
-                            print(f"  ⚠ Error during second booking flow: {e}")
+                # On reschedule booking page: attempt to change service (should be locked)
+                print("  Testing service change during reschedule (should be blocked)...")
+                try:
+                    other_service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
+                    if len(other_service_buttons) > 1:
+                        other_service = other_service_buttons[1]
+                        self.scroll_to_element(other_service)
+                        self.settle(0.2)
+                        other_service.click()
+                        print("    ✓ Clicked another service (logic should prevent actual change)")
+                    else:
+                        print("    ℹ Not enough services to test change during reschedule")
+                except Exception as e:
+                    print(f"    ⚠ Error clicking other service during reschedule: {e}")
 
-                        # ============================
-                        # RESCHEDULE FROM MY APPOINTMENTS
-                        # ============================
+                # Change to a later date/time using same logic (skip today)
+                print("  Selecting a new (later) date/time for reschedule...")
+                try:
+                    self.settle(1)
+                    date_buttons_r = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-date-button-')]")
+                    available_dates_r = [b for b in date_buttons_r if b.is_enabled()]
+                    if len(available_dates_r) > 1:
+                        date_button_r = available_dates_r[-1]  # pick a later date
+                    elif available_dates_r:
+                        date_button_r = available_dates_r[0]
+                    else:
+                        date_button_r = None
+                    if date_button_r:
+                        self.scroll_to_element(date_button_r)
+                        self.settle(0.2)
                         try:
-                            print("\nNavigating to My Appointments to test reschedule...")
-                            self.driver.get(f"{BASE_URL}/appointments")
-                            time.sleep(2)
-                            print(f"  Current URL (appointments): {self.driver.current_url}")
+                            self.driver.execute_script("arguments[0].click();", date_button_r)
+                        except Exception:
+                            date_button_r.click()
+                        print("    ✓ Selected new reschedule date")
+                        self.settle(2)
 
-                            # Wait for at least one reschedule button
-                            WebDriverWait(self.driver, 15).until(
-                                EC.presence_of_element_located((By.XPATH,
-                                    "//button[contains(@id, 'reschedule-appointment-button-')]"
-                                ))
-                            )
-                            reschedule_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'reschedule-appointment-button-')]")
-                            print(f"  Found {len(reschedule_buttons)} reschedule button(s)")
-                            
-                            # Store booking_id from the first reschedule button for private note interactions
-                            rescheduled_booking_id = None
-                            if reschedule_buttons:
-                                resched_button = reschedule_buttons[0]
-                                # Extract booking_id from button ID
-                                button_id = resched_button.get_attribute('id')
-                                if button_id and 'reschedule-appointment-button-' in button_id:
-                                    rescheduled_booking_id = button_id.replace('reschedule-appointment-button-', '')
-                                    print(f"  Stored booking_id for private note: {rescheduled_booking_id}")
-                                
-                                self.scroll_to_element(resched_button)
-                                time.sleep(0.2)
-                                try:
-                                    self.driver.execute_script("arguments[0].click();", resched_button)
-                                except:
-                                    resched_button.click()
-                                print("  ✓ Clicked Reschedule button for first appointment")
-                                time.sleep(3)  # Wait for booking page/reschedule view
+                        # time
+                        time_buttons_r = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-time-button-')]")
+                        avail_times_r = [b for b in time_buttons_r if b.is_enabled()]
+                        if avail_times_r:
+                            time_button_r = avail_times_r[-1]
+                            self.scroll_to_element(time_button_r)
+                            self.settle(0.2)
+                            try:
+                                self.driver.execute_script("arguments[0].click();", time_button_r)
+                            except Exception:
+                                time_button_r.click()
+                            print("    ✓ Selected new reschedule time")
+                            self.settle(1)
+                except Exception as e:
+                    print(f"    ⚠ Error selecting new reschedule date/time: {e}")
 
-                                # On reschedule booking page: attempt to change service (should be locked)
-                                print("  Testing service change during reschedule (should be blocked)...")
-                                try:
-                                    other_service_buttons = self.driver.find_elements(By.XPATH, "//div[contains(@id, 'select-service-button-')]")
-                                    if len(other_service_buttons) > 1:
-                                        other_service = other_service_buttons[1]
-                                        self.scroll_to_element(other_service)
-                                        time.sleep(0.2)
-                                        other_service.click()
-                                        print("    ✓ Clicked another service (logic should prevent actual change)")
-                                    else:
-                                        print("    ℹ Not enough services to test change during reschedule")
-                                except Exception as e:
-                                    print(f"    ⚠ Error clicking other service during reschedule: {e}")
+                # Submit reschedule (same book-appointment-submit-button and modal)
+                try:
+                    print("  Submitting reschedule...")
+                    resched_submit = self.wait.until(EC.element_to_be_clickable((By.ID, "book-appointment-submit-button")))
+                    self.scroll_to_element(resched_submit)
+                    self.settle(0.2)
+                    try:
+                        self.driver.execute_script("arguments[0].click();", resched_submit)
+                    except Exception:
+                        resched_submit.click()
+                    self.settle(2)
 
-                                # Change to a later date/time using same logic (skip today)
-                                print("  Selecting a new (later) date/time for reschedule...")
+                    # Confirm reschedule
+                    confirm_resched = self.wait.until(EC.element_to_be_clickable((By.ID, "booking-confirm-button")))
+                    self.scroll_to_element(confirm_resched)
+                    self.settle(0.2)
+                    try:
+                        self.driver.execute_script("arguments[0].click();", confirm_resched)
+                    except Exception:
+                        confirm_resched.click()
+                    self.settle(3)
+                    print("  ✓ Reschedule flow completed")
+                    rescheduled = True
+                except Exception as e:
+                    print(f"    ⚠ Error submitting reschedule: {e}")
+            else:
+                print("  ⚠ No reschedule buttons found on appointments page")
+            
+        except Exception as e:
+            print(f"  ⚠ Error in My Appointments / reschedule flow: {e}")
+        
+        if not rescheduled:
+            print("  ✗ Appointment was not rescheduled")
+        return rescheduled
+    
+    def stage_private_note(self):
+        """Customer adds, edits and deletes a private note on the rescheduled booking"""
+        failed_steps = []
+        try:
+            print("\n" + "="*70)
+            print("PRIVATE NOTE FLOW")
+            print("="*70)
+            
+            # Navigate back to appointments page
+            print("\nNavigating back to My Appointments for private note...")
+            self.spa_navigate("/appointments")
+            self.settle(2)
+            
+            # Wait for appointments to load
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.XPATH,
+                    "//button[contains(@id, 'private-note-add-button-')] | //button[contains(@id, 'private-note-edit-button-')]"
+                ))
+            )
+            
+            # Add private note
+            print(f"  Adding private note to booking {self.rescheduled_booking_id}...")
+            try:
+                add_note_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, f"private-note-add-button-{self.rescheduled_booking_id}"
+                )))
+                self.scroll_to_element(add_note_button)
+                self.settle(0.2)
+                add_note_button.click()
+                print("    ✓ Clicked 'Add private note' button")
+                self.settle(1)
+                
+                # Type random note
+                random_note = f"This is a test note for automation. Random number: {random.randint(1000, 9999)}"
+                note_textarea = self.wait.until(EC.presence_of_element_located((
+                    By.ID, f"private-note-textarea-{self.rescheduled_booking_id}"
+                )))
+                note_textarea.clear()
+                note_textarea.send_keys(random_note)
+                print(f"    ✓ Entered note: {random_note[:50]}...")
+                self.settle(0.5)
+                
+                # Click Save Note button
+                save_note_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, f"private-note-save-button-{self.rescheduled_booking_id}"
+                )))
+                self.scroll_to_element(save_note_button)
+                self.settle(0.2)
+                save_note_button.click()
+                print("    ✓ Clicked 'Save Note' button")
+                self.wait_for_api_idle(description="after saving private note")
+                
+                # Click OK on success modal
+                success_ok_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, f"private-note-success-ok-button-{self.rescheduled_booking_id}"
+                )))
+                self.scroll_to_element(success_ok_button)
+                self.settle(0.2)
+                success_ok_button.click()
+                print("    ✓ Clicked OK on success modal")
+                self.settle(1)
+                
+            except Exception as e:
+                print(f"    ⚠ Error adding private note: {e}")
+                failed_steps.append("add")
+                import traceback
+                traceback.print_exc()
+            
+            # Edit private note
+            print(f"  Editing private note for booking {self.rescheduled_booking_id}...")
+            try:
+                edit_note_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, f"private-note-edit-button-{self.rescheduled_booking_id}"
+                )))
+                self.scroll_to_element(edit_note_button)
+                self.settle(0.2)
+                edit_note_button.click()
+                print("    ✓ Clicked 'Edit' button")
+                self.settle(1)
+                
+                # Change the note text
+                edited_note = f"Updated note text. Edit timestamp: {random.randint(10000, 99999)}"
+                note_textarea = self.wait.until(EC.presence_of_element_located((
+                    By.ID, f"private-note-textarea-{self.rescheduled_booking_id}"
+                )))
+                note_textarea.clear()
+                note_textarea.send_keys(edited_note)
+                print(f"    ✓ Changed note to: {edited_note[:50]}...")
+                self.settle(0.5)
+                
+                # Click Update Note button
+                update_note_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, f"private-note-save-button-{self.rescheduled_booking_id}"
+                )))
+                self.scroll_to_element(update_note_button)
+                self.settle(0.2)
+                update_note_button.click()
+                print("    ✓ Clicked 'Update Note' button")
+                self.wait_for_api_idle(description="after updating private note")
+                
+                # Click OK on success modal
+                success_ok_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, f"private-note-success-ok-button-{self.rescheduled_booking_id}"
+                )))
+                self.scroll_to_element(success_ok_button)
+                self.settle(0.2)
+                success_ok_button.click()
+                print("    ✓ Clicked OK on success modal after update")
+                self.settle(1)
+                
+            except Exception as e:
+                print(f"    ⚠ Error editing private note: {e}")
+                failed_steps.append("edit")
+                import traceback
+                traceback.print_exc()
+            
+            # Scroll through filters
+            print("  Scrolling through appointment filters...")
+            filter_order = ['all', 'upcoming', 'past', 'canceled']
+            for filter_name in filter_order:
+                try:
+                    filter_button_id = f"appointments-filter-{filter_name}"
+                    filter_button = self.wait.until(EC.element_to_be_clickable((
+                        By.ID, filter_button_id
+                    )))
+                    self.scroll_to_element(filter_button)
+                    self.settle(0.2)
+                    filter_button.click()
+                    print(f"    ✓ Clicked '{filter_name.title()}' filter")
+                    self.wait_for_api_idle(description=f"after {filter_name} filter")
+                except Exception as e:
+                    print(f"    ⚠ Error clicking {filter_name} filter: {e}")
+            
+            # Go back to 'All' filter
+            print("  Returning to 'All' filter...")
+            try:
+                all_filter_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, "appointments-filter-all"
+                )))
+                self.scroll_to_element(all_filter_button)
+                self.settle(0.2)
+                all_filter_button.click()
+                print("    ✓ Returned to 'All' filter")
+                self.wait_for_api_idle(description="after All filter")
+            except Exception as e:
+                print(f"    ⚠ Error returning to 'All' filter: {e}")
+            
+            # Delete private note
+            print(f"  Deleting private note for booking {self.rescheduled_booking_id}...")
+            try:
+                delete_note_button = self.wait.until(EC.element_to_be_clickable((
+                    By.ID, f"private-note-delete-button-{self.rescheduled_booking_id}"
+                )))
+                self.scroll_to_element(delete_note_button)
+                self.settle(0.2)
+                delete_note_button.click()
+                print("    ✓ Clicked 'Delete' button")
+                self.settle(1)
+                
+                # Confirm delete in modal
+                try:
+                    # Wait for delete confirmation modal
+                    delete_confirm_button = self.wait.until(EC.element_to_be_clickable((
+                        By.ID, f"private-note-delete-confirm-button-{self.rescheduled_booking_id}"
+                    )))
+                    self.scroll_to_element(delete_confirm_button)
+                    self.settle(0.2)
+                    delete_confirm_button.click()
+                    print("    ✓ Confirmed delete in modal")
+                    self.wait_for_api_idle(description="after deleting private note")
+                    
+                    # Click OK on success modal after delete
+                    try:
+                        delete_success_ok = self.wait.until(EC.element_to_be_clickable((
+                            By.ID, f"private-note-delete-success-ok-button-{self.rescheduled_booking_id}"
+                        )))
+                        self.scroll_to_element(delete_success_ok)
+                        self.settle(0.2)
+                        delete_success_ok.click()
+                        print("    ✓ Clicked OK on delete success modal")
+                        self.settle(1)
+                    except Exception as e:
+                        print(f"    ℹ No delete success modal found (or already dismissed): {e}")
+                except Exception as e:
+                    print(f"    ℹ Error confirming delete in modal: {e}")
+                
+            except Exception as e:
+                print(f"    ⚠ Error deleting private note: {e}")
+                failed_steps.append("delete")
+                import traceback
+                traceback.print_exc()
+            
+            print("\n" + "="*70)
+            print("PRIVATE NOTE FLOW COMPLETED")
+            print("="*70)
+            
+        except Exception as e:
+            print(f"  ⚠ Error in private note flow: {e}")
+            import traceback
+            traceback.print_exc()
+            failed_steps.append("flow")
+        
+        if failed_steps:
+            print(f"  ✗ Private note steps failed: {', '.join(failed_steps)}")
+        return not failed_steps
+    
+    def stage_product_purchase(self):
+        """Customer buys products, checks order history and loyalty, saves a card and browses salons"""
+        # PRODUCT PURCHASE FLOW
+        print("\n" + "="*70)
+        print("PRODUCT PURCHASE FLOW")
+        print("="*70)
+        
+        ordered = False
+        try:
+            # Get the salon ID from the booking or from the test
+            # We'll need to find the salon that was created in this test
+            # For now, we'll navigate to browse and find it by name
+            
+            # Click Browse Salons
+            print("\nNavigating to Browse Salons...")
+            try:
+                browse_salons_link = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH,
+                        "//a[contains(text(), 'Browse Salons')] | "
+                        "//button[contains(text(), 'Browse Salons')]"
+                    ))
+                )
+                self.scroll_to_element(browse_salons_link)
+                self.settle(0.2)
+                browse_salons_link.click()
+                self.settle(1.0)
+                print("  ✓ Clicked Browse Salons")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Browse Salons: {e}")
+                # Try navigating directly
+                self.spa_navigate("/browser")
+                self.settle(1.0)
+            
+            # Find the salon that was created in this test
+            # Look for the salon name that was created (should be "Selenium Test Salon" or similar)
+            print("\nFinding the test salon...")
+            self.settle(1.0)
+            
+            # Try to find View Details button for the test salon
+            # We'll look for a salon card and click View Details
+            try:
+                # Look for view details buttons - we'll click the first one or find by salon name
+                view_details_buttons = self.driver.find_elements(
+                    By.XPATH, 
+                    "//button[contains(@id, 'view-details-button-')]"
+                )
+                
+                if view_details_buttons:
+                    # Click the first salon's view details (assuming it's the test salon)
+                    print(f"  Found {len(view_details_buttons)} salon(s), clicking first View Details...")
+                    self.scroll_to_element(view_details_buttons[0])
+                    self.settle(0.2)
+                    view_details_buttons[0].click()
+                    self.settle(1.0)
+                    print("  ✓ Clicked View Details")
+                    
+                    # Extract salon ID from URL
+                    current_url = self.driver.current_url
+                    salon_id_match = None
+                    if "/salon/" in current_url:
+                        try:
+                            salon_id_match = current_url.split("/salon/")[1].split("/")[0]
+                            print(f"  Found salon ID from URL: {salon_id_match}")
+                        except Exception:
+                            pass
+                    
+                    # Wait for salon detail page to load
+                    print("\nWaiting for salon detail page to load...")
+                    try:
+                        # Wait for salon name or key elements to appear (indicating page has loaded)
+                        self.wait.until(
+                            EC.any_of(
+                                EC.presence_of_element_located((By.XPATH, "//h2[contains(@class, 'text-3xl')] | //h1[contains(@class, 'text-3xl')] | //*[contains(@class, 'CardTitle')]")),
+                                EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'View Products')]"))
+                            )
+                        )
+                        self.settle(1.0)  # Additional wait for any animations/transitions
+                        print("  ✓ Salon detail page loaded")
+                    except Exception as e:
+                        print(f"  ⚠ Warning: Could not confirm page load: {e}")
+                        self.settle(2.0)  # Fallback wait
+                    
+                    # Click View Products button
+                    print("\nClicking View Products...")
+                    try:
+                        view_products_button = self.wait.until(
+                            EC.element_to_be_clickable((By.XPATH,
+                                "//button[contains(text(), 'View Products')]"
+                            ))
+                        )
+                        self.scroll_to_element(view_products_button)
+                        self.settle(0.2)
+                        view_products_button.click()
+                        self.settle(1.0)
+                        print("  ✓ Clicked View Products")
+                        
+                        # Wait for products page to load
+                        self.settle(1.0)
+                        
+                        # Find products and add to cart
+                        print("\nAdding products to cart...")
+                        try:
+                            # Find all product cards
+                            product_cards = self.driver.find_elements(
+                                By.XPATH,
+                                "//div[contains(@class, 'card') or contains(@class, 'Card')]//button[contains(text(), 'Add to Cart')]/ancestor::div[contains(@class, 'card') or contains(@class, 'Card')]"
+                            )
+                            
+                            if product_cards:
+                                # Work with first product
+                                first_product = product_cards[0]
+                                
+                                # Find quantity controls (plus/minus buttons) using IDs
+                                print("  Adjusting product quantity...")
                                 try:
-                                    time.sleep(1)
-                                    date_buttons_r = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-date-button-')]")
-                                    available_dates_r = [b for b in date_buttons_r if b.is_enabled()]
-                                    if len(available_dates_r) > 1:
-                                        date_button_r = available_dates_r[-1]  # pick a later date
-                                    elif available_dates_r:
-                                        date_button_r = available_dates_r[0]
-                                    else:
-                                        date_button_r = None
-                                    if date_button_r:
-                                        self.scroll_to_element(date_button_r)
-                                        time.sleep(0.2)
+                                    # Extract product ID from the product card
+                                    product_id = None
+                                    # Try to find product ID from Add to Cart button ID
+                                    add_to_cart_buttons = first_product.find_elements(
+                                        By.XPATH,
+                                        ".//button[contains(@id, 'add-to-cart-button-')]"
+                                    )
+                                    if add_to_cart_buttons:
+                                        button_id = add_to_cart_buttons[0].get_attribute("id")
+                                        if button_id:
+                                            product_id = button_id.replace("add-to-cart-button-", "")
+                                            print(f"    Found product ID: {product_id}")
+                                    
+                                    if product_id:
+                                        # Click plus button using ID
                                         try:
-                                            self.driver.execute_script("arguments[0].click();", date_button_r)
-                                        except:
-                                            date_button_r.click()
-                                        print("    ✓ Selected new reschedule date")
-                                        time.sleep(2)
-
-                                        # time
-                                        time_buttons_r = self.driver.find_elements(By.XPATH, "//button[contains(@id, 'select-time-button-')]")
-                                        avail_times_r = [b for b in time_buttons_r if b.is_enabled()]
-                                        if avail_times_r:
-                                            time_button_r = avail_times_r[-1]
-                                            self.scroll_to_element(time_button_r)
-                                            time.sleep(0.2)
-                                            try:
-                                                self.driver.execute_script("arguments[0].click();", time_button_r)
-                                            except:
-                                                time_button_r.click()
-                                            print("    ✓ Selected new reschedule time")
-                                            time.sleep(1)
+                                            plus_button = self.wait.until(
+                                                EC.element_to_be_clickable((By.ID, f"quantity-plus-button-{product_id}"))
+                                            )
+                                            self.scroll_to_element(plus_button)
+                                            self.settle(0.2)
+                                            plus_button.click()
+                                            self.settle(0.3)
+                                            print("    ✓ Increased quantity")
+                                            
+                                            # Click minus button using ID
+                                            minus_button = self.wait.until(
+                                                EC.element_to_be_clickable((By.ID, f"quantity-minus-button-{product_id}"))
+                                            )
+                                            self.scroll_to_element(minus_button)
+                                            self.settle(0.2)
+                                            minus_button.click()
+                                            self.settle(0.3)
+                                            print("    ✓ Decreased quantity")
+                                        except Exception as e:
+                                            print(f"    ⚠ Error using ID-based quantity buttons: {e}")
+                                            # Fallback to XPath
+                                            plus_buttons = first_product.find_elements(
+                                                By.XPATH,
+                                                ".//button[.//*[contains(@class, 'Plus') or contains(@class, 'plus')] or .//svg[contains(@class, 'lucide-plus')]]"
+                                            )
+                                            if plus_buttons:
+                                                self.scroll_to_element(plus_buttons[0])
+                                                self.settle(0.2)
+                                                plus_buttons[0].click()
+                                                self.settle(0.3)
+                                                print("    ✓ Increased quantity (fallback)")
+                                                
+                                                minus_buttons = first_product.find_elements(
+                                                    By.XPATH,
+                                                    ".//button[.//*[contains(@class, 'Minus') or contains(@class, 'minus')] or .//svg[contains(@class, 'lucide-minus')]]"
+                                                )
+                                                if minus_buttons:
+                                                    self.scroll_to_element(minus_buttons[0])
+                                                    self.settle(0.2)
+                                                    minus_buttons[0].click()
+                                                    self.settle(0.3)
+                                                    print("    ✓ Decreased quantity (fallback)")
+                                    else:
+                                        print("    ⚠ Could not find product ID, skipping quantity adjustment")
                                 except Exception as e:
-                                    print(f"    ⚠ Error selecting new reschedule date/time: {e}")
-
-                                # Submit reschedule (same book-appointment-submit-button and modal)
+                                    print(f"    ⚠ Error adjusting quantity: {e}")
+                                
+                                # Click Add to Cart using ID
+                                print("  Clicking Add to Cart...")
                                 try:
-                                    print("  Submitting reschedule...")
-                                    resched_submit = self.wait.until(EC.element_to_be_clickable((By.ID, "book-appointment-submit-button")))
-                                    self.scroll_to_element(resched_submit)
-                                    time.sleep(0.2)
-                                    try:
-                                        self.driver.execute_script("arguments[0].click();", resched_submit)
-                                    except:
-                                        resched_submit.click()
-                                    time.sleep(2)
-
-                                    # Confirm reschedule
-                                    confirm_resched = self.wait.until(EC.element_to_be_clickable((By.ID, "booking-confirm-button")))
-                                    self.scroll_to_element(confirm_resched)
-                                    time.sleep(0.2)
+                                    if product_id:
+                                        add_to_cart_button = self.wait.until(
+                                            EC.element_to_be_clickable((By.ID, f"add-to-cart-button-{product_id}"))
+                                        )
+                                    else:
+                                        # Fallback to XPath
+                                        add_to_cart_button = first_product.find_element(
+                                            By.XPATH,
+                                            ".//button[contains(text(), 'Add to Cart')]"
+                                        )
+                                    self.scroll_to_element(add_to_cart_button)
+                                    self.settle(0.2)
+                                    add_to_cart_button.click()
+                                    self.settle(1.0)
+                                    print("    ✓ Clicked Add to Cart")
+                                    
+                                    # Wait for toast notification to appear and disappear
                                     try:
-                                        self.driver.execute_script("arguments[0].click();", confirm_resched)
-                                    except:
-                                        confirm_resched.click()
-                                    time.sleep(3)
-                                    print("  ✓ Reschedule flow completed")
+                                        WebDriverWait(self.driver, 3).until(
+                                            EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
+                                        )
+                                        self.settle(0.5)
+                                        print("    ✓ Product added to cart notification shown")
+                                    except Exception:
+                                        pass
                                 except Exception as e:
-                                    print(f"    ⚠ Error submitting reschedule: {e}")
+                                    print(f"    ⚠ Error clicking Add to Cart: {e}")
                             else:
-                                print("  ⚠ No reschedule buttons found on appointments page")
+                                print("  ⚠ No products found on page")
+                        except Exception as e:
+                            print(f"  ⚠ Error adding products: {e}")
+                        
+                        # Click View Cart using ID
+                        print("\nClicking View Cart...")
+                        try:
+                            # Wait longer for cart count to update
+                            self.settle(1.5)
                             
-                            # ============================
-                            # PRIVATE NOTE FLOW AFTER RESCHEDULE
-                            # ============================
-                            if rescheduled_booking_id:
+                            # Try using ID first
+                            try:
+                                view_cart_button = self.wait.until(
+                                    EC.element_to_be_clickable((By.ID, "view-cart-button"))
+                                )
+                                # Wait for button to be enabled
+                                WebDriverWait(self.driver, 5).until(
+                                    lambda d: view_cart_button.get_attribute("disabled") is None or view_cart_button.get_attribute("disabled") == "false"
+                                )
+                            except Exception:
+                                # Fallback to XPath
+                                view_cart_button = self.wait.until(
+                                    EC.element_to_be_clickable((By.XPATH,
+                                        "//button[@id='view-cart-button'] | "
+                                        "//button[.//span[contains(text(), 'View Cart')]] | "
+                                        "//button[contains(., 'View Cart')]"
+                                    ))
+                                )
+                            
+                            self.scroll_to_element(view_cart_button)
+                            self.settle(0.2)
+                            view_cart_button.click()
+                            self.settle(1.0)
+                            print("  ✓ Clicked View Cart")
+                            
+                            # Wait for cart page to load
+                            self.settle(1.0)
+                            
+                            # Click Continue Shopping using ID
+                            print("\nClicking Continue Shopping...")
+                            try:
+                                continue_shopping_button = self.wait.until(
+                                    EC.element_to_be_clickable((By.ID, "continue-shopping-button"))
+                                )
+                                self.scroll_to_element(continue_shopping_button)
+                                self.settle(0.2)
+                                continue_shopping_button.click()
+                                self.settle(1.0)
+                                print("  ✓ Clicked Continue Shopping")
+                                
+                                # Add more products
+                                print("\nAdding more products...")
+                                self.settle(1.0)
                                 try:
-                                    print("\n" + "="*70)
-                                    print("PRIVATE NOTE FLOW")
-                                    print("="*70)
-                                    
-                                    # Navigate back to appointments page
-                                    print("\nNavigating back to My Appointments for private note...")
-                                    self.driver.get(f"{BASE_URL}/appointments")
-                                    time.sleep(2)
+                                    # Find products again and add another one using IDs
+                                    add_to_cart_buttons = self.driver.find_elements(
+                                        By.XPATH,
+                                        "//button[contains(@id, 'add-to-cart-button-')]"
+                                    )
                                     
-                                    # Wait for appointments to load
-                                    WebDriverWait(self.driver, 10).until(
-                                        EC.presence_of_element_located((By.XPATH,
-                                            "//button[contains(@id, 'private-note-add-button-')] | //button[contains(@id, 'private-note-edit-button-')]"
-                                        ))
+                                    if add_to_cart_buttons and len(add_to_cart_buttons) > 1:
+                                        # Add second product if available
+                                        add_to_cart_button = self.wait.until(
+                                            EC.element_to_be_clickable((By.ID, add_to_cart_buttons[1].get_attribute("id")))
+                                        )
+                                        self.scroll_to_element(add_to_cart_button)
+                                        self.settle(0.2)
+                                        add_to_cart_button.click()
+                                        self.settle(1.0)
+                                        print("  ✓ Added second product to cart")
+                                    elif add_to_cart_buttons:
+                                        # Add same product again
+                                        add_to_cart_button = self.wait.until(
+                                            EC.element_to_be_clickable((By.ID, add_to_cart_buttons[0].get_attribute("id")))
+                                        )
+                                        self.scroll_to_element(add_to_cart_button)
+                                        self.settle(0.2)
+                                        add_to_cart_button.click()
+                                        self.settle(1.0)
+                                        print("  ✓ Added more of the same product to cart")
+                                    else:
+                                        # Fallback to XPath
+                                        product_cards = self.driver.find_elements(
+                                            By.XPATH,
+                                            "//div[contains(@class, 'card') or contains(@class, 'Card')]//button[contains(text(), 'Add to Cart')]/ancestor::div[contains(@class, 'card') or contains(@class, 'Card')]"
+                                        )
+                                        if product_cards:
+                                            add_to_cart_button = product_cards[0].find_element(
+                                                By.XPATH,
+                                                ".//button[contains(text(), 'Add to Cart')]"
+                                            )
+                                            self.scroll_to_element(add_to_cart_button)
+                                            self.settle(0.2)
+                                            add_to_cart_button.click()
+                                            self.settle(1.0)
+                                            print("  ✓ Added product to cart (fallback)")
+                                except Exception as e:
+                                    print(f"  ⚠ Error adding more products: {e}")
+                                
+                                # Click View Cart again using ID
+                                print("\nClicking View Cart again...")
+                                try:
+                                    self.settle(1.5)  # Wait for cart count to update
+                                    view_cart_button = self.wait.until(
+                                        EC.element_to_be_clickable((By.ID, "view-cart-button"))
                                     )
+                                    # Wait for button to be enabled
+                                    WebDriverWait(self.driver, 5).until(
+                                        lambda d: view_cart_button.get_attribute("disabled") is None or view_cart_button.get_attribute("disabled") == "false"
+                                    )
+                                    self.scroll_to_element(view_cart_button)
+                                    self.settle(0.2)
+                                    view_cart_button.click()
+                                    self.settle(1.0)
+                                    print("  ✓ Clicked View Cart again")
+                                except Exception as e:
+                                    print(f"  ⚠ Error clicking View Cart: {e}")
+                            except Exception as e:
+                                print(f"  ⚠ Error clicking Continue Shopping: {e}")
+                            
+                            # Delete item from cart before checkout
+                            print("\nDeleting item from cart...")
+                            try:
+                                # Find and click delete button (trash icon) using ID
+                                delete_buttons = self.driver.find_elements(
+                                    By.XPATH,
+                                    "//button[contains(@id, 'delete-cart-item-button-')]"
+                                )
+                                
+                                if delete_buttons:
+                                    delete_button = delete_buttons[0]
+                                    self.scroll_to_element(delete_button)
+                                    self.settle(0.2)
+                                    delete_button.click()
+                                    self.settle(0.5)
+                                    print("  ✓ Clicked delete button")
                                     
-                                    # Add private note
-                                    print(f"  Adding private note to booking {rescheduled_booking_id}...")
+                                    # Wait for modal to appear and click Remove
+                                    print("  Clicking Remove on confirmation modal...")
                                     try:
-                                        add_note_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, f"private-note-add-button-{rescheduled_booking_id}"
-                                        )))
-                                        self.scroll_to_element(add_note_button)
-                                        time.sleep(0.2)
-                                        add_note_button.click()
-                                        print("    ✓ Clicked 'Add private note' button")
-                                        time.sleep(1)
-                                        
-                                        # Type random note
-                                        random_note = f"This is a test note for automation. Random number: {random.randint(1000, 9999)}"
-                                        note_textarea = self.wait.until(EC.presence_of_element_located((
-                                            By.ID, f"private-note-textarea-{rescheduled_booking_id}"
-                                        )))
-                                        note_textarea.clear()
-                                        note_textarea.send_keys(random_note)
-                                        print(f"    ✓ Entered note: {random_note[:50]}...")
-                                        time.sleep(0.5)
-                                        
-                                        # Click Save Note button
-                                        save_note_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, f"private-note-save-button-{rescheduled_booking_id}"
-                                        )))
-                                        self.scroll_to_element(save_note_button)
-                                        time.sleep(0.2)
-                                        save_note_button.click()
-                                        print("    ✓ Clicked 'Save Note' button")
-                                        time.sleep(2)
-                                        
-                                        # Click OK on success modal
-                                        success_ok_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, f"private-note-success-ok-button-{rescheduled_booking_id}"
-                                        )))
-                                        self.scroll_to_element(success_ok_button)
-                                        time.sleep(0.2)
-                                        success_ok_button.click()
-                                        print("    ✓ Clicked OK on success modal")
-                                        time.sleep(1)
+                                        remove_button = self.wait.until(
+                                            EC.element_to_be_clickable((By.ID, "remove-item-confirm-button"))
+                                        )
+                                        self.scroll_to_element(remove_button)
+                                        self.settle(0.2)
+                                        remove_button.click()
+                                        self.settle(1.0)
+                                        print("  ✓ Clicked Remove on modal")
                                         
+                                        # Wait for toast notification to appear and disappear
+                                        try:
+                                            WebDriverWait(self.driver, 3).until(
+                                                EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
+                                            )
+                                            self.settle(0.5)
+                                            print("  ✓ Item removed notification shown")
+                                            # Wait for toast to disappear
+                                            WebDriverWait(self.driver, 5).until(
+                                                lambda d: len(d.find_elements(By.XPATH, "//li[@data-sonner-toast and @data-visible='true']")) == 0
+                                            )
+                                            self.settle(0.5)
+                                        except Exception:
+                                            pass
                                     except Exception as e:
-                                        print(f"    ⚠ Error adding private note: {e}")
-                                        import traceback
-                                        traceback.print_exc()
+                                        print(f"  ⚠ Error clicking Remove on modal: {e}")
+                                else:
+                                    print("  ⚠ No delete buttons found")
+                            except Exception as e:
+                                print(f"  ⚠ Error deleting item: {e}")
+                            
+                            # Click Browse Products (appears when cart is empty)
+                            print("\nClicking Browse Products...")
+                            try:
+                                browse_products_button = self.wait.until(
+                                    EC.element_to_be_clickable((By.ID, "browse-products-button"))
+                                )
+                                self.scroll_to_element(browse_products_button)
+                                self.settle(0.2)
+                                browse_products_button.click()
+                                self.settle(1.0)
+                                print("  ✓ Clicked Browse Products")
+                                
+                                # Wait for products page to load
+                                self.settle(1.0)
+                                
+                                # Add product to cart again
+                                print("\nAdding product to cart again...")
+                                try:
+                                    # Find Add to Cart button using ID
+                                    add_to_cart_buttons = self.driver.find_elements(
+                                        By.XPATH,
+                                        "//button[contains(@id, 'add-to-cart-button-')]"
+                                    )
                                     
-                                    # Edit private note
-                                    print(f"  Editing private note for booking {rescheduled_booking_id}...")
-                                    try:
-                                        edit_note_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, f"private-note-edit-button-{rescheduled_booking_id}"
-                                        )))
-                                        self.scroll_to_element(edit_note_button)
-                                        time.sleep(0.2)
-                                        edit_note_button.click()
-                                        print("    ✓ Clicked 'Edit' button")
-                                        time.sleep(1)
-                                        
-                                        # Change the note text
-                                        edited_note = f"Updated note text. Edit timestamp: {random.randint(10000, 99999)}"
-                                        note_textarea = self.wait.until(EC.presence_of_element_located((
-                                            By.ID, f"private-note-textarea-{rescheduled_booking_id}"
-                                        )))
-                                        note_textarea.clear()
-                                        note_textarea.send_keys(edited_note)
-                                        print(f"    ✓ Changed note to: {edited_note[:50]}...")
-                                        time.sleep(0.5)
-                                        
-                                        # Click Update Note button
-                                        update_note_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, f"private-note-save-button-{rescheduled_booking_id}"
-                                        )))
-                                        self.scroll_to_element(update_note_button)
-                                        time.sleep(0.2)
-                                        update_note_button.click()
-                                        print("    ✓ Clicked 'Update Note' button")
-                                        time.sleep(2)
-                                        
-                                        # Click OK on success modal
-                                        success_ok_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, f"private-note-success-ok-button-{rescheduled_booking_id}"
-                                        )))
-                                        self.scroll_to_element(success_ok_button)
-                                        time.sleep(0.2)
-                                        success_ok_button.click()
-                                        print("    ✓ Clicked OK on success modal after update")
-                                        time.sleep(1)
+                                    if add_to_cart_buttons:
+                                        add_to_cart_button = self.wait.until(
+                                            EC.element_to_be_clickable((By.ID, add_to_cart_buttons[0].get_attribute("id")))
+                                        )
+                                        self.scroll_to_element(add_to_cart_button)
+                                        self.settle(0.2)
+                                        add_to_cart_button.click()
+                                        self.settle(1.0)
+                                        print("  ✓ Added product to cart again")
                                         
-                                    except Exception as e:
-                                        print(f"    ⚠ Error editing private note: {e}")
-                                        import traceback
-                                        traceback.print_exc()
-                                    
-                                    # Scroll through filters
-                                    print("  Scrolling through appointment filters...")
-                                    filter_order = ['all', 'upcoming', 'past', 'canceled']
-                                    for filter_name in filter_order:
+                                        # Wait for toast notification
                                         try:
-                                            filter_button_id = f"appointments-filter-{filter_name}"
-                                            filter_button = self.wait.until(EC.element_to_be_clickable((
-                                                By.ID, filter_button_id
-                                            )))
-                                            self.scroll_to_element(filter_button)
-                                            time.sleep(0.2)
-                                            filter_button.click()
-                                            print(f"    ✓ Clicked '{filter_name.title()}' filter")
-                                            time.sleep(1.5)  # Wait for appointments to filter
-                                        except Exception as e:
-                                            print(f"    ⚠ Error clicking {filter_name} filter: {e}")
+                                            WebDriverWait(self.driver, 3).until(
+                                                EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
+                                            )
+                                            self.settle(0.5)
+                                            print("  ✓ Product added to cart notification shown")
+                                        except Exception:
+                                            pass
+                                    else:
+                                        print("  ⚠ No Add to Cart buttons found")
+                                except Exception as e:
+                                    print(f"  ⚠ Error adding product to cart: {e}")
+                            except Exception as e:
+                                print(f"  ⚠ Error clicking Browse Products: {e}")
+                            
+                            # Navigate back to cart
+                            print("\nNavigating to cart...")
+                            try:
+                                view_cart_button = self.wait.until(
+                                    EC.element_to_be_clickable((By.ID, "view-cart-button"))
+                                )
+                                # Wait for button to be enabled
+                                WebDriverWait(self.driver, 5).until(
+                                    lambda d: view_cart_button.get_attribute("disabled") is None or view_cart_button.get_attribute("disabled") == "false"
+                                )
+                                self.scroll_to_element(view_cart_button)
+                                self.settle(0.2)
+                                view_cart_button.click()
+                                self.settle(1.0)
+                                print("  ✓ Navigated to cart")
+                            except Exception as e:
+                                print(f"  ⚠ Error navigating to cart: {e}")
+                            
+                            # Click Proceed to Checkout using ID
+                            print("\nClicking Proceed to Checkout...")
+                            try:
+                                proceed_checkout_button = self.wait.until(
+                                    EC.element_to_be_clickable((By.ID, "proceed-to-checkout-button"))
+                                )
+                                self.scroll_to_element(proceed_checkout_button)
+                                self.settle(0.2)
+                                proceed_checkout_button.click()
+                                self.settle(1.5)
+                                print("  ✓ Clicked Proceed to Checkout")
+                                
+                                # Wait for checkout page to load
+                                self.settle(1.0)
+                                
+                                # Scroll down to find Complete Order button
+                                print("\nScrolling down to find Complete Order button...")
+                                page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
+                                viewport_height = self.driver.execute_script("return window.innerHeight")
+                                
+                                # Scroll down incrementally
+                                scroll_position = 0
+                                while scroll_position < page_height:
+                                    scroll_position += viewport_height * 0.5
+                                    self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
+                                    self.settle(0.3)
+                                    
+                                    # Check if Complete Order button is visible using ID
+                                    try:
+                                        complete_order_button = self.driver.find_element(
+                                            By.ID,
+                                            "complete-order-button"
+                                        )
+                                        if complete_order_button.is_displayed():
+                                            print("  ✓ Found Complete Order button")
+                                            break
+                                    except Exception:
+                                        pass
+                                
+                                # Click Complete Order button using ID
+                                print("\nClicking Complete Order...")
+                                try:
+                                    complete_order_button = self.wait.until(
+                                        EC.element_to_be_clickable((By.ID, "complete-order-button"))
+                                    )
+                                    self.scroll_to_element(complete_order_button)
+                                    self.settle(0.2)
+                                    complete_order_button.click()
+                                    self.settle(1.0)
+                                    print("  ✓ Clicked Complete Order")
+                                    ordered = True
                                     
-                                    # Go back to 'All' filter
-                                    print("  Returning to 'All' filter...")
+                                    # After completing order, user is taken to order history
+                                    # Wait for Order History page to load
+                                    print("\nWaiting for Order History page to load...")
                                     try:
-                                        all_filter_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, "appointments-filter-all"
-                                        )))
-                                        self.scroll_to_element(all_filter_button)
-                                        time.sleep(0.2)
-                                        all_filter_button.click()
-                                        print("    ✓ Returned to 'All' filter")
-                                        time.sleep(2)  # Wait for appointments to reload
+                                        # Wait for either the "Your Orders" heading or order cards to appear
+                                        WebDriverWait(self.driver, 10).until(
+                                            EC.any_of(
+                                                EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'Your Orders')]")),
+                                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'card')]//div[contains(text(), 'Order #')]")),
+                                                EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'No orders found')]"))
+                                            )
+                                        )
+                                        self.settle(1.0)  # Extra wait for content to fully render
+                                        print("  ✓ Order History page loaded")
                                     except Exception as e:
-                                        print(f"    ⚠ Error returning to 'All' filter: {e}")
+                                        print(f"  ⚠ Order History page may not have loaded: {e}")
+                                    
+                                    # Scroll on order history page
+                                    print("\nScrolling on Order History page...")
+                                    self.scroll_through_page(pause=0.3)
+                                    print("  ✓ Scrolled through Order History page")
                                     
-                                    # Delete private note
-                                    print(f"  Deleting private note for booking {rescheduled_booking_id}...")
+                                    # Navigate to Loyalty Program tab
+                                    print("\nNavigating to Loyalty Program tab...")
                                     try:
-                                        delete_note_button = self.wait.until(EC.element_to_be_clickable((
-                                            By.ID, f"private-note-delete-button-{rescheduled_booking_id}"
-                                        )))
-                                        self.scroll_to_element(delete_note_button)
-                                        time.sleep(0.2)
-                                        delete_note_button.click()
-                                        print("    ✓ Clicked 'Delete' button")
-                                        time.sleep(1)
+                                        loyalty_program_link = self.wait.until(
+                                            EC.element_to_be_clickable((By.XPATH,
+                                                "//a[contains(text(), 'Loyalty Program')] | "
+                                                "//button[contains(text(), 'Loyalty Program')]"
+                                            ))
+                                        )
+                                        self.scroll_to_element(loyalty_program_link)
+                                        self.settle(0.2)
+                                        loyalty_program_link.click()
+                                        self.settle(1.0)
+                                        print("  ✓ Clicked Loyalty Program tab")
                                         
-                                        # Confirm delete in modal
+                                        # Wait for Loyalty Program page to load
+                                        print("  Waiting for Loyalty Program page to load...")
                                         try:
-                                            # Wait for delete confirmation modal
-                                            delete_confirm_button = self.wait.until(EC.element_to_be_clickable((
-                                                By.ID, f"private-note-delete-confirm-button-{rescheduled_booking_id}"
-                                            )))
-                                            self.scroll_to_element(delete_confirm_button)
-                                            time.sleep(0.2)
-                                            delete_confirm_button.click()
-                                            print("    ✓ Confirmed delete in modal")
-                                            time.sleep(2)
-                                            
-                                            # Click OK on success modal after delete
-                                            try:
-                                                delete_success_ok = self.wait.until(EC.element_to_be_clickable((
-                                                    By.ID, f"private-note-delete-success-ok-button-{rescheduled_booking_id}"
-                                                )))
-                                                self.scroll_to_element(delete_success_ok)
-                                                time.sleep(0.2)
-                                                delete_success_ok.click()
-                                                print("    ✓ Clicked OK on delete success modal")
-                                                time.sleep(1)
-                                            except Exception as e:
-                                                print(f"    ℹ No delete success modal found (or already dismissed): {e}")
+                                            # Wait for either "Your Salon Progress" heading or loyalty cards to appear
+                                            WebDriverWait(self.driver, 10).until(
+                                                EC.any_of(
+                                                    EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'Your Salon Progress')]")),
+                                                    EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Total Visits')]")),
+                                                    EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Gold Salons')]")),
+                                                    EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'No Loyalty Data Yet')]"))
+                                                )
+                                            )
+                                            self.settle(1.0)  # Extra wait for content to fully render
+                                            print("  ✓ Loyalty Program page loaded")
                                         except Exception as e:
-                                            print(f"    ℹ Error confirming delete in modal: {e}")
+                                            print(f"  ⚠ Loyalty Program page may not have loaded: {e}")
                                         
+                                        # Scroll around on Loyalty Program page
+                                        print("  Scrolling on Loyalty Program page...")
+                                        self.settle(0.5)
+                                        self.scroll_through_page(pause=0.3)
+                                        print("  ✓ Scrolled through Loyalty Program page")
                                     except Exception as e:
-                                        print(f"    ⚠ Error deleting private note: {e}")
-                                        import traceback
-                                        traceback.print_exc()
-                                    
-                                    print("\n" + "="*70)
-                                    print("PRIVATE NOTE FLOW COMPLETED")
-                                    print("="*70)
-                                    
-                                    # PRODUCT PURCHASE FLOW
-                                    print("\n" + "="*70)
-                                    print("PRODUCT PURCHASE FLOW")
-                                    print("="*70)
+                                        print(f"  ⚠ Error navigating to Loyalty Program: {e}")
                                     
+                                    # Navigate to Settings tab
+                                    print("\nNavigating to Settings tab...")
                                     try:
-                                        # Get the salon ID from the booking or from the test
-                                        # We'll need to find the salon that was created in this test
-                                        # For now, we'll navigate to browse and find it by name
+                                        settings_link = self.wait.until(
+                                            EC.element_to_be_clickable((By.XPATH,
+                                                "//a[contains(text(), 'Settings')] | "
+                                                "//button[contains(text(), 'Settings')]"
+                                            ))
+                                        )
+                                        self.scroll_to_element(settings_link)
+                                        self.settle(0.2)
+                                        settings_link.click()
+                                        self.settle(1.0)
+                                        print("  ✓ Clicked Settings tab")
                                         
-                                        # Click Browse Salons
-                                        print("\nNavigating to Browse Salons...")
+                                        # Wait for Settings page to load
+                                        self.settle(1.0)
+                                        
+                                        # Click Edit Address button
+                                        print("\nClicking Edit Address...")
                                         try:
-                                            browse_salons_link = self.wait.until(
-                                                EC.element_to_be_clickable((By.XPATH,
-                                                    "//a[contains(text(), 'Browse Salons')] | "
-                                                    "//button[contains(text(), 'Browse Salons')]"
-                                                ))
+                                            edit_address_button = self.wait.until(
+                                                EC.element_to_be_clickable((By.ID, "edit-address-button"))
                                             )
-                                            self.scroll_to_element(browse_salons_link)
-                                            time.sleep(0.2)
-                                            browse_salons_link.click()
-                                            time.sleep(1.0)
-                                            print("  ✓ Clicked Browse Salons")
+                                            self.scroll_to_element(edit_address_button)
+                                            self.settle(0.2)
+                                            edit_address_button.click()
+                                            self.settle(0.5)
+                                            print("  ✓ Clicked Edit Address")
+                                            
+                                            # Wait for address form to appear
+                                            self.settle(0.5)
+                                            
+                                            # Click Save Address button
+                                            print("\nClicking Save Address...")
+                                            try:
+                                                save_address_button = self.wait.until(
+                                                    EC.element_to_be_clickable((By.ID, "save-address-button"))
+                                                )
+                                                self.scroll_to_element(save_address_button)
+                                                self.settle(0.2)
+                                                save_address_button.click()
+                                                self.settle(1.5)
+                                                print("  ✓ Clicked Save Address")
+                                                
+                                                # Wait for success notification
+                                                try:
+                                                    WebDriverWait(self.driver, 3).until(
+                                                        EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
+                                                    )
+                                                    self.settle(0.5)
+                                                    print("  ✓ Address saved notification shown")
+                                                except Exception:
+                                                    pass
+                                            except Exception as e:
+                                                print(f"  ⚠ Error clicking Save Address: {e}")
                                         except Exception as e:
-                                            print(f"  ⚠ Error clicking Browse Salons: {e}")
-                                            # Try navigating directly
-                                            self.driver.get(f"{BASE_URL}/browser")
-                                            time.sleep(1.0)
+                                            print(f"  ⚠ Error clicking Edit Address: {e}")
                                         
-                                        # Find the salon that was created in this test
-                                        # Look for the salon name that was created (should be "Selenium Test Salon" or similar)
-                                        print("\nFinding the test salon...")
-                                        time.sleep(1.0)
-                                        
-                                        # Try to find View Details button for the test salon
-                                        # We'll look for a salon card and click View Details
+                                        # Click Enter Card Details button
+                                        print("\nClicking Enter Card Details...")
                                         try:
-                                            # Look for view details buttons - we'll click the first one or find by salon name
-                                            view_details_buttons = self.driver.find_elements(
-                                                By.XPATH, 
-                                                "//button[contains(@id, 'view-details-button-')]"
+                                            enter_card_button = self.wait.until(
+                                                EC.element_to_be_clickable((By.ID, "enter-card-details-button"))
                                             )
+                                            self.scroll_to_element(enter_card_button)
+                                            self.settle(0.2)
+                                            enter_card_button.click()
+                                            self.settle(0.5)
+                                            print("  ✓ Clicked Enter Card Details")
+                                            
+                                            # Wait for card form to appear
+                                            self.settle(0.5)
                                             
-                                            if view_details_buttons:
-                                                # Click the first salon's view details (assuming it's the test salon)
-                                                print(f"  Found {len(view_details_buttons)} salon(s), clicking first View Details...")
-                                                self.scroll_to_element(view_details_buttons[0])
-                                                time.sleep(0.2)
-                                                view_details_buttons[0].click()
-                                                time.sleep(1.0)
-                                                print("  ✓ Clicked View Details")
+                                            # Fill in card details
+                                            print("\nFilling in card details...")
+                                            try:
+                                                # Card Number: 5555 5555 5555 4444
+                                                card_number_input = self.wait.until(
+                                                    EC.presence_of_element_located((By.ID, "card_number"))
+                                                )
+                                                self.scroll_to_element(card_number_input)
+                                                self.settle(0.2)
+                                                card_number_input.clear()
+                                                card_number_input.send_keys("5555 5555 5555 4444")
+                                                self.settle(0.3)
+                                                print("  ✓ Entered card number")
                                                 
-                                                # Extract salon ID from URL
-                                                current_url = self.driver.current_url
-                                                salon_id_match = None
-                                                if "/salon/" in current_url:
-                                                    try:
-                                                        salon_id_match = current_url.split("/salon/")[1].split("/")[0]
-                                                        print(f"  Found salon ID from URL: {salon_id_match}")
-                                                    except:
-                                                        pass
+                                                # Cardholder Name
+                                                cardholder_name_input = self.wait.until(
+                                                    EC.presence_of_element_located((By.ID, "cardholder_name"))
+                                                )
+                                                self.scroll_to_element(cardholder_name_input)
+                                                self.settle(0.2)
+                                                cardholder_name_input.clear()
+                                                cardholder_name_input.send_keys("Test User")
+                                                self.settle(0.3)
+                                                print("  ✓ Entered cardholder name")
+                                                
+                                                # Expiration Month: 12 (using same pattern as appointment booking)
+                                                exp_month_select = self.wait.until(
+                                                    EC.element_to_be_clickable((By.ID, "exp_month-select"))
+                                                )
+                                                exp_month_select.click()
+                                                self.settle(0.3)
+                                                month_option = WebDriverWait(self.driver, 3).until(
+                                                    EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and text()='12']"))
+                                                )
+                                                month_option.click()
+                                                self.settle(0.3)
+                                                print("  ✓ Selected expiration month: 12")
+                                                
+                                                # Expiration Year: 2025 (using same pattern as appointment booking)
+                                                exp_year_select = self.wait.until(
+                                                    EC.element_to_be_clickable((By.ID, "exp_year-select"))
+                                                )
+                                                exp_year_select.click()
+                                                self.settle(0.3)
+                                                year_option = WebDriverWait(self.driver, 3).until(
+                                                    EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and text()='2025']"))
+                                                )
+                                                year_option.click()
+                                                self.settle(0.3)
+                                                print("  ✓ Selected expiration year: 2025")
+                                                
+                                                # CVV: 123
+                                                cvc_input = self.wait.until(
+                                                    EC.presence_of_element_located((By.ID, "cvc"))
+                                                )
+                                                self.scroll_to_element(cvc_input)
+                                                self.settle(0.2)
+                                                cvc_input.clear()
+                                                cvc_input.send_keys("123")
+                                                self.settle(0.3)
+                                                print("  ✓ Entered CVV")
+                                                
+                                                # Click Save Card button
+                                                print("\nClicking Save Card...")
+                                                save_card_button = self.wait.until(
+                                                    EC.element_to_be_clickable((By.ID, "save-card-button"))
+                                                )
+                                                self.scroll_to_element(save_card_button)
+                                                self.settle(0.2)
+                                                save_card_button.click()
+                                                self.settle(1.5)
+                                                print("  ✓ Clicked Save Card")
                                                 
-                                                # Wait for salon detail page to load
-                                                print("\nWaiting for salon detail page to load...")
+                                                # Wait for success notification
                                                 try:
-                                                    # Wait for salon name or key elements to appear (indicating page has loaded)
-                                                    self.wait.until(
-                                                        EC.any_of(
-                                                            EC.presence_of_element_located((By.XPATH, "//h2[contains(@class, 'text-3xl')] | //h1[contains(@class, 'text-3xl')] | //*[contains(@class, 'CardTitle')]")),
-                                                            EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'View Products')]"))
-                                                        )
+                                                    WebDriverWait(self.driver, 3).until(
+                                                        EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
                                                     )
-                                                    time.sleep(1.0)  # Additional wait for any animations/transitions
-                                                    print("  ✓ Salon detail page loaded")
-                                                except Exception as e:
-                                                    print(f"  ⚠ Warning: Could not confirm page load: {e}")
-                                                    time.sleep(2.0)  # Fallback wait
+                                                    self.settle(0.5)
+                                                    print("  ✓ Card saved notification shown")
+                                                except Exception:
+                                                    pass
                                                 
-                                                # Click View Products button
-                                                print("\nClicking View Products...")
+                                                # Wait a couple seconds after saving card
+                                                self.settle(2.0)
+                                                
+                                                # Navigate to Browse Salons
+                                                print("\nNavigating to Browse Salons...")
                                                 try:
-                                                    view_products_button = self.wait.until(
+                                                    browse_salons_link = self.wait.until(
                                                         EC.element_to_be_clickable((By.XPATH,
-                                                            "//button[contains(text(), 'View Products')]"
+                                                            "//a[contains(text(), 'Browse Salons')] | "
+                                                            "//button[contains(text(), 'Browse Salons')]"
                                                         ))
                                                     )
-                                                    self.scroll_to_element(view_products_button)
-                                                    time.sleep(0.2)
-                                                    view_products_button.click()
-                                                    time.sleep(1.0)
-                                                    print("  ✓ Clicked View Products")
+                                                    self.scroll_to_element(browse_salons_link)
+                                                    self.settle(0.2)
+                                                    browse_salons_link.click()
+                                                    self.settle(1.0)
+                                                    print("  ✓ Clicked Browse Salons")
+                                                    
+                                                    # Wait for page to load
+                                                    self.settle(1.0)
                                                     
-                                                    # Wait for products page to load
-                                                    time.sleep(1.0)
+                                                    # Scroll down to find pagination
+                                                    print("\nScrolling down to find pagination...")
+                                                    page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
+                                                    viewport_height = self.driver.execute_script("return window.innerHeight")
                                                     
-                                                    # Find products and add to cart
-                                                    print("\nAdding products to cart...")
+                                                    # Scroll down incrementally
+                                                    scroll_position = 0
+                                                    while scroll_position < page_height:
+                                                        scroll_position += viewport_height * 0.5
+                                                        self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
+                                                        self.settle(0.3)
+                                                    
+                                                    print("  ✓ Scrolled to pagination area")
+                                                    
+                                                    # Test pagination: click next, then previous
+                                                    print("\nTesting pagination...")
                                                     try:
-                                                        # Find all product cards
-                                                        product_cards = self.driver.find_elements(
-                                                            By.XPATH,
-                                                            "//div[contains(@class, 'card') or contains(@class, 'Card')]//button[contains(text(), 'Add to Cart')]/ancestor::div[contains(@class, 'card') or contains(@class, 'Card')]"
-                                                        )
-                                                        
-                                                        if product_cards:
-                                                            # Work with first product
-                                                            first_product = product_cards[0]
+                                                        # Check if pagination exists (only shows if totalPages > 1)
+                                                        next_button = self.driver.find_elements(By.ID, "salon-browser-pagination-next-button")
+                                                        if next_button and not next_button[0].get_attribute("disabled"):
+                                                            # Click next button
+                                                            print("  Clicking 'Next' pagination button...")
+                                                            self.scroll_to_element(next_button[0])
+                                                            self.settle(0.2)
+                                                            next_button[0].click()
+                                                            self.settle(0.5)
+                                                            print("  ✓ Clicked 'Next' button")
                                                             
-                                                            # Find quantity controls (plus/minus buttons) using IDs
-                                                            print("  Adjusting product quantity...")
-                                                            try:
-                                                                # Extract product ID from the product card
-                                                                product_id = None
-                                                                # Try to find product ID from Add to Cart button ID
-                                                                add_to_cart_buttons = first_product.find_elements(
-                                                                    By.XPATH,
-                                                                    ".//button[contains(@id, 'add-to-cart-button-')]"
-                                                                )
-                                                                if add_to_cart_buttons:
-                                                                    button_id = add_to_cart_buttons[0].get_attribute("id")
-                                                                    if button_id:
-                                                                        product_id = button_id.replace("add-to-cart-button-", "")
-                                                                        print(f"    Found product ID: {product_id}")
-                                                                
-                                                                if product_id:
-                                                                    # Click plus button using ID
-                                                                    try:
-                                                                        plus_button = self.wait.until(
-                                                                            EC.element_to_be_clickable((By.ID, f"quantity-plus-button-{product_id}"))
-                                                                        )
-                                                                        self.scroll_to_element(plus_button)
-                                                                        time.sleep(0.2)
-                                                                        plus_button.click()
-                                                                        time.sleep(0.3)
-                                                                        print("    ✓ Increased quantity")
-                                                                        
-                                                                        # Click minus button using ID
-                                                                        minus_button = self.wait.until(
-                                                                            EC.element_to_be_clickable((By.ID, f"quantity-minus-button-{product_id}"))
-                                                                        )
-                                                                        self.scroll_to_element(minus_button)
-                                                                        time.sleep(0.2)
-                                                                        minus_button.click()
-                                                                        time.sleep(0.3)
-                                                                        print("    ✓ Decreased quantity")
-                                                                    except Exception as e:
-                                                                        print(f"    ⚠ Error using ID-based quantity buttons: {e}")
-                                                                        # Fallback to XPath
-                                                                        plus_buttons = first_product.find_elements(
-                                                                            By.XPATH,
-                                                                            ".//button[.//*[contains(@class, 'Plus') or contains(@class, 'plus')] or .//svg[contains(@class, 'lucide-plus')]]"
-                                                                        )
-                                                                        if plus_buttons:
-                                                                            self.scroll_to_element(plus_buttons[0])
-                                                                            time.sleep(0.2)
-                                                                            plus_buttons[0].click()
-                                                                            time.sleep(0.3)
-                                                                            print("    ✓ Increased quantity (fallback)")
-                                                                            
-                                                                            minus_buttons = first_product.find_elements(
-                                                                                By.XPATH,
-                                                                                ".//button[.//*[contains(@class, 'Minus') or contains(@class, 'minus')] or .//svg[contains(@class, 'lucide-minus')]]"
-                                                                            )
-                                                                            if minus_buttons:
-                                                                                self.scroll_to_element(minus_buttons[0])
-                                                                                time.sleep(0.2)
-                                                                                minus_buttons[0].click()
-                                                                                time.sleep(0.3)
-                                                                                print("    ✓ Decreased quantity (fallback)")
-                                                                else:
-                                                                    print("    ⚠ Could not find product ID, skipping quantity adjustment")
-                                                            except Exception as e:
-                                                                print(f"    ⚠ Error adjusting quantity: {e}")
-                                                            
-                                                            # Click Add to Cart using ID
-                                                            print("  Clicking Add to Cart...")
-                                                            try:
-                                                                if product_id:
-                                                                    add_to_cart_button = self.wait.until(
-                                                                        EC.element_to_be_clickable((By.ID, f"add-to-cart-button-{product_id}"))
-                                                                    )
-                                                                else:
-                                                                    # Fallback to XPath
-                                                                    add_to_cart_button = first_product.find_element(
-                                                                        By.XPATH,
-                                                                        ".//button[contains(text(), 'Add to Cart')]"
-                                                                    )
-                                                                self.scroll_to_element(add_to_cart_button)
-                                                                time.sleep(0.2)
-                                                                add_to_cart_button.click()
-                                                                time.sleep(1.0)
-                                                                print("    ✓ Clicked Add to Cart")
-                                                                
-                                                                # Wait for toast notification to appear and disappear
-                                                                try:
-                                                                    WebDriverWait(self.driver, 3).until(
-                                                                        EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
-                                                                    )
-                                                                    time.sleep(0.5)
-                                                                    print("    ✓ Product added to cart notification shown")
-                                                                except:
-                                                                    pass
-                                                            except Exception as e:
-                                                                print(f"    ⚠ Error clicking Add to Cart: {e}")
+                                                            # Now click previous button
+                                                            prev_button = self.wait.until(
+                                                                EC.element_to_be_clickable((By.ID, "salon-browser-pagination-previous-button"))
+                                                            )
+                                                            print("  Clicking 'Previous' pagination button...")
+                                                            self.scroll_to_element(prev_button)
+                                                            self.settle(0.2)
+                                                            prev_button.click()
+                                                            self.settle(0.5)
+                                                            print("  ✓ Clicked 'Previous' button")
                                                         else:
-                                                            print("  ⚠ No products found on page")
+                                                            print("  ⚠ Pagination buttons not available or disabled (may be on first/last page or only one page)")
                                                     except Exception as e:
-                                                        print(f"  ⚠ Error adding products: {e}")
+                                                        print(f"  ⚠ Could not test pagination: {e}")
                                                     
-                                                    # Click View Cart using ID
-                                                    print("\nClicking View Cart...")
+                                                    # Scroll back up to search bar
+                                                    print("\nScrolling up to search bar...")
+                                                    self.driver.execute_script("window.scrollTo(0, 0);")
+                                                    self.settle(0.5)
+                                                    print("  ✓ Scrolled to top")
+                                                    
+                                                    # Use search bar to search for "Trim"
+                                                    print("\nSearching for 'Trim'...")
                                                     try:
-                                                        # Wait longer for cart count to update
-                                                        time.sleep(1.5)
-                                                        
-                                                        # Try using ID first
-                                                        try:
-                                                            view_cart_button = self.wait.until(
-                                                                EC.element_to_be_clickable((By.ID, "view-cart-button"))
-                                                            )
-                                                            # Wait for button to be enabled
-                                                            WebDriverWait(self.driver, 5).until(
-                                                                lambda d: view_cart_button.get_attribute("disabled") is None or view_cart_button.get_attribute("disabled") == "false"
-                                                            )
-                                                        except:
-                                                            # Fallback to XPath
-                                                            view_cart_button = self.wait.until(
-                                                                EC.element_to_be_clickable((By.XPATH,
-                                                                    "//button[@id='view-cart-button'] | "
-                                                                    "//button[.//span[contains(text(), 'View Cart')]] | "
-                                                                    "//button[contains(., 'View Cart')]"
-                                                                ))
-                                                            )
-                                                        
-                                                        self.scroll_to_element(view_cart_button)
-                                                        time.sleep(0.2)
-                                                        view_cart_button.click()
-                                                        time.sleep(1.0)
-                                                        print("  ✓ Clicked View Cart")
-                                                        
-                                                        # Wait for cart page to load
-                                                        time.sleep(1.0)
-                                                        
-                                                        # Click Continue Shopping using ID
-                                                        print("\nClicking Continue Shopping...")
-                                                        try:
-                                                            continue_shopping_button = self.wait.until(
-                                                                EC.element_to_be_clickable((By.ID, "continue-shopping-button"))
-                                                            )
-                                                            self.scroll_to_element(continue_shopping_button)
-                                                            time.sleep(0.2)
-                                                            continue_shopping_button.click()
-                                                            time.sleep(1.0)
-                                                            print("  ✓ Clicked Continue Shopping")
-                                                            
-                                                            # Add more products
-                                                            print("\nAdding more products...")
-                                                            time.sleep(1.0)
-                                                            try:
-                                                                # Find products again and add another one using IDs
-                                                                add_to_cart_buttons = self.driver.find_elements(
-                                                                    By.XPATH,
-                                                                    "//button[contains(@id, 'add-to-cart-button-')]"
-                                                                )
-                                                                
-                                                                if add_to_cart_buttons and len(add_to_cart_buttons) > 1:
-                                                                    # Add second product if available
-                                                                    add_to_cart_button = self.wait.until(
-                                                                        EC.element_to_be_clickable((By.ID, add_to_cart_buttons[1].get_attribute("id")))
-                                                                    )
-                                                                    self.scroll_to_element(add_to_cart_button)
-                                                                    time.sleep(0.2)
-                                                                    add_to_cart_button.click()
-                                                                    time.sleep(1.0)
-                                                                    print("  ✓ Added second product to cart")
-                                                                elif add_to_cart_buttons:
-                                                                    # Add same product again
-                                                                    add_to_cart_button = self.wait.until(
-                                                                        EC.element_to_be_clickable((By.ID, add_to_cart_buttons[0].get_attribute("id")))
-                                                                    )
-                                                                    self.scroll_to_element(add_to_cart_button)
-                                                                    time.sleep(0.2)
-                                                                    add_to_cart_button.click()
-                                                                    time.sleep(1.0)
-                                                                    print("  ✓ Added more of the same product to cart")
-                                                                else:
-                                                                    # Fallback to XPath
-                                                                    product_cards = self.driver.find_elements(
-                                                                        By.XPATH,
-                                                                        "//div[contains(@class, 'card') or contains(@class, 'Card')]//button[contains(text(), 'Add to Cart')]/ancestor::div[contains(@class, 'card') or contains(@class, 'Card')]"
-                                                                    )
-                                                                    if product_cards:
-                                                                        add_to_cart_button = product_cards[0].find_element(
-                                                                            By.XPATH,
-                                                                            ".//button[contains(text(), 'Add to Cart')]"
-                                                                        )
-                                                                        self.scroll_to_element(add_to_cart_button)
-                                                                        time.sleep(0.2)
-                                                                        add_to_cart_button.click()
-                                                                        time.sleep(1.0)
-                                                                        print("  ✓ Added product to cart (fallback)")
-                                                            except Exception as e:
-                                                                print(f"  ⚠ Error adding more products: {e}")
-                                                            
-                                                            # Click View Cart again using ID
-                                                            print("\nClicking View Cart again...")
-                                                            try:
-                                                                time.sleep(1.5)  # Wait for cart count to update
-                                                                view_cart_button = self.wait.until(
-                                                                    EC.element_to_be_clickable((By.ID, "view-cart-button"))
-                                                                )
-                                                                # Wait for button to be enabled
-                                                                WebDriverWait(self.driver, 5).until(
-                                                                    lambda d: view_cart_button.get_attribute("disabled") is None or view_cart_button.get_attribute("disabled") == "false"
-                                                                )
-                                                                self.scroll_to_element(view_cart_button)
-                                                                time.sleep(0.2)
-                                                                view_cart_button.click()
-                                                                time.sleep(1.0)
-                                                                print("  ✓ Clicked View Cart again")
-                                                            except Exception as e:
-                                                                print(f"  ⚠ Error clicking View Cart: {e}")
-                                                        except Exception as e:
-                                                            print(f"  ⚠ Error clicking Continue Shopping: {e}")
+                                                        search_input = self.wait.until(
+                                                            EC.presence_of_element_located((By.ID, "salon-search-input"))
+                                                        )
+                                                        self.scroll_to_element(search_input)
+                                                        self.settle(0.2)
+                                                        search_input.clear()
+                                                        search_input.send_keys("Trim")
+                                                        self.settle(1.0)  # Wait for search results to filter
+                                                        print("  ✓ Searched for 'Trim'")
                                                         
-                                                        # Delete item from cart before checkout
-                                                        print("\nDeleting item from cart...")
-                                                        try:
-                                                            # Find and click delete button (trash icon) using ID
-                                                            delete_buttons = self.driver.find_elements(
-                                                                By.XPATH,
-                                                                "//button[contains(@id, 'delete-cart-item-button-')]"
-                                                            )
-                                                            
-                                                            if delete_buttons:
-                                                                delete_button = delete_buttons[0]
-                                                                self.scroll_to_element(delete_button)
-                                                                time.sleep(0.2)
-                                                                delete_button.click()
-                                                                time.sleep(0.5)
-                                                                print("  ✓ Clicked delete button")
-                                                                
-                                                                # Wait for modal to appear and click Remove
-                                                                print("  Clicking Remove on confirmation modal...")
-                                                                try:
-                                                                    remove_button = self.wait.until(
-                                                                        EC.element_to_be_clickable((By.ID, "remove-item-confirm-button"))
-                                                                    )
-                                                                    self.scroll_to_element(remove_button)
-                                                                    time.sleep(0.2)
-                                                                    remove_button.click()
-                                                                    time.sleep(1.0)
-                                                                    print("  ✓ Clicked Remove on modal")
-                                                                    
-                                                                    # Wait for toast notification to appear and disappear
-                                                                    try:
-                                                                        WebDriverWait(self.driver, 3).until(
-                                                                            EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
-                                                                        )
-                                                                        time.sleep(0.5)
-                                                                        print("  ✓ Item removed notification shown")
-                                                                        # Wait for toast to disappear
-                                                                        WebDriverWait(self.driver, 5).until(
-                                                                            lambda d: len(d.find_elements(By.XPATH, "//li[@data-sonner-toast and @data-visible='true']")) == 0
-                                                                        )
-                                                                        time.sleep(0.5)
-                                                                    except:
-                                                                        pass
-                                                                except Exception as e:
-                                                                    print(f"  ⚠ Error clicking Remove on modal: {e}")
-                                                            else:
-                                                                print("  ⚠ No delete buttons found")
-                                                        except Exception as e:
-                                                            print(f"  ⚠ Error deleting item: {e}")
-                                                        
-                                                        # Click Browse Products (appears when cart is empty)
-                                                        print("\nClicking Browse Products...")
-                                                        try:
-                                                            browse_products_button = self.wait.until(
-                                                                EC.element_to_be_clickable((By.ID, "browse-products-button"))
-                                                            )
-                                                            self.scroll_to_element(browse_products_button)
-                                                            time.sleep(0.2)
-                                                            browse_products_button.click()
-                                                            time.sleep(1.0)
-                                                            print("  ✓ Clicked Browse Products")
-                                                            
-                                                            # Wait for products page to load
-                                                            time.sleep(1.0)
-                                                            
-                                                            # Add product to cart again
-                                                            print("\nAdding product to cart again...")
-                                                            try:
-                                                                # Find Add to Cart button using ID
-                                                                add_to_cart_buttons = self.driver.find_elements(
-                                                                    By.XPATH,
-                                                                    "//button[contains(@id, 'add-to-cart-button-')]"
-                                                                )
-                                                                
-                                                                if add_to_cart_buttons:
-                                                                    add_to_cart_button = self.wait.until(
-                                                                        EC.element_to_be_clickable((By.ID, add_to_cart_buttons[0].get_attribute("id")))
-                                                                    )
-                                                                    self.scroll_to_element(add_to_cart_button)
-                                                                    time.sleep(0.2)
-                                                                    add_to_cart_button.click()
-                                                                    time.sleep(1.0)
-                                                                    print("  ✓ Added product to cart again")
-                                                                    
-                                                                    # Wait for toast notification
-                                                                    try:
-                                                                        WebDriverWait(self.driver, 3).until(
-                                                                            EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
-                                                                        )
-                                                                        time.sleep(0.5)
-                                                                        print("  ✓ Product added to cart notification shown")
-                                                                    except:
-                                                                        pass
-                                                                else:
-                                                                    print("  ⚠ No Add to Cart buttons found")
-                                                            except Exception as e:
-                                                                print(f"  ⚠ Error adding product to cart: {e}")
-                                                        except Exception as e:
-                                                            print(f"  ⚠ Error clicking Browse Products: {e}")
-                                                        
-                                                        # Navigate back to cart
-                                                        print("\nNavigating to cart...")
-                                                        try:
-                                                            view_cart_button = self.wait.until(
-                                                                EC.element_to_be_clickable((By.ID, "view-cart-button"))
-                                                            )
-                                                            # Wait for button to be enabled
-                                                            WebDriverWait(self.driver, 5).until(
-                                                                lambda d: view_cart_button.get_attribute("disabled") is None or view_cart_button.get_attribute("disabled") == "false"
-                                                            )
-                                                            self.scroll_to_element(view_cart_button)
-                                                            time.sleep(0.2)
-                                                            view_cart_button.click()
-                                                            time.sleep(1.0)
-                                                            print("  ✓ Navigated to cart")
-                                                        except Exception as e:
-                                                            print(f"  ⚠ Error navigating to cart: {e}")
-                                                        
-                                                        # Click Proceed to Checkout using ID
-                                                        print("\nClicking Proceed to Checkout...")
-                                                        try:
-                                                            proceed_checkout_button = self.wait.until(
-                                                                EC.element_to_be_clickable((By.ID, "proceed-to-checkout-button"))
-                                                            )
-                                                            self.scroll_to_element(proceed_checkout_button)
-                                                            time.sleep(0.2)
-                                                            proceed_checkout_button.click()
-                                                            time.sleep(1.5)
-                                                            print("  ✓ Clicked Proceed to Checkout")
-                                                            
-                                                            # Wait for checkout page to load
-                                                            time.sleep(1.0)
-                                                            
-                                                            # Scroll down to find Complete Order button
-                                                            print("\nScrolling down to find Complete Order button...")
-                                                            page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                                                            viewport_height = self.driver.execute_script("return window.innerHeight")
-                                                            
-                                                            # Scroll down incrementally
-                                                            scroll_position = 0
-                                                            while scroll_position < page_height:
-                                                                scroll_position += viewport_height * 0.5
-                                                                self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                                                                time.sleep(0.3)
-                                                                
-                                                                # Check if Complete Order button is visible using ID
-                                                                try:
-                                                                    complete_order_button = self.driver.find_element(
-                                                                        By.ID,
-                                                                        "complete-order-button"
-                                                                    )
-                                                                    if complete_order_button.is_displayed():
-                                                                        print("  ✓ Found Complete Order button")
-                                                                        break
-                                                                except:
-                                                                    pass
-                                                            
-                                                            # Click Complete Order button using ID
-                                                            print("\nClicking Complete Order...")
-                                                            try:
-                                                                complete_order_button = self.wait.until(
-                                                                    EC.element_to_be_clickable((By.ID, "complete-order-button"))
-                                                                )
-                                                                self.scroll_to_element(complete_order_button)
-                                                                time.sleep(0.2)
-                                                                complete_order_button.click()
-                                                                time.sleep(1.0)
-                                                                print("  ✓ Clicked Complete Order")
-                                                                
-                                                                # After completing order, user is taken to order history
-                                                                # Wait for Order History page to load
-                                                                print("\nWaiting for Order History page to load...")
-                                                                try:
-                                                                    # Wait for either the "Your Orders" heading or order cards to appear
-                                                                    WebDriverWait(self.driver, 10).until(
-                                                                        EC.any_of(
-                                                                            EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'Your Orders')]")),
-                                                                            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'card')]//div[contains(text(), 'Order #')]")),
-                                                                            EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'No orders found')]"))
-                                                                        )
-                                                                    )
-                                                                    time.sleep(1.0)  # Extra wait for content to fully render
-                                                                    print("  ✓ Order History page loaded")
-                                                                except Exception as e:
-                                                                    print(f"  ⚠ Order History page may not have loaded: {e}")
-                                                                
-                                                                # Scroll on order history page
-                                                                print("\nScrolling on Order History page...")
-                                                                page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                                                                viewport_height = self.driver.execute_script("return window.innerHeight")
-                                                                
-                                                                scroll_increment = viewport_height * 0.8
-                                                                current_scroll = 0
-                                                                while current_scroll < page_height:
-                                                                    current_scroll += scroll_increment
-                                                                    self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
-                                                                    time.sleep(0.3)
-                                                                
-                                                                # Scroll back to top
-                                                                self.driver.execute_script("window.scrollTo(0, 0);")
-                                                                time.sleep(0.5)
-                                                                print("  ✓ Scrolled through Order History page")
-                                                                
-                                                                # Navigate to Loyalty Program tab
-                                                                print("\nNavigating to Loyalty Program tab...")
-                                                                try:
-                                                                    loyalty_program_link = self.wait.until(
-                                                                        EC.element_to_be_clickable((By.XPATH,
-                                                                            "//a[contains(text(), 'Loyalty Program')] | "
-                                                                            "//button[contains(text(), 'Loyalty Program')]"
-                                                                        ))
-                                                                    )
-                                                                    self.scroll_to_element(loyalty_program_link)
-                                                                    time.sleep(0.2)
-                                                                    loyalty_program_link.click()
-                                                                    time.sleep(1.0)
-                                                                    print("  ✓ Clicked Loyalty Program tab")
-                                                                    
-                                                                    # Wait for Loyalty Program page to load
-                                                                    print("  Waiting for Loyalty Program page to load...")
-                                                                    try:
-                                                                        # Wait for either "Your Salon Progress" heading or loyalty cards to appear
-                                                                        WebDriverWait(self.driver, 10).until(
-                                                                            EC.any_of(
-                                                                                EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'Your Salon Progress')]")),
-                                                                                EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Total Visits')]")),
-                                                                                EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Gold Salons')]")),
-                                                                                EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'No Loyalty Data Yet')]"))
-                                                                            )
-                                                                        )
-                                                                        time.sleep(1.0)  # Extra wait for content to fully render
-                                                                        print("  ✓ Loyalty Program page loaded")
-                                                                    except Exception as e:
-                                                                        print(f"  ⚠ Loyalty Program page may not have loaded: {e}")
-                                                                    
-                                                                    # Scroll around on Loyalty Program page
-                                                                    print("  Scrolling on Loyalty Program page...")
-                                                                    time.sleep(0.5)
-                                                                    page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                                                                    scroll_increment = viewport_height * 0.8
-                                                                    current_scroll = 0
-                                                                    while current_scroll < page_height:
-                                                                        current_scroll += scroll_increment
-                                                                        self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
-                                                                        time.sleep(0.3)
-                                                                    
-                                                                    # Scroll back to top
-                                                                    self.driver.execute_script("window.scrollTo(0, 0);")
-                                                                    time.sleep(0.5)
-                                                                    print("  ✓ Scrolled through Loyalty Program page")
-                                                                except Exception as e:
-                                                                    print(f"  ⚠ Error navigating to Loyalty Program: {e}")
-                                                                
-                                                                # Navigate to Settings tab
-                                                                print("\nNavigating to Settings tab...")
-                                                                try:
-                                                                    settings_link = self.wait.until(
-                                                                        EC.element_to_be_clickable((By.XPATH,
-                                                                            "//a[contains(text(), 'Settings')] | "
-                                                                            "//button[contains(text(), 'Settings')]"
-                                                                        ))
-                                                                    )
-                                                                    self.scroll_to_element(settings_link)
-                                                                    time.sleep(0.2)
-                                                                    settings_link.click()
-                                                                    time.sleep(1.0)
-                                                                    print("  ✓ Clicked Settings tab")
-                                                                    
-                                                                    # Wait for Settings page to load
-                                                                    time.sleep(1.0)
-                                                                    
-                                                                    # Click Edit Address button
-                                                                    print("\nClicking Edit Address...")
-                                                                    try:
-                                                                        edit_address_button = self.wait.until(
-                                                                            EC.element_to_be_clickable((By.ID, "edit-address-button"))
-                                                                        )
-                                                                        self.scroll_to_element(edit_address_button)
-                                                                        time.sleep(0.2)
-                                                                        edit_address_button.click()
-                                                                        time.sleep(0.5)
-                                                                        print("  ✓ Clicked Edit Address")
-                                                                        
-                                                                        # Wait for address form to appear
-                                                                        time.sleep(0.5)
-                                                                        
-                                                                        # Click Save Address button
-                                                                        print("\nClicking Save Address...")
-                                                                        try:
-                                                                            save_address_button = self.wait.until(
-                                                                                EC.element_to_be_clickable((By.ID, "save-address-button"))
-                                                                            )
-                                                                            self.scroll_to_element(save_address_button)
-                                                                            time.sleep(0.2)
-                                                                            save_address_button.click()
-                                                                            time.sleep(1.5)
-                                                                            print("  ✓ Clicked Save Address")
-                                                                            
-                                                                            # Wait for success notification
-                                                                            try:
-                                                                                WebDriverWait(self.driver, 3).until(
-                                                                                    EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
-                                                                                )
-                                                                                time.sleep(0.5)
-                                                                                print("  ✓ Address saved notification shown")
-                                                                            except:
-                                                                                pass
-                                                                        except Exception as e:
-                                                                            print(f"  ⚠ Error clicking Save Address: {e}")
-                                                                    except Exception as e:
-                                                                        print(f"  ⚠ Error clicking Edit Address: {e}")
-                                                                    
-                                                                    # Click Enter Card Details button
-                                                                    print("\nClicking Enter Card Details...")
-                                                                    try:
-                                                                        enter_card_button = self.wait.until(
-                                                                            EC.element_to_be_clickable((By.ID, "enter-card-details-button"))
-                                                                        )
-                                                                        self.scroll_to_element(enter_card_button)
-                                                                        time.sleep(0.2)
-                                                                        enter_card_button.click()
-                                                                        time.sleep(0.5)
-                                                                        print("  ✓ Clicked Enter Card Details")
-                                                                        
-                                                                        # Wait for card form to appear
-                                                                        time.sleep(0.5)
-                                                                        
-                                                                        # Fill in card details
-                                                                        print("\nFilling in card details...")
-                                                                        try:
-                                                                            # Card Number: 5555 5555 5555 4444
-                                                                            card_number_input = self.wait.until(
-                                                                                EC.presence_of_element_located((By.ID, "card_number"))
-                                                                            )
-                                                                            self.scroll_to_element(card_number_input)
-                                                                            time.sleep(0.2)
-                                                                            card_number_input.clear()
-                                                                            card_number_input.send_keys("5555 5555 5555 4444")
-                                                                            time.sleep(0.3)
-                                                                            print("  ✓ Entered card number")
-                                                                            
-                                                                            # Cardholder Name
-                                                                            cardholder_name_input = self.wait.until(
-                                                                                EC.presence_of_element_located((By.ID, "cardholder_name"))
-                                                                            )
-                                                                            self.scroll_to_element(cardholder_name_input)
-                                                                            time.sleep(0.2)
-                                                                            cardholder_name_input.clear()
-                                                                            cardholder_name_input.send_keys("Test User")
-                                                                            time.sleep(0.3)
-                                                                            print("  ✓ Entered cardholder name")
-                                                                            
-                                                                            # Expiration Month: 12 (using same pattern as appointment booking)
-                                                                            exp_month_select = self.wait.until(
-                                                                                EC.element_to_be_clickable((By.ID, "exp_month-select"))
-                                                                            )
-                                                                            exp_month_select.click()
-                                                                            time.sleep(0.3)
-                                                                            month_option = WebDriverWait(self.driver, 3).until(
-                                                                                EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and text()='12']"))
-                                                                            )
-                                                                            month_option.click()
-                                                                            time.sleep(0.3)
-                                                                            print("  ✓ Selected expiration month: 12")
-                                                                            
-                                                                            # Expiration Year: 2025 (using same pattern as appointment booking)
-                                                                            exp_year_select = self.wait.until(
-                                                                                EC.element_to_be_clickable((By.ID, "exp_year-select"))
-                                                                            )
-                                                                            exp_year_select.click()
-                                                                            time.sleep(0.3)
-                                                                            year_option = WebDriverWait(self.driver, 3).until(
-                                                                                EC.element_to_be_clickable((By.XPATH, "//div[@role='option' and text()='2025']"))
-                                                                            )
-                                                                            year_option.click()
-                                                                            time.sleep(0.3)
-                                                                            print("  ✓ Selected expiration year: 2025")
-                                                                            
-                                                                            # CVV: 123
-                                                                            cvc_input = self.wait.until(
-                                                                                EC.presence_of_element_located((By.ID, "cvc"))
-                                                                            )
-                                                                            self.scroll_to_element(cvc_input)
-                                                                            time.sleep(0.2)
-                                                                            cvc_input.clear()
-                                                                            cvc_input.send_keys("123")
-                                                                            time.sleep(0.3)
-                                                                            print("  ✓ Entered CVV")
-                                                                            
-                                                                            # Click Save Card button
-                                                                            print("\nClicking Save Card...")
-                                                                            save_card_button = self.wait.until(
-                                                                                EC.element_to_be_clickable((By.ID, "save-card-button"))
-                                                                            )
-                                                                            self.scroll_to_element(save_card_button)
-                                                                            time.sleep(0.2)
-                                                                            save_card_button.click()
-                                                                            time.sleep(1.5)
-                                                                            print("  ✓ Clicked Save Card")
-                                                                            
-                                                                            # Wait for success notification
-                                                                            try:
-                                                                                WebDriverWait(self.driver, 3).until(
-                                                                                    EC.presence_of_element_located((By.XPATH, "//li[@data-sonner-toast]"))
-                                                                                )
-                                                                                time.sleep(0.5)
-                                                                                print("  ✓ Card saved notification shown")
-                                                                            except:
-                                                                                pass
-                                                                            
-                                                                            # Wait a couple seconds after saving card
-                                                                            time.sleep(2.0)
-                                                                            
-                                                                            # Navigate to Browse Salons
-                                                                            print("\nNavigating to Browse Salons...")
-                                                                            try:
-                                                                                browse_salons_link = self.wait.until(
-                                                                                    EC.element_to_be_clickable((By.XPATH,
-                                                                                        "//a[contains(text(), 'Browse Salons')] | "
-                                                                                        "//button[contains(text(), 'Browse Salons')]"
-                                                                                    ))
-                                                                                )
-                                                                                self.scroll_to_element(browse_salons_link)
-                                                                                time.sleep(0.2)
-                                                                                browse_salons_link.click()
-                                                                                time.sleep(1.0)
-                                                                                print("  ✓ Clicked Browse Salons")
-                                                                                
-                                                                                # Wait for page to load
-                                                                                time.sleep(1.0)
-                                                                                
-                                                                                # Scroll down to find pagination
-                                                                                print("\nScrolling down to find pagination...")
-                                                                                page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                                                                                viewport_height = self.driver.execute_script("return window.innerHeight")
-                                                                                
-                                                                                # Scroll down incrementally
-                                                                                scroll_position = 0
-                                                                                while scroll_position < page_height:
-                                                                                    scroll_position += viewport_height * 0.5
-                                                                                    self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                                                                                    time.sleep(0.3)
-                                                                                
-                                                                                print("  ✓ Scrolled to pagination area")
-                                                                                
-                                                                                # Test pagination: click next, then previous
-                                                                                print("\nTesting pagination...")
-                                                                                try:
-                                                                                    # Check if pagination exists (only shows if totalPages > 1)
-                                                                                    next_button = self.driver.find_elements(By.ID, "salon-browser-pagination-next-button")
-                                                                                    if next_button and not next_button[0].get_attribute("disabled"):
-                                                                                        # Click next button
-                                                                                        print("  Clicking 'Next' pagination button...")
-                                                                                        self.scroll_to_element(next_button[0])
-                                                                                        time.sleep(0.2)
-                                                                                        next_button[0].click()
-                                                                                        time.sleep(0.5)
-                                                                                        print("  ✓ Clicked 'Next' button")
-                                                                                        
-                                                                                        # Now click previous button
-                                                                                        prev_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "salon-browser-pagination-previous-button"))
-                                                                                        )
-                                                                                        print("  Clicking 'Previous' pagination button...")
-                                                                                        self.scroll_to_element(prev_button)
-                                                                                        time.sleep(0.2)
-                                                                                        prev_button.click()
-                                                                                        time.sleep(0.5)
-                                                                                        print("  ✓ Clicked 'Previous' button")
-                                                                                    else:
-                                                                                        print("  ⚠ Pagination buttons not available or disabled (may be on first/last page or only one page)")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Could not test pagination: {e}")
-                                                                                
-                                                                                # Scroll back up to search bar
-                                                                                print("\nScrolling up to search bar...")
-                                                                                self.driver.execute_script("window.scrollTo(0, 0);")
-                                                                                time.sleep(0.5)
-                                                                                print("  ✓ Scrolled to top")
-                                                                                
-                                                                                # Use search bar to search for "Trim"
-                                                                                print("\nSearching for 'Trim'...")
-                                                                                try:
-                                                                                    search_input = self.wait.until(
-                                                                                        EC.presence_of_element_located((By.ID, "salon-search-input"))
-                                                                                    )
-                                                                                    self.scroll_to_element(search_input)
-                                                                                    time.sleep(0.2)
-                                                                                    search_input.clear()
-                                                                                    search_input.send_keys("Trim")
-                                                                                    time.sleep(1.0)  # Wait for search results to filter
-                                                                                    print("  ✓ Searched for 'Trim'")
-                                                                                    
-                                                                                    # Wait a moment for results to appear
-                                                                                    time.sleep(0.5)
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error searching: {e}")
-                                                                                
-                                                                                # Before logout, check My Appointments - Completed tab and review flow
-                                                                                print("\n" + "="*70)
-                                                                                print("CHECKING MY APPOINTMENTS - COMPLETED AND REVIEW FLOW")
-                                                                                print("="*70)
-                                                                                
-                                                                                # Navigate to My Appointments
-                                                                                print("\nNavigating to My Appointments...")
-                                                                                try:
-                                                                                    self.driver.get(f"{BASE_URL}/appointments")
-                                                                                    time.sleep(2)  # Wait for page to load
-                                                                                    print("  ✓ Navigated to My Appointments page")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error navigating to My Appointments: {e}")
-                                                                                
-                                                                                # Click Completed tab
-                                                                                print("\nClicking Completed tab...")
-                                                                                try:
-                                                                                    completed_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "appointments-filter-past"))
-                                                                                    )
-                                                                                    self.scroll_to_element(completed_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    completed_tab.click()
-                                                                                    time.sleep(2.0)  # Wait 2 seconds on the completed tab
-                                                                                    print("  ✓ Clicked Completed tab and waited 2 seconds")
-                                                                                    
-                                                                                    # Check if there are any appointments in the Completed tab
-                                                                                    # Loop to refresh until appointments appear
-                                                                                    max_refresh_attempts = 10  # Maximum number of refresh attempts
-                                                                                    refresh_attempt = 0
-                                                                                    appointments_found = False
-                                                                                    
-                                                                                    while refresh_attempt < max_refresh_attempts and not appointments_found:
-                                                                                        try:
-                                                                                            # Look for empty state message
-                                                                                            empty_state_message = self.driver.find_elements(
-                                                                                                By.XPATH, 
-                                                                                                "//*[contains(text(), 'No past appointments') or contains(text(), 'No appointments found')]"
-                                                                                            )
-                                                                                            # Also check for actual appointment cards
-                                                                                            actual_appointments = self.driver.find_elements(
-                                                                                                By.XPATH,
-                                                                                                "//div[contains(@class, 'grid')]//div[contains(@class, 'card') or contains(@class, 'Card')]"
-                                                                                            )
-                                                                                            
-                                                                                            # If we see "No past appointments" message and no actual appointment cards
-                                                                                            if empty_state_message and len(actual_appointments) == 0:
-                                                                                                refresh_attempt += 1
-                                                                                                print(f"  ⚠ No appointments found in Completed tab (attempt {refresh_attempt}/{max_refresh_attempts})")
-                                                                                                
-                                                                                                if refresh_attempt < max_refresh_attempts:
-                                                                                                    print(f"  Waiting 2 seconds, then refreshing page...")
-                                                                                                    time.sleep(2.0)
-                                                                                                    
-                                                                                                    # Refresh the page
-                                                                                                    self.driver.refresh()
-                                                                                                    time.sleep(2.0)  # Wait for page to reload
-                                                                                                    print("  ✓ Page refreshed")
-                                                                                                    
-                                                                                                    # Click Completed tab again
-                                                                                                    completed_tab = self.wait.until(
-                                                                                                        EC.element_to_be_clickable((By.ID, "appointments-filter-past"))
-                                                                                                    )
-                                                                                                    self.scroll_to_element(completed_tab)
-                                                                                                    time.sleep(0.2)
-                                                                                                    completed_tab.click()
-                                                                                                    time.sleep(2.0)  # Wait 2 seconds on the completed tab again
-                                                                                                    print(f"  ✓ Clicked Completed tab again after refresh (attempt {refresh_attempt})")
-                                                                                                else:
-                                                                                                    print(f"  ⚠ Max refresh attempts reached. Continuing anyway...")
-                                                                                                    appointments_found = True  # Break the loop
-                                                                                            else:
-                                                                                                # Appointments found!
-                                                                                                appointments_found = True
-                                                                                                print("  ✓ Appointments found in Completed tab")
-                                                                                        except Exception as e:
-                                                                                            print(f"  ⚠ Error checking for appointments: {e}")
-                                                                                            # If there's an error, assume appointments might be there and continue
-                                                                                            appointments_found = True
-                                                                                            break
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Completed tab: {e}")
-                                                                                
-                                                                                # After waiting 2 seconds on Completed tab, click Review Stylist button
-                                                                                print("\nClicking Review Stylist button...")
-                                                                                try:
-                                                                                    # Find the Review Stylist button using ID pattern
-                                                                                    review_stylist_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.XPATH, "//button[starts-with(@id, 'review-stylist-button-')]"))
-                                                                                    )
-                                                                                    self.scroll_to_element(review_stylist_button)
-                                                                                    time.sleep(0.2)
-                                                                                    review_stylist_button.click()
-                                                                                    time.sleep(1.0)  # Wait for review modal to open
-                                                                                    print("  ✓ Clicked Review Stylist button")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Review Stylist button: {e}")
-                                                                                
-                                                                                # After clicking Review Stylist, click "Write a Review" button in the modal
-                                                                                print("\nClicking Write a Review button...")
-                                                                                try:
-                                                                                    write_review_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "write-review-button"))
-                                                                                    )
-                                                                                    self.scroll_to_element(write_review_button)
-                                                                                    time.sleep(0.2)
-                                                                                    write_review_button.click()
-                                                                                    time.sleep(0.5)  # Wait for review form to appear
-                                                                                    print("  ✓ Clicked Write a Review button")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Write a Review button: {e}")
-                                                                                
-                                                                                # Write a review - select rating (5 stars)
-                                                                                print("\nSelecting 5-star rating...")
-                                                                                try:
-                                                                                    # Click the full 5th star button (right half)
-                                                                                    fifth_star_full = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "review-star-5-full"))
-                                                                                    )
-                                                                                    self.scroll_to_element(fifth_star_full)
-                                                                                    time.sleep(0.2)
-                                                                                    fifth_star_full.click()
-                                                                                    time.sleep(0.3)
-                                                                                    print("  ✓ Selected 5-star rating")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error selecting rating: {e}")
-                                                                                
-                                                                                # Write a comment
-                                                                                print("\nWriting review comment...")
-                                                                                try:
-                                                                                    comment_textarea = self.wait.until(
-                                                                                        EC.presence_of_element_located((By.ID, "review-comment-textarea"))
-                                                                                    )
-                                                                                    self.scroll_to_element(comment_textarea)
-                                                                                    time.sleep(0.2)
-                                                                                    comment_textarea.click()
-                                                                                    time.sleep(0.1)
-                                                                                    comment_textarea.clear()
-                                                                                    comment_textarea.send_keys("Great service! Very professional and friendly.")
-                                                                                    time.sleep(0.3)
-                                                                                    print("  ✓ Wrote review comment")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error writing comment: {e}")
-                                                                                
-                                                                                # Submit the review
-                                                                                print("\nSubmitting review...")
-                                                                                try:
-                                                                                    submit_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "submit-review-button"))
-                                                                                    )
-                                                                                    self.scroll_to_element(submit_button)
-                                                                                    time.sleep(0.2)
-                                                                                    submit_button.click()
-                                                                                    time.sleep(1.0)  # Wait for confirmation modal
-                                                                                    
-                                                                                    # Click Confirm on the confirmation modal
-                                                                                    try:
-                                                                                        confirm_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "review-confirm-button"))
-                                                                                        )
-                                                                                        self.scroll_to_element(confirm_button)
-                                                                                        time.sleep(0.2)
-                                                                                        confirm_button.click()
-                                                                                        time.sleep(2.0)  # Wait for review to be submitted
-                                                                                        print("  ✓ Submitted review")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error confirming review submission: {e}")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error submitting review: {e}")
-                                                                                
-                                                                                # After submitting, click Edit Review button
-                                                                                print("\nClicking Edit Review button...")
-                                                                                try:
-                                                                                    # Close the review modal first if it's still open
-                                                                                    try:
-                                                                                        close_button = self.driver.find_element(By.ID, "review-modal-close-button")
-                                                                                        if close_button:
-                                                                                            close_button.click()
-                                                                                            time.sleep(0.5)
-                                                                                    except:
-                                                                                        pass
-                                                                                    
-                                                                                    # Wait for toast notifications to disappear
-                                                                                    time.sleep(2.0)  # Wait for modal to close and page to settle
-                                                                                    
-                                                                                    # Extract employee_id from the Review Stylist button we clicked earlier
-                                                                                    employee_id = None
-                                                                                    try:
-                                                                                        review_stylist_button = self.driver.find_element(By.XPATH, "//button[starts-with(@id, 'review-stylist-button-')]")
-                                                                                        button_id = review_stylist_button.get_attribute("id")
-                                                                                        if button_id:
-                                                                                            employee_id = button_id.replace("review-stylist-button-", "")
-                                                                                    except:
-                                                                                        # If Review Stylist button is gone, try to find Edit Review button and extract ID
-                                                                                        try:
-                                                                                            edit_btn = self.driver.find_element(By.XPATH, "//button[starts-with(@id, 'edit-review-button-')]")
-                                                                                            button_id = edit_btn.get_attribute("id")
-                                                                                            if button_id:
-                                                                                                employee_id = button_id.replace("edit-review-button-", "")
-                                                                                        except:
-                                                                                            pass
-                                                                                    
-                                                                                    if employee_id:
-                                                                                        # Wait for the Edit Review button to appear using the employee_id
-                                                                                        edit_review_button = self.wait.until(
-                                                                                            EC.presence_of_element_located((By.ID, f"edit-review-button-{employee_id}"))
-                                                                                        )
-                                                                                        
-                                                                                        # Scroll the button into view using JavaScript
-                                                                                        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", edit_review_button)
-                                                                                        time.sleep(0.5)
-                                                                                        
-                                                                                        # Try regular click first
-                                                                                        try:
-                                                                                            edit_review_button.click()
-                                                                                            time.sleep(1.0)
-                                                                                            print("  ✓ Clicked Edit Review button")
-                                                                                        except Exception as click_error:
-                                                                                            # If regular click fails, use JavaScript click
-                                                                                            print(f"  ⚠ Regular click failed, trying JavaScript click: {click_error}")
-                                                                                            self.driver.execute_script("arguments[0].click();", edit_review_button)
-                                                                                            time.sleep(1.0)
-                                                                                            print("  ✓ Clicked Edit Review button (JavaScript)")
-                                                                                    else:
-                                                                                        # Fallback: find by XPath if we couldn't extract employee_id
-                                                                                        edit_review_button = self.wait.until(
-                                                                                            EC.presence_of_element_located((By.XPATH, "//button[starts-with(@id, 'edit-review-button-')]"))
-                                                                                        )
-                                                                                        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", edit_review_button)
-                                                                                        time.sleep(0.5)
-                                                                                        try:
-                                                                                            edit_review_button.click()
-                                                                                            time.sleep(1.0)
-                                                                                            print("  ✓ Clicked Edit Review button (fallback)")
-                                                                                        except:
-                                                                                            self.driver.execute_script("arguments[0].click();", edit_review_button)
-                                                                                            time.sleep(1.0)
-                                                                                            print("  ✓ Clicked Edit Review button (JavaScript fallback)")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Edit Review button: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Edit the review - change rating and comment
-                                                                                print("\nEditing review...")
-                                                                                try:
-                                                                                    # Click the Edit button in the review display to open the form
-                                                                                    try:
-                                                                                        edit_form_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "edit-review-form-button"))
-                                                                                        )
-                                                                                        self.scroll_to_element(edit_form_button)
-                                                                                        time.sleep(0.2)
-                                                                                        edit_form_button.click()
-                                                                                        time.sleep(0.5)
-                                                                                        print("  ✓ Opened review form for editing")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error opening review form: {e}")
-                                                                                    
-                                                                                    # Change rating to 4 stars (click the full 4th star button)
-                                                                                    try:
-                                                                                        fourth_star_full = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "review-star-4-full"))
-                                                                                        )
-                                                                                        self.scroll_to_element(fourth_star_full)
-                                                                                        time.sleep(0.2)
-                                                                                        fourth_star_full.click()
-                                                                                        time.sleep(0.3)
-                                                                                        print("  ✓ Changed rating to 4 stars")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error changing rating: {e}")
-                                                                                    
-                                                                                    # Update the comment
-                                                                                    try:
-                                                                                        comment_textarea = self.wait.until(
-                                                                                            EC.presence_of_element_located((By.ID, "review-comment-textarea"))
-                                                                                        )
-                                                                                        self.scroll_to_element(comment_textarea)
-                                                                                        time.sleep(0.2)
-                                                                                        comment_textarea.click()
-                                                                                        time.sleep(0.1)
-                                                                                        comment_textarea.clear()
-                                                                                        comment_textarea.send_keys("Updated: Excellent service! Highly recommend.")
-                                                                                        time.sleep(0.3)
-                                                                                        print("  ✓ Updated review comment")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error updating comment: {e}")
-                                                                                    
-                                                                                    # Click Update Review button
-                                                                                    try:
-                                                                                        update_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "update-review-button"))
-                                                                                        )
-                                                                                        self.scroll_to_element(update_button)
-                                                                                        time.sleep(0.2)
-                                                                                        update_button.click()
-                                                                                        time.sleep(1.0)  # Wait for confirmation modal
-                                                                                        
-                                                                                        # Click Confirm on the confirmation modal
-                                                                                        try:
-                                                                                            confirm_button = self.wait.until(
-                                                                                                EC.element_to_be_clickable((By.ID, "review-confirm-button"))
-                                                                                            )
-                                                                                            self.scroll_to_element(confirm_button)
-                                                                                            time.sleep(0.2)
-                                                                                            confirm_button.click()
-                                                                                            time.sleep(2.0)  # Wait for review to be updated
-                                                                                            print("  ✓ Updated review")
-                                                                                        except Exception as e:
-                                                                                            print(f"  ⚠ Error confirming review update: {e}")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error clicking Update Review button: {e}")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error editing review: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Close the review modal after editing
-                                                                                print("\nClosing review modal...")
-                                                                                try:
-                                                                                    close_modal_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "review-modal-close-button"))
-                                                                                    )
-                                                                                    self.scroll_to_element(close_modal_button)
-                                                                                    time.sleep(0.2)
-                                                                                    close_modal_button.click()
-                                                                                    time.sleep(1.0)  # Wait for modal to close
-                                                                                    print("  ✓ Closed review modal")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error closing review modal: {e}")
-                                                                                
-                                                                                # Before logout, go to Browse Salons and write a salon review
-                                                                                print("\n" + "="*70)
-                                                                                print("BROWSE SALONS AND WRITE SALON REVIEW")
-                                                                                print("="*70)
-                                                                                
-                                                                                # Navigate to Browse Salons
-                                                                                print("\nNavigating to Browse Salons...")
-                                                                                try:
-                                                                                    self.driver.get(f"{BASE_URL}/browser")
-                                                                                    time.sleep(2)  # Wait for page to load
-                                                                                    print("  ✓ Navigated to Browse Salons page")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error navigating to Browse Salons: {e}")
-                                                                                
-                                                                                # Find and click View Details for "Selenium Test Salon"
-                                                                                print("\nFinding and clicking View Details for Selenium Test Salon...")
-                                                                                try:
-                                                                                    # Find the salon card by name
-                                                                                    salon_cards = self.driver.find_elements(
-                                                                                        By.XPATH,
-                                                                                        "//*[contains(text(), 'Selenium Test Salon')]/ancestor::div[contains(@class, 'card') or contains(@class, 'Card')]"
-                                                                                    )
-                                                                                    
-                                                                                    if salon_cards:
-                                                                                        salon_card = salon_cards[0]  # Get first matching salon
-                                                                                        # Find View Details button within this card
-                                                                                        view_details_button = salon_card.find_element(
-                                                                                            By.XPATH, ".//button[starts-with(@id, 'view-details-button-')]"
-                                                                                        )
-                                                                                        self.scroll_to_element(view_details_button)
-                                                                                        time.sleep(0.2)
-                                                                                        view_details_button.click()
-                                                                                        time.sleep(1.0)  # Initial wait
-                                                                                        print("  ✓ Clicked View Details for Selenium Test Salon")
-                                                                                        
-                                                                                        # Wait for salon detail page to load
-                                                                                        print("  Waiting for salon detail page to load...")
-                                                                                        try:
-                                                                                            # Wait for salon name or key elements to appear (indicating page has loaded)
-                                                                                            self.wait.until(
-                                                                                                EC.any_of(
-                                                                                                    EC.presence_of_element_located((By.XPATH, "//h2[contains(@class, 'text-3xl')] | //h1[contains(@class, 'text-3xl')] | //*[contains(@class, 'CardTitle')]")),
-                                                                                                    EC.presence_of_element_located((By.ID, "salon-write-review-button"))
-                                                                                                )
-                                                                                            )
-                                                                                            time.sleep(1.0)  # Additional wait for any animations/transitions
-                                                                                            print("  ✓ Salon detail page loaded")
-                                                                                        except Exception as e:
-                                                                                            print(f"  ⚠ Warning: Could not confirm page load: {e}")
-                                                                                            time.sleep(2.0)  # Fallback wait
-                                                                                    else:
-                                                                                        print("  ⚠ Could not find Selenium Test Salon")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error finding/clicking View Details: {e}")
-                                                                                
-                                                                                # Scroll on the salon detail page
-                                                                                print("\nScrolling on salon detail page...")
-                                                                                try:
-                                                                                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                                                                    time.sleep(0.5)
-                                                                                    self.driver.execute_script("window.scrollTo(0, 0);")
-                                                                                    time.sleep(0.5)
-                                                                                    print("  ✓ Scrolled on salon detail page")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error scrolling: {e}")
-                                                                                
-                                                                                # Find and click Write a Review button
-                                                                                print("\nClicking Write a Review button...")
-                                                                                try:
-                                                                                    write_review_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "salon-write-review-button"))
-                                                                                    )
-                                                                                    self.scroll_to_element(write_review_button)
-                                                                                    time.sleep(0.2)
-                                                                                    write_review_button.click()
-                                                                                    time.sleep(0.5)  # Wait for review form to appear
-                                                                                    print("  ✓ Clicked Write a Review button")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Write a Review button: {e}")
-                                                                                
-                                                                                # Fill out review - select rating (5 stars)
-                                                                                print("\nSelecting 5-star rating for salon...")
-                                                                                try:
-                                                                                    fifth_star_full = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "salon-review-star-5-full"))
-                                                                                    )
-                                                                                    self.scroll_to_element(fifth_star_full)
-                                                                                    time.sleep(0.2)
-                                                                                    fifth_star_full.click()
-                                                                                    time.sleep(0.3)
-                                                                                    print("  ✓ Selected 5-star rating for salon")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error selecting rating: {e}")
-                                                                                
-                                                                                # Write a comment
-                                                                                print("\nWriting salon review comment...")
-                                                                                try:
-                                                                                    comment_textarea = self.wait.until(
-                                                                                        EC.presence_of_element_located((By.ID, "salon-review-comment-textarea"))
-                                                                                    )
-                                                                                    self.scroll_to_element(comment_textarea)
-                                                                                    time.sleep(0.2)
-                                                                                    comment_textarea.click()
-                                                                                    time.sleep(0.1)
-                                                                                    comment_textarea.clear()
-                                                                                    comment_textarea.send_keys("Great salon! Excellent service and friendly staff.")
-                                                                                    time.sleep(0.3)
-                                                                                    print("  ✓ Wrote salon review comment")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error writing comment: {e}")
-                                                                                
-                                                                                # Submit the review
-                                                                                print("\nSubmitting salon review...")
-                                                                                try:
-                                                                                    submit_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "salon-submit-review-button"))
-                                                                                    )
-                                                                                    self.scroll_to_element(submit_button)
-                                                                                    time.sleep(0.2)
-                                                                                    submit_button.click()
-                                                                                    time.sleep(1.0)  # Wait for confirmation modal
-                                                                                    
-                                                                                    # Click Confirm on the confirmation modal
-                                                                                    try:
-                                                                                        confirm_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "salon-review-confirm-button"))
-                                                                                        )
-                                                                                        self.scroll_to_element(confirm_button)
-                                                                                        time.sleep(0.2)
-                                                                                        confirm_button.click()
-                                                                                        time.sleep(2.0)  # Wait for review to be submitted
-                                                                                        print("  ✓ Submitted salon review")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error confirming review submission: {e}")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error submitting review: {e}")
-                                                                                
-                                                                                # Wait for any toast notifications to disappear before logout
-                                                                                print("\nWaiting for toast notifications to disappear...")
-                                                                                try:
-                                                                                    toasts = self.driver.find_elements(By.XPATH, "//li[@data-sonner-toast]")
-                                                                                    if toasts:
-                                                                                        print("  Toast notifications found, waiting for them to disappear...")
-                                                                                        WebDriverWait(self.driver, 5).until(
-                                                                                            lambda d: len(d.find_elements(By.XPATH, "//li[@data-sonner-toast and @data-visible='true']")) == 0
-                                                                                        )
-                                                                                        time.sleep(0.5)  # Extra wait for animation
-                                                                                        print("  ✓ Toast notifications disappeared")
-                                                                                except:
-                                                                                    pass  # No toasts or they already disappeared
-                                                                                
-                                                                                # Click logout
-                                                                                print("\nClicking Logout...")
-                                                                                try:
-                                                                                    logout_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "customer-logout-button"))
-                                                                                    )
-                                                                                    self.scroll_to_element(logout_button)
-                                                                                    time.sleep(0.2)
-                                                                                    
-                                                                                    # Try regular click first, fallback to JavaScript click if intercepted
-                                                                                    try:
-                                                                                        logout_button.click()
-                                                                                    except:
-                                                                                        # If click is intercepted, use JavaScript click
-                                                                                        self.driver.execute_script("arguments[0].click();", logout_button)
-                                                                                    
-                                                                                    time.sleep(1.0)
-                                                                                    print("  ✓ Clicked Logout")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Logout: {e}")
-                                                                                
-                                                                                # After customer logout, log back into stylist account
-                                                                                print("\n" + "="*70)
-                                                                                print("LOGGING BACK INTO STYLIST ACCOUNT")
-                                                                                print("="*70)
-                                                                                
-                                                                                # Navigate to landing page and sign back into stylist account
-                                                                                print("\nSigning back into stylist account...")
-                                                                                time.sleep(0.5)
-                                                                                self.navigate_and_scroll(f"{BASE_URL}/")
-                                                                                time.sleep(0.3)
-                                                                                
-                                                                                if not self.login(self.stylist_email, "test123", "Stylist"):
-                                                                                    print("  ⚠ Failed to log back into stylist account")
-                                                                                    return False
-                                                                                
-                                                                                print("  ✓ Logged back into stylist account")
-                                                                                
-                                                                                # Navigate to Customers tab
-                                                                                print("\nNavigating to Customers tab...")
-                                                                                try:
-                                                                                    customers_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "stylist-tab-customers"))
-                                                                                    )
-                                                                                    self.scroll_to_element(customers_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    customers_tab.click()
-                                                                                    time.sleep(1.0)  # Wait for customers to load
-                                                                                    print("  ✓ Opened Customers tab")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error opening Customers tab: {e}")
-                                                                                
-                                                                                # Find and click "View History" for the customer we created
-                                                                                print(f"\nLooking for customer: {self.user_email}")
-                                                                                try:
-                                                                                    # Wait for customers to load
-                                                                                    print(f"  Waiting for customer list to load...")
-                                                                                    time.sleep(2.0)  # Give more time for customers to load
-                                                                                    
-                                                                                    # Find the customer email element - email is in a <p> tag with a nested <span>
-                                                                                    # Use XPath that checks all text nodes within the paragraph
-                                                                                    customer_email_element = self.wait.until(
-                                                                                        EC.presence_of_element_located((By.XPATH, f"//p[.//text()[contains(., '{self.user_email}')]]"))
-                                                                                    )
-                                                                                    print(f"  ✓ Found customer email element")
-                                                                                    
-                                                                                    # Get the ID of the email element to extract user_id
-                                                                                    email_element_id = customer_email_element.get_attribute("id")
-                                                                                    if email_element_id and email_element_id.startswith("customer-email-"):
-                                                                                        user_id = email_element_id.replace("customer-email-", "")
-                                                                                        print(f"  ✓ Extracted user_id: {user_id}")
-                                                                                        
-                                                                                        # Find the View History button using the user_id
-                                                                                        view_history_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, f"view-history-button-{user_id}"))
-                                                                                        )
-                                                                                    else:
-                                                                                        # Fallback: find the parent card and then the button
-                                                                                        print(f"  ⚠ Could not extract user_id from email element ID, using fallback method")
-                                                                                        customer_card = customer_email_element.find_element(By.XPATH, "./ancestor::div[starts-with(@id, 'customer-card-')]")
-                                                                                        card_id = customer_card.get_attribute("id")
-                                                                                        if card_id:
-                                                                                            user_id = card_id.replace("customer-card-", "")
-                                                                                            view_history_button = self.wait.until(
-                                                                                                EC.element_to_be_clickable((By.ID, f"view-history-button-{user_id}"))
-                                                                                            )
-                                                                                        else:
-                                                                                            # Last resort: find button by XPath within the card
-                                                                                            view_history_button = customer_card.find_element(
-                                                                                                By.XPATH, ".//button[starts-with(@id, 'view-history-button-')]"
-                                                                                            )
-                                                                                    
-                                                                                    # Scroll to and click the button
-                                                                                    self.scroll_to_element(view_history_button)
-                                                                                    time.sleep(0.3)
-                                                                                    view_history_button.click()
-                                                                                    time.sleep(1.0)  # Wait for modal to open
-                                                                                    print("  ✓ Clicked 'View History' for customer")
-                                                                                    
-                                                                                    # Close the customer visit history modal
-                                                                                    print("\nClosing customer visit history modal...")
-                                                                                    try:
-                                                                                        close_modal_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "customer-visit-modal-close-button"))
-                                                                                        )
-                                                                                        self.scroll_to_element(close_modal_button)
-                                                                                        time.sleep(0.2)
-                                                                                        close_modal_button.click()
-                                                                                        time.sleep(0.5)  # Wait for modal to close
-                                                                                        print("  ✓ Closed customer visit history modal")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error closing modal: {e}")
-                                                                                    
-                                                                                    # Navigate to Reviews tab
-                                                                                    print("\nNavigating to Reviews tab...")
-                                                                                    try:
-                                                                                        reviews_tab = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "stylist-tab-reviews"))
-                                                                                        )
-                                                                                        self.scroll_to_element(reviews_tab)
-                                                                                        time.sleep(0.2)
-                                                                                        reviews_tab.click()
-                                                                                        time.sleep(1.0)  # Wait for reviews to load
-                                                                                        print("  ✓ Opened Reviews tab")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error opening Reviews tab: {e}")
-                                                                                    
-                                                                                    # Click "My Reviews" sub-tab
-                                                                                    print("\nClicking 'My Reviews' sub-tab...")
-                                                                                    try:
-                                                                                        my_reviews_tab = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "reviews-subtab-my"))
-                                                                                        )
-                                                                                        self.scroll_to_element(my_reviews_tab)
-                                                                                        time.sleep(0.2)
-                                                                                        my_reviews_tab.click()
-                                                                                        # Wait for My Reviews to load - wait for review elements to be present
-                                                                                        print("  Waiting for reviews to load...")
-                                                                                        try:
-                                                                                            # Wait for either reply buttons (reviews without replies) or edit buttons (reviews with replies) to appear
-                                                                                            self.wait.until(
-                                                                                                EC.any_of(
-                                                                                                    EC.presence_of_element_located((By.XPATH, "//button[starts-with(@id, 'staff-reply-button-')]")),
-                                                                                                    EC.presence_of_element_located((By.XPATH, "//button[starts-with(@id, 'staff-edit-reply-button-')]")),
-                                                                                                    EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'review')] | //div[contains(@class, 'Review')]"))
-                                                                                                )
-                                                                                            )
-                                                                                            time.sleep(0.5)  # Additional small wait for any animations
-                                                                                            print("  ✓ Reviews loaded")
-                                                                                        except Exception as e:
-                                                                                            print(f"  ⚠ Timeout waiting for reviews to load: {e}")
-                                                                                            time.sleep(2.0)  # Fallback wait
-                                                                                        print("  ✓ Clicked 'My Reviews' sub-tab")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error clicking 'My Reviews' sub-tab: {e}")
-                                                                                    
-                                                                                    # Find a review without a reply and reply to it
-                                                                                    print("\nLooking for a review without a reply...")
-                                                                                    try:
-                                                                                        # Wait for reviews to be visible
-                                                                                        time.sleep(1.0)
-                                                                                        
-                                                                                        # Find all Reply buttons (reviews without replies)
-                                                                                        reply_buttons = self.driver.find_elements(By.XPATH, "//button[starts-with(@id, 'staff-reply-button-')]")
-                                                                                        
-                                                                                        if reply_buttons:
-                                                                                            # Get the first reply button
-                                                                                            reply_button = reply_buttons[0]
-                                                                                            reply_button_id = reply_button.get_attribute("id")
-                                                                                            # Extract review_id from ID (format: staff-reply-button-{review_id})
-                                                                                            review_id = reply_button_id.replace("staff-reply-button-", "")
-                                                                                            print(f"  ✓ Found a review without a reply (review_id: {review_id})")
-                                                                                            
-                                                                                            # Click Reply button
-                                                                                            print("\nClicking Reply button...")
-                                                                                            self.scroll_to_element(reply_button)
-                                                                                            time.sleep(0.2)
-                                                                                            reply_button.click()
-                                                                                            time.sleep(0.5)
-                                                                                            print("  ✓ Clicked Reply button")
-                                                                                            
-                                                                                            # Find the reply textarea using ID
-                                                                                            print("\nFilling reply textarea...")
-                                                                                            reply_textarea = self.wait.until(
-                                                                                                EC.presence_of_element_located((By.ID, f"staff-reply-textarea-{review_id}"))
-                                                                                            )
-                                                                                            self.scroll_to_element(reply_textarea)
-                                                                                            time.sleep(0.2)
-                                                                                            reply_textarea.click()
-                                                                                            time.sleep(0.1)
-                                                                                            reply_textarea.clear()
-                                                                                            reply_text = "Thank you for your feedback! I'm glad you enjoyed the service."
-                                                                                            reply_textarea.send_keys(reply_text)
-                                                                                            time.sleep(0.3)
-                                                                                            print(f"  ✓ Filled reply textarea with: {reply_text}")
-                                                                                            
-                                                                                            # Click Send Reply button using ID
-                                                                                            print("\nClicking Send Reply button...")
-                                                                                            send_reply_button = self.wait.until(
-                                                                                                EC.element_to_be_clickable((By.ID, f"staff-send-reply-button-{review_id}"))
-                                                                                            )
-                                                                                            self.scroll_to_element(send_reply_button)
-                                                                                            time.sleep(0.2)
-                                                                                            send_reply_button.click()
-                                                                                            time.sleep(2.0)  # Wait for reply to be saved
-                                                                                            print("  ✓ Clicked Send Reply button")
-                                                                                            
-                                                                                            # Wait for toast notifications to disappear
-                                                                                            time.sleep(1.0)
-                                                                                            
-                                                                                            # Now find the Edit button for the reply we just created
-                                                                                            print("\nLooking for the Edit button for the reply we just created...")
-                                                                                            time.sleep(1.0)
-                                                                                            
-                                                                                            # Find all Edit buttons (reviews with replies)
-                                                                                            edit_buttons = self.driver.find_elements(By.XPATH, "//button[starts-with(@id, 'staff-edit-reply-button-')]")
-                                                                                            
-                                                                                            if edit_buttons:
-                                                                                                # Get the first edit button (should be the one we just created)
-                                                                                                edit_button = edit_buttons[0]
-                                                                                                edit_button_id = edit_button.get_attribute("id")
-                                                                                                # Extract reply_id from ID (format: staff-edit-reply-button-{reply_id})
-                                                                                                reply_id = edit_button_id.replace("staff-edit-reply-button-", "")
-                                                                                                print(f"  ✓ Found Edit button for reply (reply_id: {reply_id})")
-                                                                                                
-                                                                                                # Click Edit button
-                                                                                                print("\nClicking Edit button...")
-                                                                                                self.scroll_to_element(edit_button)
-                                                                                                time.sleep(0.2)
-                                                                                                edit_button.click()
-                                                                                                time.sleep(0.5)
-                                                                                                print("  ✓ Clicked Edit button")
-                                                                                                
-                                                                                                # Find the edit textarea using ID
-                                                                                                print("\nUpdating reply text...")
-                                                                                                edit_textarea = self.wait.until(
-                                                                                                    EC.presence_of_element_located((By.ID, f"staff-edit-reply-textarea-{reply_id}"))
-                                                                                                )
-                                                                                                self.scroll_to_element(edit_textarea)
-                                                                                                time.sleep(0.2)
-                                                                                                edit_textarea.click()
-                                                                                                time.sleep(0.1)
-                                                                                                edit_textarea.clear()
-                                                                                                updated_reply_text = "Thank you so much for your kind words! I really appreciate your feedback and look forward to serving you again."
-                                                                                                edit_textarea.send_keys(updated_reply_text)
-                                                                                                time.sleep(0.3)
-                                                                                                print(f"  ✓ Updated reply text to: {updated_reply_text}")
-                                                                                                
-                                                                                                # Click Update Reply button using ID
-                                                                                                print("\nClicking Update Reply button...")
-                                                                                                update_reply_button = self.wait.until(
-                                                                                                    EC.element_to_be_clickable((By.ID, f"staff-update-reply-button-{reply_id}"))
-                                                                                                )
-                                                                                                self.scroll_to_element(update_reply_button)
-                                                                                                time.sleep(0.2)
-                                                                                                update_reply_button.click()
-                                                                                                time.sleep(2.0)  # Wait for reply to be updated
-                                                                                                print("  ✓ Clicked Update Reply button")
-                                                                                                
-                                                                                                # Wait for toast notifications to disappear
-                                                                                                time.sleep(1.0)
-                                                                                                
-                                                                                                print("\n" + "="*70)
-                                                                                                print("MY REVIEWS REPLY AND EDIT FLOW COMPLETED")
-                                                                                                print("="*70)
-                                                                                            else:
-                                                                                                print("  ⚠ Could not find Edit button for the reply")
-                                                                                        else:
-                                                                                            print("  ⚠ No reviews without replies found, or all reviews already have replies")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error in My Reviews reply/edit flow: {e}")
-                                                                                        import traceback
-                                                                                        traceback.print_exc()
-                                                                                    
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking View History: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # OWNER DASHBOARD FLOW
-                                                                                print("\n" + "="*70)
-                                                                                print("OWNER DASHBOARD FLOW - STARTING")
-                                                                                print("="*70)
-                                                                                
-                                                                                # Logout as stylist and login as owner
-                                                                                print("\nLogging out as stylist...")
-                                                                                try:
-                                                                                    # Wait for any toast notifications to disappear
-                                                                                    time.sleep(2.0)
-                                                                                    try:
-                                                                                        toast_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'sonner-toast')]")
-                                                                                        if toast_elements:
-                                                                                            time.sleep(2.0)
-                                                                                    except:
-                                                                                        pass
-                                                                                    
-                                                                                    # Try stylist logout button ID first
-                                                                                    try:
-                                                                                        logout_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "stylist-logout-button"))
-                                                                                        )
-                                                                                        self.scroll_to_element(logout_button)
-                                                                                        time.sleep(0.3)
-                                                                                        try:
-                                                                                            logout_button.click()
-                                                                                        except:
-                                                                                            # If regular click fails, use JavaScript click
-                                                                                            self.driver.execute_script("arguments[0].click();", logout_button)
-                                                                                        time.sleep(2.0)
-                                                                                        print("  ✓ Logged out using stylist logout button ID")
-                                                                                    except:
-                                                                                        # Fallback to XPath
-                                                                                        logout_buttons = self.driver.find_elements(By.XPATH, 
-                                                                                            "//button[@id='stylist-logout-button'] | "
-                                                                                            "//button[contains(text(), 'Logout')]"
-                                                                                        )
-                                                                                        if logout_buttons:
-                                                                                            self.scroll_to_element(logout_buttons[0])
-                                                                                            time.sleep(0.3)
-                                                                                            try:
-                                                                                                logout_buttons[0].click()
-                                                                                            except:
-                                                                                                self.driver.execute_script("arguments[0].click();", logout_buttons[0])
-                                                                                            time.sleep(2.0)
-                                                                                            print("  ✓ Logged out (fallback)")
-                                                                                        else:
-                                                                                            raise Exception("Could not find logout button")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error logging out: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Login as owner
-                                                                                print("\nLogging in as owner...")
-                                                                                try:
-                                                                                    # Wait for page to load after logout
-                                                                                    time.sleep(2.0)
-                                                                                    
-                                                                                    # Click Sign In button (or navigate to login page)
-                                                                                    try:
-                                                                                        # Try to find and click Sign In button on landing page
-                                                                                        sign_in_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Sign In')]"))
-                                                                                        )
-                                                                                        self.scroll_to_element(sign_in_button)
-                                                                                        time.sleep(0.2)
-                                                                                        sign_in_button.click()
-                                                                                        time.sleep(1.0)
-                                                                                        print("  ✓ Clicked Sign In button")
-                                                                                    except:
-                                                                                        # Fallback: navigate directly to login page
-                                                                                        self.driver.get(f"{BASE_URL}/login")
-                                                                                        time.sleep(1.0)
-                                                                                        print("  ✓ Navigated to login page")
-                                                                                    
-                                                                                    # Now login as owner using existing login method
-                                                                                    if not self.login(self.owner_email, self.owner_password, "Owner"):
-                                                                                        raise Exception("Failed to login as owner")
-                                                                                    
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Logged in as owner")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error logging in as owner: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Navigate to Customers tab
-                                                                                print("\nNavigating to Customers tab...")
-                                                                                try:
-                                                                                    customers_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Customers')]"))
-                                                                                    )
-                                                                                    self.scroll_to_element(customers_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    customers_tab.click()
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Clicked Customers tab")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Customers tab: {e}")
-                                                                                
-                                                                                # Click View History for a customer (similar to stylist logic)
-                                                                                print("\nClicking View History for customer...")
-                                                                                try:
-                                                                                    time.sleep(2.0)
-                                                                                    customer_email_element = self.wait.until(
-                                                                                        EC.presence_of_element_located((By.XPATH, f"//p[.//text()[contains(., '{self.user_email}')]]"))
-                                                                                    )
-                                                                                    user_id = customer_email_element.get_attribute("id").replace("owner-customer-email-", "")
-                                                                                    print(f"  ✓ Found customer with email: {self.user_email} (User ID: {user_id})")
-                                                                                    
-                                                                                    view_history_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, f"owner-view-history-button-{user_id}"))
-                                                                                    )
-                                                                                    self.scroll_to_element(view_history_button)
-                                                                                    time.sleep(0.3)
-                                                                                    view_history_button.click()
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Clicked 'View History' for customer")
-                                                                                    
-                                                                                    # Close the modal
-                                                                                    print("  Closing customer visit history modal...")
-                                                                                    try:
-                                                                                        # Wait for modal to appear first
-                                                                                        time.sleep(1.0)
-                                                                                        
-                                                                                        # Try multiple ways to close the modal
-                                                                                        modal_closed = False
-                                                                                        
-                                                                                        # Method 1: Find close button by X button (X icon)
-                                                                                        try:
-                                                                                            close_button = self.wait.until(
-                                                                                                EC.element_to_be_clickable((By.XPATH, "//button[.//*[local-name()='svg' and contains(@class, 'w-5')] and contains(@class, 'h-5')] | //button[contains(@class, 'text-gray-400')]"))
-                                                                                            )
-                                                                                            self.scroll_to_element(close_button)
-                                                                                            time.sleep(0.2)
-                                                                                            try:
-                                                                                                close_button.click()
-                                                                                            except:
-                                                                                                self.driver.execute_script("arguments[0].click();", close_button)
-                                                                                            time.sleep(1.0)
-                                                                                            modal_closed = True
-                                                                                            print("  ✓ Closed customer visit history modal")
-                                                                                        except:
-                                                                                            pass
-                                                                                        
-                                                                                        # Method 2: Click outside modal (on backdrop) if close button didn't work
-                                                                                        if not modal_closed:
-                                                                                            try:
-                                                                                                # Click on the modal backdrop/overlay
-                                                                                                backdrop = self.driver.find_element(By.XPATH, "//div[contains(@class, 'fixed') and contains(@class, 'inset-0') and contains(@class, 'bg-black')]")
-                                                                                                self.driver.execute_script("arguments[0].click();", backdrop)
-                                                                                                time.sleep(1.0)
-                                                                                                modal_closed = True
-                                                                                                print("  ✓ Closed modal by clicking backdrop")
-                                                                                            except:
-                                                                                                pass
-                                                                                        
-                                                                                        # Method 3: Press Escape key
-                                                                                        if not modal_closed:
-                                                                                            try:
-                                                                                                from selenium.webdriver.common.keys import Keys
-                                                                                                self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                                                                                                time.sleep(1.0)
-                                                                                                modal_closed = True
-                                                                                                print("  ✓ Closed modal with Escape key")
-                                                                                            except:
-                                                                                                pass
-                                                                                        
-                                                                                        # Wait a bit more to ensure modal is fully closed
-                                                                                        time.sleep(1.0)
-                                                                                        
-                                                                                        # Verify modal is closed by checking if it's not visible
-                                                                                        try:
-                                                                                            modal_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'fixed') and contains(@class, 'inset-0')]")
-                                                                                            if modal_elements:
-                                                                                                # If modal still exists, try clicking outside one more time
-                                                                                                self.driver.execute_script("document.body.click();")
-                                                                                                time.sleep(1.0)
-                                                                                        except:
-                                                                                            pass
-                                                                                            
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error closing modal: {e}")
-                                                                                        # Try to continue anyway - might already be closed
-                                                                                        time.sleep(2.0)
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking View History: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Navigate to Order History tab
-                                                                                print("\nNavigating to Order History tab...")
-                                                                                try:
-                                                                                    order_history_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Order History')]"))
-                                                                                    )
-                                                                                    self.scroll_to_element(order_history_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    order_history_tab.click()
-                                                                                    time.sleep(3.0)
-                                                                                    print("  ✓ Clicked Order History tab")
-                                                                                    
-                                                                                    # Check if orders are loaded
-                                                                                    try:
-                                                                                        orders_loaded = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'card') or contains(@class, 'Card')]")
-                                                                                        if orders_loaded:
-                                                                                            print(f"  ✓ Found {len(orders_loaded)} order(s) loaded")
-                                                                                        else:
-                                                                                            print("  ℹ No orders found (may be empty)")
-                                                                                    except:
-                                                                                        print("  ℹ Could not verify if orders are loaded")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error navigating to Order History: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Navigate to Reviews tab
-                                                                                print("\nNavigating to Reviews tab...")
-                                                                                try:
-                                                                                    reviews_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Reviews')]"))
-                                                                                    )
-                                                                                    self.scroll_to_element(reviews_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    reviews_tab.click()
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Clicked Reviews tab")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Reviews tab: {e}")
-                                                                                
-                                                                                # Click Salon Reviews sub-tab
-                                                                                print("\nClicking Salon Reviews sub-tab...")
-                                                                                try:
-                                                                                    salon_reviews_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "reviews-subtab-salon"))
-                                                                                    )
-                                                                                    self.scroll_to_element(salon_reviews_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    salon_reviews_tab.click()
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Clicked Salon Reviews sub-tab")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Salon Reviews sub-tab: {e}")
-                                                                                
-                                                                                # Reply to a salon review
-                                                                                print("\nLooking for a salon review without a reply...")
-                                                                                try:
-                                                                                    time.sleep(1.0)
-                                                                                    reply_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.XPATH, "//button[starts-with(@id, 'salon-reply-button-')]"))
-                                                                                    )
-                                                                                    review_id = reply_button.get_attribute("id").replace("salon-reply-button-", "")
-                                                                                    print(f"  ✓ Found a review without a reply (Review ID: {review_id})")
-                                                                                    
-                                                                                    self.scroll_to_element(reply_button)
-                                                                                    time.sleep(0.2)
-                                                                                    reply_button.click()
-                                                                                    time.sleep(0.5)
-                                                                                    print("  ✓ Clicked Reply button")
-                                                                                    
-                                                                                    reply_textarea = self.wait.until(
-                                                                                        EC.presence_of_element_located((By.ID, f"salon-reply-textarea-{review_id}"))
-                                                                                    )
-                                                                                    self.scroll_to_element(reply_textarea)
-                                                                                    time.sleep(0.2)
-                                                                                    reply_textarea.click()
-                                                                                    time.sleep(0.1)
-                                                                                    reply_textarea.clear()
-                                                                                    reply_text = "Thank you for your feedback! We're glad you enjoyed your visit."
-                                                                                    reply_textarea.send_keys(reply_text)
-                                                                                    time.sleep(0.3)
-                                                                                    print(f"  ✓ Filled reply textarea with: {reply_text}")
-                                                                                    
-                                                                                    send_reply_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, f"salon-send-reply-button-{review_id}"))
-                                                                                    )
-                                                                                    self.scroll_to_element(send_reply_button)
-                                                                                    time.sleep(0.2)
-                                                                                    send_reply_button.click()
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Clicked Send Reply button")
-                                                                                    
-                                                                                    time.sleep(1.0)  # Wait for toast
-                                                                                    
-                                                                                    # Now find the same review (which should now have a reply) and edit it
-                                                                                    print("\nLooking for the review with the reply we just created to edit...")
-                                                                                    time.sleep(1.0)
-                                                                                    edit_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.XPATH, f"//button[starts-with(@id, 'salon-edit-reply-button-')]"))
-                                                                                    )
-                                                                                    reply_id_to_edit = edit_button.get_attribute("id").replace("salon-edit-reply-button-", "")
-                                                                                    print(f"  ✓ Found review with reply (Reply ID: {reply_id_to_edit})")
-                                                                                    
-                                                                                    self.scroll_to_element(edit_button)
-                                                                                    time.sleep(0.2)
-                                                                                    edit_button.click()
-                                                                                    time.sleep(0.5)
-                                                                                    print("  ✓ Clicked Edit button")
-                                                                                    
-                                                                                    edit_textarea = self.wait.until(
-                                                                                        EC.presence_of_element_located((By.ID, f"salon-edit-reply-textarea-{reply_id_to_edit}"))
-                                                                                    )
-                                                                                    self.scroll_to_element(edit_textarea)
-                                                                                    time.sleep(0.2)
-                                                                                    edit_textarea.click()
-                                                                                    time.sleep(0.1)
-                                                                                    edit_textarea.clear()
-                                                                                    updated_reply_text = "Thank you so much for your kind words! We really appreciate your feedback and look forward to serving you again."
-                                                                                    edit_textarea.send_keys(updated_reply_text)
-                                                                                    time.sleep(0.3)
-                                                                                    print(f"  ✓ Updated reply text to: {updated_reply_text}")
-                                                                                    
-                                                                                    update_reply_button = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, f"salon-update-reply-button-{reply_id_to_edit}"))
-                                                                                    )
-                                                                                    self.scroll_to_element(update_reply_button)
-                                                                                    time.sleep(0.2)
-                                                                                    update_reply_button.click()
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Clicked Update Reply button")
-                                                                                    
-                                                                                    time.sleep(1.0)  # Wait for toast
-                                                                                    
-                                                                                    print("\n" + "="*70)
-                                                                                    print("SALON REVIEWS REPLY AND EDIT FLOW COMPLETED")
-                                                                                    print("="*70)
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error in Salon Reviews reply/edit flow: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Click Staff Reviews sub-tab
-                                                                                print("\nClicking Staff Reviews sub-tab...")
-                                                                                try:
-                                                                                    staff_reviews_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.ID, "reviews-subtab-staff"))
-                                                                                    )
-                                                                                    self.scroll_to_element(staff_reviews_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    staff_reviews_tab.click()
-                                                                                    time.sleep(2.0)
-                                                                                    print("  ✓ Clicked Staff Reviews sub-tab")
-                                                                                    
-                                                                                    # Check if staff reviews are loaded
-                                                                                    try:
-                                                                                        staff_reviews_loaded = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'card') or contains(@class, 'Card')]")
-                                                                                        if staff_reviews_loaded:
-                                                                                            print(f"  ✓ Found {len(staff_reviews_loaded)} staff review(s) loaded")
-                                                                                        else:
-                                                                                            print("  ℹ No staff reviews found (may be empty)")
-                                                                                    except:
-                                                                                        print("  ℹ Could not verify if staff reviews are loaded")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error clicking Staff Reviews sub-tab: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Navigate to Revenue tab
-                                                                                print("\nNavigating to Revenue tab...")
-                                                                                try:
-                                                                                    revenue_tab = self.wait.until(
-                                                                                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Revenue')]"))
-                                                                                    )
-                                                                                    self.scroll_to_element(revenue_tab)
-                                                                                    time.sleep(0.2)
-                                                                                    revenue_tab.click()
-                                                                                    time.sleep(3.0)
-                                                                                    print("  ✓ Clicked Revenue tab")
-                                                                                    
-                                                                                    # Scroll on the revenue page to see all data
-                                                                                    print("  Scrolling on revenue page...")
-                                                                                    try:
-                                                                                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                                                                        time.sleep(0.5)
-                                                                                        self.driver.execute_script("window.scrollTo(0, 0);")
-                                                                                        time.sleep(0.5)
-                                                                                        print("  ✓ Scrolled on revenue page")
-                                                                                    except Exception as e:
-                                                                                        print(f"  ⚠ Error scrolling: {e}")
-                                                                                    
-                                                                                    # Check if revenue data is loaded
-                                                                                    try:
-                                                                                        revenue_data_loaded = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'card') or contains(@class, 'Card')] | //div[contains(@class, 'text-4xl')]")
-                                                                                        if revenue_data_loaded:
-                                                                                            print(f"  ✓ Found revenue data loaded ({len(revenue_data_loaded)} elements)")
-                                                                                        else:
-                                                                                            print("  ℹ No revenue data found (may be empty)")
-                                                                                    except:
-                                                                                        print("  ℹ Could not verify if revenue data is loaded")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error navigating to Revenue tab: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                print("\n" + "="*70)
-                                                                                print("OWNER DASHBOARD FLOW COMPLETED")
-                                                                                print("="*70)
-                                                                                
-                                                                                # Log out from owner account
-                                                                                print("\n" + "="*70)
-                                                                                print("LOGGING OUT FROM OWNER ACCOUNT")
-                                                                                print("="*70)
-                                                                                try:
-                                                                                    # Wait for any toast notifications to disappear
-                                                                                    time.sleep(2.0)
-                                                                                    try:
-                                                                                        toast_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'sonner-toast')]")
-                                                                                        if toast_elements:
-                                                                                            time.sleep(2.0)
-                                                                                    except:
-                                                                                        pass
-                                                                                    
-                                                                                    # Try owner logout button ID first
-                                                                                    try:
-                                                                                        logout_button = self.wait.until(
-                                                                                            EC.element_to_be_clickable((By.ID, "owner-logout-button"))
-                                                                                        )
-                                                                                        self.scroll_to_element(logout_button)
-                                                                                        time.sleep(0.3)
-                                                                                        try:
-                                                                                            logout_button.click()
-                                                                                        except:
-                                                                                            self.driver.execute_script("arguments[0].click();", logout_button)
-                                                                                        time.sleep(2.0)
-                                                                                        print("  ✓ Logged out using owner logout button ID")
-                                                                                    except:
-                                                                                        # Fallback to XPath
-                                                                                        logout_buttons = self.driver.find_elements(By.XPATH, 
-                                                                                            "//button[@id='owner-logout-button'] | "
-                                                                                            "//button[contains(text(), 'Logout')] | "
-                                                                                            "//button[contains(., 'Logout')]"
-                                                                                        )
-                                                                                        if logout_buttons:
-                                                                                            self.scroll_to_element(logout_buttons[0])
-                                                                                            time.sleep(0.3)
-                                                                                            try:
-                                                                                                logout_buttons[0].click()
-                                                                                            except:
-                                                                                                self.driver.execute_script("arguments[0].click();", logout_buttons[0])
-                                                                                            time.sleep(2.0)
-                                                                                            print("  ✓ Logged out (fallback)")
-                                                                                        else:
-                                                                                            print("  ⚠ Could not find logout button, navigating to home")
-                                                                                            self.navigate_and_scroll(BASE_URL)
-                                                                                    
-                                                                                    # Wait for logout to process and redirect to landing page
-                                                                                    time.sleep(2.0)
-                                                                                    current_url = self.driver.current_url
-                                                                                    if "/login" in current_url or BASE_URL in current_url or current_url == BASE_URL + "/":
-                                                                                        print("  ✓ Successfully logged out and redirected to landing page")
-                                                                                    else:
-                                                                                        print(f"  ⚠ Unexpected URL after logout: {current_url}")
-                                                                                except Exception as e:
-                                                                                    print(f"  ⚠ Error logging out: {e}")
-                                                                                    import traceback
-                                                                                    traceback.print_exc()
-                                                                                
-                                                                                # Log into admin account
-                                                                                print("\n" + "="*70)
-                                                                                print("LOGGING INTO ADMIN ACCOUNT")
-                                                                                print("="*70)
-                                                                                if not self.login("admin@strands.com", "test123", "Admin"):
-                                                                                    print("  ⚠ Failed to log in as admin")
-                                                                                else:
-                                                                                    print("  ✓ Successfully logged in as admin")
-                                                                                    
-                                                                                    # Wait for admin dashboard to load
-                                                                                    time.sleep(2.0)
-                                                                                    current_url = self.driver.current_url
-                                                                                    print(f"  Current URL after admin login: {current_url}")
-                                                                                    
-                                                                                    # Navigate to admin dashboard if not already there
-                                                                                    if "/admin" not in current_url and "/dashboard" not in current_url:
-                                                                                        self.navigate_and_scroll(f"{BASE_URL}/dashboard?tab=user-analytics")
-                                                                                        time.sleep(2.0)
-                                                                                    
-                                                                                    # Go through admin tabs and slowly scroll through them
-                                                                                    print("\n" + "="*70)
-                                                                                    print("CHECKING ADMIN TABS FOR UPDATED DATA")
-                                                                                    print("="*70)
-                                                                                    
-                                                                                    admin_tabs = [
-                                                                                        ("Loyalty Monitoring", "/admin/loyalty-monitoring"),
-                                                                                        ("User Analytics", "/dashboard?tab=user-analytics"),
-                                                                                        ("Business Insights", "/dashboard?tab=business-insights"),
-                                                                                        ("Revenue Tracking", "/dashboard?tab=revenue-analytics")
-                                                                                    ]
-                                                                                    
-                                                                                    for tab_name, tab_path in admin_tabs:
-                                                                                        print(f"\n  Checking {tab_name} tab...")
-                                                                                        try:
-                                                                                            # Try to click the tab button first
-                                                                                            if tab_name == "Loyalty Monitoring":
-                                                                                                tab_clicked = self.safe_click(
-                                                                                                    By.XPATH,
-                                                                                                    "//button[contains(text(), 'Loyalty Monitoring')] | //a[contains(text(), 'Loyalty Monitoring')]",
-                                                                                                    f"{tab_name} tab"
-                                                                                                )
-                                                                                            elif tab_name == "User Analytics":
-                                                                                                tab_clicked = self.safe_click(
-                                                                                                    By.XPATH,
-                                                                                                    "//button[contains(text(), 'User Analytics')] | //a[contains(text(), 'User Analytics')]",
-                                                                                                    f"{tab_name} tab"
-                                                                                                )
-                                                                                            elif tab_name == "Business Insights":
-                                                                                                tab_clicked = self.safe_click(
-                                                                                                    By.XPATH,
-                                                                                                    "//button[contains(text(), 'Business Insights')] | //a[contains(text(), 'Business Insights')]",
-                                                                                                    f"{tab_name} tab"
-                                                                                                )
-                                                                                            elif tab_name == "Revenue Tracking":
-                                                                                                tab_clicked = self.safe_click(
-                                                                                                    By.XPATH,
-                                                                                                    "//button[contains(text(), 'Revenue Tracking')] | //button[contains(text(), 'Revenue Analytics')] | //a[contains(text(), 'Revenue')]",
-                                                                                                    f"{tab_name} tab"
-                                                                                                )
-                                                                                            
-                                                                                            # Wait a moment after clicking the tab
-                                                                                            if tab_clicked:
-                                                                                                time.sleep(0.5)  # Small wait for tab click to register
-                                                                                            
-                                                                                            if not tab_clicked:
-                                                                                                # Fallback to direct navigation
-                                                                                                self.navigate_and_scroll(f"{BASE_URL}{tab_path}")
-                                                                                                time.sleep(0.5)  # Small wait after navigation
-                                                                                            
-                                                                                            # Wait for page to load - wait for content elements to be present
-                                                                                            print(f"    Waiting for {tab_name} page to load...")
-                                                                                            try:
-                                                                                                # Wait for common data elements or page structure to appear
-                                                                                                # More specific waits for admin pages
-                                                                                                self.wait.until(
-                                                                                                    EC.any_of(
-                                                                                                        EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'card')] | //div[contains(@class, 'Card')]")),
-                                                                                                        EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'chart')] | //div[contains(@class, 'Chart')] | //canvas")),
-                                                                                                        EC.presence_of_element_located((By.XPATH, "//table | //tbody | //tr")),
-                                                                                                        EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'text-4xl')] | //div[contains(@class, 'text-3xl')] | //div[contains(@class, 'text-2xl')]")),
-                                                                                                        EC.presence_of_element_located((By.XPATH, "//h1 | //h2 | //h3 | //h4")),
-                                                                                                        EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'grid')] | //div[contains(@class, 'flex')]")),
-                                                                                                        EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Total')] | //div[contains(text(), 'Users')] | //div[contains(text(), 'Revenue')]"))
-                                                                                                    )
-                                                                                                )
-                                                                                                time.sleep(0.5)  # Additional small wait for any animations
-                                                                                                print(f"    ✓ {tab_name} page loaded")
-                                                                                            except Exception as e:
-                                                                                                print(f"    ⚠ Timeout waiting for {tab_name} to load: {e}")
-                                                                                                time.sleep(2.0)  # Fallback wait
-                                                                                            
-                                                                                            # Slowly scroll through the page to check updated data
-                                                                                            print(f"    Slowly scrolling through {tab_name}...")
-                                                                                            try:
-                                                                                                page_height = self.driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-                                                                                                viewport_height = self.driver.execute_script("return window.innerHeight")
-                                                                                                
-                                                                                                if page_height > viewport_height:
-                                                                                                    # Scroll in smaller increments for slower, more visible scrolling
-                                                                                                    scroll_increment = viewport_height * 0.5  # Smaller increments
-                                                                                                    current_scroll = 0
-                                                                                                    while current_scroll < page_height:
-                                                                                                        current_scroll += scroll_increment
-                                                                                                        self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
-                                                                                                        time.sleep(0.8)  # Longer delay for slower scrolling
-                                                                                                    
-                                                                                                    # Scroll to bottom
-                                                                                                    self.driver.execute_script(f"window.scrollTo(0, {page_height});")
-                                                                                                    time.sleep(1.0)
-                                                                                                    
-                                                                                                    # Scroll back to top slowly
-                                                                                                    scroll_back_increment = viewport_height * 0.5
-                                                                                                    current_scroll = page_height
-                                                                                                    while current_scroll > 0:
-                                                                                                        current_scroll -= scroll_back_increment
-                                                                                                        if current_scroll < 0:
-                                                                                                            current_scroll = 0
-                                                                                                        self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
-                                                                                                        time.sleep(0.8)
-                                                                                                    
-                                                                                                    # Final scroll to top
-                                                                                                    self.driver.execute_script("window.scrollTo(0, 0);")
-                                                                                                    time.sleep(0.5)
-                                                                                                else:
-                                                                                                    print(f"    ℹ Page content fits in viewport, no scrolling needed")
-                                                                                                
-                                                                                                print(f"    ✓ Finished scrolling through {tab_name}")
-                                                                                            except Exception as e:
-                                                                                                print(f"    ⚠ Error scrolling through {tab_name}: {e}")
-                                                                                            
-                                                                                            # Check if data is loaded (look for common data elements)
-                                                                                            try:
-                                                                                                data_elements = self.driver.find_elements(By.XPATH, 
-                                                                                                    "//div[contains(@class, 'card')] | "
-                                                                                                    "//div[contains(@class, 'Card')] | "
-                                                                                                    "//div[contains(@class, 'chart')] | "
-                                                                                                    "//div[contains(@class, 'Chart')] | "
-                                                                                                    "//table | "
-                                                                                                    "//div[contains(@class, 'text-4xl')] | "
-                                                                                                    "//div[contains(@class, 'text-3xl')]"
-                                                                                                )
-                                                                                                if data_elements:
-                                                                                                    print(f"    ✓ Found {len(data_elements)} data element(s) on {tab_name} page")
-                                                                                                else:
-                                                                                                    print(f"    ℹ No data elements found on {tab_name} page (may be empty)")
-                                                                                            except:
-                                                                                                print(f"    ℹ Could not verify data elements on {tab_name} page")
-                                                                                                
-                                                                                        except Exception as e:
-                                                                                            print(f"    ⚠ Error checking {tab_name} tab: {e}")
-                                                                                            import traceback
-                                                                                            traceback.print_exc()
-                                                                                    
-                                                                                    print("\n" + "="*70)
-                                                                                    print("ADMIN TABS DATA CHECK COMPLETED")
-                                                                                    print("="*70)
-                                                                            except Exception as e:
-                                                                                print(f"  ⚠ Error navigating to Browse Salons: {e}")
-                                                                        except Exception as e:
-                                                                            print(f"  ⚠ Error filling card details: {e}")
-                                                                            import traceback
-                                                                            traceback.print_exc()
-                                                                    except Exception as e:
-                                                                        print(f"  ⚠ Error clicking Enter Card Details: {e}")
-                                                                except Exception as e:
-                                                                    print(f"  ⚠ Error navigating to Settings: {e}")
-                                                            except Exception as e:
-                                                                print(f"  ⚠ Error clicking Complete Order: {e}")
-                                                        except Exception as e:
-                                                            print(f"  ⚠ Error clicking Proceed to Checkout: {e}")
+                                                        # Wait a moment for results to appear
+                                                        self.settle(0.5)
                                                     except Exception as e:
-                                                        print(f"  ⚠ Error clicking View Cart: {e}")
+                                                        print(f"  ⚠ Error searching: {e}")
+                                                    
                                                 except Exception as e:
-                                                    print(f"  ⚠ Error clicking View Products: {e}")
-                                            else:
-                                                print("  ⚠ No View Details buttons found")
+                                                    print(f"  ⚠ Error navigating to Browse Salons: {e}")
+                                            except Exception as e:
+                                                print(f"  ⚠ Error filling card details: {e}")
+                                                import traceback
+                                                traceback.print_exc()
                                         except Exception as e:
-                                            print(f"  ⚠ Error finding salon: {e}")
-                                            import traceback
-                                            traceback.print_exc()
-                                        
-                                        print("\n" + "="*70)
-                                        print("PRODUCT PURCHASE FLOW COMPLETED")
-                                        print("="*70)
-                                        
+                                            print(f"  ⚠ Error clicking Enter Card Details: {e}")
                                     except Exception as e:
-                                        print(f"  ⚠ Error in product purchase flow: {e}")
-                                        import traceback
-                                        traceback.print_exc()
-                                    
+                                        print(f"  ⚠ Error navigating to Settings: {e}")
                                 except Exception as e:
-                                    print(f"  ⚠ Error in private note flow: {e}")
-                                    import traceback
-                                    traceback.print_exc()
-                            else:
-                                print("  ⚠ Could not determine booking_id for private note flow")
+                                    print(f"  ⚠ Error clicking Complete Order: {e}")
+                            except Exception as e:
+                                print(f"  ⚠ Error clicking Proceed to Checkout: {e}")
                         except Exception as e:
-                            print(f"  ⚠ Error in My Appointments / reschedule flow: {e}")
+                            print(f"  ⚠ Error clicking View Cart: {e}")
                     except Exception as e:
-                        print(f"    ⚠ Error filling payment card: {e}")
-                        import traceback
-                        traceback.print_exc()
+                        print(f"  ⚠ Error clicking View Products: {e}")
                 else:
-                    print(f"  ⚠ Signup may have completed - redirected to: {current_url}")
-                    print("  Attempting to navigate to browser page anyway...")
+                    print("  ⚠ No View Details buttons found")
+            except Exception as e:
+                print(f"  ⚠ Error finding salon: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            print("\n" + "="*70)
+            print("PRODUCT PURCHASE FLOW COMPLETED")
+            print("="*70)
+            
+        except Exception as e:
+            print(f"  ⚠ Error in product purchase flow: {e}")
+            import traceback
+            traceback.print_exc()
+        
+        if not ordered:
+            print("  ✗ No product order was completed")
+        return ordered
+    
+    def stage_appointment_review(self):
+        """Customer reviews the stylist from the Completed appointments tab"""
+        try:
+            # Before logout, check My Appointments - Completed tab and review flow
+            print("\n" + "="*70)
+            print("CHECKING MY APPOINTMENTS - COMPLETED AND REVIEW FLOW")
+            print("="*70)
+            
+            # Navigate to My Appointments
+            print("\nNavigating to My Appointments...")
+            try:
+                self.spa_navigate("/appointments")
+                self.settle(2)  # Wait for page to load
+                print("  ✓ Navigated to My Appointments page")
+            except Exception as e:
+                print(f"  ⚠ Error navigating to My Appointments: {e}")
+            
+            # Click Completed tab
+            print("\nClicking Completed tab...")
+            try:
+                completed_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "appointments-filter-past"))
+                )
+                self.scroll_to_element(completed_tab)
+                self.settle(0.2)
+                completed_tab.click()
+                self.wait_for_api_idle(description="after opening Completed tab")
+                print("  ✓ Clicked Completed tab and appointments loaded")
+                
+                # Check if there are any appointments in the Completed tab
+                # Loop to refresh until appointments appear
+                max_refresh_attempts = 10  # Maximum number of refresh attempts
+                refresh_attempt = 0
+                appointments_found = False
+                
+                while refresh_attempt < max_refresh_attempts and not appointments_found:
                     try:
-                        self.driver.get(f"{BASE_URL}/browser")
-                        time.sleep(2)
-                        print("  ✓ Navigated to browser page")
-                        # Try to continue with booking flow
-                        print("Attempting booking flow from current page...")
-                        # (The booking flow code would continue here, but we'll let it try)
-                    except:
+                        # Look for empty state message
+                        empty_state_message = self.driver.find_elements(
+                            By.XPATH, 
+                            "//*[contains(text(), 'No past appointments') or contains(text(), 'No appointments found')]"
+                        )
+                        # Also check for actual appointment cards
+                        actual_appointments = self.driver.find_elements(
+                            By.XPATH,
+                            "//div[contains(@class, 'grid')]//div[contains(@class, 'card') or contains(@class, 'Card')]"
+                        )
+                        
+                        # If we see "No past appointments" message and no actual appointment cards
+                        if empty_state_message and len(actual_appointments) == 0:
+                            refresh_attempt += 1
+                            print(f"  ⚠ No appointments found in Completed tab (attempt {refresh_attempt}/{max_refresh_attempts})")
+                            
+                            if refresh_attempt < max_refresh_attempts:
+                                print(f"  Waiting 2 seconds, then refreshing page...")
+                                self.settle(2.0)
+                                
+                                # Refresh the page
+                                self.driver.refresh()
+                                self.settle(2.0)  # Wait for page to reload
+                                print("  ✓ Page refreshed")
+                                
+                                # Click Completed tab again
+                                completed_tab = self.wait.until(
+                                    EC.element_to_be_clickable((By.ID, "appointments-filter-past"))
+                                )
+                                self.scroll_to_element(completed_tab)
+                                self.settle(0.2)
+                                completed_tab.click()
+                                self.wait_for_api_idle(description="after opening Completed tab")
+                                print(f"  ✓ Clicked Completed tab again after refresh (attempt {refresh_attempt})")
+                            else:
+                                print(f"  ⚠ Max refresh attempts reached. Continuing anyway...")
+                                appointments_found = True  # Break the loop
+                        else:
+                            # Appointments found!
+                            appointments_found = True
+                            print("  ✓ Appointments found in Completed tab")
+                    except Exception as e:
+                        print(f"  ⚠ Error checking for appointments: {e}")
+                        # If there's an error, assume appointments might be there and continue
+                        appointments_found = True
+                        break
+            except Exception as e:
+                print(f"  ⚠ Error clicking Completed tab: {e}")
+            
+            # Once the Completed tab has loaded, click Review Stylist button
+            print("\nClicking Review Stylist button...")
+            try:
+                # Find the Review Stylist button using ID pattern
+                review_stylist_button = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[starts-with(@id, 'review-stylist-button-')]"))
+                )
+                self.scroll_to_element(review_stylist_button)
+                self.settle(0.2)
+                review_stylist_button.click()
+                self.settle(1.0)  # Wait for review modal to open
+                print("  ✓ Clicked Review Stylist button")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Review Stylist button: {e}")
+            
+            # After clicking Review Stylist, click "Write a Review" button in the modal
+            print("\nClicking Write a Review button...")
+            try:
+                write_review_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "write-review-button"))
+                )
+                self.scroll_to_element(write_review_button)
+                self.settle(0.2)
+                write_review_button.click()
+                self.settle(0.5)  # Wait for review form to appear
+                print("  ✓ Clicked Write a Review button")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Write a Review button: {e}")
+            
+            # Write a review - select rating (5 stars)
+            print("\nSelecting 5-star rating...")
+            try:
+                # Click the full 5th star button (right half)
+                fifth_star_full = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "review-star-5-full"))
+                )
+                self.scroll_to_element(fifth_star_full)
+                self.settle(0.2)
+                fifth_star_full.click()
+                self.settle(0.3)
+                print("  ✓ Selected 5-star rating")
+            except Exception as e:
+                print(f"  ⚠ Error selecting rating: {e}")
+            
+            # Write a comment
+            print("\nWriting review comment...")
+            try:
+                comment_textarea = self.wait.until(
+                    EC.presence_of_element_located((By.ID, "review-comment-textarea"))
+                )
+                self.scroll_to_element(comment_textarea)
+                self.settle(0.2)
+                comment_textarea.click()
+                self.settle(0.1)
+                comment_textarea.clear()
+                comment_textarea.send_keys("Great service! Very professional and friendly.")
+                self.settle(0.3)
+                print("  ✓ Wrote review comment")
+            except Exception as e:
+                print(f"  ⚠ Error writing comment: {e}")
+            
+            # Submit the review
+            print("\nSubmitting review...")
+            try:
+                submit_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "submit-review-button"))
+                )
+                self.scroll_to_element(submit_button)
+                self.settle(0.2)
+                submit_button.click()
+                self.settle(1.0)  # Wait for confirmation modal
+                
+                # Click Confirm on the confirmation modal
+                try:
+                    confirm_button = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "review-confirm-button"))
+                    )
+                    self.scroll_to_element(confirm_button)
+                    self.settle(0.2)
+                    confirm_button.click()
+                    self.settle(2.0)  # Wait for review to be submitted
+                    print("  ✓ Submitted review")
+                except Exception as e:
+                    print(f"  ⚠ Error confirming review submission: {e}")
+            except Exception as e:
+                print(f"  ⚠ Error submitting review: {e}")
+            
+            # After submitting, click Edit Review button
+            print("\nClicking Edit Review button...")
+            try:
+                # Close the review modal first if it's still open
+                try:
+                    close_button = self.driver.find_element(By.ID, "review-modal-close-button")
+                    if close_button:
+                        close_button.click()
+                        self.settle(0.5)
+                except Exception:
+                    pass
+                
+                # Wait for toast notifications to disappear
+                self.settle(2.0)  # Wait for modal to close and page to settle
+                
+                # Extract employee_id from the Review Stylist button we clicked earlier
+                employee_id = None
+                try:
+                    review_stylist_button = self.driver.find_element(By.XPATH, "//button[starts-with(@id, 'review-stylist-button-')]")
+                    button_id = review_stylist_button.get_attribute("id")
+                    if button_id:
+                        employee_id = button_id.replace("review-stylist-button-", "")
+                except Exception:
+                    # If Review Stylist button is gone, try to find Edit Review button and extract ID
+                    try:
+                        edit_btn = self.driver.find_element(By.XPATH, "//button[starts-with(@id, 'edit-review-button-')]")
+                        button_id = edit_btn.get_attribute("id")
+                        if button_id:
+                            employee_id = button_id.replace("edit-review-button-", "")
+                    except Exception:
                         pass
+                
+                if employee_id:
+                    # Wait for the Edit Review button to appear using the employee_id
+                    edit_review_button = self.wait.until(
+                        EC.presence_of_element_located((By.ID, f"edit-review-button-{employee_id}"))
+                    )
+                    
+                    # Scroll the button into view using JavaScript
+                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", edit_review_button)
+                    self.settle(0.5)
                     
+                    # Try regular click first
+                    try:
+                        edit_review_button.click()
+                        self.settle(1.0)
+                        print("  ✓ Clicked Edit Review button")
+                    except Exception as click_error:
+                        # If regular click fails, use JavaScript click
+                        print(f"  ⚠ Regular click failed, trying JavaScript click: {click_error}")
+                        self.driver.execute_script("arguments[0].click();", edit_review_button)
+                        self.settle(1.0)
+                        print("  ✓ Clicked Edit Review button (JavaScript)")
+                else:
+                    # Fallback: find by XPath if we couldn't extract employee_id
+                    edit_review_button = self.wait.until(
+                        EC.presence_of_element_located((By.XPATH, "//button[starts-with(@id, 'edit-review-button-')]"))
+                    )
+                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", edit_review_button)
+                    self.settle(0.5)
+                    try:
+                        edit_review_button.click()
+                        self.settle(1.0)
+                        print("  ✓ Clicked Edit Review button (fallback)")
+                    except Exception:
+                        self.driver.execute_script("arguments[0].click();", edit_review_button)
+                        self.settle(1.0)
+                        print("  ✓ Clicked Edit Review button (JavaScript fallback)")
             except Exception as e:
-                print(f"  ⚠ Error signing up new user or booking: {e}")
+                print(f"  ⚠ Error clicking Edit Review button: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            # Edit the review - change rating and comment
+            print("\nEditing review...")
+            try:
+                # Click the Edit button in the review display to open the form
+                try:
+                    edit_form_button = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "edit-review-form-button"))
+                    )
+                    self.scroll_to_element(edit_form_button)
+                    self.settle(0.2)
+                    edit_form_button.click()
+                    self.settle(0.5)
+                    print("  ✓ Opened review form for editing")
+                except Exception as e:
+                    print(f"  ⚠ Error opening review form: {e}")
+                
+                # Change rating to 4 stars (click the full 4th star button)
+                try:
+                    fourth_star_full = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "review-star-4-full"))
+                    )
+                    self.scroll_to_element(fourth_star_full)
+                    self.settle(0.2)
+                    fourth_star_full.click()
+                    self.settle(0.3)
+                    print("  ✓ Changed rating to 4 stars")
+                except Exception as e:
+                    print(f"  ⚠ Error changing rating: {e}")
+                
+                # Update the comment
+                try:
+                    comment_textarea = self.wait.until(
+                        EC.presence_of_element_located((By.ID, "review-comment-textarea"))
+                    )
+                    self.scroll_to_element(comment_textarea)
+                    self.settle(0.2)
+                    comment_textarea.click()
+                    self.settle(0.1)
+                    comment_textarea.clear()
+                    comment_textarea.send_keys("Updated: Excellent service! Highly recommend.")
+                    self.settle(0.3)
+                    print("  ✓ Updated review comment")
+                except Exception as e:
+                    print(f"  ⚠ Error updating comment: {e}")
+                
+                # Click Update Review button
+                try:
+                    update_button = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "update-review-button"))
+                    )
+                    self.scroll_to_element(update_button)
+                    self.settle(0.2)
+                    update_button.click()
+                    self.settle(1.0)  # Wait for confirmation modal
+                    
+                    # Click Confirm on the confirmation modal
+                    try:
+                        confirm_button = self.wait.until(
+                            EC.element_to_be_clickable((By.ID, "review-confirm-button"))
+                        )
+                        self.scroll_to_element(confirm_button)
+                        self.settle(0.2)
+                        confirm_button.click()
+                        self.settle(2.0)  # Wait for review to be updated
+                        print("  ✓ Updated review")
+                    except Exception as e:
+                        print(f"  ⚠ Error confirming review update: {e}")
+                except Exception as e:
+                    print(f"  ⚠ Error clicking Update Review button: {e}")
+            except Exception as e:
+                print(f"  ⚠ Error editing review: {e}")
                 import traceback
                 traceback.print_exc()
             
+            # Close the review modal after editing
+            print("\nClosing review modal...")
+            try:
+                close_modal_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "review-modal-close-button"))
+                )
+                self.scroll_to_element(close_modal_button)
+                self.settle(0.2)
+                close_modal_button.click()
+                self.settle(1.0)  # Wait for modal to close
+                print("  ✓ Closed review modal")
+            except Exception as e:
+                print(f"  ⚠ Error closing review modal: {e}")
+            
             return True
         except Exception as e:
-            print(f" Test 5 failed: {e}")
+            print(f" Stage appointment_review failed: {e}")
             import traceback
             traceback.print_exc()
             return False
     
-    def run_all_tests(self):
-        print("=" * 70)
-        print("STRANDS PLATFORM SELENIUM TEST SUITE - PHASE 1 & 2")
-        print("=" * 70)
-        
-        start_time = time.time()
-        
+    def stage_salon_review(self):
+        """Customer writes a salon review from Browse Salons"""
         try:
-            self.setup()
-            
-            tests = [
-                self.test_1_login_page_loads,
-                self.test_2_invalid_login_attempt,
-                self.test_3_successful_login_admin,
-                self.test_4_admin_pages_and_salon_rejection,
-                self.test_5_owner_signup_and_admin_approval,
-            ]
+            # Before logout, go to Browse Salons and write a salon review
+            print("\n" + "="*70)
+            print("BROWSE SALONS AND WRITE SALON REVIEW")
+            print("="*70)
             
-            passed = 0
-            failed = 0
+            # Navigate to Browse Salons
+            print("\nNavigating to Browse Salons...")
+            try:
+                self.spa_navigate("/browser")
+                self.settle(2)  # Wait for page to load
+                print("  ✓ Navigated to Browse Salons page")
+            except Exception as e:
+                print(f"  ⚠ Error navigating to Browse Salons: {e}")
             
-            for test in tests:
-                test_start = time.time()
-                try:
-                    # Check if driver is still valid before each test
+            # Find and click View Details for "Selenium Test Salon"
+            print("\nFinding and clicking View Details for Selenium Test Salon...")
+            try:
+                # Find the salon card by name
+                salon_cards = self.driver.find_elements(
+                    By.XPATH,
+                    "//*[contains(text(), 'Selenium Test Salon')]/ancestor::div[contains(@class, 'card') or contains(@class, 'Card')]"
+                )
+                
+                if salon_cards:
+                    salon_card = salon_cards[0]  # Get first matching salon
+                    # Find View Details button within this card
+                    view_details_button = salon_card.find_element(
+                        By.XPATH, ".//button[starts-with(@id, 'view-details-button-')]"
+                    )
+                    self.scroll_to_element(view_details_button)
+                    self.settle(0.2)
+                    view_details_button.click()
+                    self.settle(1.0)  # Initial wait
+                    print("  ✓ Clicked View Details for Selenium Test Salon")
+                    
+                    # Wait for salon detail page to load
+                    print("  Waiting for salon detail page to load...")
                     try:
-                        if not self.driver or not hasattr(self.driver, 'current_url'):
-                            print("Browser session lost, restarting...")
-                            self.setup()
-                    except:
-                        print("Browser session lost, restarting...")
-                        self.setup()
+                        # Wait for salon name or key elements to appear (indicating page has loaded)
+                        self.wait.until(
+                            EC.any_of(
+                                EC.presence_of_element_located((By.XPATH, "//h2[contains(@class, 'text-3xl')] | //h1[contains(@class, 'text-3xl')] | //*[contains(@class, 'CardTitle')]")),
+                                EC.presence_of_element_located((By.ID, "salon-write-review-button"))
+                            )
+                        )
+                        self.settle(1.0)  # Additional wait for any animations/transitions
+                        print("  ✓ Salon detail page loaded")
+                    except Exception as e:
+                        print(f"  ⚠ Warning: Could not confirm page load: {e}")
+                        self.settle(2.0)  # Fallback wait
+                else:
+                    print("  ⚠ Could not find Selenium Test Salon")
+            except Exception as e:
+                print(f"  ⚠ Error finding/clicking View Details: {e}")
+            
+            # Scroll on the salon detail page
+            print("\nScrolling on salon detail page...")
+            try:
+                self.scroll_through_page(step=None, pause=0.5)
+                print("  ✓ Scrolled on salon detail page")
+            except Exception as e:
+                print(f"  ⚠ Error scrolling: {e}")
+            
+            # Find and click Write a Review button
+            print("\nClicking Write a Review button...")
+            try:
+                write_review_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "salon-write-review-button"))
+                )
+                self.scroll_to_element(write_review_button)
+                self.settle(0.2)
+                write_review_button.click()
+                self.settle(0.5)  # Wait for review form to appear
+                print("  ✓ Clicked Write a Review button")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Write a Review button: {e}")
+            
+            # Fill out review - select rating (5 stars)
+            print("\nSelecting 5-star rating for salon...")
+            try:
+                fifth_star_full = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "salon-review-star-5-full"))
+                )
+                self.scroll_to_element(fifth_star_full)
+                self.settle(0.2)
+                fifth_star_full.click()
+                self.settle(0.3)
+                print("  ✓ Selected 5-star rating for salon")
+            except Exception as e:
+                print(f"  ⚠ Error selecting rating: {e}")
+            
+            # Write a comment
+            print("\nWriting salon review comment...")
+            try:
+                comment_textarea = self.wait.until(
+                    EC.presence_of_element_located((By.ID, "salon-review-comment-textarea"))
+                )
+                self.scroll_to_element(comment_textarea)
+                self.settle(0.2)
+                comment_textarea.click()
+                self.settle(0.1)
+                comment_textarea.clear()
+                comment_textarea.send_keys("Great salon! Excellent service and friendly staff.")
+                self.settle(0.3)
+                print("  ✓ Wrote salon review comment")
+            except Exception as e:
+                print(f"  ⚠ Error writing comment: {e}")
+            
+            # Submit the review
+            print("\nSubmitting salon review...")
+            try:
+                submit_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "salon-submit-review-button"))
+                )
+                self.scroll_to_element(submit_button)
+                self.settle(0.2)
+                submit_button.click()
+                self.settle(1.0)  # Wait for confirmation modal
+                
+                # Click Confirm on the confirmation modal
+                try:
+                    confirm_button = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "salon-review-confirm-button"))
+                    )
+                    self.scroll_to_element(confirm_button)
+                    self.settle(0.2)
+                    confirm_button.click()
+                    self.settle(2.0)  # Wait for review to be submitted
+                    print("  ✓ Submitted salon review")
+                except Exception as e:
+                    print(f"  ⚠ Error confirming review submission: {e}")
+            except Exception as e:
+                print(f"  ⚠ Error submitting review: {e}")
+            
+            return True
+        except Exception as e:
+            print(f" Stage salon_review failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_stylist_review_replies(self):
+        """Stylist checks the customer's visit history and replies to a review"""
+        try:
+            # Navigate to Customers tab
+            print("\nNavigating to Customers tab...")
+            try:
+                customers_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "stylist-tab-customers"))
+                )
+                self.scroll_to_element(customers_tab)
+                self.settle(0.2)
+                customers_tab.click()
+                self.settle(1.0)  # Wait for customers to load
+                print("  ✓ Opened Customers tab")
+            except Exception as e:
+                print(f"  ⚠ Error opening Customers tab: {e}")
+            
+            # Find and click "View History" for the customer we created
+            print(f"\nLooking for customer: {self.user_email}")
+            try:
+                # Wait for customers to load
+                print(f"  Waiting for customer list to load...")
+                self.settle(2.0)  # Give more time for customers to load
+                
+                # Find the customer email element - email is in a <p> tag with a nested <span>
+                # Use XPath that checks all text nodes within the paragraph
+                customer_email_element = self.wait.until(
+                    EC.presence_of_element_located((By.XPATH, f"//p[.//text()[contains(., '{self.user_email}')]]"))
+                )
+                print(f"  ✓ Found customer email element")
+                
+                # Get the ID of the email element to extract user_id
+                email_element_id = customer_email_element.get_attribute("id")
+                if email_element_id and email_element_id.startswith("customer-email-"):
+                    user_id = email_element_id.replace("customer-email-", "")
+                    print(f"  ✓ Extracted user_id: {user_id}")
                     
-                    # Run test
-                    result = test()
-                    test_duration = time.time() - test_start
+                    # Find the View History button using the user_id
+                    view_history_button = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, f"view-history-button-{user_id}"))
+                    )
+                else:
+                    # Fallback: find the parent card and then the button
+                    print(f"  ⚠ Could not extract user_id from email element ID, using fallback method")
+                    customer_card = customer_email_element.find_element(By.XPATH, "./ancestor::div[starts-with(@id, 'customer-card-')]")
+                    card_id = customer_card.get_attribute("id")
+                    if card_id:
+                        user_id = card_id.replace("customer-card-", "")
+                        view_history_button = self.wait.until(
+                            EC.element_to_be_clickable((By.ID, f"view-history-button-{user_id}"))
+                        )
+                    else:
+                        # Last resort: find button by XPath within the card
+                        view_history_button = customer_card.find_element(
+                            By.XPATH, ".//button[starts-with(@id, 'view-history-button-')]"
+                        )
+                
+                # Scroll to and click the button
+                self.scroll_to_element(view_history_button)
+                self.settle(0.3)
+                view_history_button.click()
+                self.settle(1.0)  # Wait for modal to open
+                print("  ✓ Clicked 'View History' for customer")
+                
+                # Close the customer visit history modal
+                print("\nClosing customer visit history modal...")
+                try:
+                    close_modal_button = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "customer-visit-modal-close-button"))
+                    )
+                    self.scroll_to_element(close_modal_button)
+                    self.settle(0.2)
+                    close_modal_button.click()
+                    self.settle(0.5)  # Wait for modal to close
+                    print("  ✓ Closed customer visit history modal")
+                except Exception as e:
+                    print(f"  ⚠ Error closing modal: {e}")
+                
+                # Navigate to Reviews tab
+                print("\nNavigating to Reviews tab...")
+                try:
+                    reviews_tab = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "stylist-tab-reviews"))
+                    )
+                    self.scroll_to_element(reviews_tab)
+                    self.settle(0.2)
+                    reviews_tab.click()
+                    self.settle(1.0)  # Wait for reviews to load
+                    print("  ✓ Opened Reviews tab")
+                except Exception as e:
+                    print(f"  ⚠ Error opening Reviews tab: {e}")
+                
+                # Click "My Reviews" sub-tab
+                print("\nClicking 'My Reviews' sub-tab...")
+                try:
+                    my_reviews_tab = self.wait.until(
+                        EC.element_to_be_clickable((By.ID, "reviews-subtab-my"))
+                    )
+                    self.scroll_to_element(my_reviews_tab)
+                    self.settle(0.2)
+                    my_reviews_tab.click()
+                    # Wait for My Reviews to load - wait for review elements to be present
+                    print("  Waiting for reviews to load...")
+                    try:
+                        # Wait for either reply buttons (reviews without replies) or edit buttons (reviews with replies) to appear
+                        self.wait.until(
+                            EC.any_of(
+                                EC.presence_of_element_located((By.XPATH, "//button[starts-with(@id, 'staff-reply-button-')]")),
+                                EC.presence_of_element_located((By.XPATH, "//button[starts-with(@id, 'staff-edit-reply-button-')]")),
+                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'review')] | //div[contains(@class, 'Review')]"))
+                            )
+                        )
+                        self.settle(0.5)  # Additional small wait for any animations
+                        print("  ✓ Reviews loaded")
+                    except Exception as e:
+                        print(f"  ⚠ Timeout waiting for reviews to load: {e}")
+                        self.settle(2.0)  # Fallback wait
+                    print("  ✓ Clicked 'My Reviews' sub-tab")
+                except Exception as e:
+                    print(f"  ⚠ Error clicking 'My Reviews' sub-tab: {e}")
+                
+                # Find a review without a reply and reply to it
+                print("\nLooking for a review without a reply...")
+                try:
+                    # Wait for reviews to be visible
+                    self.settle(1.0)
                     
-                    if test_duration > MAX_TEST_TIME:
-                        print(f"WARNING: Test {test.__name__} took {test_duration:.1f}s (exceeded {MAX_TEST_TIME}s limit)")
+                    # Find all Reply buttons (reviews without replies)
+                    reply_buttons = self.driver.find_elements(By.XPATH, "//button[starts-with(@id, 'staff-reply-button-')]")
                     
-                    if result:
-                        passed += 1
-                        self.test_results.append((test.__name__, "PASSED"))
+                    if reply_buttons:
+                        # Get the first reply button
+                        reply_button = reply_buttons[0]
+                        reply_button_id = reply_button.get_attribute("id")
+                        # Extract review_id from ID (format: staff-reply-button-{review_id})
+                        review_id = reply_button_id.replace("staff-reply-button-", "")
+                        print(f"  ✓ Found a review without a reply (review_id: {review_id})")
+                        
+                        # Click Reply button
+                        print("\nClicking Reply button...")
+                        self.scroll_to_element(reply_button)
+                        self.settle(0.2)
+                        reply_button.click()
+                        self.settle(0.5)
+                        print("  ✓ Clicked Reply button")
+                        
+                        # Find the reply textarea using ID
+                        print("\nFilling reply textarea...")
+                        reply_textarea = self.wait.until(
+                            EC.presence_of_element_located((By.ID, f"staff-reply-textarea-{review_id}"))
+                        )
+                        self.scroll_to_element(reply_textarea)
+                        self.settle(0.2)
+                        reply_textarea.click()
+                        self.settle(0.1)
+                        reply_textarea.clear()
+                        reply_text = "Thank you for your feedback! I'm glad you enjoyed the service."
+                        reply_textarea.send_keys(reply_text)
+                        self.settle(0.3)
+                        print(f"  ✓ Filled reply textarea with: {reply_text}")
+                        
+                        # Click Send Reply button using ID
+                        print("\nClicking Send Reply button...")
+                        send_reply_button = self.wait.until(
+                            EC.element_to_be_clickable((By.ID, f"staff-send-reply-button-{review_id}"))
+                        )
+                        self.scroll_to_element(send_reply_button)
+                        self.settle(0.2)
+                        send_reply_button.click()
+                        self.settle(2.0)  # Wait for reply to be saved
+                        print("  ✓ Clicked Send Reply button")
+                        
+                        # Wait for toast notifications to disappear
+                        self.settle(1.0)
+                        
+                        # Now find the Edit button for the reply we just created
+                        print("\nLooking for the Edit button for the reply we just created...")
+                        self.settle(1.0)
+                        
+                        # Find all Edit buttons (reviews with replies)
+                        edit_buttons = self.driver.find_elements(By.XPATH, "//button[starts-with(@id, 'staff-edit-reply-button-')]")
+                        
+                        if edit_buttons:
+                            # Get the first edit button (should be the one we just created)
+                            edit_button = edit_buttons[0]
+                            edit_button_id = edit_button.get_attribute("id")
+                            # Extract reply_id from ID (format: staff-edit-reply-button-{reply_id})
+                            reply_id = edit_button_id.replace("staff-edit-reply-button-", "")
+                            print(f"  ✓ Found Edit button for reply (reply_id: {reply_id})")
+                            
+                            # Click Edit button
+                            print("\nClicking Edit button...")
+                            self.scroll_to_element(edit_button)
+                            self.settle(0.2)
+                            edit_button.click()
+                            self.settle(0.5)
+                            print("  ✓ Clicked Edit button")
+                            
+                            # Find the edit textarea using ID
+                            print("\nUpdating reply text...")
+                            edit_textarea = self.wait.until(
+                                EC.presence_of_element_located((By.ID, f"staff-edit-reply-textarea-{reply_id}"))
+                            )
+                            self.scroll_to_element(edit_textarea)
+                            self.settle(0.2)
+                            edit_textarea.click()
+                            self.settle(0.1)
+                            edit_textarea.clear()
+                            updated_reply_text = "Thank you so much for your kind words! I really appreciate your feedback and look forward to serving you again."
+                            edit_textarea.send_keys(updated_reply_text)
+                            self.settle(0.3)
+                            print(f"  ✓ Updated reply text to: {updated_reply_text}")
+                            
+                            # Click Update Reply button using ID
+                            print("\nClicking Update Reply button...")
+                            update_reply_button = self.wait.until(
+                                EC.element_to_be_clickable((By.ID, f"staff-update-reply-button-{reply_id}"))
+                            )
+                            self.scroll_to_element(update_reply_button)
+                            self.settle(0.2)
+                            update_reply_button.click()
+                            self.settle(2.0)  # Wait for reply to be updated
+                            print("  ✓ Clicked Update Reply button")
+                            
+                            # Wait for toast notifications to disappear
+                            self.settle(1.0)
+                            
+                            print("\n" + "="*70)
+                            print("MY REVIEWS REPLY AND EDIT FLOW COMPLETED")
+                            print("="*70)
+                        else:
+                            print("  ⚠ Could not find Edit button for the reply")
                     else:
-                        failed += 1
-                        self.test_results.append((test.__name__, "FAILED"))
-                except KeyboardInterrupt:
-                    print(f"\nWARNING: Test interrupted: {test.__name__}")
-                    raise
-                except (TimeoutException, WebDriverException) as e:
-                    failed += 1
-                    error_msg = str(e)[:80]
-                    self.test_results.append((test.__name__, f"ERROR: {error_msg}"))
-                    print(f"Test {test.__name__} error: {error_msg}")
-                    # Try to recover browser if session lost
-                    try:
-                        if "invalid session" in str(e).lower() or "disconnected" in str(e).lower():
-                            print("  Browser session lost, will restart for next test...")
-                            self.driver = None
-                            self.wait = None
-                    except:
-                        pass
+                        print("  ⚠ No reviews without replies found, or all reviews already have replies")
                 except Exception as e:
-                    failed += 1
-                    error_msg = str(e)[:80]
-                    self.test_results.append((test.__name__, f"ERROR: {error_msg}"))
-                    print(f"Test {test.__name__} crashed: {error_msg}")
-                finally:
-                    # Cleanup between tests
-                    try:
-                        if self.driver:
-                            # Dismiss any modals
-                            try:
-                                cancel_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Cancel')]")
-                                if cancel_buttons:
-                                    self.driver.execute_script("arguments[0].click();", cancel_buttons[0])
-                                    time.sleep(0.1)
-                            except:
-                                pass
-                    except:
-                        pass
+                    print(f"  ⚠ Error in My Reviews reply/edit flow: {e}")
+                    import traceback
+                    traceback.print_exc()
+                
+            except Exception as e:
+                print(f"  ⚠ Error clicking View History: {e}")
+                import traceback
+                traceback.print_exc()
             
-            elapsed_time = time.time() - start_time
-            
-            print("\n" + "=" * 70)
-            print("TEST SUMMARY - PHASE 1, 2 & 3")
-            print("=" * 70)
-            print(f"Passed: {passed}")
-            print(f"Failed: {failed}")
-            print(f"Total Time: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
-            if (passed + failed) > 0:
-                print(f"Success Rate: {(passed/(passed+failed)*100):.1f}%")
-            print("\nDetailed Results:")
-            for test_name, result in self.test_results:
-                print(f"  {test_name}: {result}")
-            print("=" * 70)
+            return True
+        except Exception as e:
+            print(f" Stage stylist_review_replies failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_owner_review_replies(self):
+        """Owner checks customers, orders, reviews and revenue"""
+        try:
+            # OWNER DASHBOARD FLOW
+            print("\n" + "="*70)
+            print("OWNER DASHBOARD FLOW - STARTING")
+            print("="*70)
             
-        finally:
+            # Navigate to Customers tab
+            print("\nNavigating to Customers tab...")
+            try:
+                customers_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Customers')]"))
+                )
+                self.scroll_to_element(customers_tab)
+                self.settle(0.2)
+                customers_tab.click()
+                self.settle(2.0)
+                print("  ✓ Clicked Customers tab")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Customers tab: {e}")
+            
+            # Click View History for a customer (similar to stylist logic)
+            print("\nClicking View History for customer...")
+            try:
+                self.settle(2.0)
+                customer_email_element = self.wait.until(
+                    EC.presence_of_element_located((By.XPATH, f"//p[.//text()[contains(., '{self.user_email}')]]"))
+                )
+                user_id = customer_email_element.get_attribute("id").replace("owner-customer-email-", "")
+                print(f"  ✓ Found customer with email: {self.user_email} (User ID: {user_id})")
+                
+                view_history_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, f"owner-view-history-button-{user_id}"))
+                )
+                self.scroll_to_element(view_history_button)
+                self.settle(0.3)
+                view_history_button.click()
+                self.settle(2.0)
+                print("  ✓ Clicked 'View History' for customer")
+                
+                # Close the modal
+                print("  Closing customer visit history modal...")
+                try:
+                    # Wait for modal to appear first
+                    self.settle(1.0)
+                    
+                    # Try multiple ways to close the modal
+                    modal_closed = False
+                    
+                    # Method 1: Find close button by X button (X icon)
+                    try:
+                        close_button = self.wait.until(
+                            EC.element_to_be_clickable((By.XPATH, "//button[.//*[local-name()='svg' and contains(@class, 'w-5')] and contains(@class, 'h-5')] | //button[contains(@class, 'text-gray-400')]"))
+                        )
+                        self.scroll_to_element(close_button)
+                        self.settle(0.2)
+                        try:
+                            close_button.click()
+                        except Exception:
+                            self.driver.execute_script("arguments[0].click();", close_button)
+                        self.settle(1.0)
+                        modal_closed = True
+                        print("  ✓ Closed customer visit history modal")
+                    except Exception:
+                        pass
+                    
+                    # Method 2: Click outside modal (on backdrop) if close button didn't work
+                    if not modal_closed:
+                        try:
+                            # Click on the modal backdrop/overlay
+                            backdrop = self.driver.find_element(By.XPATH, "//div[contains(@class, 'fixed') and contains(@class, 'inset-0') and contains(@class, 'bg-black')]")
+                            self.driver.execute_script("arguments[0].click();", backdrop)
+                            self.settle(1.0)
+                            modal_closed = True
+                            print("  ✓ Closed modal by clicking backdrop")
+                        except Exception:
+                            pass
+                    
+                    # Method 3: Press Escape key
+                    if not modal_closed:
+                        try:
+                            from selenium.webdriver.common.keys import Keys
+                            self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+                            self.settle(1.0)
+                            modal_closed = True
+                            print("  ✓ Closed modal with Escape key")
+                        except Exception:
+                            pass
+                    
+                    # Wait a bit more to ensure modal is fully closed
+                    self.settle(1.0)
+                    
+                    # Verify modal is closed by checking if it's not visible
+                    try:
+                        modal_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'fixed') and contains(@class, 'inset-0')]")
+                        if modal_elements:
+                            # If modal still exists, try clicking outside one more time
+                            self.driver.execute_script("document.body.click();")
+                            self.settle(1.0)
+                    except Exception:
+                        pass
+                        
+                except Exception as e:
+                    print(f"  ⚠ Error closing modal: {e}")
+                    # Try to continue anyway - might already be closed
+                    self.settle(2.0)
+            except Exception as e:
+                print(f"  ⚠ Error clicking View History: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            # Navigate to Order History tab
+            print("\nNavigating to Order History tab...")
+            try:
+                order_history_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Order History')]"))
+                )
+                self.scroll_to_element(order_history_tab)
+                self.settle(0.2)
+                order_history_tab.click()
+                self.settle(3.0)
+                print("  ✓ Clicked Order History tab")
+                
+                # Check if orders are loaded
+                try:
+                    orders_loaded = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'card') or contains(@class, 'Card')]")
+                    if orders_loaded:
+                        print(f"  ✓ Found {len(orders_loaded)} order(s) loaded")
+                    else:
+                        print("  ℹ No orders found (may be empty)")
+                except Exception:
+                    print("  ℹ Could not verify if orders are loaded")
+            except Exception as e:
+                print(f"  ⚠ Error navigating to Order History: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            # Navigate to Reviews tab
+            print("\nNavigating to Reviews tab...")
+            try:
+                reviews_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Reviews')]"))
+                )
+                self.scroll_to_element(reviews_tab)
+                self.settle(0.2)
+                reviews_tab.click()
+                self.settle(2.0)
+                print("  ✓ Clicked Reviews tab")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Reviews tab: {e}")
+            
+            # Click Salon Reviews sub-tab
+            print("\nClicking Salon Reviews sub-tab...")
+            try:
+                salon_reviews_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "reviews-subtab-salon"))
+                )
+                self.scroll_to_element(salon_reviews_tab)
+                self.settle(0.2)
+                salon_reviews_tab.click()
+                self.settle(2.0)
+                print("  ✓ Clicked Salon Reviews sub-tab")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Salon Reviews sub-tab: {e}")
+            
+            # Reply to a salon review
+            print("\nLooking for a salon review without a reply...")
+            try:
+                self.settle(1.0)
+                reply_button = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[starts-with(@id, 'salon-reply-button-')]"))
+                )
+                review_id = reply_button.get_attribute("id").replace("salon-reply-button-", "")
+                print(f"  ✓ Found a review without a reply (Review ID: {review_id})")
+                
+                self.scroll_to_element(reply_button)
+                self.settle(0.2)
+                reply_button.click()
+                self.settle(0.5)
+                print("  ✓ Clicked Reply button")
+                
+                reply_textarea = self.wait.until(
+                    EC.presence_of_element_located((By.ID, f"salon-reply-textarea-{review_id}"))
+                )
+                self.scroll_to_element(reply_textarea)
+                self.settle(0.2)
+                reply_textarea.click()
+                self.settle(0.1)
+                reply_textarea.clear()
+                reply_text = "Thank you for your feedback! We're glad you enjoyed your visit."
+                reply_textarea.send_keys(reply_text)
+                self.settle(0.3)
+                print(f"  ✓ Filled reply textarea with: {reply_text}")
+                
+                send_reply_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, f"salon-send-reply-button-{review_id}"))
+                )
+                self.scroll_to_element(send_reply_button)
+                self.settle(0.2)
+                send_reply_button.click()
+                self.settle(2.0)
+                print("  ✓ Clicked Send Reply button")
+                
+                self.settle(1.0)  # Wait for toast
+                
+                # Now find the same review (which should now have a reply) and edit it
+                print("\nLooking for the review with the reply we just created to edit...")
+                self.settle(1.0)
+                edit_button = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, f"//button[starts-with(@id, 'salon-edit-reply-button-')]"))
+                )
+                reply_id_to_edit = edit_button.get_attribute("id").replace("salon-edit-reply-button-", "")
+                print(f"  ✓ Found review with reply (Reply ID: {reply_id_to_edit})")
+                
+                self.scroll_to_element(edit_button)
+                self.settle(0.2)
+                edit_button.click()
+                self.settle(0.5)
+                print("  ✓ Clicked Edit button")
+                
+                edit_textarea = self.wait.until(
+                    EC.presence_of_element_located((By.ID, f"salon-edit-reply-textarea-{reply_id_to_edit}"))
+                )
+                self.scroll_to_element(edit_textarea)
+                self.settle(0.2)
+                edit_textarea.click()
+                self.settle(0.1)
+                edit_textarea.clear()
+                updated_reply_text = "Thank you so much for your kind words! We really appreciate your feedback and look forward to serving you again."
+                edit_textarea.send_keys(updated_reply_text)
+                self.settle(0.3)
+                print(f"  ✓ Updated reply text to: {updated_reply_text}")
+                
+                update_reply_button = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, f"salon-update-reply-button-{reply_id_to_edit}"))
+                )
+                self.scroll_to_element(update_reply_button)
+                self.settle(0.2)
+                update_reply_button.click()
+                self.settle(2.0)
+                print("  ✓ Clicked Update Reply button")
+                
+                self.settle(1.0)  # Wait for toast
+                
+                print("\n" + "="*70)
+                print("SALON REVIEWS REPLY AND EDIT FLOW COMPLETED")
+                print("="*70)
+            except Exception as e:
+                print(f"  ⚠ Error in Salon Reviews reply/edit flow: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            # Click Staff Reviews sub-tab
+            print("\nClicking Staff Reviews sub-tab...")
+            try:
+                staff_reviews_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "reviews-subtab-staff"))
+                )
+                self.scroll_to_element(staff_reviews_tab)
+                self.settle(0.2)
+                staff_reviews_tab.click()
+                self.settle(2.0)
+                print("  ✓ Clicked Staff Reviews sub-tab")
+                
+                # Check if staff reviews are loaded
+                try:
+                    staff_reviews_loaded = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'card') or contains(@class, 'Card')]")
+                    if staff_reviews_loaded:
+                        print(f"  ✓ Found {len(staff_reviews_loaded)} staff review(s) loaded")
+                    else:
+                        print("  ℹ No staff reviews found (may be empty)")
+                except Exception:
+                    print("  ℹ Could not verify if staff reviews are loaded")
+            except Exception as e:
+                print(f"  ⚠ Error clicking Staff Reviews sub-tab: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            # Navigate to Revenue tab
+            print("\nNavigating to Revenue tab...")
+            try:
+                revenue_tab = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Revenue')]"))
+                )
+                self.scroll_to_element(revenue_tab)
+                self.settle(0.2)
+                revenue_tab.click()
+                self.settle(3.0)
+                print("  ✓ Clicked Revenue tab")
+                
+                # Scroll on the revenue page to see all data
+                print("  Scrolling on revenue page...")
+                try:
+                    self.scroll_through_page(step=None, pause=0.5)
+                    print("  ✓ Scrolled on revenue page")
+                except Exception as e:
+                    print(f"  ⚠ Error scrolling: {e}")
+                
+                # Check if revenue data is loaded
+                try:
+                    revenue_data_loaded = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'card') or contains(@class, 'Card')] | //div[contains(@class, 'text-4xl')]")
+                    if revenue_data_loaded:
+                        print(f"  ✓ Found revenue data loaded ({len(revenue_data_loaded)} elements)")
+                    else:
+                        print("  ℹ No revenue data found (may be empty)")
+                except Exception:
+                    print("  ℹ Could not verify if revenue data is loaded")
+            except Exception as e:
+                print(f"  ⚠ Error navigating to Revenue tab: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            print("\n" + "="*70)
+            print("OWNER DASHBOARD FLOW COMPLETED")
+            print("="*70)
+            
+            return True
+        except Exception as e:
+            print(f" Stage owner_review_replies failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def stage_admin_analytics(self):
+        """Admin rechecks the analytics tabs for the data created by the run"""
+        try:
+            # Wait for admin dashboard to load
+            self.settle(2.0)
+            current_url = self.driver.current_url
+            print(f"  Current URL: {current_url}")
+            
+            # Navigate to admin dashboard if not already there
+            if "/admin" not in current_url and "/dashboard" not in current_url:
+                self.navigate_and_scroll(f"{BASE_URL}/dashboard?tab=user-analytics")
+                self.settle(2.0)
+            
+            # Go through admin tabs and slowly scroll through them
+            print("\n" + "="*70)
+            print("CHECKING ADMIN TABS FOR UPDATED DATA")
+            print("="*70)
+            
+            admin_tabs = [
+                ("Loyalty Monitoring", "/admin/loyalty-monitoring"),
+                ("User Analytics", "/dashboard?tab=user-analytics"),
+                ("Business Insights", "/dashboard?tab=business-insights"),
+                ("Revenue Tracking", "/dashboard?tab=revenue-analytics")
+            ]
+            
+            for tab_name, tab_path in admin_tabs:
+                print(f"\n  Checking {tab_name} tab...")
+                try:
+                    # Try to click the tab button first
+                    if tab_name == "Loyalty Monitoring":
+                        tab_clicked = self.safe_click(
+                            By.XPATH,
+                            "//button[contains(text(), 'Loyalty Monitoring')] | //a[contains(text(), 'Loyalty Monitoring')]",
+                            f"{tab_name} tab"
+                        )
+                    elif tab_name == "User Analytics":
+                        tab_clicked = self.safe_click(
+                            By.XPATH,
+                            "//button[contains(text(), 'User Analytics')] | //a[contains(text(), 'User Analytics')]",
+                            f"{tab_name} tab"
+                        )
+                    elif tab_name == "Business Insights":
+                        tab_clicked = self.safe_click(
+                            By.XPATH,
+                            "//button[contains(text(), 'Business Insights')] | //a[contains(text(), 'Business Insights')]",
+                            f"{tab_name} tab"
+                        )
+                    elif tab_name == "Revenue Tracking":
+                        tab_clicked = self.safe_click(
+                            By.XPATH,
+                            "//button[contains(text(), 'Revenue Tracking')] | //button[contains(text(), 'Revenue Analytics')] | //a[contains(text(), 'Revenue')]",
+                            f"{tab_name} tab"
+                        )
+                    
+                    # Wait a moment after clicking the tab
+                    if tab_clicked:
+                        self.settle(0.5)  # Small wait for tab click to register
+                    
+                    if not tab_clicked:
+                        # Fallback to direct navigation
+                        self.navigate_and_scroll(f"{BASE_URL}{tab_path}")
+                        self.settle(0.5)  # Small wait after navigation
+                    
+                    # Wait for page to load - wait for content elements to be present
+                    print(f"    Waiting for {tab_name} page to load...")
+                    try:
+                        # Wait for common data elements or page structure to appear
+                        # More specific waits for admin pages
+                        self.wait.until(
+                            EC.any_of(
+                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'card')] | //div[contains(@class, 'Card')]")),
+                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'chart')] | //div[contains(@class, 'Chart')] | //canvas")),
+                                EC.presence_of_element_located((By.XPATH, "//table | //tbody | //tr")),
+                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'text-4xl')] | //div[contains(@class, 'text-3xl')] | //div[contains(@class, 'text-2xl')]")),
+                                EC.presence_of_element_located((By.XPATH, "//h1 | //h2 | //h3 | //h4")),
+                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'grid')] | //div[contains(@class, 'flex')]")),
+                                EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Total')] | //div[contains(text(), 'Users')] | //div[contains(text(), 'Revenue')]"))
+                            )
+                        )
+                        self.settle(0.5)  # Additional small wait for any animations
+                        print(f"    ✓ {tab_name} page loaded")
+                    except Exception as e:
+                        print(f"    ⚠ Timeout waiting for {tab_name} to load: {e}")
+                        self.settle(2.0)  # Fallback wait
+                    
+                    # Slowly scroll through the page to check updated data
+                    print(f"    Slowly scrolling through {tab_name}...")
+                    try:
+                        self.scroll_through_page(step=0.5, pause=0.8, scroll_back=True)
+                        
+                        print(f"    ✓ Finished scrolling through {tab_name}")
+                    except Exception as e:
+                        print(f"    ⚠ Error scrolling through {tab_name}: {e}")
+                    
+                    # Check if data is loaded (look for common data elements)
+                    try:
+                        data_elements = self.driver.find_elements(By.XPATH, 
+                            "//div[contains(@class, 'card')] | "
+                            "//div[contains(@class, 'Card')] | "
+                            "//div[contains(@class, 'chart')] | "
+                            "//div[contains(@class, 'Chart')] | "
+                            "//table | "
+                            "//div[contains(@class, 'text-4xl')] | "
+                            "//div[contains(@class, 'text-3xl')]"
+                        )
+                        if data_elements:
+                            print(f"    ✓ Found {len(data_elements)} data element(s) on {tab_name} page")
+                        else:
+                            print(f"    ℹ No data elements found on {tab_name} page (may be empty)")
+                    except Exception:
+                        print(f"    ℹ Could not verify data elements on {tab_name} page")
+                        
+                except Exception as e:
+                    print(f"    ⚠ Error checking {tab_name} tab: {e}")
+                    import traceback
+                    traceback.print_exc()
+            
+            print("\n" + "="*70)
+            print("ADMIN TABS DATA CHECK COMPLETED")
+            print("="*70)
+        
+            return True
+        except Exception as e:
+            print(f" Stage admin_analytics failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    
+    def run_test(self, test, own_deadline=True):
+        """Run a single test method, record its result and return True if it passed.
+        
+        own_deadline=False when the caller already runs it under its deadline (run_stage).
+        """
+        test_start = time.time()
+        passed = False
+        deadline = self.start_deadline(test.__name__) if own_deadline else None
+        if self.tracer:
+            self.tracer.begin(self.name, test.__name__, "test", {"role": self.current_role})
+        fault_profile = self.start_fault_profile(test.__name__)
+        try:
+            # Check if driver is still valid before each test
+            if not self.driver or not DriverPool.is_alive(self.driver):
+                print("Browser session lost, switching to a fresh browser...")
+                self.replace_driver()
+            
+            # Run test
+            result = test()
+            self.check_deadline()
+            
+            if result:
+                passed = True
+                self.test_results.append((test.__name__, "PASSED"))
+            else:
+                self.test_results.append((test.__name__, "FAILED"))
+        except KeyboardInterrupt:
+            print(f"\nWARNING: Test interrupted: {test.__name__}")
+            raise
+        except StageTimeout as e:
+            self.test_results.append((test.__name__, f"TIMED OUT: {e}"))
+            print(f"Test {test.__name__} timed out: {e}")
+            # The watchdog closed the browser; the next test or stage starts a fresh one
+            self.role_drivers.pop(self.current_role, None)
+            self.driver = None
+            self.wait = None
+        except (TimeoutException, WebDriverException) as e:
+            error_msg = str(e)[:80]
+            self.test_results.append((test.__name__, f"ERROR: {error_msg}"))
+            print(f"Test {test.__name__} error: {error_msg}")
+            # Try to recover browser if session lost
+            try:
+                if "invalid session" in str(e).lower() or "disconnected" in str(e).lower():
+                    print("  Browser session lost, will restart for next test...")
+                    DriverPool.discard(self.driver)
+                    self.role_drivers.pop(self.current_role, None)
+                    self.driver = None
+                    self.wait = None
+            except Exception:
+                pass
+        except Exception as e:
+            error_msg = str(e)[:80]
+            self.test_results.append((test.__name__, f"ERROR: {error_msg}"))
+            print(f"Test {test.__name__} crashed: {error_msg}")
+        finally:
+            # Cleanup between tests
+            try:
+                if self.driver:
+                    # Dismiss any modals
+                    try:
+                        cancel_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Cancel')]")
+                        if cancel_buttons:
+                            self.driver.execute_script("arguments[0].click();", cancel_buttons[0])
+                            self.settle(0.1)
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+            self.stop_deadline(deadline)
+            if self.test_results:
+                self.durations.append((test.__name__, time.time() - test_start, self.test_results[-1][1]))
+            if fault_profile:
+                self.finish_fault_profile(test.__name__, fault_profile, test_start)
+            self.collect_vitals(test.__name__)
+            self.collect_api_timings()
+            if self.tracer:
+                self.tracer.end(self.name, test.__name__, "test", {"result": self.test_results[-1][1] if self.test_results else None})
+        return passed
+    
+    def start_deadline(self, name):
+        """Start the watchdog for test or stage `name` (None when deadlines are disabled)"""
+        seconds = STAGE_DEADLINES.get(name, self.options.deadline)
+        if not seconds:
+            return None
+        deadline = Deadline(name, seconds, self.deadline_expired)
+        self.deadlines.append(deadline)
+        deadline.timer.start()
+        return deadline
+    
+    def stop_deadline(self, deadline):
+        if deadline:
+            deadline.timer.cancel()
+            self.deadlines.remove(deadline)
+    
+    def check_deadline(self):
+        """Raise StageTimeout once the running test or stage (or one it is part of) is past its deadline"""
+        for deadline in self.deadlines:
+            if deadline.expired:
+                raise StageTimeout(f"{deadline.name} exceeded its {deadline.seconds}s deadline")
+    
+    def deadline_expired(self, deadline):
+        """Watchdog thread: snapshot the stuck test, then close its browser to abort the command it is blocked in"""
+        print(f"⚠ {deadline.name} exceeded its {deadline.seconds}s deadline, aborting")
+        driver = self.driver
+        snapshot = threading.Thread(target=self.save_deadline_snapshot, args=(deadline, driver), daemon=True)
+        snapshot.start()
+        snapshot.join(DEADLINE_SNAPSHOT_TIMEOUT)
+        if driver:
+            DriverPool.discard(driver)
+    
+    def save_deadline_snapshot(self, deadline, driver):
+        """Write the stuck thread's stack, the page URL and title, and a screenshot to DEADLINE_SNAPSHOT_DIR"""
+        base = os.path.join(DEADLINE_SNAPSHOT_DIR, f"{deadline.name}_{self.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        frame = sys._current_frames().get(deadline.thread_id)
+        snapshot = {
+            "name": deadline.name,
+            "deadline_seconds": deadline.seconds,
+            "worker": self.name,
+            "role": self.current_role,
+            "stack": traceback.format_stack(frame) if frame else [],
+        }
+        try:
+            os.makedirs(DEADLINE_SNAPSHOT_DIR, exist_ok=True)
+            if driver:
+                try:
+                    snapshot["url"] = driver.current_url
+                    snapshot["title"] = driver.title
+                    if driver.save_screenshot(base + ".png"):
+                        snapshot["screenshot"] = base + ".png"
+                except Exception as e:
+                    snapshot["browser_error"] = str(e)[:200]
+            with open(base + ".json", "w") as f:
+                json.dump(snapshot, f, indent=2)
+            print(f"  Saved deadline snapshot to {base}.json")
+        except Exception as e:
+            print(f"  ⚠ Could not save deadline snapshot: {e}")
+    
+    def collect_api_timings(self, driver=None):
+        """Turn the Network events in the driver's performance log into ApiCall entries for BACKEND_URL"""
+        driver = driver or self.driver
+        if not self.options.api_stats or not driver:
+            return
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            key = (id(driver), params.get("requestId"))
+            if method == "Network.requestWillBeSent":
+                if params["request"]["url"].startswith(BACKEND_URL) and params["request"]["method"] != "OPTIONS":
+                    self.api_in_flight[key] = dict(params, status=None)
+            elif method == "Network.responseReceived" and key in self.api_in_flight:
+                self.api_in_flight[key]["status"] = params["response"]["status"]
+            elif method in ("Network.loadingFinished", "Network.loadingFailed") and key in self.api_in_flight:
+                sent = self.api_in_flight.pop(key)
+                path = sent["request"]["url"][len(BACKEND_URL):].split("?", 1)[0] or "/"
+                self.api_calls.append(ApiCall(
+                    sent["request"]["method"],
+                    route_template(path),
+                    sent["status"] if method == "Network.loadingFinished" else "failed",
+                    params["timestamp"] - sent["timestamp"],
+                    params.get("encodedDataLength", 0),
+                ))
+    
+    def api_latency_summary(self):
+        """Count, errors, p50/p95/p99/max latency and average size per "METHOD /route" endpoint"""
+        endpoints = {}
+        for call in self.api_calls:
+            endpoints.setdefault(f"{call.method} {call.route}", []).append(call)
+        summary = {}
+        for endpoint, calls in endpoints.items():
+            latencies = [call.latency * 1000 for call in calls]
+            sizes = [call.size for call in calls]
+            summary[endpoint] = {
+                "count": len(calls),
+                "errors": sum(1 for call in calls if call.status == "failed" or (call.status or 0) >= 400),
+                "p50_ms": round(percentile(latencies, 0.5), 1),
+                "p95_ms": round(percentile(latencies, 0.95), 1),
+                "p99_ms": round(percentile(latencies, 0.99), 1),
+                "max_ms": round(max(latencies), 1),
+                "avg_bytes": round(sum(sizes) / len(sizes)),
+            }
+        return summary
+    
+    def report_api_latency(self):
+        """Print and save count, p50/p95/p99/max latency and response size per backend endpoint"""
+        for suite in [self] + self.workers:
+            for driver in suite.role_drivers.values():
+                suite.collect_api_timings(driver)
+        summary = self.api_latency_summary()
+        try:
+            with open(API_LATENCY_REPORT, "w") as f:
+                json.dump({"saved_at": datetime.now().isoformat(), "backend": BACKEND_URL, "endpoints": summary}, f, indent=2)
+        except Exception as e:
+            print(f"Could not write {API_LATENCY_REPORT}: {e}")
+        print("\nBACKEND API LATENCY (slowest p95 first)")
+        print(f"  {'endpoint':<55} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'bytes':>8}")
+        for endpoint, stats in sorted(summary.items(), key=lambda item: -item[1]["p95_ms"]):
+            print(f"  {endpoint:<55} {stats['count']:>6} {stats['p50_ms']:>6.0f}ms {stats['p95_ms']:>6.0f}ms "
+                  f"{stats['p99_ms']:>6.0f}ms {stats['max_ms']:>6.0f}ms {stats['avg_bytes']:>8}")
+        print(f"  {len(self.api_calls)} calls to {len(summary)} endpoints, saved to {API_LATENCY_REPORT}")
+    
+    def collect_vitals(self, test_name, driver=None, final=False):
+        """Move the route records gathered by WEB_VITALS_SCRIPT into self.vitals.
+        
+        final=True also closes the record of the route currently on screen.
+        """
+        driver = driver or self.driver
+        if not self.options.web_vitals or not driver:
+            return
+        try:
+            records = driver.execute_script(
+                "return window.__strandsVitals ? window.__strandsVitals.drain(arguments[0]) : [];", final)
+        except Exception:
+            return
+        for record in records or []:
+            record["test"] = test_name
+            record["role"] = self.current_role
+            self.vitals.append(record)
+    
+    def vitals_summary(self):
+        """Number of samples and p50/p75/max of each metric per route template"""
+        routes = {}
+        for record in self.vitals:
+            routes.setdefault(route_template(record["route"]), []).append(record)
+        summary = {}
+        for route, records in sorted(routes.items()):
+            summary[route] = {"samples": len(records)}
+            for metric in VITALS_METRICS:
+                values = [record[metric] for record in records if record.get(metric) is not None]
+                if values:
+                    summary[route][metric] = {
+                        "p50": round(percentile(values, 0.5), 3),
+                        "p75": round(percentile(values, 0.75), 3),
+                        "max": round(max(values), 3),
+                    }
+        return summary
+    
+    def save_vitals_report(self):
+        """Write WEB_VITALS_REPORT: p50/p75/max per route template, plus every raw record"""
+        for suite in [self] + self.workers:
+            for driver in suite.role_drivers.values():
+                suite.collect_vitals("teardown", driver, final=True)
+        summary = self.vitals_summary()
+        try:
+            with open(WEB_VITALS_REPORT, "w") as f:
+                json.dump({"saved_at": datetime.now().isoformat(), "routes": summary, "records": self.vitals}, f, indent=2)
+            print(f"\nWeb vitals for {len(summary)} routes written to {WEB_VITALS_REPORT}")
+        except Exception as e:
+            print(f"Could not write {WEB_VITALS_REPORT}: {e}")
+        for route, stats in summary.items():
+            lcp = stats.get("lcp", stats.get("render_ms"))
+            timing = f"p75 {'LCP' if 'lcp' in stats else 'render'} {lcp['p75']:.0f}ms" if lcp else "no paint timing"
+            print(f"  {route}: {stats['samples']} visit(s), {timing}, max CLS {stats['cls']['max']:.3f}")
+    
+    def fault_proxy(self, command, body=None):
+        """Call a fault_proxy.py control endpoint and return its JSON reply (None when no proxy answers)"""
+        import urllib.request
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(f"{FAULT_PROXY_URL}/{command}", data=data, method="POST" if data else "GET",
+                                     headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(req, timeout=2) as response:
+                return json.load(response)
+        except Exception as e:
+            print(f"  ⚠ Fault proxy not reachable at {FAULT_PROXY_URL}: {e}")
+            return None
+    
+    def start_fault_profile(self, test_name):
+        """Switch the proxy to the --fault-profile for this stage; returns (profile, stats before, waited before)"""
+        stage_name = test_name[len("stage_"):] if test_name.startswith("stage_") else test_name
+        if not self.options.fault_profile or stage_name not in (stage.name for stage in ALL_STAGES):
+            return None
+        profiles = dict(spec.split("=", 1) if "=" in spec else ("*", spec) for spec in self.options.fault_profile)
+        profile = profiles.get(stage_name, profiles.get("*", "none"))
+        stats = self.fault_proxy("profile", {"profile": profile})
+        if stats is None:
+            return None
+        print(f"  ℹ Backend fault profile for {stage_name}: {profile}")
+        return profile, stats, self.waited
+    
+    def finish_fault_profile(self, test_name, fault_profile, test_start):
+        profile, stats_before, waited_before = fault_profile
+        stats_after = self.fault_proxy("stats") or stats_before
+        self.fault_results.append({
+            "stage": test_name,
+            "profile": profile,
+            "result": self.test_results[-1][1] if self.test_results else "UNKNOWN",
+            "duration": round(time.time() - test_start, 2),
+            "waited": round(self.waited - waited_before, 2),
+            "proxy": {name: round(stats_after[name] - stats_before[name], 2)
+                      for name in ("requests", "errors", "timeouts", "delay_seconds")},
+        })
+    
+    def save_fault_report(self):
+        """Write FAULT_REPORT_FILE and print pass rate and timings per fault profile"""
+        try:
+            with open(FAULT_REPORT_FILE, "w") as f:
+                json.dump({"saved_at": datetime.now().isoformat(), "stages": self.fault_results}, f, indent=2)
+            print(f"\nFault injection report written to {FAULT_REPORT_FILE}")
+        except Exception as e:
+            print(f"Could not write {FAULT_REPORT_FILE}: {e}")
+        for profile in sorted({entry["profile"] for entry in self.fault_results}):
+            entries = [entry for entry in self.fault_results if entry["profile"] == profile]
+            passed = sum(1 for entry in entries if entry["result"] == "PASSED")
+            duration = sum(entry["duration"] for entry in entries)
+            waited = sum(entry["waited"] for entry in entries)
+            print(f"  {profile}: {passed}/{len(entries)} stages passed, {duration:.1f}s total, {waited:.1f}s waiting on the UI")
+    
+    def spawn_worker(self, name):
+        """Create an isolated suite (own Chrome driver) sharing this suite's options"""
+        worker = StrandsTestSuite(options=self.options, install_signal_handlers=False)
+        worker.name = name
+        worker.sessions = self.sessions
+        worker.auth_tokens = self.auth_tokens
+        worker.driver_pool = self.driver_pool
+        worker.fault_results = self.fault_results
+        worker.vitals = self.vitals
+        worker.api_calls = self.api_calls
+        worker.interactions = self.interactions
+        worker.tracer = self.tracer
+        worker.command_profiler = self.command_profiler
+        worker.durations = self.durations
+        self.workers.append(worker)
+        return worker
+    
+    def current_session_email(self):
+        """Email of the user the app currently has signed in (None when signed out)"""
+        try:
+            return self.driver.execute_script(
+                "var data = window.localStorage.getItem('user_data');"
+                "return data ? JSON.parse(data).email : null;"
+            )
+        except Exception:
+            return None
+    
+    def save_session(self, email):
+        """Remember the signed-in browser state for `email` so it can be restored without the login form"""
+        try:
+            self.sessions[email] = {
+                "cookies": self.driver.get_cookies(),
+                "local_storage": self.driver.execute_script(
+                    "var items = {};"
+                    "for (var i = 0; i < window.localStorage.length; i++) {"
+                    "  var key = window.localStorage.key(i);"
+                    "  items[key] = window.localStorage.getItem(key);"
+                    "}"
+                    "return items;"
+                ),
+            }
+        except Exception as e:
+            print(f"Could not save session for {email}: {e}")
+    
+    @traced("auth")
+    def restore_session(self, email):
+        """Load a saved session for `email` into the browser and return True if the app picked it up"""
+        session = self.sessions.get(email)
+        if not session:
+            return False
+        try:
+            # Cookies and localStorage can only be set for the app origin once a page from it is loaded
+            if not self.driver.current_url.startswith(BASE_URL):
+                self.driver.get(BASE_URL)
+            self.driver.delete_all_cookies()
+            for cookie in session["cookies"]:
+                cookie = {key: value for key, value in cookie.items() if key in ("name", "value", "path", "secure", "httpOnly", "expiry")}
+                self.driver.add_cookie(cookie)
+            self.driver.execute_script(
+                "window.localStorage.clear();"
+                "var items = arguments[0];"
+                "for (var key in items) { window.localStorage.setItem(key, items[key]); }",
+                session["local_storage"],
+            )
+            # Reload so the auth context initialises from the restored storage
+            self.navigate_and_scroll(f"{BASE_URL}/dashboard", reload=True)
+            if self.current_session_email() == email:
+                print(f"Restored saved session for {email}")
+                return True
+        except Exception as e:
+            print(f"Could not restore session for {email}: {e}")
+        return False
+    
+    def save_checkpoint(self, stage_name, result, state=None):
+        """Write stage results, shared state and saved sessions to CHECKPOINT_FILE"""
+        self.checkpoint_results[stage_name] = result
+        if state is None:
+            state = {attr: getattr(self, attr) for attr in STATE_ATTRS}
+        checkpoint = {
+            "saved_at": datetime.now().isoformat(),
+            "results": self.checkpoint_results,
+            "state": state,
+            "sessions": self.sessions,
+        }
+        try:
+            tmp_path = self.options.checkpoint + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(tmp_path, self.options.checkpoint)
+        except Exception as e:
+            print(f"Could not write checkpoint {self.options.checkpoint}: {e}")
+    
+    def load_checkpoint(self, resume_from):
+        """Restore state from CHECKPOINT_FILE and mark every stage before `resume_from` as restored"""
+        try:
+            with open(self.options.checkpoint) as f:
+                checkpoint = json.load(f)
+        except Exception as e:
+            print(f"Cannot resume: could not read checkpoint {self.options.checkpoint}: {e}")
+            return False
+        names = [stage.name for stage in ALL_STAGES]
+        restored = names[:names.index(resume_from)]
+        results = checkpoint.get("results", {})
+        not_passed = [name for name in restored if results.get(name) not in COMPLETED_RESULTS]
+        if not_passed:
+            print(f"WARNING: checkpoint has no passing result for: {', '.join(not_passed)}")
+        for attr in STATE_ATTRS:
+            if attr in checkpoint.get("state", {}):
+                setattr(self, attr, checkpoint["state"][attr])
+        self.sessions.update(checkpoint.get("sessions", {}))
+        self.checkpoint_results = {name: results[name] for name in restored if name in results}
+        self.restored_stages = set(restored)
+        print(f"Resuming from stage {resume_from} (checkpoint saved {checkpoint.get('saved_at', 'unknown')}, {len(restored)} stages restored)")
+        return True
+    
+    def load_fixtures(self, resume_from):
+        """Seed owner, salon and stylist through the API and mark every stage before `resume_from` as restored"""
+        print("Seeding owner, salon and stylist through the API...")
+        try:
+            world = Fixtures(BACKEND_URL).seed_world()
+        except Exception as e:
+            print(f"Cannot resume: could not seed fixtures: {e}")
+            return False
+        self.owner_email = world.owner.email
+        self.owner_password = world.owner.password
+        self.stylist_email = world.stylist.email
+        self.test_salon_id = str(world.salon_id)
+        # Fixture logins double as cached --fast-auth tokens
+        for account in (world.admin, world.owner, world.stylist):
+            self.auth_tokens[account.email] = {"token": account.token, "user_data": account.user_data}
+        names = [stage.name for stage in ALL_STAGES]
+        restored = names[:names.index(resume_from)]
+        unseeded = [attr for stage in ALL_STAGES if stage.name in restored for attr in stage.provides if attr not in SEEDED_ATTRS]
+        if unseeded:
+            print(f"WARNING: fixtures do not provide {', '.join(unseeded)}; stages that need them will be skipped")
+        self.restored_stages = set(restored)
+        print(f"Resuming from stage {resume_from} with seeded salon {world.salon_id} ({len(restored)} stages restored)")
+        return True
+    
+    def role_credentials(self, role):
+        """(email, password) for a suite role"""
+        if role == "admin":
+            return "admin@strands.com", "test123"
+        if role == "owner":
+            return self.owner_email, self.owner_password
+        if role == "stylist":
+            return self.stylist_email, "test123"
+        if role == "user":
+            return self.user_email, self.user_password
+        raise ValueError(f"Unknown role: {role}")
+    
+    @traced("auth")
+    def ensure_role(self, role):
+        """Make sure the browser is signed in as `role` (or signed out for "guest") before a stage"""
+        session_email = self.current_session_email()
+        if role == "guest":
+            if session_email:
+                self.reset_browser()
+            return True
+        email, password = self.role_credentials(role)
+        if session_email == email:
+            return True
+        if session_email:
+            self.reset_browser()
+        if self.restore_session(email):
+            return True
+        return self.login(email, password, role.capitalize())
+    
+    @traced("auth")
+    def reset_browser(self):
+        """Sign out between stages by wiping cookies and storage instead of clicking through logout"""
+        if not DriverPool.reset(self.driver):
+            self.logout()
+            return
+        self.navigate_and_scroll(BASE_URL, reload=True)
+    
+    @contextmanager
+    def as_role(self, role):
+        """Run the body on the persistent browser signed in as `role`, then switch back.
+        
+        Each role keeps its own Chrome session for the whole run, so changing roles
+        is a driver switch instead of a logout and a fresh login.
+        """
+        previous_role = self.current_role
+        driver = self.role_drivers.get(role)
+        if driver is None:
+            print(f"Opening browser for {role}...")
+            driver = self.driver_pool.acquire()
+            self.role_drivers[role] = driver
+        self.driver = driver
+        self.wait = WebDriverWait(driver, WAIT_TIMEOUT)
+        self.current_role = role
+        try:
+            signed_in_as = self.current_session_email()
+            if not self.ensure_role(role):
+                raise Exception(f"Could not sign in as {role}")
+            # Start where a fresh login would land (the role's dashboard)
+            if role != "guest" and signed_in_as == self.current_session_email():
+                self.navigate_and_scroll(f"{BASE_URL}/dashboard")
+            yield driver
+        finally:
+            self.current_role = previous_role
+            self.driver = self.role_drivers.get(previous_role)
+            self.wait = WebDriverWait(self.driver, WAIT_TIMEOUT) if self.driver else None
+    
+    def stage_method(self, stage):
+        if stage.name.startswith("test_"):
+            return getattr(self, stage.name)
+        return getattr(self, f"stage_{stage.name}")
+    
+    def run_stage(self, stage, state):
+        """Run one stage on this suite's driver and return (result, provided state)"""
+        if isinstance(sys.stdout, WorkerOutput):
+            sys.stdout.set_worker(self.name)
+        if self.tracer:
+            self.tracer.begin(self.name, stage.name, "stage", {"role": stage.role})
+        try:
+            for attr in STATE_ATTRS:
+                setattr(self, attr, state.get(attr))
+            if not self.driver:
+                self.setup(check_backend=False)
+            print("\n" + "-"*70)
+            print(f"STAGE: {stage.name}")
+            print("-"*70)
+            method = self.stage_method(stage)
+            # Started before the role switch, so a hang while signing in counts against the stage too
+            deadline = self.start_deadline(method.__name__)
+            try:
+                self.check_deadline()
+                with self.as_role(stage.role):
+                    self.run_test(method, own_deadline=False)
+            except StageTimeout as e:
+                self.test_results.append((method.__name__, f"TIMED OUT: {e}"))
+                print(f"Stage {stage.name} timed out: {e}")
+                # The watchdog closed the browser the role was being signed in on
+                if self.role_drivers.pop(stage.role, None) is self.driver:
+                    self.driver = None
+                    self.wait = None
+            except Exception as e:
+                self.test_results.append((method.__name__, f"FAILED: {str(e)[:80]}"))
+            finally:
+                self.stop_deadline(deadline)
+            return self.test_results[-1][1], {attr: getattr(self, attr) for attr in stage.provides}
+        finally:
+            if self.tracer:
+                self.tracer.end(self.name, stage.name, "stage")
+            if isinstance(sys.stdout, WorkerOutput):
+                sys.stdout.set_worker(None)
+    
+    def run_stages(self, stages, workers=None):
+        """Run stages on the given worker suites, starting each as soon as its dependencies allow"""
+        workers = workers or [self]
+        parallel = len(workers) > 1
+        names = {stage.name for stage in stages}
+        state = {attr: getattr(self, attr) for attr in STATE_ATTRS}
+        results = {}
+        pending = list(stages)
+        idle_workers = list(workers)
+        running = {}
+        
+        def finish(stage, result, provided):
+            results[stage.name] = result
+            if result == "PASSED":
+                state.update(provided)
+            self.save_checkpoint(stage.name, result, state)
+        
+        def skip(stage, reason):
+            result = f"SKIPPED: {reason}"
+            results[stage.name] = result
+            print(f"Skipping stage {stage.name}: {reason}")
+            if not parallel:
+                self.test_results.append((self.stage_method(stage).__name__, result))
+        
+        for stage in list(pending):
+            if stage.name in self.restored_stages:
+                pending.remove(stage)
+                results[stage.name] = "RESTORED"
+                if not parallel:
+                    self.test_results.append((self.stage_method(stage).__name__, "RESTORED"))
+        
+        pool = ThreadPoolExecutor(max_workers=len(workers)) if parallel else None
+        try:
+            while pending or running:
+                progressed = False
+                for stage in list(pending):
+                    deps = [dep for dep in stage.after if dep in names]
+                    # Tests only order the graph; a failed stage blocks everything that depends on it
+                    failed_deps = [dep for dep in deps if dep in results and results[dep] not in COMPLETED_RESULTS and not dep.startswith("test_")]
+                    if failed_deps:
+                        pending.remove(stage)
+                        skip(stage, f"depends on {', '.join(failed_deps)}")
+                        progressed = True
+                        continue
+                    if any(dep not in results for dep in deps) or not idle_workers:
+                        continue
+                    missing = [attr for attr in stage.requires if not state.get(attr)]
+                    pending.remove(stage)
+                    progressed = True
+                    if missing:
+                        skip(stage, f"missing {', '.join(missing)}")
+                        continue
+                    worker = idle_workers.pop(0)
+                    if parallel:
+                        running[pool.submit(worker.run_stage, stage, dict(state))] = (stage, worker)
+                    else:
+                        finish(stage, *worker.run_stage(stage, dict(state)))
+                        idle_workers.append(worker)
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        stage, worker = running.pop(future)
+                        try:
+                            finish(stage, *future.result())
+                        except Exception as e:
+                            finish(stage, f"ERROR: worker {worker.name} crashed: {str(e)[:80]}", {})
+                        idle_workers.append(worker)
+                elif not progressed:
+                    # Nothing is running and nothing could start: the rest wait on each other
+                    for stage in pending:
+                        skip(stage, "unsatisfiable ordering")
+                    pending = []
+        finally:
+            if pool:
+                pool.shutdown(wait=True)
+        
+        # Parallel workers keep their own results; merge them in declaration order
+        if parallel:
+            for stage in stages:
+                self.test_results.append((self.stage_method(stage).__name__, results.get(stage.name, "SKIPPED")))
+        for attr in STATE_ATTRS:
+            setattr(self, attr, state.get(attr))
+        return all(results.get(stage.name) in COMPLETED_RESULTS for stage in stages)
+    
+    def run_parallel(self, worker_count):
+        """Schedule tests 1-4 and the stages of test 5 on a pool of isolated Chrome workers"""
+        if not isinstance(sys.stdout, WorkerOutput):
+            sys.stdout = WorkerOutput(sys.stdout)
+        print(f"Running {len(ALL_STAGES)} stages on {worker_count} parallel workers...")
+        workers = [self.spawn_worker(f"w{i + 1}") for i in range(worker_count)]
+        self.run_stages(ALL_STAGES, workers)
+        test_5_stage_names = {self.stage_method(stage).__name__ for stage in TEST_5_STAGES}
+        test_5_passed = all(result in COMPLETED_RESULTS for name, result in self.test_results if name in test_5_stage_names)
+        self.test_results.append(("test_5_owner_signup_and_admin_approval", "PASSED" if test_5_passed else "FAILED"))
+    
+    def check_budgets(self):
+        """Compare the run's route and interaction metrics with the --budgets file; a crossed limit fails the run"""
+        budgets, warn_at = self.options.budget_rules
+        summaries = {"routes": self.vitals_summary(), "interactions": self.interaction_summary()}
+        results = check_budgets(budgets, summaries, warn_at)
+        print(f"\nPERFORMANCE BUDGETS ({self.options.budgets})")
+        symbols = {"ok": "✓", "warn": "⚠", "fail": "✗", "missing": "⚠"}
+        for result in results:
+            budget = result.budget
+            value = "not measured" if result.value is None else f"{round(result.value, 3):g}"
+            print(f"  {symbols[result.status]} {budget.target} {budget.metric}: {value} (limit {budget.limit:g})"
+                  + (f" - within {(1 - warn_at) * 100:.0f}% of the limit" if result.status == "warn" else ""))
+        def names(status):
+            return ", ".join(f"{result.budget.target} {result.budget.metric}" for result in results if result.status == status)
+        if names("fail"):
+            self.test_results.append(("performance_budgets", f"FAILED: over budget: {names('fail')}"[:200]))
+        elif names("missing") or names("warn"):
+            # A budget that was never measured cannot pass; it needs a different metric or route
+            warnings = [f"{label}: {names(status)}" for status, label in (("missing", "not measured"), ("warn", "near limit"))
+                        if names(status)]
+            self.test_results.append(("performance_budgets", f"WARNING: {'; '.join(warnings)}"[:200]))
+        else:
+            self.test_results.append(("performance_budgets", "PASSED"))
+    
+    def history_config(self):
+        """Settings that change timings; runs are only compared with runs that share them"""
+        parts = [f"workers={self.options.workers}", f"profile={self.options.profile}"]
+        for flag in ("lean", "block_media", "fast_auth", "seed"):
+            if getattr(self.options, flag):
+                parts.append(flag.replace("_", "-"))
+        if self.options.fault_profile:
+            parts.append("faults=" + ",".join(sorted(self.options.fault_profile)))
+        return " ".join(parts)
+    
+    def record_history(self, elapsed_time):
+        """Append this run's timings to the --history database and flag regressions against earlier runs"""
+        timings = [("run", "total", "duration", "seconds", elapsed_time)]
+        for name, seconds, result in self.durations:
+            if result == "PASSED":
+                timings.append(("stage" if name.startswith("stage_") else "test", name, "duration", "seconds", seconds))
+        for route, stats in self.vitals_summary().items():
+            for metric, unit in VITALS_METRICS.items():
+                if metric in stats and unit != "count":
+                    timings.append(("route", route, f"{metric} p75", unit, stats[metric]["p75"]))
+        for endpoint, stats in self.api_latency_summary().items():
+            timings.append(("endpoint", endpoint, "latency p95", "ms", stats["p95_ms"]))
+        try:
+            history = TimingHistory(self.options.history)
+            try:
+                commit = git_commit(__file__)
+                run_id = history.record_run(commit, self.history_config(), timings)
+                print(f"\nRecorded {len(timings)} timings for frontend commit {commit or 'unknown'} in {self.options.history}")
+                print_regressions(history.regressions(run_id))
+            finally:
+                history.close()
+        except Exception as e:
+            print(f"⚠ Could not update timing history {self.options.history}: {e}")
+    
+    def print_summary(self, elapsed_time):
+        passed = sum(1 for _, result in self.test_results if result == "PASSED")
+        skipped = sum(1 for _, result in self.test_results if result.startswith("SKIPPED"))
+        restored = sum(1 for _, result in self.test_results if result == "RESTORED")
+        warned = sum(1 for _, result in self.test_results if result.startswith("WARNING"))
+        failed = len(self.test_results) - passed - skipped - restored - warned
+        print("\n" + "=" * 70)
+        print("TEST SUMMARY - PHASE 1, 2 & 3")
+        print("=" * 70)
+        print(f"Passed: {passed}")
+        print(f"Failed: {failed}")
+        if skipped:
+            print(f"Skipped: {skipped}")
+        if restored:
+            print(f"Restored from checkpoint: {restored}")
+        if warned:
+            print(f"Warnings: {warned}")
+        print(f"Total Time: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
+        if (passed + failed) > 0:
+            print(f"Success Rate: {(passed/(passed+failed)*100):.1f}%")
+        print("\nDetailed Results:")
+        for test_name, result in self.test_results:
+            print(f"  {test_name}: {result}")
+        print("=" * 70)
+    
+    def run_all_tests(self):
+        print("=" * 70)
+        print("STRANDS PLATFORM SELENIUM TEST SUITE - PHASE 1 & 2")
+        print("=" * 70)
+        
+        start_time = time.time()
+        
+        try:
+            if self.options.resume_from:
+                load = self.load_fixtures if self.options.seed else self.load_checkpoint
+                if not load(self.options.resume_from):
+                    return
+            if self.options.workers > 1:
+                # One browser per worker starts while the backend is checked
+                self.start_driver_pool(self.options.workers)
+                print("Checking backend connection...")
+                self.check_backend()
+                self.run_parallel(self.options.workers)
+            else:
+                self.setup()
+                
+                tests = [
+                    self.test_1_login_page_loads,
+                    self.test_2_invalid_login_attempt,
+                    self.test_3_successful_login_admin,
+                    self.test_4_admin_pages_and_salon_rejection,
+                    self.test_5_owner_signup_and_admin_approval,
+                ]
+                
+                for test in tests:
+                    if test.__name__ in self.restored_stages:
+                        self.test_results.append((test.__name__, "RESTORED"))
+                        continue
+                    self.run_test(test)
+                    self.save_checkpoint(test.__name__, self.test_results[-1][1])
+            
+            if self.fault_results:
+                self.save_fault_report()
+            if self.options.web_vitals:
+                self.save_vitals_report()
+            if self.options.budgets:
+                self.check_budgets()
+            self.print_summary(time.time() - start_time)
+            if self.options.api_stats:
+                self.report_api_latency()
+            if self.options.interaction_stats and self.interactions:
+                self.report_interactions()
+            if self.command_profiler:
+                self.command_profiler.report()
+            if self.options.history:
+                self.record_history(time.time() - start_time)
+            
+        finally:
             self.teardown()
+            if self.tracer:
+                try:
+                    count = self.tracer.save(self.options.trace)
+                    print(f"✓ Saved {count} trace events to {self.options.trace} (open in Perfetto or chrome://tracing)")
+                except Exception as e:
+                    print(f"⚠ Could not write {self.options.trace}: {e}")
+
+class SleepFinder(ast.NodeVisitor):
+    """Collect time.sleep and self.pause calls together with the method they are in"""
+    def __init__(self):
+        self.function = None
+        self.sleeps = []
+        self.pauses = []
+
+    def visit_FunctionDef(self, node):
+        outer, self.function = self.function, node.name
+        self.generic_visit(node)
+        self.function = outer
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            args = ", ".join(ast.unparse(arg) for arg in node.args)
+            if func.value.id == "time" and func.attr == "sleep" and self.function not in WAIT_ENGINE_METHODS:
+                self.sleeps.append((node.lineno, self.function, args))
+            elif func.value.id == "self" and func.attr == "pause":
+                self.pauses.append((node.lineno, self.function, args))
+        self.generic_visit(node)
+
+def report_raw_sleeps(path=__file__):
+    """Print every fixed wait left in the suite; returns the number of raw time.sleep calls"""
+    finder = SleepFinder()
+    with open(path) as f:
+        finder.visit(ast.parse(f.read()))
+    for line, function, args in finder.sleeps:
+        print(f"{path}:{line}: raw time.sleep({args}) in {function} - use self.settle() or self.pause()")
+    for line, function, args in finder.pauses:
+        print(f"{path}:{line}: fixed pause({args}) in {function}")
+    print(f"{len(finder.sleeps)} raw sleep(s), {len(finder.pauses)} intentional pause(s)")
+    return len(finder.sleeps)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Strands platform Selenium test suite")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of isolated Chrome workers; independent flows run in parallel when > 1")
+    parser.add_argument("--fast-auth", action="store_true",
+                        help="Sign in by injecting a backend-issued token instead of the login form "
+                             "(tests 1-3 still use the form)")
+    parser.add_argument("--resume-from", metavar="STAGE", choices=[stage.name for stage in ALL_STAGES],
+                        help="Restore state and sessions from the checkpoint and continue at STAGE "
+                             "(one of: " + ", ".join(stage.name for stage in ALL_STAGES) + ")")
+    parser.add_argument("--seed", action="store_true",
+                        help="With --resume-from: create the owner, approved salon and stylist through the "
+                             "backend API instead of restoring them from the checkpoint")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE,
+                        help=f"Checkpoint file written after every stage (default: {CHECKPOINT_FILE})")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="demo",
+                        help="demo: visible scrolling and pacing for recordings (default); "
+                             "fast: no cosmetic scrolling, scroll only to reach off-screen elements")
+    parser.add_argument("--lean", action="store_true",
+                        help=f"Headless Chrome at {LEAN_WINDOW_SIZE[0]}x{LEAN_WINDOW_SIZE[1]} with animations "
+                             "and background services disabled (for CI)")
+    parser.add_argument("--block-media", action="store_true",
+                        help="Block image and font requests (for runs that do not check them)")
+    parser.add_argument("--fault-profile", action="append", metavar="[STAGE=]PROFILE",
+                        help="Switch fault_proxy.py (running on port 3001) to PROFILE for every stage, or only "
+                             "for STAGE; repeatable, needs --workers 1. Profiles: " + ", ".join(sorted(FAULT_PROFILES)))
+    parser.add_argument("--web-vitals", action="store_true",
+                        help=f"Record TTFB, FCP, LCP, CLS, long tasks and navigation timing per route to {WEB_VITALS_REPORT}")
+    parser.add_argument("--api-stats", action="store_true",
+                        help="Report latency percentiles and response size per backend endpoint from Chrome's "
+                             f"network log (also saved to {API_LATENCY_REPORT})")
+    parser.add_argument("--interaction-stats", action="store_true",
+                        help="Measure paint, DOM and API response times for every click and keystroke the helpers "
+                             f"dispatch and rank the slowest interactions (also saved to {INTERACTION_REPORT})")
+    parser.add_argument("--trace", nargs="?", const=TRACE_FILE, metavar="FILE",
+                        help="Write begin/end spans for every test, stage, navigation, wait, click, form fill and "
+                             f"sleep as Chrome trace-event JSON (default file: {TRACE_FILE})")
+    parser.add_argument("--profile-commands", action="store_true",
+                        help="Count and time every chromedriver command per calling line of the suite and list the "
+                             f"most expensive call sites (also saved to {COMMAND_PROFILE_REPORT})")
+    parser.add_argument("--deadline", type=float, default=MAX_TEST_TIME, metavar="SECONDS",
+                        help=f"Abort a test or stage still running after SECONDS (default: {MAX_TEST_TIME}; 0 disables); "
+                             f"a snapshot is saved to {DEADLINE_SNAPSHOT_DIR}/ and dependent stages are skipped")
+    parser.add_argument("--history", nargs="?", const=HISTORY_FILE, metavar="FILE",
+                        help="Append per-test, per-stage, per-route and per-endpoint timings to a SQLite history keyed "
+                             f"by frontend commit and flag regressions against recent runs (default file: {HISTORY_FILE})")
+    parser.add_argument("--budgets", nargs="?", const=BUDGET_FILE, metavar="FILE",
+                        help="Check route and interaction limits from a TOML budget file and fail the run when one is "
+                             f"crossed (default file: {BUDGET_FILE}); turns on --web-vitals/--interaction-stats as needed")
+    parser.add_argument("--lint-sleeps", action="store_true",
+                        help="List fixed waits (raw time.sleep calls and pauses) in this file and exit")
+    options = parser.parse_args(argv)
+    if options.seed and not options.resume_from:
+        parser.error("--seed needs --resume-from STAGE")
+    for spec in options.fault_profile or []:
+        stage_name, _, profile = spec.rpartition("=")
+        if profile not in FAULT_PROFILES or (stage_name and stage_name not in [stage.name for stage in ALL_STAGES]):
+            parser.error(f"invalid --fault-profile {spec}")
+    if options.fault_profile and options.workers > 1:
+        # The proxy has one active profile, so parallel stages would switch it under each other
+        parser.error("--fault-profile needs --workers 1 (the fault proxy runs one profile at a time)")
+    if options.budgets:
+        try:
+            options.budget_rules = load_budgets(options.budgets)
+        except BudgetError as e:
+            parser.error(str(e))
+        measured = needs(options.budget_rules[0])
+        options.web_vitals = options.web_vitals or "routes" in measured
+        options.interaction_stats = options.interaction_stats or "interactions" in measured
+    return options
 
 if __name__ == "__main__":
-    suite = StrandsTestSuite()
+    options = parse_args()
+    if options.lint_sleeps:
+        sys.exit(1 if report_raw_sleeps() else 0)
+    suite = StrandsTestSuite(options=options)
     suite.run_all_tests()
-
@@ -0,0 +1,299 @@
+"""Record/replay stand-in for the Strands backend API.
+
+record: run the real backend on another port and put this proxy on 3001; every
+API request the frontend makes is forwarded and the response saved to a tape.
+
+    python standin_backend.py record --upstream http://localhost:3002 --tape api_tape.json
+
+replay: serve the tape on 3001 with no backend or database behind it, so
+frontend-only runs get deterministic, near-zero API latency.
+
+    python standin_backend.py replay --tape api_tape.json
+
+Requests are matched on method, path and normalized body (see normalize_body).
+Repeated requests replay their recorded responses in order, repeating the last
+one; a request with no exact match gets a 404. With --route-fallback it instead
+gets a response recorded for the same method and path (ignoring body and
+query), and every such substitution is logged.
+"""
+from collections import namedtuple, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import base64
+import json
+import re
+import sys
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+STANDIN_PORT = 3001  # Where the frontend expects the backend (VITE_API_URL)
+TAPE_FILE = "api_tape.json"
+UPSTREAM_TIMEOUT = 30
+
+# Values that change from run to run and must not affect matching:
+# generated test accounts, random SKUs and cache-busting query parameters
+VOLATILE_PATTERNS = [
+    (re.compile(r"test_[a-z0-9]{8}@selenium\.com"), "<email>"),
+    (re.compile(r"PROD-\d{4}"), "<sku>"),
+]
+VOLATILE_QUERY_PARAMS = ("_t",)
+
+# Response headers that are kept on the tape (the rest are per-connection)
+RECORDED_HEADERS = ("content-type", "access-control-allow-origin", "access-control-allow-credentials",
+                    "access-control-expose-headers", "set-cookie", "cache-control")
+
+# Request headers not forwarded upstream
+SKIPPED_REQUEST_HEADERS = ("host", "content-length", "accept-encoding", "connection")
+
+# One recorded response
+Recording = namedtuple("Recording", ["method", "path", "key", "status", "headers", "body"])
+
+def normalize_path(path):
+    """Path with volatile query parameters removed and the rest sorted"""
+    parsed = urllib.parse.urlsplit(path)
+    query = [(name, value) for name, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+             if name not in VOLATILE_QUERY_PARAMS]
+    return parsed.path + ("?" + urllib.parse.urlencode(sorted(query)) if query else "")
+
+def normalize_body(body):
+    """Canonical text for a request body: JSON with sorted keys, volatile values masked"""
+    if not body:
+        return ""
+    try:
+        text = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        text = body.decode("utf-8", errors="replace")
+    for pattern, placeholder in VOLATILE_PATTERNS:
+        text = pattern.sub(placeholder, text)
+    return text
+
+def request_key(method, path, body):
+    return f"{method} {normalize_path(path)} {normalize_body(body)}"
+
+def encode_body(body):
+    try:
+        return {"text": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(body).decode("ascii")}
+
+def decode_body(stored):
+    if "base64" in stored:
+        return base64.b64decode(stored["base64"])
+    return stored["text"].encode("utf-8")
+
+class Tape:
+    """Recorded responses, looked up by request key and then by method and path"""
+    def __init__(self, recordings=()):
+        self.recordings = []
+        self.by_key = defaultdict(list)
+        self.by_route = defaultdict(list)
+        self.served = defaultdict(int)
+        self.lock = threading.Lock()
+        for recording in recordings:
+            self.add(recording)
+
+    def add(self, recording):
+        with self.lock:
+            self.recordings.append(recording)
+            self.by_key[recording.key].append(recording)
+            self.by_route[(recording.method, urllib.parse.urlsplit(recording.path).path)].append(recording)
+
+    def match(self, method, path, body, route_fallback=False):
+        """Next recorded response for the request as (recording, exact), or (None, False).
+        
+        Only the exact request key matches unless route_fallback is set, in which
+        case a response recorded for the same method and path is used (exact=False).
+        """
+        key = request_key(method, path, body)
+        lookups = [(key, self.by_key.get(key), True)]
+        if route_fallback:
+            route = (method, urllib.parse.urlsplit(path).path)
+            lookups.append((route, self.by_route.get(route), False))
+        with self.lock:
+            for lookup, candidates, exact in lookups:
+                if candidates:
+                    index = min(self.served[lookup], len(candidates) - 1)
+                    self.served[lookup] += 1
+                    return candidates[index], exact
+        return None, False
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            entries = json.load(f)["entries"]
+        return cls(Recording(entry["method"], entry["path"], entry["key"], entry["status"],
+                             entry["headers"], decode_body(entry["body"])) for entry in entries)
+
+    def save(self, path):
+        with self.lock:
+            entries = [{
+                "method": recording.method,
+                "path": recording.path,
+                "key": recording.key,
+                "status": recording.status,
+                "headers": recording.headers,
+                "body": encode_body(recording.body),
+            } for recording in self.recordings]
+        with open(path, "w") as f:
+            json.dump({"version": 1, "entries": entries}, f, indent=1)
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Shared request plumbing; subclasses implement respond()"""
+    tape = None
+    upstream = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def send(self, status, headers, body):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_any(self):
+        try:
+            self.respond(self.command, self.read_body())
+        except Exception as e:
+            print(f"⚠ {self.command} {self.path} failed: {e}")
+            self.send(502, [("Content-Type", "application/json")], json.dumps({"message": str(e)}).encode())
+
+    def forward(self, method, body):
+        """Send the request on to self.upstream and return (status, headers, body)"""
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in SKIPPED_REQUEST_HEADERS}
+        req = urllib.request.Request(self.upstream + self.path, data=body or None, method=method, headers=headers)
+        try:
+            response = urllib.request.urlopen(req, timeout=UPSTREAM_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            response = e
+        with response:
+            response_body = response.read()
+            status = response.status if hasattr(response, "status") else response.code
+            response_headers = [(name, value) for name, value in response.headers.items()
+                                if name.lower() not in ("transfer-encoding", "connection", "content-encoding", "content-length")]
+        return status, response_headers, response_body
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = handle_any
+
+class RecordingHandler(StandinHandler):
+    """Forward every request to the real backend and add the response to the tape"""
+
+    def respond(self, method, body):
+        status, response_headers, response_body = self.forward(method, body)
+        if method != "OPTIONS":
+            self.tape.add(Recording(method, self.path, request_key(method, self.path, body), status,
+                                    [[name, value] for name, value in response_headers if name.lower() in RECORDED_HEADERS],
+                                    response_body))
+        self.send(status, response_headers, response_body)
+
+class ReplayHandler(StandinHandler):
+    """Answer from the tape; CORS preflights and the health check are answered locally"""
+    misses = None
+    fallbacks = None
+    route_fallback = False
+
+    def cors_headers(self):
+        origin = self.headers.get("Origin")
+        if not origin:
+            return []
+        return [("Access-Control-Allow-Origin", origin), ("Access-Control-Allow-Credentials", "true")]
+
+    def respond(self, method, body):
+        if method == "OPTIONS":
+            self.send(204, self.cors_headers() + [
+                ("Access-Control-Allow-Methods", "GET, POST, PUT, PATCH, DELETE, OPTIONS"),
+                ("Access-Control-Allow-Headers", self.headers.get("Access-Control-Request-Headers", "*")),
+                ("Access-Control-Max-Age", "600"),
+            ], b"")
+            return
+        recording, exact = self.tape.match(method, self.path, body, self.route_fallback)
+        if recording is not None and not exact:
+            self.fallbacks[f"{method} {normalize_path(self.path)}"] += 1
+            print(f"⚠ No exact recording for {method} {self.path}; replaying the one recorded for {recording.method} {recording.path}")
+        if recording is None:
+            if urllib.parse.urlsplit(self.path).path.endswith("/health"):
+                self.send(200, self.cors_headers() + [("Content-Type", "application/json")], b'{"status":"ok"}')
+                return
+            self.misses[f"{method} {normalize_path(self.path)}"] += 1
+            print(f"⚠ No recorded response for {method} {self.path}")
+            message = json.dumps({"message": f"No recorded response for {method} {self.path}"}).encode()
+            self.send(404, self.cors_headers() + [("Content-Type", "application/json")], message)
+            return
+        # Answer for whichever origin is asking, not the one that was recorded
+        headers = [(name, value) for name, value in recording.headers if not name.lower().startswith("access-control-allow")]
+        self.send(recording.status, self.cors_headers() + headers, recording.body)
+
+def serve(handler, port):
+    server = ThreadingHTTPServer(("", port), handler)
+    server.daemon_threads = True
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def record(upstream, tape_path, port=STANDIN_PORT):
+    """Proxy port → upstream until interrupted, then write the tape"""
+    RecordingHandler.upstream = upstream.rstrip("/")
+    RecordingHandler.tape = tape = Tape()
+    print(f"Recording API traffic on port {port} → {upstream} (Ctrl+C to stop and save {tape_path})")
+    try:
+        serve(RecordingHandler, port)
+    finally:
+        tape.save(tape_path)
+        print(f"✓ Saved {len(tape.recordings)} responses to {tape_path}")
+
+def replay(tape_path, port=STANDIN_PORT, route_fallback=False):
+    """Serve the tape on port until interrupted"""
+    ReplayHandler.tape = Tape.load(tape_path)
+    ReplayHandler.misses = misses = defaultdict(int)
+    ReplayHandler.fallbacks = fallbacks = defaultdict(int)
+    ReplayHandler.route_fallback = route_fallback
+    print(f"Replaying {len(ReplayHandler.tape.recordings)} recorded responses from {tape_path} on port {port} (Ctrl+C to stop)")
+    try:
+        serve(ReplayHandler, port)
+    finally:
+        if misses:
+            print(f"⚠ {sum(misses.values())} request(s) had no recording:")
+            for request, count in sorted(misses.items()):
+                print(f"  {count}x {request}")
+        if fallbacks:
+            print(f"⚠ {sum(fallbacks.values())} request(s) were answered with a response recorded for a different body or query:")
+            for request, count in sorted(fallbacks.items()):
+                print(f"  {count}x {request}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Record/replay stand-in for the Strands backend API")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--tape", default=TAPE_FILE, help=f"Recorded API traffic (default: {TAPE_FILE})")
+    parser.add_argument("--port", type=int, default=STANDIN_PORT,
+                        help=f"Port to listen on (default: {STANDIN_PORT}, where the frontend expects the backend)")
+    parser.add_argument("--upstream", help="Real backend to record from, e.g. http://localhost:3002")
+    parser.add_argument("--route-fallback", action="store_true",
+                        help="replay: answer requests with no exact recording using one recorded for the same method "
+                             "and path, logging each substitution (default: 404)")
+    options = parser.parse_args(argv)
+    if options.mode == "record" and not options.upstream:
+        parser.error("record needs --upstream")
+    return options
+
+if __name__ == "__main__":
+    options = parse_args()
+    if options.mode == "record":
+        record(options.upstream, options.tape, options.port)
+    else:
+        try:
+            replay(options.tape, options.port, options.route_fallback)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠ Could not replay {options.tape}: {e}")
+            sys.exit(1)
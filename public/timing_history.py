@@ -0,0 +1,156 @@
+"""Timing history of suite runs with regression detection.
+
+Every run of selenium_test.py --history appends its per-test, per-stage,
+per-route (web vitals) and per-endpoint (API latency) timings to a SQLite file,
+keyed by the frontend's git commit. Each value is then compared with the same
+timing in recent runs that used the same configuration; a value is flagged
+when it is both well above the baseline and far outside its usual spread:
+
+    history = TimingHistory()
+    run_id = history.record_run(commit, config, [("stage", "customer_booking", "duration", "seconds", 41.2)])
+    for regression in history.regressions(run_id):
+        print(regression)
+
+Run directly to list recent runs and the regressions of the latest one.
+"""
+from collections import namedtuple
+from datetime import datetime
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+
+HISTORY_FILE = "timing_history.sqlite"
+BASELINE_RUNS = 10  # Most recent comparable runs that form the baseline
+MIN_BASELINE_RUNS = 3  # Fewer comparable runs than this and nothing is flagged
+REGRESSION_MIN_CHANGE = 0.2  # Flag only values at least 20% above the baseline mean...
+REGRESSION_MIN_Z = 3.0  # ...and at least this many standard deviations above it
+# Smallest increase worth flagging per unit, so noise on tiny values is ignored
+REGRESSION_MIN_DELTA = {"seconds": 1.0, "ms": 50.0, "score": 0.05}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS timings_series ON timings (kind, name, metric);
+"""
+
+# One timing that is significantly slower than its baseline; change is relative (0.4 = 40% slower)
+Regression = namedtuple("Regression", ["kind", "name", "metric", "unit", "value", "baseline", "change", "z"])
+
+def git_commit(path=None):
+    """Commit checked out where `path` lives (default: this file), with "-dirty" for uncommitted changes"""
+    cwd = os.path.dirname(os.path.abspath(path or __file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty else "")
+
+def format_value(value, unit):
+    if unit == "seconds":
+        return f"{value:.1f}s"
+    if unit == "ms":
+        return f"{value:.0f}ms"
+    return f"{value:.3f}"
+
+class TimingHistory:
+    """Runs and their timings in a SQLite file"""
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def record_run(self, commit, config, timings):
+        """Store one run; timings are (kind, name, metric, unit, value). Returns the run id"""
+        with self.connection:
+            cursor = self.connection.execute("INSERT INTO runs (started_at, git_commit, config) VALUES (?, ?, ?)",
+                                             (datetime.now().isoformat(), commit, config))
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO timings (run_id, kind, name, metric, unit, value) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, kind, name, metric, unit, value) for kind, name, metric, unit, value in timings])
+        return run_id
+
+    def baseline(self, run_id, kind, name, metric, runs=BASELINE_RUNS):
+        """Values of the same timing in the `runs` latest earlier runs with the same config"""
+        rows = self.connection.execute("""
+            SELECT timings.value FROM timings JOIN runs USING (run_id)
+            WHERE timings.kind = ? AND timings.name = ? AND timings.metric = ?
+              AND runs.run_id < ? AND runs.config = (SELECT config FROM runs WHERE run_id = ?)
+            ORDER BY runs.run_id DESC LIMIT ?
+        """, (kind, name, metric, run_id, run_id, runs)).fetchall()
+        return [value for (value,) in rows]
+
+    def regressions(self, run_id):
+        """Timings of run `run_id` significantly above their baseline, largest relative change first"""
+        found = []
+        rows = self.connection.execute("SELECT kind, name, metric, unit, value FROM timings WHERE run_id = ?", (run_id,))
+        for kind, name, metric, unit, value in rows.fetchall():
+            history = self.baseline(run_id, kind, name, metric)
+            if len(history) < MIN_BASELINE_RUNS:
+                continue
+            mean = statistics.mean(history)
+            # A perfectly steady baseline still gets some spread, so z stays finite
+            spread = max(statistics.stdev(history), abs(mean) * 0.05, 1e-9)
+            z = (value - mean) / spread
+            if (value - mean >= REGRESSION_MIN_DELTA.get(unit, 0) and value >= mean * (1 + REGRESSION_MIN_CHANGE)
+                    and z >= REGRESSION_MIN_Z):
+                found.append(Regression(kind, name, metric, unit, value, mean, (value - mean) / mean if mean else float("inf"), z))
+        return sorted(found, key=lambda regression: -regression.change)
+
+    def recent_runs(self, limit=10):
+        """(run_id, started_at, git_commit, config, timing count) of the latest runs, newest first"""
+        return self.connection.execute("""
+            SELECT runs.run_id, runs.started_at, runs.git_commit, runs.config, COUNT(timings.run_id)
+            FROM runs LEFT JOIN timings USING (run_id)
+            GROUP BY runs.run_id ORDER BY runs.run_id DESC LIMIT ?
+        """, (limit,)).fetchall()
+
+def print_regressions(regressions):
+    if not regressions:
+        print("✓ No timing regressions against the baseline")
+        return
+    print(f"⚠ {len(regressions)} timing regression(s) against the last {BASELINE_RUNS} comparable runs:")
+    for regression in regressions:
+        print(f"  {regression.kind} {regression.name} {regression.metric}: "
+              f"{format_value(regression.value, regression.unit)} vs {format_value(regression.baseline, regression.unit)} "
+              f"(+{regression.change * 100:.0f}%, {regression.z:.1f} sd)")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Recent suite runs and regressions of the latest one")
+    parser.add_argument("--db", default=HISTORY_FILE, help=f"History file (default: {HISTORY_FILE})")
+    parser.add_argument("--runs", type=int, default=10, help="How many recent runs to list (default: 10)")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    options = parse_args()
+    if not os.path.exists(options.db):
+        print(f"⚠ No history at {options.db}; run selenium_test.py --history first")
+        sys.exit(1)
+    history = TimingHistory(options.db)
+    runs = history.recent_runs(options.runs)
+    for run_id, started_at, commit, config, count in runs:
+        print(f"  #{run_id} {started_at[:19]} {commit or 'unknown commit'} [{config}] {count} timings")
+    if runs:
+        print_regressions(history.regressions(runs[0][0]))
+    history.close()